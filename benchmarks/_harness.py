@@ -1,16 +1,21 @@
 """
-Pure timing/arithmetic core for the GIL-release spike (SPIKE-01, SPIKE-02).
+Pure timing/arithmetic core for the benchmarks in this directory.
 
 This module is deliberately ADBC-free: it imports no `adbc_poolhouse`, no
 `create_pool`, and no driver. Every function operates on plain floats or on a
 caller-supplied `call`, so the arithmetic is unit-testable without a database,
 a connection pool, or any wall-clock assertion.
 
-The headline figure is a speedup ratio bounded by two reference points:
+For the GIL-release spike (SPIKE-01, SPIKE-02) the headline figure is a speedup
+ratio bounded by two reference points:
 
 - `speedup == N` means the work parallelized fully (the GIL was released).
 - `speedup == 1` means the work serialized (the GIL was re-held).
 
+The per-call helpers ([`per_call_us`][benchmarks._harness.per_call_us],
+[`overhead_report`][benchmarks._harness.overhead_report]) back the pool
+checkout-overhead benchmark, which compares two implementations of the same loop.
+
 The concurrency primitive ([`concurrent_wall`][benchmarks._harness.concurrent_wall])
 uses raw threads only (`threading.Barrier` + `ThreadPoolExecutor`); it never uses
 anyio or any async machinery.
@@ -168,3 +173,55 @@ def concurrent_wall(
         return time.perf_counter() - t0
 
     return median(trial() for _ in range(trials))
+
+
+def per_call_us(elapsed: float, calls: int) -> float:
+    """
+    Convert a batch wall-clock into microseconds per call.
+
+    Args:
+        elapsed: Seconds taken by the whole batch.
+        calls: Number of calls in the batch.
+
+    Returns:
+        The mean cost of one call in microseconds.
+
+    Raises:
+        ValueError: If `calls <= 0`; a per-call cost of an empty batch is
+            undefined.
+    """
+    if calls <= 0:
+        msg = f"calls must be > 0 (got {calls})"
+        raise ValueError(msg)
+    return elapsed / calls * 1e6
+
+
+def overhead_report(baseline_us: float, candidate_us: float) -> dict[str, float]:
+    """
+    Compare two per-call costs (e.g. `QueuePool` vs `AdbcPool` checkout/checkin).
+
+    Args:
+        baseline_us: Per-call cost of the reference implementation, in microseconds.
+        candidate_us: Per-call cost of the implementation under test, in microseconds.
+
+    Returns:
+        A dict with keys `baseline_us`, `candidate_us`, `saved_us` (baseline minus
+        candidate) and `speedup_x` (baseline / candidate; above `1.0` means the
+        candidate is cheaper).
+
+    Raises:
+        ValueError: If `candidate_us <= 0.0`; the loop ran below timer resolution,
+            so the ratio is undefined (increase `--iterations`).
+    """
+    if candidate_us <= 0.0:
+        msg = (
+            f"candidate_us must be > 0 (got {candidate_us}); the loop finished below "
+            "timer resolution -- increase --iterations"
+        )
+        raise ValueError(msg)
+    return {
+        "baseline_us": baseline_us,
+        "candidate_us": candidate_us,
+        "saved_us": baseline_us - candidate_us,
+        "speedup_x": baseline_us / candidate_us,
+    }
@@ -0,0 +1,237 @@
+"""
+Async checkout under contention: thread-parked waits vs the event-loop queue.
+
+Both modes drive the same file-backed DuckDB `AsyncPool`, built by the real
+`create_async_pool(DuckDBConfig(...))` path, with `--tasks` tasks sharing a pool
+of `--pool-size` connections. Each task does `--rounds` checkouts, runs
+`SELECT 1`, holds the connection for `--hold-ms` (an `anyio.sleep`, standing in
+for awaiting something else mid-transaction) and checks it in.
+
+- `thread`: the checkout path before the event-loop queue existed, rebuilt here.
+  `AdbcQueuePool.connect()` is offloaded under the pool's `CapacityLimiter`, so
+  on an exhausted pool a worker thread blocks inside SQLAlchemy's queue holding
+  a token. Check-in goes through the same limiter, as it always has.
+- `queue`: `AsyncPool.connect()`, which waits in the pool's `CheckoutQueue` on
+  the event loop and offloads only the checkout itself.
+
+For each mode the script prints a `contention_report` dict: `wall_s`,
+`checkouts_per_s`, `timeouts` (checkouts that hit the pool's `--timeout`),
+`peak_parked_threads` (the most worker threads blocked inside the sync
+`connect()` at once), and the median and p99 checkout wait in milliseconds as
+seen by the task.
+
+Expect the `thread` mode to park one thread per limiter token and then stall:
+once every token is held by a thread waiting for a connection, the check-ins
+that would free one queue behind them for a token, and nothing moves until a
+wait hits `--timeout`. With more tasks than connections this happens within the
+first few rounds, and `timeouts` counts the damage. No assertion is made on the
+numbers; they are hardware-dependent.
+
+Run:
+    .venv/bin/python -m benchmarks.async_checkout --tasks 32 --pool-size 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import anyio
+import anyio.to_thread
+import sqlalchemy.exc
+
+from adbc_poolhouse import DuckDBConfig, close_async_pool, create_async_pool
+from adbc_poolhouse._async._connection import AsyncConnection
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from adbc_poolhouse._async._pool import AsyncPool
+
+MODES = ("thread", "queue")
+
+
+class _Parked:
+    """Counts worker threads inside the sync `connect()`, keeping the peak."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.now = 0
+        self.peak = 0
+
+    def enter(self) -> None:
+        with self._lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+
+    def leave(self) -> None:
+        with self._lock:
+            self.now -= 1
+
+
+def _thread_checkout(pool: AsyncPool, parked: _Parked) -> Callable[[], Awaitable[AsyncConnection]]:
+    """
+    Build the pre-queue checkout: the blocking sync `connect()` on a worker thread.
+
+    Args:
+        pool: The pool under test.
+        parked: Where to count threads blocked in the sync checkout.
+
+    Returns:
+        A zero-argument coroutine function returning an `AsyncConnection`.
+    """
+    sync_pool = pool._pool
+
+    def blocking_connect() -> object:
+        parked.enter()
+        try:
+            return sync_pool.connect()
+        finally:
+            parked.leave()
+
+    async def connect() -> AsyncConnection:
+        fairy = await anyio.to_thread.run_sync(blocking_connect, limiter=pool._limiter)
+        return AsyncConnection(fairy, pool._limiter)  # type: ignore[arg-type]
+
+    return connect
+
+
+def _queue_checkout(pool: AsyncPool, parked: _Parked) -> Callable[[], Awaitable[AsyncConnection]]:
+    """
+    Build the event-loop-queue checkout, counting threads in the sync checkout.
+
+    Args:
+        pool: The pool under test.
+        parked: Where to count threads inside the sync checkout.
+
+    Returns:
+        `pool.connect`.
+    """
+    sync_pool = pool._pool
+    checkout = sync_pool._adbc_checkout
+
+    def counted(start: float) -> object:
+        parked.enter()
+        try:
+            return checkout(start)
+        finally:
+            parked.leave()
+
+    sync_pool._adbc_checkout = counted  # type: ignore[method-assign]
+    return pool.connect
+
+
+async def run_mode(
+    mode: str, tasks: int, pool_size: int, rounds: int, hold_s: float, timeout: int
+) -> dict[str, float]:
+    """
+    Run one contention trial and summarise it.
+
+    Args:
+        mode: `"thread"` or `"queue"`.
+        tasks: Concurrent tasks.
+        pool_size: Pool connections (`max_overflow` is 0).
+        rounds: Checkouts per task.
+        hold_s: Seconds each task holds its connection after the query.
+        timeout: The pool's checkout timeout, in seconds.
+
+    Returns:
+        The `contention_report` dict.
+    """
+    tmpdir = tempfile.mkdtemp()
+    cfg = DuckDBConfig(database=os.path.join(tmpdir, "bench.db"))
+    pool = create_async_pool(
+        cfg, pool_size=pool_size, max_overflow=0, timeout=timeout, prefill=pool_size
+    )
+    parked = _Parked()
+    connect = (_thread_checkout if mode == "thread" else _queue_checkout)(pool, parked)
+    waits: list[float] = []
+    timeouts = 0
+
+    async def worker() -> None:
+        nonlocal timeouts
+        for _ in range(rounds):
+            t0 = time.perf_counter()
+            try:
+                conn = await connect()
+            except sqlalchemy.exc.TimeoutError:
+                timeouts += 1
+                continue
+            waits.append(time.perf_counter() - t0)
+            async with conn:
+                await conn.cursor().execute("SELECT 1")
+                await anyio.sleep(hold_s)
+
+    try:
+        t0 = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for _ in range(tasks):
+                tg.start_soon(worker)
+        wall = time.perf_counter() - t0
+    finally:
+        await close_async_pool(pool)
+        shutil.rmtree(tmpdir, ignore_errors=True)
+    waits.sort()
+    return {
+        "wall_s": wall,
+        "checkouts_per_s": len(waits) / wall,
+        "timeouts": timeouts,
+        "peak_parked_threads": parked.peak,
+        "wait_p50_ms": waits[len(waits) // 2] * 1e3 if waits else 0.0,
+        "wait_p99_ms": waits[int(len(waits) * 0.99)] * 1e3 if waits else 0.0,
+    }
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser for the benchmark."""
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.async_checkout",
+        description="Compare thread-parked and event-loop async checkout under contention.",
+    )
+    parser.add_argument("--tasks", type=int, default=32, help="Concurrent tasks (default: 32).")
+    parser.add_argument(
+        "--pool-size", type=int, default=4, help="Pool connections, no overflow (default: 4)."
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Checkouts per task (default: 5).")
+    parser.add_argument(
+        "--hold-ms",
+        type=float,
+        default=1.0,
+        help="Milliseconds each checkout is held after its query (default: 1).",
+    )
+    parser.add_argument(
+        "--timeout", type=int, default=1, help="Pool checkout timeout in seconds (default: 1)."
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("asyncio", "trio"),
+        default="asyncio",
+        help="Event loop to run on (default: asyncio).",
+    )
+    return parser
+
+
+def main() -> None:
+    """Parse CLI args and run both modes."""
+    args = _build_parser().parse_args()
+    for mode in MODES:
+        result = anyio.run(
+            run_mode,
+            mode,
+            args.tasks,
+            args.pool_size,
+            args.rounds,
+            args.hold_ms / 1e3,
+            args.timeout,
+            backend=args.backend,
+        )
+        print(f"[{mode}] tasks={args.tasks} pool_size={args.pool_size}: {result}")
+
+
+if __name__ == "__main__":
+    main()
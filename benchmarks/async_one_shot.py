@@ -0,0 +1,187 @@
+"""
+Per-query overhead of the async wrapper: four offloads vs one `fetch_arrow`.
+
+A read on the step-by-step path is `pool.connect()`, `cursor.execute`,
+`cursor.fetch_arrow_table` and `conn.close()`: four trips through the offload
+chokepoint, each with a limiter acquire, a thread hop and (for the two cursor
+calls) a `cancellable_offload` watcher task group. `AsyncPool.fetch_arrow` does
+the same checkout, query, fetch and check-in in one dispatch.
+
+To time the wrapper rather than a driver, both paths run against an `AsyncPool`
+over a real `AdbcQueuePool` whose connections are the async harness's stub
+connections (`tests/_async_harness/stubs.py`), with the cursor's blocking gate
+removed so every driver call returns at once. What is left is the pool checkout
+and check-in, the offloads and the task-group bookkeeping.
+
+Two phases are measured:
+
+- `single`: one task, `--iterations` queries; the uncontended cost.
+- `tasks`: `--tasks` concurrent tasks, each doing `--iterations` queries, against
+  a pool sized to the task count; reported per query across all tasks.
+
+The script prints one `overhead_report` dict per phase, with the four-hop path as
+the baseline; `speedup_x > 1` means `fetch_arrow` is cheaper. No assertion is made
+on the numbers; they are hardware-dependent.
+
+Run:
+    .venv/bin/python -m benchmarks.async_one_shot --iterations 2000 --tasks 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import TYPE_CHECKING
+
+import anyio
+from tests._async_harness.stubs import BlockingStubConnection, BlockingStubCursor
+
+from adbc_poolhouse import AdbcQueuePool, close_async_pool
+from adbc_poolhouse._async._pool import AsyncPool
+from benchmarks._harness import median, overhead_report, per_call_us
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+PATHS = ("four_hop", "one_shot")
+
+
+class _InstantCursor(BlockingStubCursor):
+    """A stub cursor whose `execute` and `fetch_arrow_table` return at once."""
+
+    def _block(self) -> None:
+        return
+
+
+class _InstantConnection(BlockingStubConnection):
+    """A stub connection handing out `_InstantCursor`s, without retaining them."""
+
+    def cursor(self) -> _InstantCursor:
+        return _InstantCursor()
+
+
+def _stub_pool(size: int) -> AsyncPool:
+    """
+    Build an `AsyncPool` of `size` stub connections, all opened up front.
+
+    Args:
+        size: Pool size; `max_overflow` is 0.
+
+    Returns:
+        The pool. Close it with `close_async_pool`.
+    """
+    sync_pool = AdbcQueuePool(
+        _InstantConnection, pool_size=size, max_overflow=0, reset_on_return=None
+    )
+    sync_pool._adbc_source = _InstantConnection()  # type: ignore[attr-defined]
+    # Open every connection now, so no timed query pays a connect.
+    for conn in [sync_pool.connect() for _ in range(size)]:
+        conn.close()
+    return AsyncPool(sync_pool, pool_size=size, max_overflow=0)
+
+
+def _query(pool: AsyncPool, path: str) -> Callable[[], Awaitable[object]]:
+    """
+    Build the zero-argument query coroutine function for `path`.
+
+    Args:
+        pool: The pool under test.
+        path: `"four_hop"` or `"one_shot"`.
+
+    Returns:
+        A coroutine function running one `SELECT 1` read.
+    """
+
+    async def four_hop() -> object:
+        conn = await pool.connect()
+        try:
+            cursor = conn.cursor()
+            await cursor.execute("SELECT 1")
+            return await cursor.fetch_arrow_table()
+        finally:
+            await conn.close()
+
+    async def one_shot() -> object:
+        return await pool.fetch_arrow("SELECT 1")
+
+    return four_hop if path == "four_hop" else one_shot
+
+
+async def _loop(query: Callable[[], Awaitable[object]], iterations: int) -> None:
+    for _ in range(iterations):
+        await query()
+
+
+async def measure(path: str, tasks: int, iterations: int, trials: int) -> float:
+    """
+    Median cost of one query on `path` with `tasks` concurrent tasks, in microseconds.
+
+    Args:
+        path: `"four_hop"` or `"one_shot"`.
+        tasks: Concurrent tasks (and pool size).
+        iterations: Queries per task per trial.
+        trials: Number of trials; the median is taken.
+
+    Returns:
+        Microseconds of wall-clock per query, over all `tasks * iterations`.
+    """
+    pool = _stub_pool(tasks)
+    query = _query(pool, path)
+    try:
+        await _loop(query, min(iterations, 100))  # warm-up: worker threads, code paths
+        walls: list[float] = []
+        for _ in range(trials):
+            t0 = time.perf_counter()
+            async with anyio.create_task_group() as tg:
+                for _ in range(tasks):
+                    tg.start_soon(_loop, query, iterations)
+            walls.append(time.perf_counter() - t0)
+    finally:
+        assert pool._pool.checkedout() == 0, "connections leaked from the pool"  # noqa: S101
+        await close_async_pool(pool)
+    return per_call_us(median(walls), tasks * iterations)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser for the benchmark."""
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.async_one_shot",
+        description="Compare four-offload async reads with the one-shot AsyncPool.fetch_arrow.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=2_000,
+        help="Queries per task per trial (default: 2000).",
+    )
+    parser.add_argument(
+        "--tasks", type=int, default=4, help="Tasks for the concurrent phase (default: 4)."
+    )
+    parser.add_argument(
+        "--trials", type=int, default=5, help="Trials per phase; median is reported (default: 5)."
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("asyncio", "trio"),
+        default="asyncio",
+        help="Event loop to run on (default: asyncio).",
+    )
+    return parser
+
+
+def main() -> None:
+    """Parse CLI args and run both phases for both paths."""
+    args = _build_parser().parse_args()
+    for phase, tasks in (("single", 1), ("tasks", args.tasks)):
+        cost = {
+            path: anyio.run(
+                measure, path, tasks, args.iterations, args.trials, backend=args.backend
+            )
+            for path in PATHS
+        }
+        result = overhead_report(cost["four_hop"], cost["one_shot"])
+        print(f"[{phase}] tasks={tasks} iterations={args.iterations}: {result}")
+
+
+if __name__ == "__main__":
+    main()
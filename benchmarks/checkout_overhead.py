@@ -0,0 +1,202 @@
+"""
+Checkout/checkin overhead: SQLAlchemy `QueuePool` vs the native `AdbcPool`.
+
+Both pools are built by the real `create_pool(DuckDBConfig(...))` path --- the
+default `pool_class="queue"` and `pool_class="adbc"` --- against the same
+file-backed DuckDB database. The timed loop is a bare `pool.connect()` followed
+by `conn.close()`, with no query in between, so the figure is the pool's own
+per-round-trip cost: for `QueuePool` the `_ConnectionFairy` / `_ConnectionRecord`
+machinery and the `reset` event dispatch, for `AdbcPool` a deque pop/append and
+the inline cursor release. Both pools roll back on checkin; on DuckDB that
+rollback is most of the round trip, so a bare `dbapi_connection.rollback()` loop
+is timed too and printed as `[rollback]` for scale. It is not subtracted: the
+driver's rollback cost varies with connection state, so the difference would be
+noise.
+
+Two phases are measured per pool:
+
+- `single`: one thread, `--iterations` round trips; the uncontended cost.
+- `threads`: `--threads` barrier-gated threads, each doing `--iterations` round
+  trips against a pool sized to the thread count; the cost under lock
+  contention, reported per round trip across all threads.
+
+The script prints one `overhead_report` dict per phase; `speedup_x > 1` means
+`AdbcPool` is cheaper. No assertion on the ratio appears here --- absolute
+numbers are hardware-dependent.
+
+Run:
+    .venv/bin/python -m benchmarks.checkout_overhead
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from adbc_poolhouse import DuckDBConfig, close_pool, create_pool
+from benchmarks._harness import concurrent_wall, median, overhead_report, per_call_us
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from adbc_poolhouse import AdbcPool, AdbcQueuePool
+
+POOL_CLASSES = ("queue", "adbc")
+
+
+@contextmanager
+def _pool(pool_class: str, n: int) -> Iterator[AdbcQueuePool | AdbcPool]:
+    """
+    Yield a warmed, file-backed DuckDB pool of `pool_class` holding `n` connections.
+
+    Every connection is opened up front (`prefill=n`), so the timed loop never
+    pays a clone. The temp directory is removed after the pool is closed.
+
+    Args:
+        pool_class: `"queue"` or `"adbc"`.
+        n: Pool size; `max_overflow` is 0 so no overflow connection is opened.
+
+    Yields:
+        The configured pool.
+    """
+    tmpdir = tempfile.mkdtemp()
+    cfg = DuckDBConfig(database=os.path.join(tmpdir, "bench.db"), pool_size=n)
+    pool = create_pool(cfg, max_overflow=0, prefill=n, pool_class=pool_class)  # type: ignore[call-overload]
+    try:
+        yield pool
+    finally:
+        assert pool.checkedout() == 0, "connections leaked from the pool"  # noqa: S101
+        close_pool(pool)
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def round_trips(pool: AdbcQueuePool | AdbcPool, iterations: int) -> float:
+    """
+    Time `iterations` bare checkout/checkin round trips on one thread.
+
+    Args:
+        pool: The pool under test.
+        iterations: Number of `connect()` / `close()` pairs.
+
+    Returns:
+        Elapsed seconds for the whole loop.
+    """
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        pool.connect().close()
+    return time.perf_counter() - t0
+
+
+def measure_rollback(iterations: int, trials: int) -> float:
+    """
+    Median cost of the bare driver rollback both pools run on checkin, in microseconds.
+
+    Args:
+        iterations: Rollbacks per trial.
+        trials: Number of trials; the median is taken.
+
+    Returns:
+        Microseconds per `rollback()` on a raw DuckDB ADBC connection.
+    """
+
+    def loop(raw: object) -> float:
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            raw.rollback()  # type: ignore[attr-defined]
+        return time.perf_counter() - t0
+
+    with _pool("adbc", 1) as pool, pool.connect() as conn:
+        raw = conn.dbapi_connection
+        loop(raw)  # warm-up
+        elapsed = median(loop(raw) for _ in range(trials))
+    return per_call_us(elapsed, iterations)
+
+
+def measure_single(pool_class: str, iterations: int, trials: int) -> float:
+    """
+    Median uncontended cost of one round trip, in microseconds.
+
+    Args:
+        pool_class: `"queue"` or `"adbc"`.
+        iterations: Round trips per trial.
+        trials: Number of trials; the median is taken.
+
+    Returns:
+        Microseconds per checkout/checkin round trip.
+    """
+    with _pool(pool_class, 1) as pool:
+        round_trips(pool, iterations)  # warm-up: first rollback, code paths
+        elapsed = median(round_trips(pool, iterations) for _ in range(trials))
+    return per_call_us(elapsed, iterations)
+
+
+def measure_threads(pool_class: str, n: int, iterations: int, trials: int) -> float:
+    """
+    Median contended cost of one round trip across `n` threads, in microseconds.
+
+    Args:
+        pool_class: `"queue"` or `"adbc"`.
+        n: Concurrent threads (and pool size).
+        iterations: Round trips per thread per trial.
+        trials: Number of trials; the median is taken.
+
+    Returns:
+        Microseconds of wall-clock per round trip, over all `n * iterations`.
+    """
+    with _pool(pool_class, n) as pool:
+        wall = concurrent_wall(
+            lambda _worker: round_trips(pool, iterations), list(range(n)), n, trials
+        )
+    return per_call_us(wall, n * iterations)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser for the benchmark."""
+    default_n = min(4, os.cpu_count() or 1)
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.checkout_overhead",
+        description="Compare QueuePool and AdbcPool checkout/checkin cost via create_pool.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=20_000,
+        help="Round trips per trial (per thread in the threaded phase; default: 20000).",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=default_n,
+        help=f"Threads for the contended phase (default: min(4, cpu_count)={default_n}).",
+    )
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=5,
+        help="Trials per phase; median is reported (default: 5).",
+    )
+    return parser
+
+
+def main() -> None:
+    """Parse CLI args and run both phases for both pool classes."""
+    args = _build_parser().parse_args()
+    rollback = measure_rollback(args.iterations, args.trials)
+    print(f"[rollback] iterations={args.iterations}: {{'rollback_us': {rollback}}}")
+    single = {pc: measure_single(pc, args.iterations, args.trials) for pc in POOL_CLASSES}
+    result = overhead_report(single["queue"], single["adbc"])
+    print(f"[single] iterations={args.iterations}: {result}")
+    threaded = {
+        pc: measure_threads(pc, args.threads, args.iterations, args.trials) for pc in POOL_CLASSES
+    }
+    result = overhead_report(threaded["queue"], threaded["adbc"])
+    print(f"[threads] N={args.threads} iterations={args.iterations}: {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Pool-creation latency with and without the process-wide driver resolution cache.
+
+Every `create_pool` resolves its driver: a config's `_driver_path()` runs
+`find_spec`, an import and the driver package's path function, and a
+`dbapi_module` build imports the module and inspects its `connect()` signature
+to choose the call shape. `adbc_poolhouse._driver_cache` keeps those answers
+for the life of the process. This script times `create_pool` followed by
+`close_pool` in two modes:
+
+- `cold`: `clear_driver_caches()` before every build, so each one resolves from
+  scratch, as every build did before the cache.
+- `warm`: the cache as a long-running service sees it after its first pool.
+
+Two build paths are measured, both against in-memory SQLite so that opening the
+source connection stays cheap next to the resolution:
+
+- `config`: `create_pool(SQLiteConfig(database=":memory:"))`, the driver-path route.
+- `dbapi`: `create_pool(dbapi_module="adbc_driver_sqlite.dbapi", ...)`, the
+  connect-plan route.
+
+The script prints one `overhead_report` dict per path, with `cold` as the
+baseline; `saved_us` is the resolution cost each build no longer pays. A real
+warehouse login dwarfs it, so it matters for services that build or rebuild many
+pools, not for one. No assertion is made on the numbers; they are
+hardware-dependent.
+
+Run:
+    .venv/bin/python -m benchmarks.pool_creation --iterations 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import TYPE_CHECKING, Any
+
+from adbc_poolhouse import SQLiteConfig, close_pool, create_pool
+from adbc_poolhouse._driver_cache import clear_driver_caches
+from benchmarks._harness import median, overhead_report, per_call_us
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PATHS: dict[str, Callable[[], Any]] = {
+    "config": lambda: create_pool(SQLiteConfig(database=":memory:")),
+    "dbapi": lambda: create_pool(
+        dbapi_module="adbc_driver_sqlite.dbapi", db_kwargs={"uri": ":memory:"}
+    ),
+}
+
+
+def builds(build: Callable[[], Any], iterations: int, *, cold: bool) -> float:
+    """
+    Time `iterations` pool builds and closes on one thread.
+
+    Args:
+        build: Builds one pool.
+        iterations: Number of builds.
+        cold: Clear the driver caches before every build.
+
+    Returns:
+        Elapsed seconds for the whole loop.
+    """
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        if cold:
+            clear_driver_caches()
+        close_pool(build())
+    return time.perf_counter() - t0
+
+
+def measure(path: str, iterations: int, trials: int, *, cold: bool) -> float:
+    """
+    Median cost of one build and close on `path`, in microseconds.
+
+    Args:
+        path: A key of `PATHS`.
+        iterations: Builds per trial.
+        trials: Number of trials; the median is taken.
+        cold: Clear the driver caches before every build.
+
+    Returns:
+        Microseconds per `create_pool` / `close_pool` pair.
+    """
+    build = PATHS[path]
+    builds(build, iterations, cold=cold)  # warm-up: imports, driver library load
+    elapsed = median(builds(build, iterations, cold=cold) for _ in range(trials))
+    return per_call_us(elapsed, iterations)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser for the benchmark."""
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.pool_creation",
+        description="Compare create_pool latency with cold and warm driver resolution caches.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=500,
+        help="Pool builds per trial (default: 500).",
+    )
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=5,
+        help="Trials per mode; median is reported (default: 5).",
+    )
+    return parser
+
+
+def main() -> None:
+    """Parse CLI args and time both modes on both build paths."""
+    args = _build_parser().parse_args()
+    for path in PATHS:
+        cold = measure(path, args.iterations, args.trials, cold=True)
+        warm = measure(path, args.iterations, args.trials, cold=False)
+        result = overhead_report(cold, warm)
+        print(f"[{path}] iterations={args.iterations}: {result}")
+
+
+if __name__ == "__main__":
+    main()
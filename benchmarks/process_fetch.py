@@ -0,0 +1,135 @@
+"""
+Fetch throughput with `fetch_processes`: thread fetches vs worker-process fetches.
+
+`benchmarks/gil_release.py` shows that `fetch_arrow_table` serializes across
+threads: materializing an Arrow table holds the GIL. A pool built with
+`fetch_processes=N` runs `pool.fetch_arrow` in `N` worker processes instead, each
+with its own GIL and connection, and maps each result back from shared memory.
+
+For each `N` in `--n`, both modes run the same wide projection (`HEAVY_FETCH` from
+`gil_release`) through `pool.fetch_arrow`, with `N` barrier-gated threads:
+
+- `threads`: `create_pool(DuckDBConfig(), pool_size=N)`; every fetch runs on a
+  pool connection in the calling thread.
+- `processes`: `create_pool(DuckDBConfig(), fetch_processes=N)`; every fetch runs
+  in a worker process. The processes are started (and warmed) before timing.
+
+Each mode prints the `report` dict (`speedup_x` near `N` means the fetches ran in
+parallel, near `1` that they serialized) and `fetches_per_s`, the batch
+throughput. Expect `threads` to stay flat as `N` grows and `processes` to climb,
+up to the machine's core count. Both modes use in-memory DuckDB (the query reads
+only `range()`), so every worker can open its own database. No assertion is made
+on the numbers; they are hardware-dependent.
+
+Run:
+    .venv/bin/python -m benchmarks.process_fetch --n 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import TYPE_CHECKING
+
+from adbc_poolhouse import DuckDBConfig, close_pool, create_pool
+from benchmarks._harness import concurrent_wall, median, report
+from benchmarks.gil_release import HEAVY_FETCH
+
+if TYPE_CHECKING:
+    from adbc_poolhouse import AdbcQueuePool
+
+MODES = ("threads", "processes")
+
+
+def time_fetch(pool: AdbcQueuePool, rows: int) -> float:
+    """
+    Time one `pool.fetch_arrow` of the heavy projection.
+
+    Args:
+        pool: The pool under test.
+        rows: Row count for the driving `range(...)` projection.
+
+    Returns:
+        The per-call elapsed time in seconds.
+    """
+    t0 = time.perf_counter()
+    pool.fetch_arrow(HEAVY_FETCH.format(rows=rows))
+    return time.perf_counter() - t0
+
+
+def measure(mode: str, n: int, rows: int, trials: int) -> dict[str, float]:
+    """
+    Measure `n` concurrent fetches in one mode.
+
+    Args:
+        mode: `"threads"` or `"processes"`.
+        n: Concurrent fetches, and the pool size or process count.
+        rows: Row count driving the heavy query.
+        trials: Trials per phase; the median is reported.
+
+    Returns:
+        The `report` dict plus `fetches_per_s`.
+    """
+    if mode == "processes":
+        pool = create_pool(DuckDBConfig(), pool_size=1, max_overflow=0, fetch_processes=n)
+    else:
+        pool = create_pool(DuckDBConfig(), pool_size=n, max_overflow=0)
+    try:
+        # Warm up with `n` concurrent fetches: opens every pool connection, or
+        # starts every worker process, outside the timed region.
+        concurrent_wall(lambda p: time_fetch(p, rows), [pool] * n, n, 1)
+        single = median(time_fetch(pool, rows) for _ in range(trials))
+        wall = concurrent_wall(lambda p: time_fetch(p, rows), [pool] * n, n, trials)
+    finally:
+        close_pool(pool)
+    result = report(single, wall, n)
+    result["fetches_per_s"] = n / wall
+    print(f"[{mode}] N={n} rows={rows} trials={trials}: {result}")
+    return result
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser for the benchmark."""
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.process_fetch",
+        description="Compare fetch_arrow throughput on threads and in fetch_processes workers.",
+    )
+    parser.add_argument(
+        "--n",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="Concurrent fetches to measure, one run per value (default: 1 2 4).",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=5_000_000,
+        help="Row count for the heavy query (default: 5_000_000).",
+    )
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=3,
+        help="Trials per phase; median is reported (default: 3).",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=(*MODES, "both"),
+        default="both",
+        help="Which mode(s) to measure (default: both).",
+    )
+    return parser
+
+
+def main() -> None:
+    """Parse CLI args and run the requested measurements."""
+    args = _build_parser().parse_args()
+    modes = MODES if args.mode == "both" else (args.mode,)
+    for n in args.n:
+        for mode in modes:
+            measure(mode, n, args.rows, args.trials)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from adbc_poolhouse._adbc_pool import AdbcPool, AdbcPooledConnection
 from adbc_poolhouse._base_config import BaseWarehouseConfig, WarehouseConfig
 from adbc_poolhouse._bigquery_config import BigQueryConfig
+from adbc_poolhouse._budget import ConnectionBudget, HostConnectionBudget
 from adbc_poolhouse._clickhouse_config import ClickHouseConfig
 from adbc_poolhouse._databricks_config import DatabricksConfig
 from adbc_poolhouse._duckdb_config import DuckDBConfig
@@ -19,10 +21,21 @@ from adbc_poolhouse._mssql_config import MSSQLConfig
 from adbc_poolhouse._mysql_config import MySQLConfig
 from adbc_poolhouse._pool_factory import close_pool, create_pool, managed_pool
 from adbc_poolhouse._postgresql_config import PostgreSQLConfig
+from adbc_poolhouse._prefill import PrefillReport
+from adbc_poolhouse._prometheus import (
+    PrometheusHandler,
+    render_prometheus,
+    write_prometheus_textfile,
+)
 from adbc_poolhouse._quack_config import QuackConfig
+from adbc_poolhouse._queue_pool import AdbcQueuePool
 from adbc_poolhouse._redshift_config import RedshiftConfig
+from adbc_poolhouse._registry import PoolRegistry, get_pool, release_pool
+from adbc_poolhouse._result_store import SharedResultStore
 from adbc_poolhouse._snowflake_config import SnowflakeConfig
 from adbc_poolhouse._sqlite_config import SQLiteConfig
+from adbc_poolhouse._stats import LatencySummary, PoolStats
+from adbc_poolhouse._tracing import disable_tracing, enable_tracing
 from adbc_poolhouse._trino_config import TrinoConfig
 
 if TYPE_CHECKING:
@@ -30,36 +43,61 @@ if TYPE_CHECKING:
     # to keep `import adbc_poolhouse` anyio-free; re-declared here only so static
     # type checkers and IDEs see them as package attributes.
     from adbc_poolhouse._async import (
+        AsyncPoolRegistry,
         close_async_pool,
         create_async_pool,
+        get_async_pool,
         managed_async_pool,
+        open_async_pool,
+        release_async_pool,
     )
 
 __all__ = [
+    "AdbcPool",
+    "AdbcPooledConnection",
+    "AdbcQueuePool",
+    "AsyncPoolRegistry",
     "BaseWarehouseConfig",
     "BigQueryConfig",
     "ClickHouseConfig",
     "ConfigurationError",
+    "ConnectionBudget",
     "ConnectionBusyError",
     "DatabricksConfig",
     "DuckDBConfig",
     "FlightSQLConfig",
+    "HostConnectionBudget",
+    "LatencySummary",
     "MSSQLConfig",
     "MySQLConfig",
+    "PoolRegistry",
+    "PoolStats",
     "PoolhouseError",
     "PostgreSQLConfig",
+    "PrefillReport",
+    "PrometheusHandler",
     "QuackConfig",
     "RedshiftConfig",
     "SnowflakeConfig",
     "SQLiteConfig",
+    "SharedResultStore",
     "TrinoConfig",
     "WarehouseConfig",
     "close_async_pool",
     "close_pool",
     "create_async_pool",
     "create_pool",
+    "disable_tracing",
+    "enable_tracing",
+    "get_async_pool",
+    "get_pool",
     "managed_async_pool",
     "managed_pool",
+    "open_async_pool",
+    "release_async_pool",
+    "release_pool",
+    "render_prometheus",
+    "write_prometheus_textfile",
 ]
 
 # Async entry points exposed lazily (PEP 562). Importing them eagerly would pull
@@ -67,7 +105,17 @@ __all__ = [
 # (PKG-04), so they are resolved from the `_async` subpackage only on first
 # access. If anyio is not installed, the access raises a clear ImportError
 # naming the [async] extra rather than a bare "No module named 'anyio'".
-_LAZY_ASYNC_NAMES = frozenset({"create_async_pool", "managed_async_pool", "close_async_pool"})
+_LAZY_ASYNC_NAMES = frozenset(
+    {
+        "create_async_pool",
+        "open_async_pool",
+        "managed_async_pool",
+        "close_async_pool",
+        "AsyncPoolRegistry",
+        "get_async_pool",
+        "release_async_pool",
+    }
+)
 
 
 def __getattr__(name: str) -> object:
@@ -0,0 +1,670 @@
+"""
+`AdbcPool`: a lean native connection pool, selected with `pool_class="adbc"`.
+
+Every `QueuePool` checkout builds a `_ConnectionFairy` around a
+`_ConnectionRecord`, runs the recycle / invalidation checks, dispatches the
+`checkout` event, and on checkin dispatches `reset` --- tens of microseconds and
+several allocations per round trip. That is noise next to a warehouse query but
+visible next to a sub-millisecond DuckDB one.
+
+`AdbcPool` keeps only what an ADBC pool needs:
+
+- idle connections live in a `collections.deque` of `__slots__` records guarded
+  by one `threading.Lock`; checkout and checkin are a pop / append under it
+  (checkout pops the right end with `use_lifo`, the left end otherwise);
+- the checked-out proxy is a single `__slots__` object;
+- checkin closes open cursors (releasing Arrow allocators) and rolls back
+  inline, instead of through the `reset` event;
+- waiting for a connection when the pool is exhausted uses a
+  `threading.Condition` on the same lock, with the pool's `timeout`.
+
+The behaviour callers rely on is kept: `connect()` returns a
+`PoolProxiedConnection` (usable as a context manager, `close()` returns it to
+the pool), overflow connections are closed on checkin, checkout recycles
+connections older than `recycle`, an exhausted pool raises
+`sqlalchemy.exc.TimeoutError`, and `size()` / `checkedin()` / `checkedout()` /
+`overflow()` / `dispose()` mean what they mean on `QueuePool`. What is not kept
+is the SQLAlchemy pool event system: listeners registered with
+`sqlalchemy.event.listen` have nothing to attach to. `stats()` records the same
+checkout, hold-time and connection-open figures as `AdbcQueuePool.stats()`.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import sqlalchemy.exc
+from sqlalchemy.pool import PoolProxiedConnection
+
+from adbc_poolhouse import _fork
+from adbc_poolhouse._maintenance import _IDLE_SINCE
+from adbc_poolhouse._procfetch import fetch_table
+from adbc_poolhouse._stats import PoolRecorder, TimedCreator
+from adbc_poolhouse._stream import stream_query
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import pyarrow
+    from sqlalchemy.engine.interfaces import DBAPIConnection, DBAPICursor
+
+    from adbc_poolhouse._autoscale import PoolAutoscaler
+    from adbc_poolhouse._budget import BudgetGate
+    from adbc_poolhouse._maintenance import PoolMaintainer
+    from adbc_poolhouse._prefill import PrefillReport
+    from adbc_poolhouse._procfetch import ConnectSpec, ProcessFetcher
+    from adbc_poolhouse._result_store import SharedResultStore
+    from adbc_poolhouse._stats import PoolStats
+
+logger = logging.getLogger(__name__)
+
+
+def _close_open_cursors(dbapi_conn: object) -> None:
+    # ADBC connections track their cursors in a `_cursors` WeakSet; closing the
+    # open ones releases their Arrow record batch readers.
+    for cur in list(getattr(dbapi_conn, "_cursors", ())):
+        if not getattr(cur, "_closed", True):
+            with contextlib.suppress(Exception):
+                cur.close()
+
+
+class _AdbcRecord:
+    """One pooled ADBC connection and the bookkeeping the pool keeps for it."""
+
+    __slots__ = ("checked_out_at", "dbapi_connection", "gate", "info", "pid", "starttime")
+
+    def __init__(
+        self, creator: Callable[[], DBAPIConnection], gate: BudgetGate | None = None
+    ) -> None:
+        self.info: dict[Any, Any] = {}
+        self.starttime = time.time()
+        self.checked_out_at = 0.0
+        self.dbapi_connection: DBAPIConnection | None = creator()
+        # The process the connection belongs to; see `adbc_poolhouse._fork`.
+        self.pid = os.getpid()
+        # Gets the connection's budget lease back on close; see `adbc_poolhouse._budget`.
+        self.gate = gate
+
+    def reconnect(self, creator: Callable[[], DBAPIConnection]) -> None:
+        """Close the connection and open a fresh one in its place."""
+        self.close()
+        self.info.clear()
+        self.starttime = time.time()
+        self.dbapi_connection = creator()
+        self.pid = os.getpid()
+
+    def close(self) -> None:
+        """Close the underlying connection. Errors are logged, not raised."""
+        conn = self.dbapi_connection
+        if conn is None:
+            return
+        self.dbapi_connection = None
+        try:
+            conn.close()
+        except Exception:
+            logger.debug("Exception closing pooled ADBC connection", exc_info=True)
+        if self.gate is not None:
+            self.gate.release(conn)
+
+
+class AdbcPooledConnection(PoolProxiedConnection):
+    """
+    A connection checked out of an `AdbcPool`.
+
+    Proxies the ADBC DBAPI connection: `cursor()`, `commit()`, `rollback()` and
+    any other attribute (e.g. `adbc_get_info`) go straight to it. `close()`
+    returns the connection to the pool instead of closing it; using the object as
+    a context manager does the same on exit.
+    """
+
+    __slots__ = ("_pool", "_record", "dbapi_connection")
+
+    def __init__(self, pool: AdbcPool, record: _AdbcRecord) -> None:
+        self._pool: AdbcPool | None = pool
+        self._record: _AdbcRecord | None = record
+        self.dbapi_connection: DBAPIConnection | None = record.dbapi_connection
+
+    def cursor(self, *args: Any, **kwargs: Any) -> DBAPICursor:
+        """Open a cursor on the underlying connection."""
+        return self._live().cursor(*args, **kwargs)
+
+    def commit(self) -> None:
+        """Commit on the underlying connection."""
+        self._live().commit()
+
+    def rollback(self) -> None:
+        """Roll back on the underlying connection."""
+        self._live().rollback()
+
+    def __getattr__(self, key: str) -> Any:
+        if key in AdbcPooledConnection.__slots__:
+            # An unset slot (only possible mid-construction): never proxy it.
+            raise AttributeError(key)
+        return getattr(self._live(), key)
+
+    def _live(self) -> DBAPIConnection:
+        conn = self.dbapi_connection
+        if conn is None:
+            raise sqlalchemy.exc.InvalidRequestError("This connection is closed")
+        return conn
+
+    @property
+    def driver_connection(self) -> Any:
+        """The ADBC DBAPI connection (the same object as `dbapi_connection`)."""
+        return self.dbapi_connection
+
+    @property
+    def info(self) -> dict[Any, Any]:
+        """Per-connection dict that survives checkin, like `QueuePool`'s `info`."""
+        record = self._record
+        return record.info if record is not None else {}
+
+    @property
+    def record_info(self) -> dict[Any, Any] | None:
+        """Same as `info`; `AdbcPool` keeps one dict per pooled connection."""
+        record = self._record
+        return record.info if record is not None else None
+
+    @property
+    def is_valid(self) -> bool:
+        """`True` while this proxy still refers to an open DBAPI connection."""
+        return self.dbapi_connection is not None
+
+    @property
+    def is_detached(self) -> bool:
+        """`True` after `detach()`."""
+        return self._pool is None and self._record is not None
+
+    def close(self) -> None:
+        """Return the connection to the pool. Idempotent."""
+        record, pool = self._record, self._pool
+        self._record = None
+        self.dbapi_connection = None
+        if record is None:
+            return
+        if pool is None:
+            # Detached: the connection is ours alone to close.
+            record.close()
+            return
+        pool._checkin(record)
+
+    def invalidate(self, e: BaseException | None = None, soft: bool = False) -> None:
+        """
+        Close the underlying connection and release its pool slot.
+
+        Args:
+            e: The error that prompted the invalidation, for the log.
+            soft: Accepted for `QueuePool` compatibility; `AdbcPool` always
+                closes the connection immediately.
+        """
+        del soft
+        record, pool = self._record, self._pool
+        self._record = None
+        self.dbapi_connection = None
+        if record is None:
+            return
+        if e is not None:
+            logger.info("Invalidating pooled ADBC connection: %r", e)
+        if pool is None:
+            record.close()
+        else:
+            pool._invalidate(record)
+
+    def detach(self) -> None:
+        """Remove the connection from the pool; `close()` will then really close it."""
+        pool = self._pool
+        if pool is None or self._record is None:
+            return
+        self._pool = None
+        pool._release_slot()
+
+    def __del__(self) -> None:
+        # A proxy dropped without close() would otherwise hold its slot forever.
+        if self._record is not None:
+            with contextlib.suppress(Exception):
+                self.close()
+
+
+class AdbcPool:
+    """
+    Native ADBC connection pool, the `pool_class="adbc"` alternative to `QueuePool`.
+
+    Returned by [`create_pool`][adbc_poolhouse.create_pool] when called with
+    `pool_class="adbc"`. Connections are cloned from the pool's ADBC source
+    connection exactly as with the default pool; only the pooling machinery is
+    different, and much lighter per checkout. Close it with
+    [`close_pool`][adbc_poolhouse.close_pool].
+
+    Pool sizing follows `QueuePool`: up to `pool_size` idle connections are
+    kept, up to `max_overflow` more may be open while demand is high (closed
+    again on checkin), and a checkout that finds the pool at
+    `pool_size + max_overflow` waits up to `timeout` seconds before raising
+    `sqlalchemy.exc.TimeoutError`. A negative `max_overflow` means no limit.
+
+    Attributes:
+        prefill_report: Timings from the eager pre-fill when the pool was created
+            with `prefill > 0`, else `None`.
+
+    Example:
+        ```python
+        from adbc_poolhouse import DuckDBConfig, close_pool, create_pool
+
+        pool = create_pool(DuckDBConfig(database="/tmp/wh.db"), pool_class="adbc")
+        with pool.connect() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT 1")
+        close_pool(pool)
+        ```
+    """
+
+    prefill_report: PrefillReport | None = None
+    _adbc_maintainer: PoolMaintainer | None = None
+    _adbc_autoscaler: PoolAutoscaler | None = None
+    _adbc_fetcher: ProcessFetcher | None = None
+    # `db.system` on trace spans; set by the factory from the config.
+    _adbc_backend = "adbc"
+    # `pool` and `config` labels in metrics exports; set by the factory.
+    _adbc_name = ""
+    _adbc_config_class = ""
+    _adbc_source: Any = None
+    # How to reopen the source, and what to pre-fill, in a forked child.
+    _adbc_connect_spec: ConnectSpec | None = None
+    _adbc_fork_prefill = 0
+    # Set by a fork reset that owes the pool its `fork_prefill` warm-up.
+    _adbc_warm_pending = False
+    # Takes a connection budget lease per open; see `adbc_poolhouse._budget`.
+    _adbc_gate: BudgetGate | None = None
+
+    def __init__(
+        self,
+        creator: Callable[[], DBAPIConnection],
+        *,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        timeout: float = 30.0,
+        recycle: int = -1,
+        use_lifo: bool = False,
+    ) -> None:
+        """
+        Build an empty pool.
+
+        Args:
+            creator: Zero-argument callable opening a new connection (the ADBC
+                source's `adbc_clone`).
+            pool_size: Idle connections to keep.
+            max_overflow: Extra connections allowed above `pool_size`; negative
+                for no limit.
+            timeout: Seconds a checkout waits when the pool is exhausted.
+            recycle: Seconds after which a connection is reopened on checkout;
+                `-1` disables recycling.
+            use_lifo: Hand out the most recently returned connection first
+                instead of the longest idle, as `QueuePool(use_lifo=True)`.
+        """
+        self._adbc_stats = PoolRecorder()
+        self._creator = TimedCreator(creator, self._adbc_stats)
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._timeout = timeout
+        self._recycle = recycle
+        self._use_lifo = use_lifo
+        self._idle: collections.deque[_AdbcRecord] = collections.deque()
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        # Connections open or being opened: idle + checked out + in flight.
+        self._open = 0
+        self._checkout_hooks: tuple[Callable[..., None], ...] = ()
+        self._adbc_pid = os.getpid()
+
+    # -- checkout / checkin --------------------------------------------------
+
+    def connect(self) -> AdbcPooledConnection:
+        """
+        Check out a connection, opening one if none is idle and there is room.
+
+        Returns:
+            The checked-out connection. Return it with `close()` or a `with`
+            block.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If the pool stays exhausted for
+                `timeout` seconds.
+        """
+        return self._adbc_checkout(time.perf_counter())
+
+    def _adbc_checkout(self, start: float) -> AdbcPooledConnection:
+        # `connect()`, with the checkout wait measured from `start`. `AsyncPool`
+        # passes the moment its task started queueing for a checkout slot.
+        if self._adbc_pid != os.getpid():
+            _fork.reset(self)
+        if self._adbc_warm_pending:
+            _fork.warm_up(self)
+        record: _AdbcRecord | None = None
+        with self._lock:
+            if self._idle:
+                record = self._take_idle()
+            elif self._has_room():
+                self._open += 1
+            else:
+                try:
+                    record = self._wait_for_idle()
+                except sqlalchemy.exc.TimeoutError:
+                    self._adbc_stats.timed_out()
+                    raise
+        if record is None:
+            record = self._open_record()
+        elif self._recycle > -1 and time.time() - record.starttime > self._recycle:
+            self._reconnect(record)
+        for hook in self._checkout_hooks:
+            hook()
+        now = time.perf_counter()
+        record.checked_out_at = now
+        self._adbc_stats.checked_out(now - start)
+        autoscaler = self._adbc_autoscaler
+        if autoscaler is not None:
+            autoscaler.observe(now - start)
+        return AdbcPooledConnection(self, record)
+
+    def _wait_for_idle(self) -> _AdbcRecord | None:
+        # Called with the lock held. Returns an idle record, or None when a slot
+        # was reserved for a new connection instead.
+        deadline = time.monotonic() + self._timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._available.wait(remaining):
+                raise sqlalchemy.exc.TimeoutError(
+                    f"AdbcPool limit of size {self._pool_size} overflow "
+                    f"{self._max_overflow} reached, connection timed out, "
+                    f"timeout {self._timeout:.2f}"
+                )
+            if self._idle:
+                return self._take_idle()
+            if self._has_room():
+                self._open += 1
+                return None
+
+    def _take_idle(self) -> _AdbcRecord:
+        # Called with the lock held and the idle deque non-empty. Checkin
+        # appends on the right, so the left end has been idle longest.
+        return self._idle.pop() if self._use_lifo else self._idle.popleft()
+
+    def _has_room(self) -> bool:
+        return self._max_overflow < 0 or self._open < self._pool_size + self._max_overflow
+
+    def _open_record(self) -> _AdbcRecord:
+        # A slot has already been reserved; give it back if the open fails.
+        try:
+            return _AdbcRecord(self._creator, self._adbc_gate)
+        except BaseException:
+            self._release_slot()
+            raise
+
+    def _reconnect(self, record: _AdbcRecord) -> None:
+        try:
+            record.reconnect(self._creator)
+        except BaseException:
+            self._release_slot()
+            raise
+
+    def _checkin(self, record: _AdbcRecord) -> None:
+        if record.pid != self._adbc_pid:
+            # Checked out before a fork: the parent's, so neither pooled nor closed.
+            _fork.abandon(record)
+            return
+        self._adbc_stats.checked_in(time.perf_counter() - record.checked_out_at)
+        conn = record.dbapi_connection
+        try:
+            _close_open_cursors(conn)
+            if conn is not None:
+                conn.rollback()
+        except Exception:
+            logger.error("Exception during reset of pooled ADBC connection", exc_info=True)
+            self._discard(record)
+            return
+        self._return(record)
+
+    def _return(self, record: _AdbcRecord) -> None:
+        record.info[_IDLE_SINCE] = time.time()
+        with self._lock:
+            if len(self._idle) < self._pool_size:
+                self._idle.append(record)
+                self._available.notify()
+                return
+            # Overflow connection: close it rather than keep it idle.
+            self._open -= 1
+            self._available.notify()
+        record.close()
+
+    def _invalidate(self, record: _AdbcRecord) -> None:
+        if record.pid != self._adbc_pid:
+            _fork.abandon(record)
+            return
+        self._adbc_stats.checked_in(time.perf_counter() - record.checked_out_at)
+        self._adbc_stats.invalidated()
+        self._discard(record)
+
+    def _discard(self, record: _AdbcRecord) -> None:
+        record.close()
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._open -= 1
+            self._available.notify()
+
+    # -- QueuePool-compatible status -------------------------------------------
+
+    def size(self) -> int:
+        """Return `pool_size`."""
+        return self._pool_size
+
+    def timeout(self) -> float:
+        """Return the checkout timeout in seconds."""
+        return self._timeout
+
+    def checkedin(self) -> int:
+        """Return the number of idle connections."""
+        return len(self._idle)
+
+    def checkedout(self) -> int:
+        """Return the number of connections checked out (or being opened)."""
+        with self._lock:
+            return self._open - len(self._idle)
+
+    def overflow(self) -> int:
+        """Return open connections minus `pool_size` (negative while below it)."""
+        return self._open - self._pool_size
+
+    def status(self) -> str:
+        """Return a one-line summary, in the format of `QueuePool.status()`."""
+        return (
+            f"Pool size: {self.size()}  Connections in pool: {self.checkedin()} "
+            f"Current Overflow: {self.overflow()} "
+            f"Current Checked out connections: {self.checkedout()}"
+        )
+
+    def stats(self) -> PoolStats:
+        """
+        Snapshot the pool's current state and recorded latencies.
+
+        Returns:
+            Connection counts right now, plus checkout / timeout counts and
+            checkout-wait, hold-time and connection-open percentiles over the
+            pool's lifetime.
+        """
+        return self._adbc_stats.snapshot(self)
+
+    def stream(
+        self, operation: str, parameters: Any = None
+    ) -> contextlib.AbstractContextManager[pyarrow.RecordBatchReader]:
+        """
+        Run a query and stream its result without materializing it.
+
+        Checks a connection out, executes `operation` and yields a
+        `pyarrow.RecordBatchReader` that pulls batches from the driver as it is
+        read. The connection stays checked out while the reader is live and is
+        returned to the pool when the reader is exhausted or the `with` block
+        exits, whichever comes first. Do not keep the reader past the block.
+
+        Args:
+            operation: The SQL text to execute.
+            parameters: Bound parameters, forwarded to the dbapi cursor.
+
+        Returns:
+            A context manager yielding the reader.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If the pool stays exhausted for
+                `timeout` seconds.
+
+        Example:
+            ```python
+            with pool.stream("SELECT * FROM events") as reader:
+                for batch in reader:
+                    sink.write(batch)
+            ```
+        """
+        return stream_query(self, operation, parameters)
+
+    def fetch_arrow(
+        self, operation: str, parameters: Any = None, *, shared: SharedResultStore | None = None
+    ) -> pyarrow.Table:
+        """
+        Run a query and return its whole result as a `pyarrow.Table`.
+
+        On a pool built with `fetch_processes`, the query runs in one of the
+        pool's worker processes, on that process's own connection, and the table
+        comes back through shared memory; no pool connection is checked out.
+        Otherwise a connection is checked out for the query and checked in
+        before this returns.
+
+        With `shared`, the result is taken from the store if another call, in
+        this process or any other, already put it there. On a miss it is fetched
+        as above and stored, and concurrent misses on the same query wait for
+        that one fetch.
+
+        Args:
+            operation: The SQL text to execute.
+            parameters: Bound parameters, forwarded to the dbapi cursor. With
+                `fetch_processes` they must be picklable.
+            shared: A `SharedResultStore` to read the result from, or to fetch
+                it into. Default: `None`.
+
+        Returns:
+            The materialized result.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If the query needs a pool connection and
+                the pool stays exhausted for `timeout` seconds.
+        """
+        return fetch_table(self, operation, parameters, shared)
+
+    def dispose(self) -> None:
+        """
+        Close every idle connection.
+
+        Checked-out connections are unaffected and return to the pool as usual.
+        """
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+            self._available.notify_all()
+        for record in idle:
+            record.close()
+
+    # -- maintainer hooks ------------------------------------------------------
+
+    def _create_connection(self) -> _AdbcRecord:
+        return _AdbcRecord(self._creator, self._adbc_gate)
+
+    def _adbc_add_idle(self) -> bool:
+        with self._lock:
+            if not self._has_room():
+                return False
+            self._open += 1
+        self._return(self._open_record())
+        return True
+
+    def _adbc_evict_idle(self) -> bool:
+        with self._lock:
+            if not self._idle:
+                return False
+            record = self._idle.popleft()
+            self._open -= 1
+        record.close()
+        return True
+
+    def _adbc_evict_record(self, record: _AdbcRecord) -> bool:
+        with self._lock:
+            try:
+                self._idle.remove(record)
+            except ValueError:
+                return False
+            self._open -= 1
+            self._available.notify()
+        record.close()
+        return True
+
+    def _adbc_idle_records(self) -> list[_AdbcRecord]:
+        with self._lock:
+            return list(self._idle)
+
+    def _adbc_replace_idle(self, old: _AdbcRecord) -> bool:
+        # Under a budget the replacement takes over `old`'s leases (see
+        # `AdbcQueuePool._adbc_replace_idle`).
+        gate = self._adbc_gate
+        with gate.replacing() if gate is not None else contextlib.nullcontext():
+            new = _AdbcRecord(self._creator, gate)
+        with self._lock:
+            try:
+                index = self._idle.index(old)
+            except ValueError:
+                index = -1
+            else:
+                self._idle[index] = new
+        if index < 0:
+            new.close()
+            return False
+        if gate is not None:
+            gate.hand_over(old.dbapi_connection, new.dbapi_connection)
+        old.close()
+        return True
+
+    def _adbc_resize(self, pool_size: int) -> None:
+        with self._lock:
+            self._pool_size = pool_size
+            # Waiters re-check for room under the new ceiling.
+            self._available.notify_all()
+
+    def _adbc_listen_checkout(self, fn: Callable[..., None]) -> None:
+        self._checkout_hooks = (*self._checkout_hooks, fn)
+
+    def _adbc_remove_checkout(self, fn: Callable[..., None]) -> None:
+        self._checkout_hooks = tuple(h for h in self._checkout_hooks if h is not fn)
+
+    # -- fork hooks (see `adbc_poolhouse._fork`) -------------------------------
+
+    def _adbc_forget(self) -> list[_AdbcRecord]:
+        # Start over empty in a forked child, handing back the inherited idle
+        # records for the caller to keep unclosed.
+        inherited = list(self._idle)
+        self._idle = collections.deque()
+        self._open = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._adbc_stats = PoolRecorder()
+        self._creator = TimedCreator(self._creator.creator, self._adbc_stats)
+        return inherited
+
+    def _adbc_set_creator(self, creator: Callable[[], DBAPIConnection]) -> None:
+        # A budget gate stays in front of whatever opens the connections.
+        if self._adbc_gate is not None:
+            self._adbc_gate.creator = creator
+        else:
+            self._creator.creator = creator
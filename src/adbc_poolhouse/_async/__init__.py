@@ -16,10 +16,20 @@ from adbc_poolhouse._async._factory import (
     close_async_pool,
     create_async_pool,
     managed_async_pool,
+    open_async_pool,
+)
+from adbc_poolhouse._async._registry import (
+    AsyncPoolRegistry,
+    get_async_pool,
+    release_async_pool,
 )
 
 __all__ = [
+    "AsyncPoolRegistry",
     "close_async_pool",
     "create_async_pool",
+    "get_async_pool",
     "managed_async_pool",
+    "open_async_pool",
+    "release_async_pool",
 ]
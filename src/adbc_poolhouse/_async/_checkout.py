@@ -0,0 +1,133 @@
+"""
+`CheckoutQueue`: the event-loop-native wait for a free pool connection.
+
+Before this existed, `AsyncPool.connect` offloaded the blocking
+`QueuePool.connect()` and, on an exhausted pool, a worker thread sat inside
+SQLAlchemy's queue holding a limiter token for up to `timeout` seconds. With
+more waiting tasks than connections every token ended up parked that way, and
+the check-ins that would have freed a connection queued behind them for a token.
+
+`AsyncPool` now counts checkouts itself. A task takes a checkout slot from the
+queue before it offloads anything; with a slot in hand the sync pool has an idle
+connection or room to open one, so the offloaded call only pops, clones or
+recycles and never waits. Returning the connection hands its slot straight to
+the longest-waiting task. Waiting is a plain `await` on an `anyio.Event`: no
+thread, no token.
+
+The queue only runs on the event loop, so it needs no lock: every check and
+update between two `await`s is atomic with respect to other tasks. That holds
+for one loop only: `BudgetCheckoutQueue`, shared by every async pool on one
+`ConnectionBudget`, refuses a second loop.
+"""
+
+from __future__ import annotations
+
+import collections
+
+import anyio
+import anyio.lowlevel
+
+from adbc_poolhouse._exceptions import ConfigurationError
+
+
+class CheckoutQueue:
+    """
+    FIFO of tasks waiting for one of `total` checkout slots.
+
+    Args:
+        total: The number of slots, `pool_size + max_overflow`.
+    """
+
+    __slots__ = ("_waiters", "held", "total")
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.held = 0
+        self._waiters: collections.deque[anyio.Event] = collections.deque()
+
+    @property
+    def waiting(self) -> int:
+        """Tasks currently queued for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """
+        Take a slot, waiting in line if none is free.
+
+        A free slot is taken without a checkpoint only when nobody is queued, so
+        a new arrival never overtakes a waiting task. When the wait is cancelled
+        after a slot was already handed over, the slot is passed on to the next
+        waiter rather than lost.
+        """
+        if self.held < self.total and not self._waiters:
+            self.held += 1
+            return
+        handoff = anyio.Event()
+        self._waiters.append(handoff)
+        try:
+            await handoff.wait()
+        except BaseException:
+            if handoff.is_set():
+                self.release()
+            else:
+                self._waiters.remove(handoff)
+            raise
+
+    def release(self) -> None:
+        """Give a slot back, handing it to the longest-waiting task if any."""
+        if self._waiters and self.held <= self.total:
+            # The slot changes hands: `held` stays the same.
+            self._waiters.popleft().set()
+        else:
+            self.held -= 1
+
+    def resize(self, total: int) -> None:
+        """
+        Change the slot count, waking queued tasks into any new slots.
+
+        Shrinking never takes a slot away; `release` retires slots above the new
+        total as they come back.
+
+        Args:
+            total: The new slot count.
+        """
+        self.total = total
+        while self._waiters and self.held < total:
+            self.held += 1
+            self._waiters.popleft().set()
+
+
+class BudgetCheckoutQueue(CheckoutQueue):
+    """
+    The checkout queue of a `ConnectionBudget`, shared by its async pools.
+
+    Bound to the event loop of the first task that takes a slot. Its waiters'
+    `anyio.Event`s belong to that loop, and a task on another loop would
+    update `held` without the single-loop atomicity the queue relies on.
+
+    Args:
+        total: The number of slots, the budget's `limit`.
+    """
+
+    __slots__ = ("_loop",)
+
+    def __init__(self, total: int) -> None:
+        super().__init__(total)
+        self._loop: anyio.lowlevel.EventLoopToken | None = None
+
+    async def acquire(self) -> None:
+        """
+        Take a slot, as `CheckoutQueue.acquire`, on the queue's own event loop.
+
+        Raises:
+            ConfigurationError: If the budget's slots were first taken on another
+                event loop.
+        """
+        loop = anyio.lowlevel.current_token()
+        if self._loop is None:
+            self._loop = loop
+        elif loop != self._loop:
+            raise ConfigurationError(
+                "a ConnectionBudget can be shared by async pools on one event loop only"
+            )
+        await super().acquire()
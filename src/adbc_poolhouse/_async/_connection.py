@@ -25,6 +25,11 @@ Three structural guarantees live here:
   (`_release_arrow_allocators`) unchanged, so Arrow allocators are released on the
   normal path with no new cleanup code.
 
+Returning the connection --- by `close`, `__aexit__` or `invalidate`, whichever
+comes first --- also gives the owning pool's checkout slot back through the
+`on_release` callback, exactly once, so the next task queued in
+`AsyncPool.connect` can proceed.
+
 The check-in routes through the fairy's own methods (`fairy.cursor`,
 `fairy.commit`, `fairy.rollback`, `fairy.close`), which SQLAlchemy's
 `_ConnectionFairy` proxies to the underlying dbapi `Connection`; no
@@ -35,6 +40,7 @@ DuckDB driver).
 from __future__ import annotations
 
 import contextlib
+import threading
 from typing import TYPE_CHECKING, cast
 
 import anyio
@@ -44,13 +50,14 @@ from adbc_poolhouse._async._offload import offload
 from adbc_poolhouse._exceptions import ConnectionBusyError
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
     from types import TracebackType
 
     from anyio import CapacityLimiter
     from sqlalchemy.pool import PoolProxiedConnection
 
     from adbc_poolhouse._async._cursor import _SyncCursor
+    from adbc_poolhouse._stats import PoolRecorder
 
 
 class AsyncConnection:
@@ -80,6 +87,8 @@ class AsyncConnection:
             poison-recovery `invalidate` offloads through, kept separate from the
             shared pool `limiter` so recovery never contends for the pool token the
             just-aborted worker is still releasing (WR-03).
+        _fetch_limiter: The owning pool's fetch limiter, which this connection's
+            cursors take before offloading a fetch, or `None`.
 
     Example:
         ```python
@@ -99,6 +108,11 @@ class AsyncConnection:
         self,
         fairy: PoolProxiedConnection,
         limiter: CapacityLimiter,
+        *,
+        backend: str = "adbc",
+        recorder: PoolRecorder | None = None,
+        on_release: Callable[[], None] | None = None,
+        fetch_limiter: CapacityLimiter | None = None,
     ) -> None:
         """
         Bind a checked-out sync connection to its pool limiter.
@@ -109,9 +123,25 @@ class AsyncConnection:
                 `QueuePool.connect()`.
             limiter: The owning pool's `anyio.CapacityLimiter`, threaded into
                 every offloaded call on this connection and its cursors.
+            backend: The `db.system` value for trace spans from this
+                connection's cursors.
+            recorder: The owning pool's statistics recorder, which counts calls
+                aborted mid-flight. `None` records nothing.
+            on_release: Called once, on the event loop, when the connection has
+                been returned to the pool or invalidated. `AsyncPool` passes its
+                checkout queue's `release`.
+            fetch_limiter: The owning pool's fetch limiter. Cursor fetches wait
+                for one of its tokens before offloading. `None` (the default)
+                bounds fetches by `limiter` alone.
         """
         self._fairy = fairy
         self._limiter = limiter
+        self._backend = backend
+        self._recorder = recorder
+        self._on_release = on_release
+        self._fetch_limiter = fetch_limiter
+        # The event-loop thread: `__del__` only releases the checkout slot there.
+        self._loop_thread = threading.get_ident()
         self._in_use = False
         # Poison-recovery (`invalidate`) runs off a DEDICATED 1-token limiter, not
         # the pool's shared `limiter` (WR-03). Teardown is not throughput-bounded,
@@ -144,6 +174,12 @@ class AsyncConnection:
         """Release the connection after an offloaded call (call from `finally`)."""
         self._in_use = False
 
+    def _released(self) -> None:
+        """Run `on_release` the first time the connection leaves our hands."""
+        on_release, self._on_release = self._on_release, None
+        if on_release is not None:
+            on_release()
+
     @contextlib.contextmanager
     def _offloading(self) -> Generator[None]:
         """
@@ -244,7 +280,10 @@ class AsyncConnection:
                 already in flight.
         """
         with self._offloading(), anyio.CancelScope(shield=True):
-            await offload(self._fairy.close, limiter=self._limiter)
+            try:
+                await offload(self._fairy.close, limiter=self._limiter)
+            finally:
+                self._released()
 
     async def invalidate(self) -> None:
         """
@@ -274,7 +313,10 @@ class AsyncConnection:
         safe no-op (probe-confirmed).
         """
         with anyio.CancelScope(shield=True):
-            await offload(self._fairy.invalidate, limiter=self._teardown_limiter)
+            try:
+                await offload(self._fairy.invalidate, limiter=self._teardown_limiter)
+            finally:
+                self._released()
 
     async def __aenter__(self) -> AsyncConnection:
         """
@@ -308,4 +350,18 @@ class AsyncConnection:
             tb: The traceback if the block raised, else `None`.
         """
         with anyio.CancelScope(shield=True):
-            await offload(self._fairy.close, limiter=self._limiter)
+            try:
+                await offload(self._fairy.close, limiter=self._limiter)
+            finally:
+                self._released()
+
+    def __del__(self) -> None:
+        # Dropped without close(): the fairy returns itself to the sync pool when
+        # collected, and the checkout slot must follow it. The checkout queue is
+        # loop-bound, so this is only safe on the loop thread.
+        if (
+            getattr(self, "_on_release", None) is not None
+            and threading.get_ident() == self._loop_thread
+        ):
+            with contextlib.suppress(Exception):
+                self._released()
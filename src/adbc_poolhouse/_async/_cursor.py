@@ -23,6 +23,20 @@ Two deliberate non-offloads:
   or hands back a streaming `RecordBatchReader`, which would dangle once the cursor
   closed (Pitfall 7).
 
+Materializing fetches (`fetchall`, `fetchmany`, `fetch_arrow_table`) first wait
+on the event loop for a token from the pool's fetch limiter, when it has one,
+and only then offload. `fetchone` returns a single row and is not gated.
+
+Results too large to materialize are streamed instead: `stream_batches` is an
+async context manager whose block owns a task group. A worker thread reads the
+driver's `RecordBatchReader` and hands each batch to the loop through a bounded
+memory channel, which the block iterates. The worker blocks while `prefetch`
+batches are waiting, so a slow consumer holds back the read. Only batches cross
+to the loop, never the reader, and the connection stays claimed by `_in_use`
+until the block exits. A driver error is carried through the channel and raised
+where the batches stop rather than from the producer task, so it never cancels
+the consumer's code between batches.
+
 Worker exceptions are never re-wrapped (ACUR-06/EDGE-17): the single
 [`offload`][adbc_poolhouse._async._offload.offload] chokepoint re-raises an
 `AdbcError` with its exact type and traceback, and nothing here catches it.
@@ -30,19 +44,24 @@ Worker exceptions are never re-wrapped (ACUR-06/EDGE-17): the single
 
 from __future__ import annotations
 
+import contextlib
 from typing import TYPE_CHECKING, Protocol
 
 import anyio
+import anyio.from_thread
 
+from adbc_poolhouse import _tracing
 from adbc_poolhouse._async._cancel import cancellable_offload
 from adbc_poolhouse._async._offload import offload
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncGenerator, Sequence
+    from contextlib import AbstractAsyncContextManager
     from types import TracebackType
 
     import pyarrow
     from anyio import CapacityLimiter
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
     from adbc_poolhouse._async._connection import AsyncConnection
 
@@ -70,10 +89,47 @@ class _SyncCursor(Protocol):
     def fetchmany(self, size: int = ..., /) -> Sequence[object]: ...
     def fetchall(self) -> Sequence[object]: ...
     def fetch_arrow_table(self) -> pyarrow.Table: ...
+    def fetch_record_batch(self) -> pyarrow.RecordBatchReader: ...
     def adbc_cancel(self) -> None: ...
     def close(self) -> None: ...
 
 
+class _BatchStream:
+    """
+    The batches of one `AsyncCursor.stream_batches` block.
+
+    Iterates the receiving end of the worker's channel. When the channel ends
+    because the worker's read failed, the driver error is raised here, bare,
+    in place of the end of iteration.
+    """
+
+    __slots__ = ("_failure", "_receive")
+
+    def __init__(
+        self,
+        receive: MemoryObjectReceiveStream[pyarrow.RecordBatch],
+        failure: dict[str, Exception],
+    ) -> None:
+        """Iterate `receive`; `failure` holds the worker's error, if any."""
+        self._receive = receive
+        self._failure = failure
+
+    def __aiter__(self) -> _BatchStream:
+        """Return self."""
+        return self
+
+    async def __anext__(self) -> pyarrow.RecordBatch:
+        """Return the next batch, or raise the error that ended the read."""
+        try:
+            return await self._receive.receive()
+        except anyio.EndOfStream:
+            pass
+        exc = self._failure.pop("exc", None)
+        if exc is not None:
+            raise exc
+        raise StopAsyncIteration
+
+
 class AsyncCursor:
     """
     Async wrapper over a sync ADBC cursor.
@@ -127,6 +183,12 @@ class AsyncCursor:
         self._limiter = limiter
         self._owner = owner
 
+    def _fetch_slot(self) -> AbstractAsyncContextManager[object]:
+        # The pool's fetch limiter, or a no-op when it has none. Acquired inside
+        # the `_in_use` guard, so an aliased caller is still rejected at once.
+        limiter = self._owner._fetch_limiter  # noqa: SLF001
+        return contextlib.nullcontext() if limiter is None else limiter
+
     def _adbc_cancel(self) -> None:
         """
         Fire the driver's thread-safe `adbc_cancel` to abort an in-flight call.
@@ -138,6 +200,9 @@ class AsyncCursor:
         so its absence is tolerated as a no-op rather than surfaced --- the abort
         path is unreachable for an instant, non-blocking backend.
         """
+        recorder = self._owner._recorder  # noqa: SLF001
+        if recorder is not None:
+            recorder.cancelled()
         cancel = getattr(self._cursor, "adbc_cancel", None)
         if cancel is not None:
             cancel()
@@ -197,7 +262,10 @@ class AsyncCursor:
             ConnectionBusyError: If another offloaded call on the owning connection
                 is already in flight.
         """
-        with self._owner._offloading():  # noqa: SLF001 (intentional parent guard, see module docstring)
+        with (
+            _tracing.start_span("adbc_poolhouse.execute") as span,
+            self._owner._offloading(),  # noqa: SLF001 (intentional parent guard, see module docstring)
+        ):
             await cancellable_offload(
                 self._adbc_cancel,
                 self._cursor.execute,
@@ -206,6 +274,11 @@ class AsyncCursor:
                 limiter=self._limiter,
                 on_abort=self._owner.invalidate,  # poison recovery on a real abort (D-25-03)
             )
+            if span is not None:
+                span.set_attribute("db.system", self._owner._backend)
+                rows = self._cursor.rowcount
+                if rows >= 0:
+                    span.set_attribute("db.response.returned_rows", rows)
 
     async def executemany(self, operation: str, seq_of_parameters: object) -> None:
         """
@@ -280,24 +353,26 @@ class AsyncCursor:
                 is already in flight.
         """
         with self._owner._offloading():  # noqa: SLF001
-            # Forward `size` only when given, so the dbapi cursor falls back to its
-            # own `arraysize` default. The two arms differ only by that argument; a
-            # single `*tuple`-spread call would lose the `TypeVarTuple` arity the
-            # `cancellable_offload` signature enforces, so the branch stays explicit.
-            if size is None:
+            async with self._fetch_slot():
+                # Forward `size` only when given, so the dbapi cursor falls back to
+                # its own `arraysize` default. The two arms differ only by that
+                # argument; a single `*tuple`-spread call would lose the
+                # `TypeVarTuple` arity the `cancellable_offload` signature enforces,
+                # so the branch stays explicit.
+                if size is None:
+                    return await cancellable_offload(
+                        self._adbc_cancel,
+                        self._cursor.fetchmany,
+                        limiter=self._limiter,
+                        on_abort=self._owner.invalidate,  # poison recovery (D-25-03)
+                    )
                 return await cancellable_offload(
                     self._adbc_cancel,
                     self._cursor.fetchmany,
+                    size,
                     limiter=self._limiter,
                     on_abort=self._owner.invalidate,  # poison recovery on a real abort (D-25-03)
                 )
-            return await cancellable_offload(
-                self._adbc_cancel,
-                self._cursor.fetchmany,
-                size,
-                limiter=self._limiter,
-                on_abort=self._owner.invalidate,  # poison recovery on a real abort (D-25-03)
-            )
 
     async def fetchall(self) -> object:
         """
@@ -315,12 +390,13 @@ class AsyncCursor:
                 is already in flight.
         """
         with self._owner._offloading():  # noqa: SLF001
-            return await cancellable_offload(
-                self._adbc_cancel,
-                self._cursor.fetchall,
-                limiter=self._limiter,
-                on_abort=self._owner.invalidate,  # poison recovery on a real abort (D-25-03)
-            )
+            async with self._fetch_slot():
+                return await cancellable_offload(
+                    self._adbc_cancel,
+                    self._cursor.fetchall,
+                    limiter=self._limiter,
+                    on_abort=self._owner.invalidate,  # poison recovery on a real abort (D-25-03)
+                )
 
     async def fetch_arrow_table(self) -> pyarrow.Table:
         """
@@ -344,13 +420,132 @@ class AsyncCursor:
             ConnectionBusyError: If another offloaded call on the owning connection
                 is already in flight.
         """
+        with (
+            _tracing.start_span("adbc_poolhouse.fetch_arrow_table") as span,
+            self._owner._offloading(),  # noqa: SLF001
+        ):
+            async with self._fetch_slot():
+                table = await cancellable_offload(
+                    self._adbc_cancel,
+                    self._cursor.fetch_arrow_table,
+                    limiter=self._limiter,
+                    on_abort=self._owner.invalidate,  # poison recovery on a real abort (D-25-03)
+                )
+            if span is not None:
+                span.set_attributes(
+                    {
+                        "db.system": self._owner._backend,
+                        "db.response.returned_rows": table.num_rows,
+                        "adbc_poolhouse.arrow.bytes": table.nbytes,
+                    }
+                )
+            return table
+
+    @contextlib.asynccontextmanager
+    async def stream_batches(self, prefetch: int = 2) -> AsyncGenerator[_BatchStream, None]:
+        """
+        Stream the current result set as Arrow record batches.
+
+        The async counterpart of the dbapi `fetch_record_batch`, for results too
+        large to materialize with `fetch_arrow_table`. Entering the block starts
+        a worker thread that reads the driver's `RecordBatchReader` and passes
+        each batch to the loop through a bounded channel; the block yields the
+        receiving end to iterate. While `prefetch` batches are waiting to be
+        consumed the worker stops reading, so memory stays bounded by the
+        consumer's pace. The worker holds one pool limiter token for the life of
+        the block.
+
+        The owning connection is claimed (`_in_use`) for the whole block; any
+        other call on it meanwhile raises `ConnectionBusyError`. Leaving the
+        block before the end, normally or by raising, lets the batch being read
+        finish, then closes the reader and keeps the connection. Cancelling the
+        block's task, or a timeout, aborts the read with `cursor.adbc_cancel`
+        and invalidates the connection, as for `execute` (CANCEL-01/02).
+
+        Args:
+            prefetch: Batches the worker may read ahead of the consumer. `0`
+                reads each batch only once the previous one has been taken.
+                Default: 2.
+
+        Yields:
+            An async iterator over the result set's `pyarrow.RecordBatch`es, in
+            order. Each batch owns its buffers and stays valid after the block.
+            A driver error is raised, unwrapped, where the batches stop.
+
+        Raises:
+            ValueError: If `prefetch` is negative.
+            ConnectionBusyError: If another offloaded call on the owning connection
+                is already in flight.
+
+        Example:
+            ```python
+            await cursor.execute("SELECT * FROM events")
+            async with cursor.stream_batches(prefetch=4) as batches:
+                async for batch in batches:
+                    await sink.write(batch)
+            ```
+        """
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be >= 0, got {prefetch}")
+        send, receive = anyio.create_memory_object_stream["pyarrow.RecordBatch"](prefetch)
+        # A holder, mutated by the producer task and never rebound.
+        failure: dict[str, Exception] = {}
+        body_error: Exception | None = None
         with self._owner._offloading():  # noqa: SLF001
-            return await cancellable_offload(
-                self._adbc_cancel,
-                self._cursor.fetch_arrow_table,
-                limiter=self._limiter,
-                on_abort=self._owner.invalidate,  # poison recovery on a real abort (D-25-03)
-            )
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(self._produce_batches, send, failure)
+                # Closing the receiving end (on any exit from the block) is what
+                # makes a producer blocked in `send` give up.
+                with receive:
+                    try:
+                        yield _BatchStream(receive, failure)
+                    except Exception as exc:  # noqa: BLE001
+                        # Leave like an early exit rather than through the task
+                        # group, which would cancel the producer (abort and
+                        # invalidate) and wrap the error in an ExceptionGroup.
+                        body_error = exc
+        if body_error is not None:
+            raise body_error
+        if "exc" in failure:
+            raise failure["exc"]
+
+    async def _produce_batches(
+        self,
+        send: MemoryObjectSendStream[pyarrow.RecordBatch],
+        failure: dict[str, Exception],
+    ) -> None:
+        # Never raises a driver error into the task group: that would cancel the
+        # consumer wherever it is, even outside the generator between batches.
+        # The error is handed to `_BatchStream` instead, which raises it once
+        # the channel (closed here on exit) has drained.
+        with send:
+            try:
+                await cancellable_offload(
+                    self._adbc_cancel,
+                    self._pump_batches,
+                    send,
+                    limiter=self._limiter,
+                    on_abort=self._owner.invalidate,  # poison recovery on a real abort (D-25-03)
+                )
+            except Exception as exc:  # noqa: BLE001
+                failure["exc"] = exc
+
+    def _pump_batches(self, send: MemoryObjectSendStream[pyarrow.RecordBatch]) -> None:
+        # Runs on the worker thread. `send` blocks while `prefetch` batches are
+        # queued, which is the backpressure; a closed receiving end stops the read.
+        reader = self._cursor.fetch_record_batch()
+        try:
+            while True:
+                try:
+                    batch = reader.read_next_batch()
+                except StopIteration:
+                    return
+                try:
+                    anyio.from_thread.run(send.send, batch)
+                except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                    return
+        finally:
+            reader.close()
 
     async def close(self) -> None:
         """
@@ -1,5 +1,5 @@
 """
-Async pool factory: `create_async_pool` / `managed_async_pool` / `close_async_pool`.
+Async pool factory: the `create_` / `open_` / `managed_` / `close_async_pool` entry points.
 
 These mirror the synchronous `create_pool` / `managed_pool` / `close_pool` entry
 points exactly --- same three call patterns, same keyword defaults --- and reuse
@@ -8,23 +8,40 @@ per-backend code here: the factory touches only the `WarehouseConfig` Protocol a
 the sync `QueuePool`, so all 13 backends are supported by construction (CORE-04,
 D-24-04).
 
-Pool construction stays synchronous --- `_create_pool_impl` does no per-call I/O,
-so `create_async_pool` need not be a coroutine. Only `connect` / `close` (and the
-per-call cursor methods in Plan 03) are offloaded to worker threads.
+`create_async_pool` builds the pool synchronously, on the calling thread. Building
+opens the ADBC source connection (a network login on most warehouses) and any
+pre-fill clones, so `open_async_pool` and `managed_async_pool` run
+`_create_pool_impl` through the offload chokepoint instead, under a private
+one-token limiter (the pool's own limiter does not exist yet). The build itself
+cannot be interrupted; a cancellation that arrives meanwhile takes effect as soon
+as it returns, and the freshly built pool is closed, shielded, before the
+cancellation propagates.
+
+A pool built with `lazy=True` opens nothing at all while it is built. Its first
+checkout opens the source on that checkout's worker thread, like any other
+connection open, so the loop never waits on the login.
 """
 
 from __future__ import annotations
 
 import contextlib
-from typing import TYPE_CHECKING, overload
+import functools
+from typing import TYPE_CHECKING, Literal, overload
 
-from adbc_poolhouse._async._pool import AsyncPool
-from adbc_poolhouse._pool_factory import _create_pool_impl
+import anyio
+import anyio.lowlevel
+
+from adbc_poolhouse._async._offload import offload
+from adbc_poolhouse._async._pool import AsyncPool, resolve_fetch_concurrency
+from adbc_poolhouse._pool_factory import _create_pool_impl, close_pool
 
 if TYPE_CHECKING:
     import collections.abc
 
+    from adbc_poolhouse._adbc_pool import AdbcPool
     from adbc_poolhouse._base_config import WarehouseConfig
+    from adbc_poolhouse._budget import ConnectionBudget, HostConnectionBudget
+    from adbc_poolhouse._queue_pool import AdbcQueuePool
 
 
 @overload
@@ -36,6 +53,24 @@ def create_async_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
 ) -> AsyncPool: ...
 
 
@@ -50,6 +85,24 @@ def create_async_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
 ) -> AsyncPool: ...
 
 
@@ -63,6 +116,24 @@ def create_async_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
 ) -> AsyncPool: ...
 
 
@@ -78,6 +149,24 @@ def create_async_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
 ) -> AsyncPool:
     """
     Create an `AsyncPool` backed by an ADBC driver.
@@ -113,6 +202,69 @@ def create_async_pool(
         timeout: Seconds to wait for a connection before raising. Default: 30.
         recycle: Seconds before a connection is recycled. Default: 3600.
         pre_ping: Whether to ping connections before checkout. Default: False.
+        prefill: Connections to open eagerly before the pool is returned, on a
+            small bounded thread pool; their open times are recorded on
+            `pool.prefill_report`. Must be between 0 and `pool_size`. Default: 0.
+        min_idle: Idle connections a background maintainer thread keeps open,
+            replacing checked-out ones ahead of demand. Must be between 0 and
+            `pool_size`. Default: 0 (no maintainer).
+        max_idle: Idle connections above this count are closed by the
+            maintainer. Must be between `min_idle` and `pool_size`. Default:
+            `None` (idle connections are kept up to `pool_size`).
+        maintenance_interval: Seconds between maintenance passes. Default: 1.0.
+        recycle_mode: `"checkout"` recycles on checkout, as `QueuePool` does;
+            `"background"` has the maintainer replace connections as they reach
+            `recycle` age, so a checkout never opens a clone because of age.
+            Default: `"checkout"`.
+        recycle_jitter: Random fraction of `recycle`, in `[0, 1)`, by which each
+            connection's background-recycle deadline is brought forward.
+            Default: 0.1.
+        checkout_order: `"fifo"` hands out the longest-idle connection;
+            `"lifo"` hands out the most recently returned one, so a few hot
+            connections stay warm and the rest can reach `idle_timeout`.
+            Default: `"fifo"`.
+        idle_timeout: Seconds a connection may sit idle before the maintainer
+            closes it, down to `min_idle`. Default: `None` (`config.idle_timeout`,
+            if set).
+        autoscale: `(min_size, max_size)` bounds for adaptive sizing; the
+            maintainer moves `pool_size` between them from observed checkout
+            waits, and the pool limiter is resized to match (see
+            `create_pool`). Default: `None` (fixed size).
+        autoscale_target_wait: 95th-percentile checkout wait, in seconds, above
+            which an autoscaled pool grows. Default: 0.05.
+        name: Label for this pool in metrics exports (the `pool` label of
+            `render_prometheus`). Default: `None`, which numbers unnamed
+            pools `pool-1`, `pool-2`, ... in creation order.
+        pool_class: `"queue"` wraps a SQLAlchemy `QueuePool`; `"adbc"` wraps the
+            native `AdbcPool`, which has a much cheaper checkout and checkin (see
+            `create_pool`). Default: `"queue"`.
+        fetch_processes: Worker processes for `AsyncPool.fetch_arrow`, each with
+            its own connection, returning tables through shared memory so
+            concurrent fetches are not serialized by the GIL (see
+            `create_pool`). Default: 0.
+        fork_prefill: Connections each child process opens together on its
+            first checkout, so pre-fork server workers warm up at once (see
+            `create_pool`). Default: 0.
+        host_budget: A `HostConnectionBudget` capping connections across the
+            processes on the host (see `create_pool`). An open waiting for a
+            budget slot parks its worker thread, not the event loop.
+            Default: `None`.
+        budget: A `ConnectionBudget` shared with other pools in this process,
+            sync or async (see `create_pool`). Tasks of every async pool on
+            the budget also share its `limit` as a cap on checkouts, waiting on
+            the event loop for a budget slot after their pool slot, so no more
+            than `limit` of them run offloads at once. Default: `None`.
+        lazy: Return without connecting; the first checkout opens the source
+            connection, on its worker thread like any other open, and
+            concurrent first checkouts wait for that one login (see
+            `create_pool`). Cannot be combined with `prefill` or `min_idle`.
+            Default: `False`.
+        fetch_concurrency: Cursor fetches (`fetchall`, `fetchmany`,
+            `fetch_arrow_table`) allowed to run at once, below the pool limit.
+            Materializing results holds the GIL, so extra concurrent fetches only
+            slow each other down; the excess waits on the event loop instead.
+            `"auto"` allows one per CPU, up to 2. Default: `None` (fetches are
+            bounded by the pool limit only).
 
     Returns:
         A configured `AsyncPool` ready for use.
@@ -120,6 +272,17 @@ def create_async_pool(
     Raises:
         TypeError: If none of `config`, `driver_path`, or `dbapi_module` is
             provided, or if both `driver_path` and `dbapi_module` are provided.
+        ConfigurationError: If `prefill`, `fork_prefill` or `min_idle` is negative or above
+            `pool_size`, `max_idle` is outside `min_idle..pool_size`,
+            `maintenance_interval` is not positive, `recycle_mode` is unknown,
+            `recycle_mode="background"` is combined with a non-positive
+            `recycle`, `recycle_jitter` is outside `[0, 1)`, `checkout_order`
+            is unknown, `idle_timeout` is not positive, `autoscale` bounds do
+            not contain `pool_size` (or `min_idle` exceeds the minimum),
+            `autoscale_target_wait` is not positive, `pool_class` is
+            unknown, `pre_ping` is combined with `pool_class="adbc"`,
+            `fetch_processes` is negative, `lazy` is combined with `prefill`
+            or `min_idle`, or `fetch_concurrency` is below 1.
         ImportError: If the required ADBC driver is not installed.
 
     Example:
@@ -141,6 +304,7 @@ def create_async_pool(
         anyio.run(main)
         ```
     """
+    fetch_limit = resolve_fetch_concurrency(fetch_concurrency)
     sync_pool = _create_pool_impl(
         config,
         driver_path,
@@ -152,8 +316,297 @@ def create_async_pool(
         timeout,
         recycle,
         pre_ping,
+        prefill=prefill,
+        min_idle=min_idle,
+        max_idle=max_idle,
+        maintenance_interval=maintenance_interval,
+        recycle_mode=recycle_mode,
+        recycle_jitter=recycle_jitter,
+        checkout_order=checkout_order,
+        idle_timeout=idle_timeout,
+        autoscale=autoscale,
+        autoscale_target_wait=autoscale_target_wait,
+        name=name,
+        pool_class=pool_class,
+        fetch_processes=fetch_processes,
+        fork_prefill=fork_prefill,
+        host_budget=host_budget,
+        budget=budget,
+        lazy=lazy,
+    )
+    return AsyncPool(
+        sync_pool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        fetch_concurrency=fetch_limit,
+    )
+
+
+async def _build_off_loop(
+    build: collections.abc.Callable[[], AdbcQueuePool | AdbcPool],
+) -> AdbcQueuePool | AdbcPool:
+    """
+    Run a sync pool build on a worker thread, closing the pool if cancelled.
+
+    Args:
+        build: Zero-argument callable returning the built sync pool (a
+            `_create_pool_impl` partial).
+
+    Returns:
+        The built pool.
+    """
+    # No pool limiter exists yet; a private one-token limiter keeps the build on
+    # a single worker thread.
+    limiter = anyio.CapacityLimiter(1)
+    sync_pool = await offload(build, limiter=limiter)
+    try:
+        # The offload defers a cancellation that lands mid-build; honour it now,
+        # without leaking the source connection the caller never got a handle to.
+        await anyio.lowlevel.checkpoint_if_cancelled()
+    except BaseException:
+        with anyio.CancelScope(shield=True):
+            await offload(close_pool, sync_pool, limiter=limiter)
+        raise
+    return sync_pool
+
+
+@overload
+async def open_async_pool(
+    config: WarehouseConfig,
+    *,
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
+) -> AsyncPool: ...
+
+
+@overload
+async def open_async_pool(
+    *,
+    driver_path: str,
+    db_kwargs: dict[str, str],
+    entrypoint: str | None = None,
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
+) -> AsyncPool: ...
+
+
+@overload
+async def open_async_pool(
+    *,
+    dbapi_module: str,
+    db_kwargs: dict[str, str],
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
+) -> AsyncPool: ...
+
+
+async def open_async_pool(
+    config: WarehouseConfig | None = None,
+    *,
+    driver_path: str | None = None,
+    db_kwargs: dict[str, str] | None = None,
+    entrypoint: str | None = None,
+    dbapi_module: str | None = None,
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
+) -> AsyncPool:
+    """
+    Create an `AsyncPool` without blocking the event loop.
+
+    Takes exactly the arguments of
+    [`create_async_pool`][adbc_poolhouse.create_async_pool] and returns the same
+    pool, but the build --- opening the ADBC source connection, which is a
+    network login on Snowflake, BigQuery or Databricks, and any `prefill`
+    clones --- runs on a worker thread while other tasks keep running.
+
+    The call is cancellable. The build in progress cannot be interrupted, so a
+    cancellation takes effect when it returns: the half-built pool is then
+    closed, shielded from further cancellation, and the cancellation propagates.
+    A build that fails (for example, during pre-fill) releases everything it
+    opened before the error is raised.
+
+    Three call patterns are supported:
+
+        pool = await open_async_pool(DuckDBConfig(...))           # from a config object
+        pool = await open_async_pool(driver_path="...", ...)       # native ADBC driver
+        pool = await open_async_pool(dbapi_module="...", ...)      # Python dbapi module
+
+    Args:
+        config: A warehouse config model instance (e.g. `DuckDBConfig`).
+            Mutually exclusive with `driver_path` and `dbapi_module`.
+        driver_path: Path to a native ADBC driver shared library, or a short
+            driver name for manifest-based resolution. Requires `db_kwargs`.
+        db_kwargs: ADBC connection keyword arguments as `dict[str, str]`.
+        entrypoint: ADBC entry-point symbol. Only used with `driver_path`.
+        dbapi_module: Dotted module name for a Python package implementing the
+            ADBC dbapi interface. Requires `db_kwargs`.
+        pool_size: See `create_async_pool`.
+        max_overflow: See `create_async_pool`.
+        timeout: See `create_async_pool`.
+        recycle: See `create_async_pool`.
+        pre_ping: See `create_async_pool`.
+        prefill: See `create_async_pool`.
+        min_idle: See `create_async_pool`.
+        max_idle: See `create_async_pool`.
+        maintenance_interval: See `create_async_pool`.
+        recycle_mode: See `create_async_pool`.
+        recycle_jitter: See `create_async_pool`.
+        checkout_order: See `create_async_pool`.
+        idle_timeout: See `create_async_pool`.
+        autoscale: See `create_async_pool`.
+        autoscale_target_wait: See `create_async_pool`.
+        name: See `create_async_pool`.
+        pool_class: See `create_async_pool`.
+        fetch_processes: See `create_async_pool`.
+        fork_prefill: See `create_async_pool`.
+        host_budget: See `create_async_pool`.
+        budget: See `create_async_pool`.
+        lazy: See `create_async_pool`.
+        fetch_concurrency: See `create_async_pool`.
+
+    Returns:
+        A configured `AsyncPool` ready for use.
+
+    Raises:
+        TypeError: As `create_async_pool`.
+        ConfigurationError: As `create_async_pool`.
+        ImportError: If the required ADBC driver is not installed.
+
+    Example:
+        ```python
+        from adbc_poolhouse import SnowflakeConfig, close_async_pool, open_async_pool
+
+        pool = await open_async_pool(SnowflakeConfig(), prefill=2)
+        try:
+            async with await pool.connect() as conn:
+                ...
+        finally:
+            await close_async_pool(pool)
+        ```
+    """
+    fetch_limit = resolve_fetch_concurrency(fetch_concurrency)
+    sync_pool = await _build_off_loop(
+        functools.partial(
+            _create_pool_impl,
+            config,
+            driver_path,
+            db_kwargs,
+            entrypoint,
+            dbapi_module,
+            pool_size,
+            max_overflow,
+            timeout,
+            recycle,
+            pre_ping,
+            prefill=prefill,
+            min_idle=min_idle,
+            max_idle=max_idle,
+            maintenance_interval=maintenance_interval,
+            recycle_mode=recycle_mode,
+            recycle_jitter=recycle_jitter,
+            checkout_order=checkout_order,
+            idle_timeout=idle_timeout,
+            autoscale=autoscale,
+            autoscale_target_wait=autoscale_target_wait,
+            name=name,
+            pool_class=pool_class,
+            fetch_processes=fetch_processes,
+            fork_prefill=fork_prefill,
+            host_budget=host_budget,
+            budget=budget,
+            lazy=lazy,
+        )
+    )
+    return AsyncPool(
+        sync_pool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        fetch_concurrency=fetch_limit,
     )
-    return AsyncPool(sync_pool, pool_size=pool_size, max_overflow=max_overflow)
 
 
 async def close_async_pool(pool: AsyncPool) -> None:
@@ -188,6 +641,24 @@ def managed_async_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
 ) -> contextlib.AbstractAsyncContextManager[AsyncPool]: ...
 
 
@@ -202,6 +673,24 @@ def managed_async_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
 ) -> contextlib.AbstractAsyncContextManager[AsyncPool]: ...
 
 
@@ -215,6 +704,24 @@ def managed_async_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
 ) -> contextlib.AbstractAsyncContextManager[AsyncPool]: ...
 
 
@@ -231,6 +738,24 @@ async def managed_async_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    fetch_concurrency: int | Literal["auto"] | None = None,
 ) -> collections.abc.AsyncGenerator[AsyncPool, None]:
     """
     Async context manager that creates an `AsyncPool` and closes it on exit.
@@ -238,7 +763,9 @@ async def managed_async_pool(
     The async analog of [`managed_pool`][adbc_poolhouse.managed_pool]. The pool is
     created when the `async with` block is entered and closed (via
     `close_async_pool`, whose teardown is shielded from cancellation) when the
-    block exits, whether normally or by exception.
+    block exits, whether normally or by exception. As with `open_async_pool`,
+    the pool is built on a worker thread, so entering the block does not block
+    the event loop.
 
     Three call patterns are supported:
 
@@ -264,6 +791,66 @@ async def managed_async_pool(
         timeout: Seconds to wait for a connection before raising. Default: 30.
         recycle: Seconds before a connection is recycled. Default: 3600.
         pre_ping: Whether to ping connections before checkout. Default: False.
+        prefill: Connections to open eagerly before the block is entered (see
+            `create_async_pool`). Default: 0.
+        min_idle: Idle connections to keep open (see `create_async_pool`). Here
+            the maintainer runs as a task inside the block instead of a thread.
+            Default: 0.
+        max_idle: Idle connections above this count are closed. Default: `None`.
+        maintenance_interval: Seconds between maintenance passes. Default: 1.0.
+        recycle_mode: `"checkout"` recycles on checkout, as `QueuePool` does;
+            `"background"` has the maintainer replace connections as they reach
+            `recycle` age, so a checkout never opens a clone because of age.
+            Default: `"checkout"`.
+        recycle_jitter: Random fraction of `recycle`, in `[0, 1)`, by which each
+            connection's background-recycle deadline is brought forward.
+            Default: 0.1.
+        checkout_order: `"fifo"` hands out the longest-idle connection;
+            `"lifo"` hands out the most recently returned one, so a few hot
+            connections stay warm and the rest can reach `idle_timeout`.
+            Default: `"fifo"`.
+        idle_timeout: Seconds a connection may sit idle before the maintainer
+            closes it, down to `min_idle`. Default: `None` (`config.idle_timeout`,
+            if set).
+        autoscale: `(min_size, max_size)` bounds for adaptive sizing; the
+            maintainer moves `pool_size` between them from observed checkout
+            waits, and the pool limiter is resized to match (see
+            `create_pool`). Default: `None` (fixed size).
+        autoscale_target_wait: 95th-percentile checkout wait, in seconds, above
+            which an autoscaled pool grows. Default: 0.05.
+        name: Label for this pool in metrics exports (the `pool` label of
+            `render_prometheus`). Default: `None`, which numbers unnamed
+            pools `pool-1`, `pool-2`, ... in creation order.
+        pool_class: `"queue"` wraps a SQLAlchemy `QueuePool`; `"adbc"` wraps the
+            native `AdbcPool`, which has a much cheaper checkout and checkin (see
+            `create_pool`). Default: `"queue"`.
+        fetch_processes: Worker processes for `AsyncPool.fetch_arrow`, each with
+            its own connection, returning tables through shared memory so
+            concurrent fetches are not serialized by the GIL (see
+            `create_pool`). Default: 0.
+        fork_prefill: Connections each child process opens together on its
+            first checkout, so pre-fork server workers warm up at once (see
+            `create_pool`). Default: 0.
+        host_budget: A `HostConnectionBudget` capping connections across the
+            processes on the host (see `create_pool`). An open waiting for a
+            budget slot parks its worker thread, not the event loop.
+            Default: `None`.
+        budget: A `ConnectionBudget` shared with other pools in this process,
+            sync or async (see `create_pool`). Tasks of every async pool on
+            the budget also share its `limit` as a cap on checkouts, waiting on
+            the event loop for a budget slot after their pool slot, so no more
+            than `limit` of them run offloads at once. Default: `None`.
+        lazy: Return without connecting; the first checkout opens the source
+            connection, on its worker thread like any other open, and
+            concurrent first checkouts wait for that one login (see
+            `create_pool`). Cannot be combined with `prefill` or `min_idle`.
+            Default: `False`.
+        fetch_concurrency: Cursor fetches (`fetchall`, `fetchmany`,
+            `fetch_arrow_table`) allowed to run at once, below the pool limit.
+            Materializing results holds the GIL, so extra concurrent fetches only
+            slow each other down; the excess waits on the event loop instead.
+            `"auto"` allows one per CPU, up to 2. Default: `None` (fetches are
+            bounded by the pool limit only).
 
     Yields:
         A configured `AsyncPool`, closed automatically when the block exits.
@@ -271,6 +858,17 @@ async def managed_async_pool(
     Raises:
         TypeError: If none of `config`, `driver_path`, or `dbapi_module` is
             provided, or if both `driver_path` and `dbapi_module` are provided.
+        ConfigurationError: If `prefill`, `fork_prefill` or `min_idle` is negative or above
+            `pool_size`, `max_idle` is outside `min_idle..pool_size`,
+            `maintenance_interval` is not positive, `recycle_mode` is unknown,
+            `recycle_mode="background"` is combined with a non-positive
+            `recycle`, `recycle_jitter` is outside `[0, 1)`, `checkout_order`
+            is unknown, `idle_timeout` is not positive, `autoscale` bounds do
+            not contain `pool_size` (or `min_idle` exceeds the minimum),
+            `autoscale_target_wait` is not positive, `pool_class` is
+            unknown, `pre_ping` is combined with `pool_class="adbc"`,
+            `fetch_processes` is negative, `lazy` is combined with `prefill`
+            or `min_idle`, or `fetch_concurrency` is below 1.
         ImportError: If the required ADBC driver is not installed.
 
     Example:
@@ -283,20 +881,54 @@ async def managed_async_pool(
                 await cur.execute("SELECT 42")
         ```
     """
-    sync_pool = _create_pool_impl(
-        config,
-        driver_path,
-        db_kwargs,
-        entrypoint,
-        dbapi_module,
-        pool_size,
-        max_overflow,
-        timeout,
-        recycle,
-        pre_ping,
+    fetch_limit = resolve_fetch_concurrency(fetch_concurrency)
+    sync_pool = await _build_off_loop(
+        functools.partial(
+            _create_pool_impl,
+            config,
+            driver_path,
+            db_kwargs,
+            entrypoint,
+            dbapi_module,
+            pool_size,
+            max_overflow,
+            timeout,
+            recycle,
+            pre_ping,
+            prefill=prefill,
+            min_idle=min_idle,
+            max_idle=max_idle,
+            maintenance_interval=maintenance_interval,
+            recycle_mode=recycle_mode,
+            recycle_jitter=recycle_jitter,
+            checkout_order=checkout_order,
+            idle_timeout=idle_timeout,
+            autoscale=autoscale,
+            autoscale_target_wait=autoscale_target_wait,
+            name=name,
+            pool_class=pool_class,
+            fetch_processes=fetch_processes,
+            fork_prefill=fork_prefill,
+            host_budget=host_budget,
+            budget=budget,
+            lazy=lazy,
+            start_maintainer=False,
+        )
+    )
+    pool = AsyncPool(
+        sync_pool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        fetch_concurrency=fetch_limit,
     )
-    pool = AsyncPool(sync_pool, pool_size=pool_size, max_overflow=max_overflow)
     try:
-        yield pool
+        # Maintenance runs as a task scoped to the block rather than a thread;
+        # the task is cancelled (after any in-flight pass) before the pool closes.
+        async with anyio.create_task_group() as tg:
+            await tg.start(pool.maintain)
+            try:
+                yield pool
+            finally:
+                tg.cancel_scope.cancel()
     finally:
         await close_async_pool(pool)
@@ -0,0 +1,129 @@
+"""
+One-shot queries: checkout, execute, fetch and check-in in one worker dispatch.
+
+[`AsyncPool.fetch_arrow`][adbc_poolhouse._async._pool.AsyncPool.fetch_arrow] and
+[`fetch_rows`][adbc_poolhouse._async._pool.AsyncPool.fetch_rows] run a whole read
+as a single [`cancellable_offload`][adbc_poolhouse._async._cancel.cancellable_offload]
+call. The step-by-step path (`connect`, `execute`, `fetch_arrow_table`, `close`)
+pays four limiter acquires, four thread hops and two watcher task groups for the
+same work.
+
+The connection never reaches the event loop, so
+[`OneShotQuery`][adbc_poolhouse._async._oneshot.OneShotQuery] keeps the
+`AsyncCursor` cancellation contract inside the worker:
+
+- `cancel`, fired by the watcher on the loop thread, latches an `aborted` flag
+  and, if the query has a cursor yet, calls its `adbc_cancel`. The worker
+  publishes and retires its cursor under the same lock, so a cancellation that
+  lands during the checkout is seen before `execute` starts, and `adbc_cancel`
+  never races the cursor's `close`.
+- A query interrupted by `adbc_cancel` leaves its connection poisoned, so the
+  worker invalidates it instead of checking it in (D-25-03), whether or not the
+  driver call then raised. A connection the query never touched, and one whose
+  query failed on its own, is checked in.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from adbc_poolhouse._adbc_pool import AdbcPool
+    from adbc_poolhouse._async._cursor import _SyncCursor
+    from adbc_poolhouse._queue_pool import AdbcQueuePool
+
+_T = TypeVar("_T")
+
+
+class OneShotQuery(Generic[_T]):
+    """
+    One checkout-to-check-in read, run on a worker thread and abortable from the loop.
+
+    Built per call by `AsyncPool`; `run` goes to `cancellable_offload` as the
+    blocking callable and `cancel` as its `adbc_cancel` hook.
+    """
+
+    __slots__ = ("_aborted", "_cursor", "_fetch", "_interrupted", "_lock", "_on_cancel")
+
+    def __init__(
+        self, fetch: Callable[[_SyncCursor], _T], on_cancel: Callable[[], None] | None = None
+    ) -> None:
+        """
+        Prepare a query; nothing runs until `run`.
+
+        Args:
+            fetch: Materializes the executed cursor's result (e.g. its
+                `fetch_arrow_table`). It must not return anything that reads from
+                the cursor later: the cursor is closed as soon as it returns.
+            on_cancel: Called once when `cancel` aborts a running query. The pool
+                passes its recorder's `cancelled`.
+        """
+        self._fetch = fetch
+        self._on_cancel = on_cancel
+        self._lock = threading.Lock()
+        self._cursor: _SyncCursor | None = None
+        self._aborted = False
+        self._interrupted = False
+
+    def cancel(self) -> None:
+        """Abort the query: interrupt its cursor if it has one, else stop it before `execute`."""
+        with self._lock:
+            self._aborted = True
+            cursor = self._cursor
+            if cursor is None:
+                return
+            self._interrupted = True
+            # Under the lock, so the worker cannot close the cursor meanwhile.
+            adbc_cancel = getattr(cursor, "adbc_cancel", None)
+            if adbc_cancel is not None:
+                adbc_cancel()
+        if self._on_cancel is not None:
+            self._on_cancel()
+
+    def run(
+        self,
+        pool: AdbcQueuePool | AdbcPool,
+        start: float,
+        operation: str,
+        parameters: object,
+    ) -> _T | None:
+        """
+        Check out, execute, fetch and check in (blocking; runs on a worker thread).
+
+        Args:
+            pool: The sync pool to check a connection out of.
+            start: `perf_counter()` when the caller started waiting, for the
+                checkout-wait statistics.
+            operation: The SQL text to execute.
+            parameters: Bound parameters, forwarded to the dbapi cursor.
+
+        Returns:
+            What `fetch` returned, or `None` if the query was cancelled before it
+            reached the driver.
+        """
+        fairy = pool._adbc_checkout(start)
+        poisoned = False
+        try:
+            cursor = cast("_SyncCursor", fairy.cursor())
+            with self._lock:
+                if self._aborted:
+                    cursor.close()
+                    return None
+                self._cursor = cursor
+            try:
+                cursor.execute(operation, parameters)
+                return self._fetch(cursor)
+            finally:
+                with self._lock:
+                    self._cursor = None
+                    poisoned = self._interrupted
+                if not poisoned:
+                    cursor.close()
+        finally:
+            if poisoned:
+                fairy.invalidate()
+            else:
+                fairy.close()
@@ -7,20 +7,153 @@ sync factory) and adds the async surface. It owns ONE dedicated
 40-token default --- so concurrency is bounded to exactly the pool's checkout
 ceiling (CORE-02). Every blocking call goes through the single
 [`offload`][adbc_poolhouse._async._offload.offload] chokepoint with that limiter.
+
+Waiting for a free connection happens on the event loop, in a
+[`CheckoutQueue`][adbc_poolhouse._async._checkout.CheckoutQueue] with one slot
+per connection the pool may hand out. A task offloads the sync checkout only once
+it holds a slot, so no worker thread ever blocks inside the sync pool waiting for
+a check-in; the slot goes back (to the next waiter) when the `AsyncConnection` is
+closed or invalidated. The sync pool's `timeout` bounds the wait.
+
+When the pool was built with `min_idle` / `max_idle`,
+[`maintain`][adbc_poolhouse._async._pool.AsyncPool.maintain] runs the sync
+`PoolMaintainer` passes from a task instead of a background thread; each pass is
+offloaded under a private one-token limiter so it never competes with user calls
+for the pool limiter.
+
+An autoscaled pool changes `pool_size` at runtime, on the maintainer thread or a
+worker thread. The limiter is bound to the event loop, so it is resized there
+instead: before every checkout and after every task-driven maintenance pass, the
+limiter's `total_tokens` and the checkout queue's slot count are set to the
+pool's current `size() + max_overflow`.
+
+[`fetch_arrow`][adbc_poolhouse._async._pool.AsyncPool.fetch_arrow] and
+[`fetch_rows`][adbc_poolhouse._async._pool.AsyncPool.fetch_rows] take a checkout
+slot like `connect`, then run checkout, query and check-in as one
+[`OneShotQuery`][adbc_poolhouse._async._oneshot.OneShotQuery] dispatch, so the
+connection never comes back to the loop.
+
+A pool built with `fetch_concurrency` also owns a smaller fetch limiter. Result
+materialization (`fetchall`, `fetchmany`, `fetch_arrow_table`) holds the GIL and
+does not scale across threads the way `execute` does (`benchmarks/gil_release.py`),
+so cursor fetches take a fetch-limiter token on the loop before they take a pool
+limiter token for the offload. Surplus fetches then wait as cheap loop tasks
+instead of as worker threads contending for the GIL, while executes keep the
+full pool limit. One-shot queries run execute and fetch in one dispatch and are
+bounded by the pool limiter only.
+
+On a pool built with `fetch_processes`, `fetch_arrow` skips the pool's connections
+altogether: the query runs in one of the pool's worker processes
+([`ProcessFetcher`][adbc_poolhouse._procfetch.ProcessFetcher]) and the table comes
+back through shared memory. The wait for the worker's result is offloaded under a
+process limiter with one token per worker process, so fetches beyond the process
+count queue on the loop rather than as parked threads.
+
+`fetch_arrow(..., shared=store)` reads through a
+[`SharedResultStore`][adbc_poolhouse.SharedResultStore]. Its sync
+`get_or_fetch` waits on a file lock while another caller fetches, which would park
+a worker thread holding a limiter token that the fetching task may need. The async
+path takes the lock with a non-blocking try instead, and a task that finds it held
+polls from the loop, re-checking the store, until the entry appears or the lock
+comes free.
+
+A pool built with a [`ConnectionBudget`][adbc_poolhouse.ConnectionBudget] also
+waits for a slot in the budget's own checkout queue, shared by every async pool
+on the budget, after taking its pool slot and within the same timeout. Both
+slots go back together. Tasks beyond the budget so wait on the loop, holding no
+worker thread or token, and the offloads in flight across the budgeted pools are
+bounded by the budget's `limit`.
+
+[`stats`][adbc_poolhouse._async._pool.AsyncPool.stats] is the sync pool's
+`PoolStats` plus the limiter's borrowed and waiting counts and the checkout
+queue's length, read on the loop.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import dataclasses
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Literal, TypeVar, cast
 
 import anyio
+import anyio.lowlevel
+import sqlalchemy.exc
 
+from adbc_poolhouse import _prometheus, _tracing
+from adbc_poolhouse._async._cancel import cancellable_offload
+from adbc_poolhouse._async._checkout import BudgetCheckoutQueue, CheckoutQueue
 from adbc_poolhouse._async._connection import AsyncConnection
 from adbc_poolhouse._async._offload import offload
+from adbc_poolhouse._async._oneshot import OneShotQuery
+from adbc_poolhouse._budget import ConnectionBudget
+from adbc_poolhouse._exceptions import ConfigurationError
 from adbc_poolhouse._pool_factory import close_pool
 
 if TYPE_CHECKING:
-    import sqlalchemy.pool
+    from collections.abc import Callable, Sequence
+
+    import pyarrow
+    from anyio.abc import TaskStatus
+
+    from adbc_poolhouse._adbc_pool import AdbcPool
+    from adbc_poolhouse._async._cursor import _SyncCursor
+    from adbc_poolhouse._prefill import PrefillReport
+    from adbc_poolhouse._procfetch import ProcessFetcher
+    from adbc_poolhouse._queue_pool import AdbcQueuePool
+    from adbc_poolhouse._result_store import SharedResultStore
+    from adbc_poolhouse._stats import PoolStats
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# The most `fetch_concurrency="auto"` allows: one fetch materializing under the GIL
+# while a second runs its GIL-free driver read on another core.
+# `benchmarks/gil_release.py` shows fetches gain nothing beyond that.
+_AUTO_FETCH_CONCURRENCY_MAX = 2
+
+# Seconds between checks while another caller fetches a `shared=` result.
+_SHARED_POLL_INTERVAL = 0.02
+
+
+def resolve_fetch_concurrency(fetch_concurrency: int | Literal["auto"] | None) -> int | None:
+    """
+    Validate a `fetch_concurrency` factory argument and resolve `"auto"`.
+
+    `"auto"` allows one fetch per CPU, up to 2: a second fetch only helps when
+    its driver read can run on a core of its own.
+
+    Args:
+        fetch_concurrency: A positive token count, `"auto"`, or `None`.
+
+    Returns:
+        The fetch limiter's token count, or `None` for no fetch limiter.
+
+    Raises:
+        ConfigurationError: If `fetch_concurrency` is an integer below 1.
+    """
+    if fetch_concurrency is None:
+        return None
+    if fetch_concurrency == "auto":
+        return min(_AUTO_FETCH_CONCURRENCY_MAX, os.cpu_count() or 1)
+    if fetch_concurrency < 1:
+        raise ConfigurationError(
+            f"fetch_concurrency must be 'auto' or a positive integer, got {fetch_concurrency}"
+        )
+    return fetch_concurrency
+
+
+def _budget_checkouts(sync_pool: AdbcQueuePool | AdbcPool) -> CheckoutQueue | None:
+    """The checkout queue of the pool's `ConnectionBudget`, created on first use."""
+    gate = sync_pool._adbc_gate
+    for budget in gate.budgets if gate is not None else ():
+        if isinstance(budget, ConnectionBudget):
+            if budget._async_slots is None:
+                budget._async_slots = BudgetCheckoutQueue(budget.limit)
+            return cast("BudgetCheckoutQueue", budget._async_slots)
+    return None
 
 
 class AsyncPool:
@@ -29,7 +162,8 @@ class AsyncPool:
 
     Created by [`create_async_pool`][adbc_poolhouse.create_async_pool]. The pool
     construction itself is synchronous (it does no per-call I/O); only `connect`
-    and `close` are offloaded to worker threads.
+    and `close` are offloaded to worker threads, and `connect` only once a
+    connection is free: waiting for one is a plain `await` on the event loop.
 
     The pool owns one dedicated `anyio.CapacityLimiter` sized to
     `pool_size + max_overflow`, shared by every offloaded call on the pool and its
@@ -41,6 +175,8 @@ class AsyncPool:
     Attributes:
         _limiter: The pool's dedicated `anyio.CapacityLimiter`. Exposed for tests
             that assert token accounting (e.g. `pool._limiter.borrowed_tokens`).
+        _fetch_limiter: The smaller limiter cursor fetches take first, or `None`
+            when the pool was built without `fetch_concurrency`.
 
     Example:
         ```python
@@ -66,40 +202,423 @@ class AsyncPool:
 
     def __init__(
         self,
-        sync_pool: sqlalchemy.pool.QueuePool,
+        sync_pool: AdbcQueuePool | AdbcPool,
         *,
         pool_size: int,
         max_overflow: int,
+        fetch_concurrency: int | None = None,
     ) -> None:
         """
         Wrap a sync pool and build its dedicated limiter.
 
         Args:
-            sync_pool: The synchronous `QueuePool` built by the sync factory.
+            sync_pool: The synchronous pool built by the sync factory (an
+                `AdbcQueuePool`, or an `AdbcPool` with `pool_class="adbc"`).
             pool_size: The pool's steady-state connection count. Must match the
                 value passed to the sync pool.
             max_overflow: Extra connections allowed above `pool_size`. Must match
                 the value passed to the sync pool.
+            fetch_concurrency: Tokens in the fetch limiter (see
+                `resolve_fetch_concurrency`), or `None` for none.
         """
         self._pool = sync_pool
+        self._max_overflow = max_overflow
         # Dedicated per-pool limiter sized to the checkout ceiling --- never the
         # anyio global 40-token default (CORE-02).
         self._limiter = anyio.CapacityLimiter(pool_size + max_overflow)
+        # One slot per connection the pool may hand out; tasks queue here, on
+        # the loop, for a connection to come back.
+        self._checkouts = CheckoutQueue(pool_size + max_overflow)
+        # The checkout queue shared by every async pool on a `ConnectionBudget`.
+        self._budget_checkouts = _budget_checkouts(sync_pool)
+        self._fetch_limiter = (
+            None if fetch_concurrency is None else anyio.CapacityLimiter(fetch_concurrency)
+        )
+        fetcher = sync_pool._adbc_fetcher
+        # One token per worker process; `fetch_arrow` waits here, on the loop.
+        self._process_limiter = (
+            None if fetcher is None else anyio.CapacityLimiter(fetcher.processes)
+        )
+        # Maintenance passes get their own single token: at most one runs at a
+        # time, and it never takes a token a user call is waiting for.
+        self._maintenance_limiter = anyio.CapacityLimiter(1)
+        self._maintenance_wake: anyio.Event | None = None
+        _prometheus.track(self)
+
+    @property
+    def prefill_report(self) -> PrefillReport | None:
+        """
+        Timings from the eager pre-fill, or `None` if the pool was not pre-filled.
+
+        Returns:
+            The wrapped sync pool's `prefill_report`.
+        """
+        return self._pool.prefill_report
+
+    def stats(self) -> PoolStats:
+        """
+        Snapshot the pool's state, recorded latencies and limiter usage.
+
+        Non-blocking: the sync pool's counters are read under short locks, so
+        this runs on the event loop without offloading.
 
-    async def connect(self) -> AsyncConnection:
+        Returns:
+            The wrapped pool's `stats()` with `limiter_borrowed` and
+            `limiter_waiting` filled in from the pool's `CapacityLimiter`, and
+            `checkout_waiting` from its checkout queue.
+        """
+        limiter = self._limiter.statistics()
+        return dataclasses.replace(
+            self._pool.stats(),
+            limiter_borrowed=limiter.borrowed_tokens,
+            limiter_waiting=limiter.tasks_waiting,
+            checkout_waiting=self._checkouts.waiting,
+        )
+
+    async def connect(self, *, deadline: float | None = None) -> AsyncConnection:
         """
-        Check out a connection from the pool on a worker thread.
+        Check out a connection from the pool.
 
-        The blocking `QueuePool.connect()` runs through the offload chokepoint
-        under the pool limiter; the borrowed token is released as soon as the
-        checkout returns (transient-token model). The returned `AsyncConnection`
-        belongs to exactly one task --- do not share it across concurrent tasks.
+        When every connection is checked out, the task waits on the event loop,
+        first come first served, for one to be returned; no worker thread or
+        limiter token is held while it waits. The sync checkout itself (taking an
+        idle connection, or cloning or recycling one) then runs through the
+        offload chokepoint under the pool limiter, and the borrowed token is
+        released as soon as it returns (transient-token model). The returned
+        `AsyncConnection` belongs to exactly one task --- do not share it across
+        concurrent tasks.
+
+        The wait is cancellable: a cancelled task, or an enclosing
+        `anyio.fail_after` / `move_on_after` that expires, leaves the queue at
+        once. A connection handed over just as the task gives up goes to the next
+        waiter, and one checked out while the cancellation was pending is
+        returned to the pool before the cancellation propagates. The sync
+        checkout itself, once started, runs to completion.
+
+        Args:
+            deadline: Give up waiting at this time on the event loop's clock
+                (`anyio.current_time()`), if that comes before the pool's
+                `timeout`. `None` waits up to `timeout` seconds.
 
         Returns:
             An `AsyncConnection` wrapping the checked-out sync connection.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If no connection is free within the
+                pool's `timeout` seconds or by `deadline`.
+            ConfigurationError: If the pool's `ConnectionBudget` is already
+                shared by pools on another event loop.
+
+        Example:
+            ```python
+            deadline = anyio.current_time() + 0.5
+            async with await pool.connect(deadline=deadline) as conn:
+                ...
+            ```
         """
-        fairy = await offload(self._pool.connect, limiter=self._limiter)
-        return AsyncConnection(fairy, self._limiter)
+        self._sync_limiter()
+        start = time.perf_counter()
+        with _tracing.start_span("adbc_poolhouse.connect") as span:
+            if span is not None:
+                span.set_attribute("db.system", self._pool._adbc_backend)
+            await self._acquire_slot(deadline)
+            fairy = None
+            try:
+                fairy = await offload(self._pool._adbc_checkout, start, limiter=self._limiter)
+                # The offload defers a cancellation that lands mid-checkout;
+                # honour it here rather than hand a connection to a cancelled task.
+                await anyio.lowlevel.checkpoint_if_cancelled()
+            except BaseException:
+                with anyio.CancelScope(shield=True):
+                    try:
+                        if fairy is not None:
+                            await offload(fairy.close, limiter=self._limiter)
+                    finally:
+                        self._release_slot()
+                raise
+        self._wake_maintainer()
+        return AsyncConnection(
+            fairy,
+            self._limiter,
+            backend=self._pool._adbc_backend,
+            recorder=self._pool._adbc_stats,
+            on_release=self._release_slot,
+            fetch_limiter=self._fetch_limiter,
+        )
+
+    async def fetch_arrow(
+        self,
+        operation: str,
+        parameters: object = None,
+        *,
+        deadline: float | None = None,
+        shared: SharedResultStore | None = None,
+    ) -> pyarrow.Table:
+        """
+        Run one query on a pooled connection and return its result as a `pyarrow.Table`.
+
+        Equivalent to `connect`, `cursor().execute`, `fetch_arrow_table` and
+        `close`, but the checkout, the query, the fetch and the check-in run in a
+        single worker dispatch instead of four, each of which would borrow a
+        limiter token and hop threads. Waiting for a free connection works as in
+        `connect`. The table is fully materialized and owns its buffers.
+
+        If the surrounding scope is cancelled or times out while the query is in
+        flight, it is aborted with the cursor's `adbc_cancel`, the poisoned
+        connection is invalidated instead of checked in, and the cancellation is
+        re-raised, exactly as for `AsyncCursor.execute`.
+
+        On a pool built with `fetch_processes`, the query runs in one of the
+        pool's worker processes instead, takes no pool connection or checkout
+        slot, and `deadline` does not apply. The table is mapped from shared
+        memory without a copy. Cancelling withdraws a query still waiting for a
+        worker; one already running finishes in its worker and its result is
+        dropped.
+
+        With `shared`, the result is mapped from the store if any process has
+        already put it there. On a miss, one caller per query fetches it as
+        above and stores it, while the others wait on the event loop.
+
+        Args:
+            operation: The SQL text to execute.
+            parameters: Optional bound parameters, forwarded to the dbapi cursor.
+            deadline: Give up waiting for a connection at this time on the event
+                loop's clock (see `connect`). Default: `None`.
+            shared: A `SharedResultStore` to read the result from, or to fetch
+                it into. Default: `None`.
+
+        Returns:
+            The materialized result set.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If no connection is free within the
+                pool's `timeout` seconds or by `deadline`.
+
+        Example:
+            ```python
+            table = await pool.fetch_arrow("SELECT * FROM events WHERE day = ?", ["2026-06-27"])
+            ```
+        """
+        if shared is not None:
+            return await self._fetch_shared(shared, operation, parameters, deadline)
+        with _tracing.start_span("adbc_poolhouse.fetch_arrow") as span:
+            if self._process_limiter is not None:
+                table = await self._fetch_in_process(self._process_limiter, operation, parameters)
+            else:
+                table = await self._one_shot(
+                    lambda cursor: cursor.fetch_arrow_table(), operation, parameters, deadline
+                )
+            if span is not None:
+                span.set_attributes(
+                    {
+                        "db.system": self._pool._adbc_backend,
+                        "db.response.returned_rows": table.num_rows,
+                        "adbc_poolhouse.arrow.bytes": table.nbytes,
+                    }
+                )
+            return table
+
+    async def fetch_rows(
+        self, operation: str, parameters: object = None, *, deadline: float | None = None
+    ) -> Sequence[object]:
+        """
+        Run one query on a pooled connection and return all its rows.
+
+        The `fetchall` counterpart of `fetch_arrow`, with the same single
+        dispatch, waiting and cancellation behaviour.
+
+        Args:
+            operation: The SQL text to execute.
+            parameters: Optional bound parameters, forwarded to the dbapi cursor.
+            deadline: Give up waiting for a connection at this time on the event
+                loop's clock (see `connect`). Default: `None`.
+
+        Returns:
+            The rows, as the driver's `fetchall` returns them (a list of tuples).
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If no connection is free within the
+                pool's `timeout` seconds or by `deadline`.
+        """
+        with _tracing.start_span("adbc_poolhouse.fetch_rows") as span:
+            rows = await self._one_shot(
+                lambda cursor: cursor.fetchall(), operation, parameters, deadline
+            )
+            if span is not None:
+                span.set_attributes(
+                    {
+                        "db.system": self._pool._adbc_backend,
+                        "db.response.returned_rows": len(rows),
+                    }
+                )
+            return rows
+
+    async def _one_shot(
+        self,
+        fetch: Callable[[_SyncCursor], _T],
+        operation: str,
+        parameters: object,
+        deadline: float | None,
+    ) -> _T:
+        self._sync_limiter()
+        start = time.perf_counter()
+        await self._acquire_slot(deadline)
+        query = OneShotQuery(fetch, self._pool._adbc_stats.cancelled)
+        try:
+            result = await cancellable_offload(
+                query.cancel,
+                query.run,
+                self._pool,
+                start,
+                operation,
+                parameters,
+                limiter=self._limiter,
+            )
+        finally:
+            # The worker has checked the connection in (or invalidated it).
+            self._release_slot()
+        self._wake_maintainer()
+        # `None` only when cancelled before the query ran, and then
+        # `cancellable_offload` raises instead of returning.
+        return cast("_T", result)
+
+    async def _fetch_shared(
+        self,
+        store: SharedResultStore,
+        operation: str,
+        parameters: object,
+        deadline: float | None,
+    ) -> pyarrow.Table:
+        key = store.key(operation, parameters)
+        while True:
+            table = await offload(store.get, key, limiter=self._limiter)
+            if table is not None:
+                return table
+            lock = await offload(store.try_lock, key, limiter=self._limiter)
+            if lock is not None:
+                break
+            await anyio.sleep(_SHARED_POLL_INTERVAL)
+        try:
+            # Another caller may have stored it between our miss and the lock.
+            table = await offload(store.get, key, limiter=self._limiter)
+            if table is None:
+                table = await self.fetch_arrow(operation, parameters, deadline=deadline)
+                table = await offload(store.put, key, table, limiter=self._limiter)
+            return table
+        finally:
+            lock.release()
+
+    async def _fetch_in_process(
+        self, limiter: anyio.CapacityLimiter, operation: str, parameters: object
+    ) -> pyarrow.Table:
+        fetcher = cast("ProcessFetcher", self._pool._adbc_fetcher)
+        query = fetcher.query(operation, parameters)
+        table = await cancellable_offload(query.cancel, query.run, limiter=limiter)
+        # `None` only when cancelled before submission, and then
+        # `cancellable_offload` raises instead of returning.
+        return cast("pyarrow.Table", table)
+
+    def _wake_maintainer(self) -> None:
+        # A checkout that took the idle set below `min_idle` wakes the
+        # maintenance task rather than leaving the refill to the next interval.
+        maintainer = self._pool._adbc_maintainer
+        if (
+            self._maintenance_wake is not None
+            and maintainer is not None
+            and maintainer.below_floor()
+        ):
+            self._maintenance_wake.set()
+
+    async def _acquire_slot(self, deadline: float | None) -> None:
+        timeout = self._pool._timeout
+        give_up = anyio.current_time() + timeout
+        if deadline is not None:
+            give_up = min(give_up, deadline)
+        budget = self._budget_checkouts
+        pool_slot = False
+        with anyio.move_on_at(give_up):
+            await self._checkouts.acquire()
+            if budget is None:
+                return
+            pool_slot = True
+            try:
+                await budget.acquire()
+            except BaseException:
+                self._checkouts.release()
+                raise
+            return
+        self._pool._adbc_stats.timed_out()
+        limit = (
+            f"ConnectionBudget limit of {budget.total}"
+            if pool_slot and budget is not None
+            else f"AsyncPool limit of size {self._pool.size()} overflow {self._max_overflow}"
+        )
+        raise sqlalchemy.exc.TimeoutError(
+            f"{limit} reached, connection timed out, "
+            f"timeout {timeout:.2f}" + (", deadline reached" if give_up == deadline else "")
+        )
+
+    def _release_slot(self) -> None:
+        self._checkouts.release()
+        if self._budget_checkouts is not None:
+            self._budget_checkouts.release()
+
+    async def maintain(
+        self,
+        *,
+        task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED,
+    ) -> None:
+        """
+        Run the pool's background maintenance until cancelled.
+
+        The task-based counterpart of the sync maintainer thread, for pools whose
+        lifetime is bound to a task group. `managed_async_pool` starts it
+        automatically; with `create_async_pool` the thread maintainer is already
+        running and this method is not needed. Each pass is offloaded to a worker
+        thread; the task then sleeps for `maintenance_interval` seconds, or until a
+        checkout drops the idle set below `min_idle`. A failed pass is logged and
+        retried on the next one.
+
+        Returns immediately if the pool was built with none of `min_idle`,
+        `max_idle`, `idle_timeout`, `recycle_mode="background"` or `autoscale`.
+
+        Args:
+            task_status: Supplied by `TaskGroup.start`; signalled once the loop
+                is running.
+
+        Example:
+            ```python
+            async with anyio.create_task_group() as tg:
+                await tg.start(pool.maintain)
+                ...
+                tg.cancel_scope.cancel()
+            ```
+        """
+        maintainer = self._pool._adbc_maintainer
+        task_status.started()
+        if maintainer is None:
+            return
+        try:
+            while True:
+                self._maintenance_wake = anyio.Event()
+                try:
+                    await offload(maintainer.run_once, limiter=self._maintenance_limiter)
+                except Exception:
+                    logger.warning("adbc-poolhouse pool maintenance pass failed", exc_info=True)
+                self._sync_limiter()
+                with anyio.move_on_after(maintainer.interval):
+                    await self._maintenance_wake.wait()
+        finally:
+            self._maintenance_wake = None
+
+    def _sync_limiter(self) -> None:
+        # Runs on the event loop: the only place the limiter and the checkout
+        # queue may be resized. A fixed-size pool always matches, so this is one
+        # comparison.
+        ceiling = self._pool.size() + self._max_overflow
+        if self._limiter.total_tokens != ceiling:
+            self._limiter.total_tokens = ceiling
+            self._checkouts.resize(ceiling)
 
     async def close(self) -> None:
         """
@@ -110,5 +629,6 @@ class AsyncPool:
         and wrapped in `anyio.CancelScope(shield=True)`, so a cancellation
         arriving mid-close cannot abandon the pool with leaked driver resources.
         """
+        _prometheus.untrack(self)
         with anyio.CancelScope(shield=True):
             await offload(close_pool, self._pool, limiter=self._limiter)
@@ -0,0 +1,232 @@
+"""
+`AsyncPoolRegistry`: the async counterpart of `PoolRegistry`.
+
+It matches configs by the same
+[`config_fingerprint`][adbc_poolhouse._registry.config_fingerprint], computed on
+a worker thread because resolving a driver path can import its package, and
+builds each shared pool with `open_async_pool`, off the loop. Tasks asking for a
+config whose pool is being built wait on the loop for that one build.
+
+The registry runs on one event loop and needs no lock: every check and update
+between two `await`s is atomic with respect to other tasks. Its pools are bound
+to that loop, like any `AsyncPool`, so a registry holding pools refuses a call
+from another loop. `get_async_pool` keeps one registry per loop.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import anyio
+
+from adbc_poolhouse._async._factory import close_async_pool, open_async_pool
+from adbc_poolhouse._async._offload import offload
+from adbc_poolhouse._exceptions import ConfigurationError
+from adbc_poolhouse._registry import config_fingerprint
+
+if TYPE_CHECKING:
+    from adbc_poolhouse._async._pool import AsyncPool
+    from adbc_poolhouse._base_config import WarehouseConfig
+
+
+class _AsyncEntry:
+    """One shared async pool, its reference count, and its build's completion."""
+
+    __slots__ = ("built", "pool", "refs")
+
+    def __init__(self) -> None:
+        self.built = anyio.Event()
+        self.pool: AsyncPool | None = None
+        self.refs = 0
+
+
+class AsyncPoolRegistry:
+    """
+    Hands out one shared `AsyncPool` per distinct config, closing it after the last release.
+
+    Use one registry from one event loop. Once it holds a pool, a call from
+    another loop raises `ConfigurationError`.
+
+    Example:
+        ```python
+        from adbc_poolhouse import AsyncPoolRegistry, SnowflakeConfig
+
+        registry = AsyncPoolRegistry()
+        pool = await registry.get_pool(SnowflakeConfig(), pool_size=10)
+        try:
+            ...
+        finally:
+            await registry.release_pool(pool)
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._entries: dict[str, _AsyncEntry] = {}
+        # `id(pool)` -> its key, for `release_pool`.
+        self._keys: dict[int, str] = {}
+        # The loop the registry's pools and build events belong to, bound
+        # while it holds any.
+        self._loop: anyio.lowlevel.EventLoopToken | None = None
+
+    def _bind(self) -> None:
+        """Bind the registry to the running loop, or check that it is already bound to it."""
+        loop = anyio.lowlevel.current_token()
+        if not self._entries:
+            self._loop = loop
+        elif loop != self._loop:
+            raise ConfigurationError("an AsyncPoolRegistry can be used from one event loop only")
+
+    def __len__(self) -> int:
+        """The number of pools the registry holds open."""
+        return len(self._keys)
+
+    async def get_pool(self, config: WarehouseConfig, **options: Any) -> AsyncPool:
+        """
+        Return the shared pool for `config`, building it on first use.
+
+        Every call takes a reference; give it back with `release_pool`.
+
+        Args:
+            config: The warehouse config.
+            **options: Keyword arguments for `open_async_pool`. Callers share a
+                pool only when these are equal too.
+
+        Returns:
+            The pool, as `open_async_pool(config, **options)` would build it.
+
+        Raises:
+            ConfigurationError: If the registry holds pools built on another
+                event loop.
+        """
+        self._bind()
+        key = await offload(config_fingerprint, config, options, limiter=anyio.CapacityLimiter(1))
+        while True:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _AsyncEntry()
+                try:
+                    pool = await open_async_pool(config, **options)
+                except BaseException:
+                    # Tasks waiting on this build retry it with a fresh entry.
+                    # `close()` may have dropped it meanwhile, and another task
+                    # put its own in its place.
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+                    entry.built.set()
+                    raise
+                entry.built.set()
+                if self._entries.get(key) is not entry:
+                    # `close()` ran during the build.
+                    await close_async_pool(pool)
+                    continue
+                entry.pool = pool
+                entry.refs = 1
+                self._keys[id(pool)] = key
+                return pool
+            if entry.pool is None:
+                await entry.built.wait()
+                continue
+            entry.refs += 1
+            return entry.pool
+
+    async def release_pool(self, pool: AsyncPool) -> None:
+        """
+        Give back a reference taken by `get_pool`, closing the pool after the last one.
+
+        Args:
+            pool: A pool returned by `get_pool`.
+
+        Raises:
+            ConfigurationError: If the registry holds pools built on another
+                event loop.
+            ValueError: If the registry does not hold `pool`.
+        """
+        self._bind()
+        key = self._keys.get(id(pool))
+        if key is None:
+            raise ValueError("pool was not obtained from this registry, or already closed")
+        entry = self._entries[key]
+        entry.refs -= 1
+        if entry.refs:
+            return
+        del self._entries[key], self._keys[id(pool)]
+        await close_async_pool(pool)
+
+    async def close(self) -> None:
+        """
+        Close every pool the registry holds, whatever its reference count.
+
+        Raises:
+            ConfigurationError: If the registry holds pools built on another
+                event loop.
+        """
+        self._bind()
+        pools = [entry.pool for entry in self._entries.values() if entry.pool is not None]
+        self._entries.clear()
+        self._keys.clear()
+        for pool in pools:
+            await close_async_pool(pool)
+
+
+# The registries behind `get_async_pool` / `release_async_pool`, one per event
+# loop. A registry is dropped once it is empty, so a finished loop is not kept.
+_registries: dict[anyio.lowlevel.EventLoopToken, AsyncPoolRegistry] = {}
+
+
+async def get_async_pool(config: WarehouseConfig, **options: Any) -> AsyncPool:
+    """
+    Return the process-wide shared `AsyncPool` for `config`, building it on first use.
+
+    The async analog of [`get_pool`][adbc_poolhouse.get_pool]. The pool is built
+    with `open_async_pool`, off the loop, and bound to the event loop that built
+    it; each event loop has its own shared pools. Pair every call with
+    `release_async_pool` on the same loop; the last release closes the pool.
+
+    Args:
+        config: The warehouse config.
+        **options: Keyword arguments for `open_async_pool`.
+
+    Returns:
+        The shared pool.
+
+    Example:
+        ```python
+        from adbc_poolhouse import SnowflakeConfig, get_async_pool, release_async_pool
+
+        pool = await get_async_pool(SnowflakeConfig(), pool_size=10)
+        try:
+            table = await pool.fetch_arrow("SELECT 1")
+        finally:
+            await release_async_pool(pool)
+        ```
+    """
+    loop = anyio.lowlevel.current_token()
+    registry = _registries.setdefault(loop, AsyncPoolRegistry())
+    try:
+        return await registry.get_pool(config, **options)
+    finally:
+        if not registry._entries and _registries.get(loop) is registry:
+            del _registries[loop]
+
+
+async def release_async_pool(pool: AsyncPool) -> None:
+    """
+    Give back a reference taken by `get_async_pool`, closing the pool after the last one.
+
+    Args:
+        pool: A pool returned by `get_async_pool`.
+
+    Raises:
+        ValueError: If `pool` did not come from `get_async_pool` on this event
+            loop, or was already released as many times as it was obtained.
+    """
+    loop = anyio.lowlevel.current_token()
+    registry = _registries.get(loop)
+    if registry is None:
+        raise ValueError("pool was not obtained from this registry, or already closed")
+    try:
+        await registry.release_pool(pool)
+    finally:
+        if not registry._entries and _registries.get(loop) is registry:
+            del _registries[loop]
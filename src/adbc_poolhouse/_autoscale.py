@@ -0,0 +1,201 @@
+"""
+Adaptive pool sizing: grow or shrink `pool_size` from observed checkout waits.
+
+A fixed `pool_size` is either too large off-peak (idle warehouse sessions) or
+too small at peak (checkouts queue behind `timeout`).
+[`PoolAutoscaler`][adbc_poolhouse._autoscale.PoolAutoscaler] moves the pool's
+steady-state size between configured bounds at runtime:
+
+- every checkout reports how long it waited; the autoscaler keeps the samples
+  for the current window together with the peak number of connections checked
+  out;
+- once per window it takes the 95th-percentile wait. Above `target_wait`, or
+  with overflow connections in use, the pool grows by half its size. The new
+  connections are opened straight away, which also wakes any checkout blocked on
+  the old ceiling;
+- after `shrink_after` consecutive calm windows (waits under target, peak use
+  under half the pool) it shrinks by a quarter, closing the idle connections
+  above the new size.
+
+`max_overflow` is unchanged, so the checkout ceiling `pool_size + max_overflow`
+moves with `pool_size`. The async layer resizes its `CapacityLimiter` to match
+(see `AsyncPool`).
+
+Evaluation runs inside the maintenance pass
+([`PoolMaintainer.run_once`][adbc_poolhouse._maintenance.PoolMaintainer.run_once]),
+so it happens on the maintainer thread or task, never on a checkout. Internal
+only --- configured through the `autoscale` / `autoscale_target_wait` factory
+arguments.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per window. A window normally sees far fewer checkouts than this
+# on a warehouse pool; the cap only bounds memory under a burst.
+_MAX_SAMPLES = 4096
+
+
+class ScalablePool(Protocol):
+    """The sizing operations a pool must offer to be autoscaled."""
+
+    def size(self) -> int: ...
+
+    def checkedin(self) -> int: ...
+
+    def checkedout(self) -> int: ...
+
+    def _adbc_resize(self, pool_size: int) -> None: ...
+
+    def _adbc_add_idle(self) -> bool: ...
+
+    def _adbc_evict_idle(self) -> bool: ...
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """
+    Return the `q`-th percentile of `samples` (nearest-rank).
+
+    Args:
+        samples: Observed values; need not be sorted.
+        q: Percentile in `(0, 100]`.
+
+    Returns:
+        The smallest sample with at least `q` percent of samples at or below it,
+        or `0.0` for no samples.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+class PoolAutoscaler:
+    """
+    Resize a pool between `min_size` and `max_size` from checkout waits.
+
+    Args:
+        pool: The pool to resize.
+        min_size: Smallest `pool_size` the pool is shrunk to.
+        max_size: Largest `pool_size` the pool is grown to.
+        target_wait: Seconds of 95th-percentile checkout wait above which the
+            pool grows.
+        window: Seconds of samples behind each sizing decision.
+        shrink_after: Consecutive calm windows required before shrinking.
+    """
+
+    def __init__(
+        self,
+        pool: ScalablePool,
+        *,
+        min_size: int,
+        max_size: int,
+        target_wait: float,
+        window: float,
+        shrink_after: int = 3,
+    ) -> None:
+        self.pool = pool
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_wait = target_wait
+        self.window = window
+        self.shrink_after = shrink_after
+        self._waits: collections.deque[float] = collections.deque(maxlen=_MAX_SAMPLES)
+        self._peak = 0
+        self._calm = 0
+        self._next_eval = time.monotonic() + window
+
+    def observe(self, wait: float) -> None:
+        """
+        Record one checkout. Called by the pool on every `connect()`.
+
+        Args:
+            wait: Seconds the checkout took, including any wait for a free
+                connection and any connection open.
+        """
+        self._waits.append(wait)
+        # Racy max: a lost update under contention only understates one sample.
+        out = self.pool.checkedout()
+        if out > self._peak:
+            self._peak = out
+
+    def run_once(self) -> None:
+        """Evaluate the window if it has elapsed, resizing the pool when needed."""
+        now = time.monotonic()
+        if now < self._next_eval:
+            return
+        self._next_eval = now + self.window
+        # A checkout landing between the copy and the clear is dropped; one
+        # sample does not move a percentile.
+        waits = list(self._waits)
+        self._waits.clear()
+        peak, self._peak = self._peak, self.pool.checkedout()
+        self.evaluate(waits, peak)
+
+    def evaluate(self, waits: Sequence[float], peak: int) -> int:
+        """
+        Make one sizing decision and apply it.
+
+        Args:
+            waits: Checkout waits observed during the window, in seconds.
+            peak: Most connections checked out at once during the window.
+
+        Returns:
+            The pool size after the decision.
+        """
+        size = self.pool.size()
+        p95 = percentile(waits, 95)
+        if p95 > self.target_wait or peak > size:
+            self._calm = 0
+            target = min(self.max_size, size + max(1, size // 2))
+            if target > size:
+                self._grow(size, target, p95, peak)
+            return self.pool.size()
+        if peak * 2 <= size:
+            self._calm += 1
+            if self._calm >= self.shrink_after:
+                self._calm = 0
+                target = max(self.min_size, size - max(1, size // 4))
+                if target < size:
+                    self._shrink(size, target, p95, peak)
+        else:
+            self._calm = 0
+        return self.pool.size()
+
+    def _grow(self, size: int, target: int, p95: float, peak: int) -> None:
+        logger.info(
+            "adbc-poolhouse autoscale: pool_size %d -> %d (p95 wait %.3fs, peak %d)",
+            size,
+            target,
+            p95,
+            peak,
+        )
+        self.pool._adbc_resize(target)
+        # Open the new slots now: the next burst finds them warm, and a checkout
+        # blocked on the old ceiling is handed one instead of timing out.
+        for _ in range(target - size):
+            if not self.pool._adbc_add_idle():
+                break
+
+    def _shrink(self, size: int, target: int, p95: float, peak: int) -> None:
+        logger.info(
+            "adbc-poolhouse autoscale: pool_size %d -> %d (p95 wait %.3fs, peak %d)",
+            size,
+            target,
+            p95,
+            peak,
+        )
+        self.pool._adbc_resize(target)
+        while self.pool.checkedin() > target and self.pool._adbc_evict_idle():
+            pass
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import importlib.util
 from abc import ABC, abstractmethod
-from typing import Any, Protocol, runtime_checkable
+from typing import Protocol, runtime_checkable
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
+from adbc_poolhouse._driver_cache import driver_path, package_installed
+from adbc_poolhouse._exceptions import ConfigurationError
+
 
 @runtime_checkable
 class WarehouseConfig(Protocol):
@@ -113,6 +116,18 @@ class BaseWarehouseConfig(BaseSettings, ABC):
     recycle: int = 3600
     """Seconds before a connection is closed and replaced. Default: 3600."""
 
+    idle_timeout: float | None = None
+    """Seconds a connection may sit unused before the pool's maintainer closes
+    it, measured from its last checkin. Used by `create_pool` when no
+    ``idle_timeout`` argument is passed. Default: None (disabled)."""
+
+    @field_validator("idle_timeout")
+    @classmethod
+    def validate_idle_timeout(cls, v: float | None) -> float | None:
+        if v is not None and v <= 0:
+            raise ConfigurationError(f"idle_timeout must be > 0, got {v}")
+        return v
+
     def _adbc_entrypoint(self) -> str | None:
         """
         Return the ADBC driver init symbol, or ``None`` for the default.
@@ -167,6 +182,7 @@ class BaseWarehouseConfig(BaseSettings, ABC):
 
         Tries ``find_spec`` -> ``import`` -> call ``method_name()``. Falls back
         to returning *pkg_name* for ``adbc_driver_manager`` manifest resolution.
+        The answer is cached for the life of the process.
 
         Args:
             pkg_name: Python package name (e.g. ``"adbc_driver_snowflake"``).
@@ -176,8 +192,19 @@ class BaseWarehouseConfig(BaseSettings, ABC):
         Returns:
             Absolute path to driver shared library, or *pkg_name* as fallback.
         """
-        spec = importlib.util.find_spec(pkg_name)
-        if spec is not None:
-            pkg: Any = __import__(pkg_name)
-            return pkg.__dict__[method_name]()
-        return pkg_name
+        return driver_path(pkg_name, method_name)
+
+    @staticmethod
+    def _package_installed(pkg_name: str) -> bool:
+        """
+        Whether a driver package is installed, for ``_dbapi_module`` overrides.
+
+        Calls ``find_spec`` once per package and process.
+
+        Args:
+            pkg_name: Python package name (e.g. ``"adbc_driver_snowflake"``).
+
+        Returns:
+            ``True`` if *pkg_name* can be imported.
+        """
+        return package_installed(pkg_name)
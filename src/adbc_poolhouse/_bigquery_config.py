@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import importlib.util
-
 from pydantic import SecretStr  # noqa: TC002
 from pydantic_settings import SettingsConfigDict
 
@@ -49,7 +47,7 @@ class BigQueryConfig(BaseWarehouseConfig):
         return self._resolve_driver_path("adbc_driver_bigquery")
 
     def _dbapi_module(self) -> str | None:
-        if importlib.util.find_spec("adbc_driver_bigquery") is not None:
+        if self._package_installed("adbc_driver_bigquery"):
             return "adbc_driver_bigquery.dbapi"
         return None
 
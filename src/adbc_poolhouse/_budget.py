@@ -0,0 +1,621 @@
+"""
+Connection budgets: one cap on open connections, shared by several pools.
+
+Each pool bounds its own connections at `pool_size + max_overflow`, so a process
+holding dozens of pools, or a host running many workers each with its own pool,
+has no bound on the total. A budget caps it:
+
+- [`ConnectionBudget`][adbc_poolhouse.ConnectionBudget] across the pools of one
+  process;
+- [`HostConnectionBudget`][adbc_poolhouse.HostConnectionBudget] across every
+  process on the host that uses a budget of the same name.
+
+A budget is enforced where connections are opened. The factory wraps a budgeted
+pool's creator in a [`BudgetGate`][adbc_poolhouse._budget.BudgetGate], which
+takes a lease from each budget before each open and keeps it with the connection
+until the pool closes it. An open that cannot get a lease waits, up to the pool's
+`timeout`, and then raises `sqlalchemy.exc.TimeoutError` as an exhausted pool
+does. The pool's ADBC source connection is not counted.
+
+Idle connections in other pools make room. `ConnectionBudget.acquire`, finding
+the budget full, closes the longest-idle connection of the coldest pool (the one
+whose latest checkin is oldest) and takes the slot it frees, before it waits.
+The pool asking for the open is never the one that gives up a connection:
+closing its own idle connection to open another would only go round in circles,
+as a `min_idle` top-up or an autoscale growth would do without end.
+
+The host budget is a directory of slot files in shared memory (`/dev/shm`). A
+lease is an exclusive `flock` on one slot file, held on its own file descriptor,
+so the kernel gives it back if the process dies. The waiting is a poll, with
+backoff, over the slots. Other processes' idle connections are lent rather than
+taken: while an open is waiting, it touches the budget's `demand` file, and it
+clears it once it has its slot. In every process using the budget, a lender
+thread checks that file's age every `lend_interval` seconds and, while the
+demand is fresh, closes one idle connection in each of its pools that has one,
+except pools that are waiting for a slot themselves.
+Closing the connection frees its slot for the waiting open, in whichever process
+that is. The thread runs only while the process has budgeted pools open.
+
+After a fork, the child starts each budget afresh: a `ConnectionBudget` counts no
+connections, and a `HostConnectionBudget` closes the child's copies of the
+parent's lease descriptors. The leases stay with the parent, whose connections
+they are (see `adbc_poolhouse._fork`). The reset runs once per process, from
+this module's fork hook or from the reset of a pool using the budget, whichever
+comes first, so a pool never opens a connection against the parent's count.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import math
+import os
+import random
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Protocol
+
+import sqlalchemy.exc
+
+from adbc_poolhouse._exceptions import ConfigurationError
+from adbc_poolhouse._maintenance import _IDLE_SINCE
+from adbc_poolhouse._shm import SHM_PREFIX, shm_dir
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Sequence
+
+# Backoff bounds, in seconds, between polls of an exhausted host budget.
+_POLL_MIN = 0.005
+_POLL_MAX = 0.05
+
+# Budgets alive in this process, for the fork hook.
+_budgets: weakref.WeakSet[ConnectionBudget | HostConnectionBudget] = weakref.WeakSet()
+
+
+class Lease(Protocol):
+    """One connection's share of a budget."""
+
+    def release(self) -> None:
+        """Give the share back; idempotent."""
+        ...
+
+
+class Budget(Protocol):
+    """What a `BudgetGate` needs from a budget."""
+
+    def acquire(self, timeout: float, pool: Any = None) -> Lease:
+        """Take a share for one connection of `pool`, waiting up to `timeout` seconds."""
+        ...
+
+    def register(self, pool: Any) -> None:
+        """Start lending `pool`'s idle connections to waiting opens."""
+        ...
+
+    def unregister(self, pool: Any) -> None:
+        """Stop lending `pool`'s idle connections."""
+        ...
+
+    def after_fork(self) -> None:
+        """Start afresh in a forked child; a no-op if already done in this process."""
+        ...
+
+
+class BudgetGate:
+    """
+    Connection creator that holds a lease from each budget on every connection it opens.
+
+    Built by the factory around the source's `adbc_clone` and stored on the pool
+    as `_adbc_gate`; `register` binds it to that pool. The pool calls `release`
+    with each connection it closes.
+
+    Args:
+        creator: Zero-argument callable opening a new connection.
+        budgets: The budgets every connection counts against.
+        timeout: Seconds an open waits for each budget.
+    """
+
+    __slots__ = ("_leases", "_replacing", "budgets", "creator", "pool", "timeout")
+
+    def __init__(
+        self, creator: Callable[[], Any], budgets: Sequence[Budget], timeout: float
+    ) -> None:
+        self.creator = creator
+        self.budgets = tuple(budgets)
+        self.timeout = timeout
+        # The pool the gate opens connections for, once registered.
+        self.pool: Any = None
+        # `id(connection)` -> its leases. Single dict operations need no lock.
+        self._leases: dict[int, list[Lease]] = {}
+        # Set on a thread inside `replacing()`.
+        self._replacing = threading.local()
+
+    def __call__(self) -> Any:
+        """Take a lease from every budget, then open a connection."""
+        if getattr(self._replacing, "active", False):
+            # Takes over the leases of the connection it replaces (`hand_over`).
+            return self.creator()
+        leases: list[Lease] = []
+        try:
+            for budget in self.budgets:
+                leases.append(budget.acquire(self.timeout, self.pool))
+            conn = self.creator()
+        except BaseException:
+            for lease in leases:
+                lease.release()
+            raise
+        self._leases[id(conn)] = leases
+        return conn
+
+    def release(self, conn: Any) -> None:
+        """Give back the leases of a connection the pool has closed."""
+        for lease in self._leases.pop(id(conn), ()):
+            lease.release()
+
+    @contextlib.contextmanager
+    def replacing(self) -> Generator[None]:
+        """
+        Open connections on this thread without leases, to replace idle ones.
+
+        A pool at its budget's cap could otherwise never swap an aged idle
+        connection for a fresh one: the replacement is opened before the old
+        connection is closed, so it would wait for a lease only the old
+        connection's close can free. Pass each replacement that goes into the
+        pool to `hand_over`; one closed unused instead has no leases to give back.
+        """
+        self._replacing.active = True
+        try:
+            yield
+        finally:
+            self._replacing.active = False
+
+    def hand_over(self, old: Any, new: Any) -> None:
+        """Move `old`'s leases to `new`, its replacement opened under `replacing()`."""
+        leases = self._leases.pop(id(old), None)
+        if leases is not None:
+            self._leases[id(new)] = leases
+
+    def after_fork(self) -> None:
+        """
+        Forget the inherited connections' leases, which stay with the parent.
+
+        Also resets each budget (`after_fork`), so the pool's first open in the
+        child counts against the child's budget whichever fork hook runs first.
+        """
+        self._leases.clear()
+        for budget in self.budgets:
+            budget.after_fork()
+
+    def register(self, pool: Any) -> None:
+        """Open connections for `pool`, and lend its idle ones, through every budget."""
+        self.pool = pool
+        for budget in self.budgets:
+            budget.register(pool)
+
+    def unregister(self, pool: Any) -> None:
+        """Withdraw `pool` from every budget."""
+        for budget in self.budgets:
+            budget.unregister(pool)
+
+
+class _CountLease:
+    """One connection's share of a `ConnectionBudget`."""
+
+    __slots__ = ("_budget",)
+
+    def __init__(self, budget: ConnectionBudget) -> None:
+        self._budget: ConnectionBudget | None = budget
+
+    def release(self) -> None:
+        budget, self._budget = self._budget, None
+        if budget is not None:
+            budget._release()
+
+
+class ConnectionBudget:
+    """
+    A cap on connections open at once across many pools in this process.
+
+    Pass the same budget to every pool that should share it, as `budget=` to
+    `create_pool` or `create_async_pool`. Each connection a budgeted pool opens
+    counts against `limit` until the pool closes it. An open that finds the
+    budget full first closes an idle connection of the coldest budgeted pool,
+    the one used least recently, and takes its place; with nothing idle it waits
+    up to the pool's `timeout`.
+
+    Async pools also share the budget's `limit` as a cap on checkouts: a task
+    waits on the event loop for a budget slot, after its pool slot, so tasks
+    beyond the budget never hold a worker thread or limiter token. Every
+    offload a task makes runs on a connection it has checked out, so this
+    bounds in-flight offloads across the budgeted async pools too. Share one
+    budget between pools on one event loop only: a checkout from a second
+    loop raises `ConfigurationError`. Sync pools sharing the budget are not in
+    that queue, so while they hold leases an async open can still wait for one
+    on its worker thread, up to the pool's `timeout`.
+
+    Args:
+        limit: Connections allowed open at once, across the budgeted pools.
+
+    Raises:
+        ConfigurationError: If `limit` is below 1.
+
+    Example:
+        ```python
+        from adbc_poolhouse import ConnectionBudget, create_pool
+
+        budget = ConnectionBudget(limit=20)
+        pools = {
+            tenant: create_pool(config, pool_size=5, budget=budget)
+            for tenant, config in tenant_configs.items()
+        }
+        ```
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Create an empty budget."""
+        if limit < 1:
+            raise ConfigurationError(f"limit must be at least 1, got {limit}")
+        self.limit = limit
+        self._open = 0
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._pools: weakref.WeakSet[Any] = weakref.WeakSet()
+        # The async layer's checkout queue for the budget; see `AsyncPool`.
+        self._async_slots: Any = None
+        # The process whose connections `_open` counts.
+        self._pid = os.getpid()
+        _budgets.add(self)
+
+    def acquire(self, timeout: float, pool: Any = None) -> Lease:
+        """
+        Count one more open connection, making room if the budget is full.
+
+        Room is made by closing an idle connection of another budgeted pool,
+        never one of `pool`'s own; with none idle elsewhere, the open waits.
+
+        Args:
+            timeout: Seconds to wait for room.
+            pool: The pool opening the connection, if it is budgeted.
+
+        Returns:
+            The connection's lease; `release` gives it back.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If no room is made in time.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._open < self.limit:
+                    self._open += 1
+                    return _CountLease(self)
+                pools = [other for other in self._pools if other is not pool]
+            # Close outside the lock: the closed connection releases its lease.
+            coldest = _coldest(pools)
+            if coldest is not None and coldest._adbc_evict_idle():
+                continue
+            with self._lock:
+                if self._open < self.limit:
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise sqlalchemy.exc.TimeoutError(
+                        f"ConnectionBudget limit of {self.limit} reached, "
+                        f"connection timed out, timeout {timeout:.2f}"
+                    )
+                # A checkin elsewhere makes a connection idle without notifying
+                # the budget, so look for one again after a short wait.
+                self._released.wait(min(remaining, _POLL_MAX))
+
+    def in_use(self) -> int:
+        """
+        Count the connections open under the budget.
+
+        Returns:
+            The number of connections holding a lease.
+        """
+        with self._lock:
+            return self._open
+
+    def register(self, pool: Any) -> None:
+        """
+        Let opens in other pools close `pool`'s idle connections; called by the factory.
+
+        Args:
+            pool: A pool built with this budget.
+        """
+        with self._lock:
+            self._pools.add(pool)
+
+    def unregister(self, pool: Any) -> None:
+        """
+        Withdraw `pool` from reclaiming; called by `close_pool`.
+
+        Args:
+            pool: A pool built with this budget.
+        """
+        with self._lock:
+            self._pools.discard(pool)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._open -= 1
+            self._released.notify()
+
+    def after_fork(self) -> None:
+        """Count none of the inherited connections, which are the parent's and never close here."""
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._open = 0
+        self._async_slots = None
+
+
+class _SlotLease:
+    """An exclusive `flock` on one slot file of a `HostConnectionBudget`."""
+
+    __slots__ = ("_budget", "_fd")
+
+    def __init__(self, budget: HostConnectionBudget, fd: int) -> None:
+        self._budget = budget
+        self._fd = fd
+
+    def release(self) -> None:
+        fd, self._fd = self._fd, -1
+        if fd >= 0:
+            self._budget._leases.discard(self)
+            os.close(fd)
+
+
+class HostConnectionBudget:
+    """
+    A cap on connections open at once across every process on this host.
+
+    Pass it to the pool factories as `host_budget=`, in every worker process.
+    Processes constructing a budget with the same `name` share its `limit`, so
+    give every process the same `limit`. Each connection a budgeted pool opens
+    holds a slot until the pool closes it; an open that finds every slot taken
+    waits up to the pool's `timeout`, while idle connections in other processes'
+    budgeted pools are closed to make room.
+
+    Args:
+        name: The budget's name, used as its directory name.
+        limit: Connections allowed open at once, host-wide.
+        directory: Where to create the budget directory. Default: `/dev/shm`,
+            or the system temp directory where that does not exist.
+        lend_interval: Seconds between this process's checks for opens
+            waiting elsewhere. Default: 0.1.
+
+    Raises:
+        ConfigurationError: If `name` is not a plain file name, `limit` is below
+            1, `lend_interval` is not positive, or the platform has no `fcntl`.
+
+    Example:
+        ```python
+        from adbc_poolhouse import HostConnectionBudget, SnowflakeConfig, create_pool
+
+        budget = HostConnectionBudget("snowflake", limit=20)
+        pool = create_pool(SnowflakeConfig(), pool_size=5, host_budget=budget)
+        ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        *,
+        directory: str | None = None,
+        lend_interval: float = 0.1,
+    ) -> None:
+        """Create the budget directory if it does not exist yet."""
+        if fcntl is None:
+            raise ConfigurationError("HostConnectionBudget needs fcntl file locks (POSIX only)")
+        if not name or os.sep in name or name.startswith("."):
+            raise ConfigurationError(f"budget name must be a plain file name, got {name!r}")
+        if limit < 1:
+            raise ConfigurationError(f"limit must be at least 1, got {limit}")
+        if lend_interval <= 0:
+            raise ConfigurationError(f"lend_interval must be positive, got {lend_interval}")
+        self.name = name
+        self.limit = limit
+        self.lend_interval = lend_interval
+        self.path = os.path.join(directory or shm_dir(), f"{SHM_PREFIX}budget-{name}")
+        os.makedirs(self.path, exist_ok=True)
+        self._demand = os.path.join(self.path, "demand")
+        with open(self._demand, "a"):
+            pass
+        self._lock = threading.Lock()
+        self._leases: set[_SlotLease] = set()
+        self._pools: weakref.WeakSet[Any] = weakref.WeakSet()
+        self._lender: threading.Thread | None = None
+        # `id(pool)` -> opens of that pool waiting for a slot, left out of lending.
+        self._waiting: collections.Counter[int] = collections.Counter()
+        # The process whose leases `_leases` holds.
+        self._pid = os.getpid()
+        _budgets.add(self)
+
+    def acquire(self, timeout: float, pool: Any = None) -> Lease:
+        """
+        Take a slot for one connection.
+
+        While it waits, this process's lender leaves `pool` out: closing one of
+        its idle connections to free a slot for its own open gains nothing.
+
+        Args:
+            timeout: Seconds to wait for a free slot.
+            pool: The pool opening the connection, if it is budgeted.
+
+        Returns:
+            The slot's lease; `release` gives it back.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If no slot comes free in time.
+        """
+        lease = self._try_acquire()
+        if lease is not None:
+            return lease
+        with self._lock:
+            self._waiting[id(pool)] += 1
+        try:
+            return self._wait(timeout)
+        finally:
+            with self._lock:
+                self._waiting[id(pool)] -= 1
+                if not self._waiting[id(pool)]:
+                    del self._waiting[id(pool)]
+
+    def _wait(self, timeout: float) -> Lease:
+        deadline = time.monotonic() + timeout
+        delay = _POLL_MIN
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise sqlalchemy.exc.TimeoutError(
+                    f"HostConnectionBudget {self.name!r} limit of {self.limit} "
+                    f"reached, connection timed out, timeout {timeout:.2f}"
+                )
+            os.utime(self._demand)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _POLL_MAX)
+            lease = self._try_acquire()
+            if lease is not None:
+                # Stop the lending; any other open still waiting renews the
+                # demand on its next poll.
+                os.utime(self._demand, (0, 0))
+                return lease
+
+    def in_use(self) -> int:
+        """
+        Count the slots held right now, by any process.
+
+        Probing takes each free slot for an instant, so an open racing the count
+        may briefly find it taken and poll again.
+
+        Returns:
+            The number of connections holding a slot.
+        """
+        held = 0
+        for slot in range(self.limit):
+            fd = self._open_slot(slot)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)  # type: ignore[union-attr]
+            except BlockingIOError:
+                held += 1
+            finally:
+                os.close(fd)
+        return held
+
+    def register(self, pool: Any) -> None:
+        """
+        Lend `pool`'s idle connections to opens waiting in other processes.
+
+        Called by the factory; starts the lender thread if it is not running.
+
+        Args:
+            pool: A pool built with this budget.
+        """
+        with self._lock:
+            self._pools.add(pool)
+            if self._lender is None:
+                self._start_lender()
+
+    def unregister(self, pool: Any) -> None:
+        """
+        Stop lending `pool`'s connections; called by `close_pool`.
+
+        Args:
+            pool: A pool built with this budget.
+        """
+        with self._lock:
+            self._pools.discard(pool)
+
+    def _open_slot(self, slot: int) -> int:
+        return os.open(os.path.join(self.path, f"slot-{slot}"), os.O_RDWR | os.O_CREAT, 0o600)
+
+    def _try_acquire(self) -> _SlotLease | None:
+        # Start the scan at a random slot, so concurrent opens rarely collide.
+        start = random.randrange(self.limit)
+        for i in range(self.limit):
+            fd = self._open_slot((start + i) % self.limit)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)  # type: ignore[union-attr]
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            lease = _SlotLease(self, fd)
+            self._leases.add(lease)
+            return lease
+        return None
+
+    def _start_lender(self) -> None:
+        # Called with `_lock` held.
+        self._lender = threading.Thread(
+            target=self._lend, name="adbc-poolhouse-lender", daemon=True
+        )
+        self._lender.start()
+
+    def _lend(self) -> None:
+        # Fresh means touched within the last couple of waiter polls or passes.
+        fresh = 2 * max(self.lend_interval, _POLL_MAX)
+        while True:
+            time.sleep(self.lend_interval)
+            with self._lock:
+                if not self._pools:
+                    self._lender = None
+                    return
+                pools = [pool for pool in self._pools if id(pool) not in self._waiting]
+            try:
+                wanted = time.time() - os.stat(self._demand).st_mtime < fresh
+            except FileNotFoundError:
+                wanted = False
+            if not wanted:
+                continue
+            for pool in pools:
+                with contextlib.suppress(Exception):
+                    if pool.checkedin():
+                        pool._adbc_evict_idle()
+
+    def after_fork(self) -> None:
+        """Give up the inherited descriptors and restart the lender in a forked child."""
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        # The parent's leases stay with the parent: close only this process's
+        # copies of their descriptors. Its lender thread did not survive the fork.
+        self._lock = threading.Lock()
+        self._waiting = collections.Counter()
+        leases, self._leases = list(self._leases), set()
+        for lease in leases:
+            lease.release()
+        self._lender = None
+        if self._pools:
+            self._start_lender()
+
+
+def _coldest(pools: Sequence[Any]) -> Any:
+    """The pool with idle connections whose latest checkin is oldest, if any."""
+    coldest, coldest_since = None, math.inf
+    for pool in pools:
+        with contextlib.suppress(Exception):
+            records = pool._adbc_idle_records()
+            if records:
+                since = max(r.info.get(_IDLE_SINCE, r.starttime) for r in records)
+                if since < coldest_since:
+                    coldest, coldest_since = pool, since
+    return coldest
+
+
+def _after_fork_in_child() -> None:
+    for budget in list(_budgets):
+        budget.after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -16,13 +16,13 @@ Internal only — not exported from ``__init__.py``.
 
 from __future__ import annotations
 
-import importlib
-import inspect
 from typing import TYPE_CHECKING
 
 import adbc_driver_manager
 import adbc_driver_manager.dbapi  # runtime import — adbc-driver-manager always present
 
+from adbc_poolhouse._driver_cache import connect_plan
+
 if TYPE_CHECKING:
     from adbc_driver_manager.dbapi import Connection
 
@@ -60,7 +60,9 @@ def create_adbc_connection(
       ``connect(**kwargs)`` with kwargs unpacked directly.
 
     This signature detection ensures tools that monkeypatch per-driver DBAPI
-    modules (e.g. pytest-adbc-replay) intercept at the correct module.
+    modules (e.g. pytest-adbc-replay) intercept at the correct module. The
+    import and the detection run once per module and process (see
+    ``adbc_poolhouse._driver_cache``), and again if ``connect`` is replaced.
 
     For Foundry drivers (Databricks, Redshift, Trino, MSSQL, MySQL):
     if the driver manifest is not found, ``adbc_driver_manager`` raises an
@@ -97,31 +99,28 @@ def create_adbc_connection(
         # the caller's dict (visible on the raw create_pool(dbapi_module=...,
         # db_kwargs=user_dict) path where _pool_factory forwards by reference).
         kwargs = dict(kwargs)
-        mod = importlib.import_module(dbapi_module)
-        sig = inspect.signature(mod.connect)  # type: ignore[reportUnknownMemberType]
-        params = sig.parameters
-        if "db_kwargs" in params:
-            uri_param = params.get("uri")
-            if uri_param is not None and uri_param.default is inspect.Parameter.empty:
-                # Family A' — uri is a REQUIRED parameter. Pop it from kwargs and
-                # pass explicitly so the driver's signature is satisfied; remaining
-                # keys ride as db_kwargs=. KeyError from the pop is intentional —
-                # fail loud on a config-shape mismatch.
-                # db_kwargs is passed by name because Quack declares it KEYWORD_ONLY.
-                uri_val = kwargs.pop("uri")
-                if uri_param.kind is inspect.Parameter.KEYWORD_ONLY:
-                    # `def connect(*, uri, db_kwargs=None)` — pass uri by name.
-                    conn = mod.connect(uri=uri_val, db_kwargs=kwargs)  # type: ignore[no-any-return]
-                else:
-                    # POSITIONAL_ONLY / POSITIONAL_OR_KEYWORD (Quack, Postgres, FlightSQL).
-                    conn = mod.connect(uri_val, db_kwargs=kwargs)  # type: ignore[no-any-return]
-            else:
-                # Family A (Snowflake / BigQuery): uri optional or absent — driver
-                # picks `uri` out of db_kwargs itself if it cares.
-                conn = mod.connect(db_kwargs=kwargs)  # type: ignore[no-any-return]
-        else:
+        # The module, its `connect` and the family are resolved once per process.
+        plan = connect_plan(dbapi_module)
+        if plan.shape == "kwargs":
             # Family B (DuckDB / SQLite): no db_kwargs parameter.
-            conn = mod.connect(**kwargs)  # type: ignore[no-any-return]
+            conn = plan.connect(**kwargs)
+        elif plan.shape == "db_kwargs":
+            # Family A (Snowflake / BigQuery): uri optional or absent — driver
+            # picks `uri` out of db_kwargs itself if it cares.
+            conn = plan.connect(db_kwargs=kwargs)
+        else:
+            # Family A' — uri is a REQUIRED parameter. Pop it from kwargs and
+            # pass explicitly so the driver's signature is satisfied; remaining
+            # keys ride as db_kwargs=. KeyError from the pop is intentional —
+            # fail loud on a config-shape mismatch.
+            # db_kwargs is passed by name because Quack declares it KEYWORD_ONLY.
+            uri_val = kwargs.pop("uri")
+            if plan.shape == "uri_keyword":
+                # `def connect(*, uri, db_kwargs=None)` — pass uri by name.
+                conn = plan.connect(uri=uri_val, db_kwargs=kwargs)
+            else:
+                # POSITIONAL_ONLY / POSITIONAL_OR_KEYWORD (Quack, Postgres, FlightSQL).
+                conn = plan.connect(uri_val, db_kwargs=kwargs)
         return conn  # type: ignore[return-value]
 
     try:
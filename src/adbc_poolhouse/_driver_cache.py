@@ -0,0 +1,130 @@
+"""
+Process-wide caches for driver resolution and DBAPI connect plans.
+
+Every pool build resolves its driver from scratch: `find_spec` on the driver
+package (in `_driver_path()` and again in `_dbapi_module()`), an import and the
+package's driver-path function, and, for a PyPI driver's DBAPI module, an import
+and an `inspect.signature` of its `connect()` to pick the call shape (see
+`create_adbc_connection`). None of it changes while the process runs, so each
+answer is worked out once and kept here: services that build many pools, or
+rebuild them after failures, pay for it once.
+
+A plan remembers the module and `connect` function it was built from, and is
+rebuilt when `sys.modules` holds another module under that name or the module's
+`connect` is no longer that function. Tools that monkeypatch a driver's DBAPI
+module (pytest-adbc-replay), or swap or reload the module itself, still get a
+call shaped for their replacement. Installing or removing a driver package in a running process, or
+patching `find_spec` / `import_module` in a test, needs `clear_driver_caches()`.
+
+Lookups are not locked: two threads missing together both resolve, and the
+second stores an equal answer.
+
+Internal only --- not exported from ``__init__.py``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import inspect
+import sys
+from typing import Any, Literal
+
+ConnectShape = Literal["db_kwargs", "uri_positional", "uri_keyword", "kwargs"]
+
+# Package name -> whether `find_spec` finds it.
+_packages: dict[str, bool] = {}
+
+# (package name, method name) -> the resolved driver path.
+_driver_paths: dict[tuple[str, str], str] = {}
+
+# Dotted DBAPI module name -> how to call its `connect()`.
+_plans: dict[str, ConnectPlan] = {}
+
+
+class ConnectPlan:
+    """How to call one DBAPI module's `connect()`: the function and its call shape."""
+
+    __slots__ = ("connect", "module", "shape")
+
+    def __init__(self, module: Any, connect: Any, shape: ConnectShape) -> None:
+        """Record `module.connect` (as `connect`) and the shape to call it with."""
+        self.module = module
+        self.connect = connect
+        self.shape = shape
+
+
+def package_installed(pkg_name: str) -> bool:
+    """Whether `pkg_name` is importable, as `importlib.util.find_spec` first said."""
+    found = _packages.get(pkg_name)
+    if found is None:
+        found = _packages[pkg_name] = importlib.util.find_spec(pkg_name) is not None
+    return found
+
+
+def driver_path(pkg_name: str, method_name: str) -> str:
+    """
+    The driver path a PyPI ADBC driver package reports, or `pkg_name` if it is not installed.
+
+    Args:
+        pkg_name: Python package name (e.g. ``"adbc_driver_snowflake"``).
+        method_name: Function name on the package module.
+
+    Returns:
+        The package's ``method_name()``, or *pkg_name* for manifest resolution.
+    """
+    key = (pkg_name, method_name)
+    path = _driver_paths.get(key)
+    if path is None:
+        if package_installed(pkg_name):
+            pkg: Any = __import__(pkg_name)
+            path = pkg.__dict__[method_name]()
+        else:
+            path = pkg_name
+        _driver_paths[key] = path
+    return path
+
+
+def connect_plan(dbapi_module: str) -> ConnectPlan:
+    """
+    The plan for calling `dbapi_module`'s `connect()`, built on first use.
+
+    Args:
+        dbapi_module: Dotted module name (e.g. ``"adbc_driver_snowflake.dbapi"``).
+
+    Returns:
+        The module's current `connect` and the shape to call it with.
+    """
+    plan = _plans.get(dbapi_module)
+    if (
+        plan is not None
+        and sys.modules.get(dbapi_module) is plan.module
+        and plan.module.connect is plan.connect
+    ):
+        return plan
+    module: Any = importlib.import_module(dbapi_module)
+    connect = module.connect
+    plan = _plans[dbapi_module] = ConnectPlan(module, connect, _shape(connect))
+    return plan
+
+
+def _shape(connect: Any) -> ConnectShape:
+    params = inspect.signature(connect).parameters
+    if "db_kwargs" not in params:
+        # Family B (DuckDB / SQLite): no db_kwargs parameter.
+        return "kwargs"
+    uri_param = params.get("uri")
+    if uri_param is None or uri_param.default is not inspect.Parameter.empty:
+        # Family A (Snowflake / BigQuery): uri optional or absent.
+        return "db_kwargs"
+    # Family A': uri is a REQUIRED parameter.
+    if uri_param.kind is inspect.Parameter.KEYWORD_ONLY:
+        return "uri_keyword"
+    return "uri_positional"
+
+
+def clear_driver_caches() -> None:
+    """Forget every cached resolution, so the next pool build looks again."""
+    _packages.clear()
+    _driver_paths.clear()
+    _plans.clear()
@@ -0,0 +1,199 @@
+"""
+Fork safety: pools that a pre-fork server builds before forking its workers.
+
+A child process inherits its parent's pools exactly as they were at the fork:
+the ADBC source connection, the pooled connections and their sockets, the
+pool's locks, and the `fetch_processes` worker pool. None of it is usable in the
+child. Closing it there is worse than useless, because it would close or send a
+goodbye on sockets the parent is still using. So the factories register every
+pool here, and in the child each one is reset:
+
+- Every inherited connection, the source included, is dropped without being
+  closed. The child marks each one closed, so the DBAPI finalizer leaves it
+  alone at garbage collection or interpreter exit, and keeps it referenced in
+  `_abandoned` until it exits.
+- The pool starts afresh: empty idle set, zero counts, new locks (another parent
+  thread may have held the old ones at the fork) and new `stats()`.
+- The source connection is reopened from the arguments it was first opened
+  with, by the first connection the child opens. With `fork_prefill`, the
+  child's first checkout opens that many connections at once, so the child is
+  warm before its second request.
+- A background maintainer thread, which did not survive the fork, is
+  restarted, and the `fetch_processes` workers are replaced by a fresh set that
+  starts on the child's first fetch.
+
+The reset runs from an `os.register_at_fork` hook. It only resets state: no
+connection is opened inside the hook. Every checkout also compares the pid the
+pool was built (or last reset) in with `os.getpid()`, which catches a fork made
+without the hook, e.g. from C.
+
+Do not fork while holding a connection. If the child checks one in anyway, the
+pool drops it instead of pooling it, but `AdbcQueuePool` rolls a connection back
+before the pool sees it.
+
+Internal only --- `fork_prefill` is a factory argument.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from adbc_poolhouse._prefill import prefill_pool
+
+if TYPE_CHECKING:
+    from adbc_poolhouse._adbc_pool import AdbcPool
+    from adbc_poolhouse._queue_pool import AdbcQueuePool
+
+logger = logging.getLogger(__name__)
+
+# Factory-built pools not yet closed.
+_pools: weakref.WeakSet[Any] = weakref.WeakSet()
+
+# Connections and worker pools inherited from the parent, kept alive unclosed.
+_abandoned: list[Any] = []
+
+# Serializes resets. Replaced in every child, since the
+# parent may have held it at the fork.
+_lock = threading.Lock()
+
+
+def track(pool: AdbcQueuePool | AdbcPool) -> None:
+    """Reset `pool` in forked children until it is untracked or collected."""
+    _pools.add(pool)
+
+
+def untrack(pool: AdbcQueuePool | AdbcPool) -> None:
+    """Stop resetting `pool` after forks; a no-op if it was not tracked."""
+    _pools.discard(pool)
+
+
+def reset(pool: AdbcQueuePool | AdbcPool, *, warm: bool = True) -> None:
+    """
+    Make a pool inherited from a parent process usable in this one.
+
+    A no-op if the pool was built, or already reset, in this process. Opens
+    nothing: the pool's `fork_prefill` is left to its first checkout (`warm_up`).
+
+    Args:
+        pool: The pool to reset.
+        warm: Leave the pool's `fork_prefill` owed. `close_pool` passes `False`.
+    """
+    with _lock:
+        if pool._adbc_pid == os.getpid():
+            return
+        _forget(pool)
+        pool._adbc_warm_pending = warm and pool._adbc_fork_prefill > 0
+
+
+def warm_up(pool: AdbcQueuePool | AdbcPool) -> None:
+    """
+    Open the `fork_prefill` connections a reset pool owes; called by its first checkout.
+
+    Runs once per reset, on the first thread to get here. A failed warm-up is
+    logged, not raised: connections then open on demand.
+
+    Args:
+        pool: A pool reset in this process.
+    """
+    with _lock:
+        if not pool._adbc_warm_pending:
+            return
+        pool._adbc_warm_pending = False
+    try:
+        pool.prefill_report = prefill_pool(pool, pool._adbc_fork_prefill)
+    except Exception:
+        logger.warning("adbc-poolhouse fork_prefill failed in the child", exc_info=True)
+
+
+def abandon(obj: Any) -> None:
+    """
+    Keep an inherited connection alive, unclosed, for the life of this process.
+
+    Args:
+        obj: A DBAPI connection, or a pool record holding one in
+            `dbapi_connection`.
+    """
+    _disarm(getattr(obj, "dbapi_connection", obj))
+    _abandoned.append(obj)
+
+
+def _disarm(conn: Any) -> None:
+    # The ADBC DBAPI `Connection.__del__` (and `Cursor.__del__`) close the
+    # handles unless `_closed` is set. Closing the parent's connection from
+    # here would close or log off what the parent still uses, so mark it
+    # closed without closing it.
+    if conn is None or not hasattr(conn, "_closed"):
+        return
+    for cursor in list(getattr(conn, "_cursors", ())):
+        cursor._closed = True
+    conn._closed = True
+
+
+def _forget(pool: AdbcQueuePool | AdbcPool) -> None:
+    # Called with `_lock` held.
+    for record in pool._adbc_forget():
+        abandon(record)
+    pool._adbc_pid = os.getpid()
+    if pool._adbc_connect_spec is not None:
+        if pool._adbc_source is not None:
+            abandon(pool._adbc_source)
+            pool._adbc_source = None
+        # A new opener: another parent thread may have held the old one's lock.
+        pool._adbc_set_creator(SourceOpener(pool))
+    gate = pool._adbc_gate
+    if gate is not None:
+        gate.after_fork()
+    fetcher = pool._adbc_fetcher
+    if fetcher is not None:
+        _abandoned.append(fetcher)
+        pool._adbc_fetcher = fetcher.after_fork()
+    maintainer = pool._adbc_maintainer
+    if maintainer is not None:
+        maintainer.after_fork()
+
+
+class SourceOpener:
+    """
+    The creator of a pool with no source yet: open the source once, then clone it.
+
+    Pools reset in a forked child start with one, as do pools built with
+    `lazy=True`. Concurrent first connections wait on one open, under a lock of
+    the opener's own, so a slow login holds up no other pool. Once the source
+    is open, the pool's creator becomes `source.adbc_clone`.
+    """
+
+    __slots__ = ("_lock", "pool")
+
+    def __init__(self, pool: AdbcQueuePool | AdbcPool | None = None) -> None:
+        """Create an opener; the factory binds `pool` once the pool is built."""
+        self._lock = threading.Lock()
+        self.pool = pool
+
+    def __call__(self) -> Any:
+        """Open the pool's source if no connection has yet, and clone it."""
+        pool = self.pool
+        assert pool is not None
+        with self._lock:
+            source = pool._adbc_source
+            if source is None:
+                spec = pool._adbc_connect_spec
+                assert spec is not None
+                source = spec.connect()
+                pool._adbc_source = source
+                pool._adbc_set_creator(source.adbc_clone)
+        return source.adbc_clone()
+
+
+def _after_fork_in_child() -> None:
+    global _lock  # noqa: PLW0603
+    _lock = threading.Lock()
+    for pool in list(_pools):
+        reset(pool)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
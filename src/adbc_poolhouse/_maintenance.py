@@ -0,0 +1,253 @@
+"""
+Background pool maintenance: keep a minimum idle set warm off the request path.
+
+`QueuePool` only opens a connection when a checkout finds the idle set empty, so
+after a burst drains the pool the next request pays a full warehouse login.
+[`PoolMaintainer`][adbc_poolhouse._maintenance.PoolMaintainer] watches the idle
+count and opens replacement clones ahead of demand, so checkouts find a warm
+connection instead of blocking on `adbc_clone`. It also closes idle connections
+above an optional ceiling, so a pool that grew for a burst does not hold
+warehouse sessions open indefinitely, and (with `idle_timeout`) idle connections
+nobody has checked out for that long, down to `min_idle`. The pools stamp each
+connection's checkin time under `_IDLE_SINCE` for the latter.
+
+With `recycle_mode="background"` the maintainer also owns connection recycling.
+The pool itself is built with recycling disabled, so a checkout never closes and
+re-clones a connection because of its age; instead each pass replaces idle
+connections that have passed their recycle deadline, opening the replacement
+first and swapping it in atomically. Every connection gets its own deadline,
+shortened by a random fraction of up to `recycle_jitter`, so a pool that was
+filled all at once does not expire all at once.
+
+Each maintenance pass is a plain synchronous call,
+[`run_once`][adbc_poolhouse._maintenance.PoolMaintainer.run_once]. The sync
+factories drive it from a daemon thread that wakes every `interval` seconds and
+as soon as a checkout takes a connection; the async layer drives the same
+method from a task (see `AsyncPool.maintain`).
+
+Internal only --- configured through the `min_idle` / `max_idle` /
+`idle_timeout` / `maintenance_interval` factory arguments. When the pool is
+autoscaled, each pass also gives the
+[`PoolAutoscaler`][adbc_poolhouse._autoscale.PoolAutoscaler] its turn.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from adbc_poolhouse._autoscale import PoolAutoscaler
+
+logger = logging.getLogger(__name__)
+
+# Key in `ConnectionPoolEntry.info` holding `(starttime, deadline)`. The start
+# time is kept alongside so a record that SQLAlchemy reconnected in place (after
+# an invalidation) gets a fresh deadline instead of inheriting the old one.
+_RECYCLE_DEADLINE = "adbc_poolhouse.recycle_deadline"
+
+# Key in `ConnectionPoolEntry.info` holding the wall-clock time the connection
+# last entered the idle set. Written by the pools on every checkin.
+_IDLE_SINCE = "adbc_poolhouse.idle_since"
+
+
+class MaintainedPool(Protocol):
+    """
+    The idle-set operations a pool must offer to be maintained.
+
+    Implemented by both `AdbcQueuePool` and `AdbcPool`. Records are opaque to
+    the maintainer apart from `starttime`, `info` and `close()`.
+    """
+
+    def checkedin(self) -> int: ...
+
+    def _adbc_add_idle(self) -> bool: ...
+
+    def _adbc_evict_idle(self) -> bool: ...
+
+    def _adbc_evict_record(self, record: Any) -> bool: ...
+
+    def _adbc_idle_records(self) -> Sequence[Any]: ...
+
+    def _adbc_replace_idle(self, old: Any) -> bool: ...
+
+    def _adbc_listen_checkout(self, fn: Callable[..., None]) -> None: ...
+
+    def _adbc_remove_checkout(self, fn: Callable[..., None]) -> None: ...
+
+
+class PoolMaintainer:
+    """
+    Keep a pool's idle set between `min_idle` and `max_idle` connections.
+
+    Args:
+        pool: The pool to maintain.
+        min_idle: Idle connections to keep open. When a checkout drops the idle
+            count below this floor, replacements are opened in the background,
+            up to the pool's `pool_size + max_overflow` ceiling.
+        max_idle: Idle connections above this ceiling are closed. `None` leaves
+            the idle set alone (the `QueuePool` default, up to `pool_size`).
+        interval: Seconds between maintenance passes when the background thread
+            is running.
+        recycle: Connection lifetime in seconds for background recycling, or
+            `None` when the pool recycles on checkout (the `QueuePool` default).
+        recycle_jitter: Fraction of `recycle` by which each connection's
+            deadline is randomly brought forward, in `[0, 1)`.
+        idle_timeout: Seconds since its last checkin after which an idle
+            connection is closed, never taking the idle set below `min_idle`.
+            `None` disables idle eviction.
+        autoscaler: Resizes the pool from checkout waits; evaluated at the
+            start of each pass. `None` keeps `pool_size` fixed.
+    """
+
+    def __init__(
+        self,
+        pool: MaintainedPool,
+        *,
+        min_idle: int,
+        max_idle: int | None,
+        interval: float,
+        recycle: float | None = None,
+        recycle_jitter: float = 0.0,
+        idle_timeout: float | None = None,
+        autoscaler: PoolAutoscaler | None = None,
+    ) -> None:
+        self.pool = pool
+        self.min_idle = min_idle
+        self.max_idle = max_idle
+        self.interval = interval
+        self.recycle = recycle
+        self.recycle_jitter = recycle_jitter
+        self.idle_timeout = idle_timeout
+        self.autoscaler = autoscaler
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        pool._adbc_listen_checkout(self._on_checkout)
+
+    def below_floor(self) -> bool:
+        """
+        Report whether the idle set has dropped below `min_idle`.
+
+        Returns:
+            `True` if a maintenance pass would open connections.
+        """
+        return self.pool.checkedin() < self.min_idle
+
+    def _on_checkout(self, *_args: Any) -> None:
+        # Runs inside every checkout: keep it to a comparison and an Event.set.
+        if self.below_floor():
+            self._wake.set()
+
+    def _deadline(self, record: Any) -> float:
+        # Assigned lazily the first time a pass sees the record, from the
+        # record's own start time, so pre-filled and lazily opened connections
+        # are treated alike. `starttime` is wall-clock (`time.time()`).
+        assert self.recycle is not None
+        starttime = cast("float", record.starttime)
+        stamped = cast("tuple[float, float] | None", record.info.get(_RECYCLE_DEADLINE))
+        if stamped is None or stamped[0] != starttime:
+            lifetime = self.recycle * (1.0 - random.uniform(0.0, self.recycle_jitter))
+            stamped = (starttime, starttime + lifetime)
+            record.info[_RECYCLE_DEADLINE] = stamped
+        return stamped[1]
+
+    def _recycle_expired(self) -> None:
+        pool = self.pool
+        now = time.time()
+        for old in pool._adbc_idle_records():
+            if self._deadline(old) <= now:
+                # False when `old` was checked out while its replacement opened:
+                # its turn comes on a later pass, once it is idle again.
+                pool._adbc_replace_idle(old)
+
+    def _evict_stale(self, idle_timeout: float) -> None:
+        pool = self.pool
+        cutoff = time.time() - idle_timeout
+        # Oldest checkin first: with LIFO checkout these are the cold connections.
+        for record in pool._adbc_idle_records():
+            if pool.checkedin() <= self.min_idle:
+                return
+            since = cast("float", record.info.get(_IDLE_SINCE, record.starttime))
+            if since <= cutoff:
+                # False when it was checked out since the snapshot: it is not idle.
+                pool._adbc_evict_record(record)
+
+    def run_once(self) -> None:
+        """
+        Run a single maintenance pass.
+
+        With autoscaling, first lets the autoscaler resize the pool if its
+        window has elapsed. With background recycling, then replaces idle
+        connections past their recycle deadline. Then opens connections until
+        the idle set reaches `min_idle` (or the pool is at its ceiling), closes
+        connections idle for longer than `idle_timeout` (keeping `min_idle`),
+        and closes idle connections above `max_idle`. Opens run serially: the
+        pass is off the request path, so latency is not a concern, and serial
+        opens never stampede the warehouse login.
+
+        Errors from opening a connection propagate; the background thread logs
+        them and retries on the next pass.
+        """
+        pool = self.pool
+        if self.autoscaler is not None:
+            self.autoscaler.run_once()
+        if self.recycle is not None:
+            self._recycle_expired()
+        while pool.checkedin() < self.min_idle and pool._adbc_add_idle():
+            pass
+        if self.idle_timeout is not None:
+            self._evict_stale(self.idle_timeout)
+        if self.max_idle is not None:
+            while pool.checkedin() > self.max_idle and pool._adbc_evict_idle():
+                pass
+
+    def start(self) -> None:
+        """Start the background maintenance thread. Runs a first pass at once."""
+        self._thread = threading.Thread(
+            target=self._run,
+            name="adbc-poolhouse-maintainer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def after_fork(self) -> None:
+        """
+        Start over in a forked child: restart the thread if it was running.
+
+        Only the forking thread survives a fork, so the parent's maintenance
+        thread is gone, and its events may have been mid-update.
+        """
+        running = self._thread is not None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+        if running:
+            self.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread and wait for an in-flight pass to finish.
+
+        Idempotent, and a no-op when the thread was never started.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.pool._adbc_remove_checkout(self._on_checkout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.run_once()
+            except Exception:
+                logger.warning("adbc-poolhouse pool maintenance pass failed", exc_info=True)
+            self._wake.wait(self.interval)
@@ -21,17 +21,35 @@ Internal helpers are prefixed with _ and not exported.
 from __future__ import annotations
 
 import contextlib
-from typing import TYPE_CHECKING, overload
+import itertools
+import os
+from typing import TYPE_CHECKING, Literal, overload
 
 import sqlalchemy.pool
 from sqlalchemy import event
 
+from adbc_poolhouse import _fork, _prometheus, _tracing
+from adbc_poolhouse._adbc_pool import AdbcPool, _close_open_cursors
+from adbc_poolhouse._autoscale import PoolAutoscaler
+from adbc_poolhouse._budget import BudgetGate
 from adbc_poolhouse._driver_api import create_adbc_connection
+from adbc_poolhouse._exceptions import ConfigurationError
+from adbc_poolhouse._maintenance import PoolMaintainer
+from adbc_poolhouse._prefill import prefill_pool
+from adbc_poolhouse._procfetch import ConnectSpec, ProcessFetcher
+from adbc_poolhouse._queue_pool import AdbcQueuePool
 
 if TYPE_CHECKING:
     import collections.abc
 
     from adbc_poolhouse._base_config import WarehouseConfig
+    from adbc_poolhouse._budget import ConnectionBudget, HostConnectionBudget
+
+# Maintenance passes' worth of checkout samples behind each autoscale decision.
+_AUTOSCALE_WINDOW_PASSES = 10
+
+# Numbers unnamed pools for the metrics `pool` label.
+_POOL_NUMBERS = itertools.count(1)
 
 
 def _create_pool_impl(
@@ -45,10 +63,100 @@ def _create_pool_impl(
     timeout: int,
     recycle: int,
     pre_ping: bool,
-) -> sqlalchemy.pool.QueuePool:
-    """Internal: create pool from either config or raw driver args."""
+    *,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+    start_maintainer: bool = True,
+) -> AdbcQueuePool | AdbcPool:
+    """
+    Internal: create pool from either config or raw driver args.
+
+    ``start_maintainer=False`` builds the `PoolMaintainer` (when one is needed)
+    without starting its thread; the async factories drive it from a task.
+    """
     if driver_path is not None and dbapi_module is not None:
         raise TypeError("create_pool() accepts driver_path or dbapi_module, not both")
+    if not 0 <= prefill <= pool_size:
+        raise ConfigurationError(
+            f"prefill must be between 0 and pool_size ({pool_size}), got {prefill}"
+        )
+    if not 0 <= min_idle <= pool_size:
+        raise ConfigurationError(
+            f"min_idle must be between 0 and pool_size ({pool_size}), got {min_idle}"
+        )
+    if max_idle is not None and not min_idle <= max_idle <= pool_size:
+        raise ConfigurationError(
+            f"max_idle must be between min_idle ({min_idle}) and pool_size ({pool_size}), "
+            f"got {max_idle}"
+        )
+    if maintenance_interval <= 0:
+        raise ConfigurationError(
+            f"maintenance_interval must be positive, got {maintenance_interval}"
+        )
+    if recycle_mode not in ("checkout", "background"):
+        raise ConfigurationError(
+            f"recycle_mode must be 'checkout' or 'background', got {recycle_mode!r}"
+        )
+    background_recycle = recycle_mode == "background"
+    if background_recycle and recycle <= 0:
+        raise ConfigurationError(
+            f"recycle_mode='background' requires a positive recycle, got {recycle}"
+        )
+    if not 0 <= recycle_jitter < 1:
+        raise ConfigurationError(f"recycle_jitter must be in [0, 1), got {recycle_jitter}")
+    if checkout_order not in ("fifo", "lifo"):
+        raise ConfigurationError(f"checkout_order must be 'fifo' or 'lifo', got {checkout_order!r}")
+    if idle_timeout is None and config is not None:
+        # Configs that predate the field (or implement the protocol from
+        # scratch) simply have no idle timeout.
+        idle_timeout = getattr(config, "idle_timeout", None)
+    if idle_timeout is not None and idle_timeout <= 0:
+        raise ConfigurationError(f"idle_timeout must be positive, got {idle_timeout}")
+    if autoscale is not None:
+        min_size, max_size = autoscale
+        if not 1 <= min_size <= pool_size <= max_size:
+            raise ConfigurationError(
+                f"autoscale bounds must satisfy 1 <= min <= pool_size ({pool_size}) <= max, "
+                f"got {autoscale}"
+            )
+        if min_idle > min_size:
+            raise ConfigurationError(
+                f"min_idle ({min_idle}) must not exceed the autoscale minimum ({min_size})"
+            )
+    if autoscale_target_wait <= 0:
+        raise ConfigurationError(
+            f"autoscale_target_wait must be positive, got {autoscale_target_wait}"
+        )
+    if pool_class not in ("queue", "adbc"):
+        raise ConfigurationError(f"pool_class must be 'queue' or 'adbc', got {pool_class!r}")
+    if pool_class == "adbc" and pre_ping:
+        raise ConfigurationError("pre_ping is not supported with pool_class='adbc'")
+    if fetch_processes < 0:
+        raise ConfigurationError(f"fetch_processes must be 0 or more, got {fetch_processes}")
+    if not 0 <= fork_prefill <= pool_size:
+        raise ConfigurationError(
+            f"fork_prefill must be between 0 and pool_size ({pool_size}), got {fork_prefill}"
+        )
+    if lazy and prefill:
+        raise ConfigurationError("prefill opens connections at creation; it cannot be lazy")
+    if lazy and min_idle:
+        # The maintainer's first pass would open the source at startup.
+        raise ConfigurationError("min_idle keeps connections open from startup; it cannot be lazy")
 
     if config is not None:
         # Config path -- extract driver info from config methods
@@ -85,39 +193,222 @@ def _create_pool_impl(
             "driver_path=..., or dbapi_module=..."
         )
 
-    source = create_adbc_connection(
-        resolved_driver_path,
-        resolved_kwargs,
-        entrypoint=resolved_entrypoint,
-        dbapi_module=resolved_dbapi_module,
-    )
+    backend = _tracing.backend_name(config, driver_path, dbapi_module)
+    with _tracing.start_span("adbc_poolhouse.create_pool") as span:
+        if span is not None:
+            span.set_attributes(
+                {
+                    "db.system": backend,
+                    "adbc_poolhouse.pool_class": pool_class,
+                    "adbc_poolhouse.pool_size": pool_size,
+                }
+            )
+        # Worker processes, forked children reopening the source and lazy pools
+        # opening it connect exactly as the source was (or would have been).
+        spec = ConnectSpec(
+            resolved_driver_path,
+            dict(resolved_kwargs),
+            resolved_entrypoint,
+            resolved_dbapi_module,
+        )
+        opener: _fork.SourceOpener | None = None
+        if lazy:
+            # The pool's first connection opens the source instead.
+            source = None
+            opener = _fork.SourceOpener()
+            clone = opener
+        else:
+            source = create_adbc_connection(
+                resolved_driver_path,
+                resolved_kwargs,
+                entrypoint=resolved_entrypoint,
+                dbapi_module=resolved_dbapi_module,
+            )
+            clone = source.adbc_clone
+
+        pool: AdbcQueuePool | AdbcPool | None = None
+        try:
+            # In background mode the maintainer replaces aged connections; the pool
+            # itself must never recycle on checkout.
+            pool_recycle = -1 if background_recycle else recycle
+            use_lifo = checkout_order == "lifo"
+            # With a budget, every clone first takes a lease from each.
+            budgets = [b for b in (budget, host_budget) if b is not None]
+            gate = BudgetGate(clone, budgets, timeout) if budgets else None
+            creator = gate if gate is not None else clone
+            if pool_class == "adbc":
+                # Releases Arrow allocators inline on checkin; no reset event needed.
+                pool = AdbcPool(
+                    creator,  # type: ignore[arg-type]
+                    pool_size=pool_size,
+                    max_overflow=max_overflow,
+                    timeout=timeout,
+                    recycle=pool_recycle,
+                    use_lifo=use_lifo,
+                )
+            else:
+                pool = AdbcQueuePool(
+                    creator,  # type: ignore[arg-type]
+                    pool_size=pool_size,
+                    max_overflow=max_overflow,
+                    timeout=timeout,
+                    recycle=pool_recycle,
+                    pre_ping=pre_ping,
+                    use_lifo=use_lifo,
+                )
+                event.listen(pool, "reset", _release_arrow_allocators)
+
+            pool._adbc_source = source  # type: ignore[attr-defined]
+            pool._adbc_backend = backend
+            pool._adbc_name = name if name is not None else f"pool-{next(_POOL_NUMBERS)}"
+            pool._adbc_config_class = type(config).__name__ if config is not None else ""
+            pool._adbc_connect_spec = spec
+            pool._adbc_fork_prefill = fork_prefill
+            if fetch_processes:
+                pool._adbc_fetcher = ProcessFetcher(spec, fetch_processes)
+            pool._adbc_gate = gate
+            if opener is not None:
+                opener.pool = pool
+            _fork.track(pool)
+            if gate is not None:
+                gate.register(pool)
+
+            if prefill:
+                # Open the clones now, on a bounded thread pool, so the first requests
+                # after startup do not each pay a warehouse login.
+                pool.prefill_report = prefill_pool(pool, prefill)
+
+            autoscaler = None
+            if autoscale is not None:
+                autoscaler = PoolAutoscaler(
+                    pool,
+                    min_size=autoscale[0],
+                    max_size=autoscale[1],
+                    target_wait=autoscale_target_wait,
+                    window=maintenance_interval * _AUTOSCALE_WINDOW_PASSES,
+                )
+                pool._adbc_autoscaler = autoscaler
+
+            if (
+                min_idle
+                or max_idle is not None
+                or idle_timeout is not None
+                or background_recycle
+                or autoscaler is not None
+            ):
+                maintainer = PoolMaintainer(
+                    pool,
+                    min_idle=min_idle,
+                    max_idle=max_idle,
+                    interval=maintenance_interval,
+                    recycle=recycle if background_recycle else None,
+                    recycle_jitter=recycle_jitter,
+                    idle_timeout=idle_timeout,
+                    autoscaler=autoscaler,
+                )
+                pool._adbc_maintainer = maintainer
+                if start_maintainer:
+                    maintainer.start()
+
+            _prometheus.track(pool)
+        except BaseException:
+            # Nothing opened here may leak: the caller never got a handle to close.
+            if pool is not None:
+                pool._adbc_source = source  # type: ignore[attr-defined]
+                close_pool(pool)
+            elif source is not None:
+                source.close()
+            raise
+    return pool
 
-    pool = sqlalchemy.pool.QueuePool(
-        source.adbc_clone,  # type: ignore[arg-type]
-        pool_size=pool_size,
-        max_overflow=max_overflow,
-        timeout=timeout,
-        recycle=recycle,
-        pre_ping=pre_ping,
-    )
 
-    pool._adbc_source = source  # type: ignore[attr-defined]
+@overload
+def create_pool(
+    config: WarehouseConfig,
+    *,
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> AdbcQueuePool: ...
 
-    event.listen(pool, "reset", _release_arrow_allocators)
 
-    return pool
+@overload
+def create_pool(
+    config: WarehouseConfig,
+    *,
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["adbc"],
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> AdbcPool: ...
 
 
 @overload
 def create_pool(
-    config: WarehouseConfig,
     *,
+    driver_path: str,
+    db_kwargs: dict[str, str],
+    entrypoint: str | None = None,
     pool_size: int = 5,
     max_overflow: int = 3,
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
-) -> sqlalchemy.pool.QueuePool: ...
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> AdbcQueuePool: ...
 
 
 @overload
@@ -131,7 +422,24 @@ def create_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
-) -> sqlalchemy.pool.QueuePool: ...
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["adbc"],
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> AdbcPool: ...
 
 
 @overload
@@ -144,7 +452,54 @@ def create_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
-) -> sqlalchemy.pool.QueuePool: ...
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> AdbcQueuePool: ...
+
+
+@overload
+def create_pool(
+    *,
+    dbapi_module: str,
+    db_kwargs: dict[str, str],
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["adbc"],
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> AdbcPool: ...
 
 
 def create_pool(
@@ -159,7 +514,24 @@ def create_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
-) -> sqlalchemy.pool.QueuePool:
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> AdbcQueuePool | AdbcPool:
     """
     Create a SQLAlchemy QueuePool backed by an ADBC driver.
 
@@ -195,14 +567,126 @@ def create_pool(
         pre_ping: Whether to ping connections before checkout. Default: False.
             Pre-ping does not function on a standalone QueuePool without a
             SQLAlchemy dialect; recycle is the preferred health mechanism.
+        prefill: Connections to open eagerly, before this call returns, so the
+            first requests do not each pay a warehouse login. The clones are
+            opened concurrently on a small bounded thread pool and their open
+            times are recorded on ``pool.prefill_report``. Must be between 0
+            and ``pool_size``. Default: 0 (connections open lazily).
+        min_idle: Idle connections a background maintainer thread keeps open.
+            When checkouts drain the idle set below this floor, replacement
+            clones are opened off the request path, so the next checkout does
+            not block on a warehouse login. Must be between 0 and
+            ``pool_size``. Default: 0 (no maintainer).
+        max_idle: Idle connections above this count are closed by the
+            maintainer, so a pool that grew for a burst releases its warehouse
+            sessions. Must be between ``min_idle`` and ``pool_size``. Default:
+            ``None`` (idle connections are kept up to ``pool_size``).
+        maintenance_interval: Seconds between maintenance passes. The
+            maintainer also wakes immediately when a checkout drops the idle
+            set below ``min_idle``. Default: 1.0.
+        recycle_mode: ``"checkout"`` recycles the way ``QueuePool`` does: a
+            checkout that finds an expired connection closes it and opens a new
+            one while the caller waits. ``"background"`` hands recycling to the
+            maintainer, which replaces idle connections as they reach
+            ``recycle`` age and swaps each replacement in atomically, so a
+            checkout never opens a clone because of age. Default: ``"checkout"``.
+        recycle_jitter: With ``recycle_mode="background"``, each connection's
+            deadline is brought forward by a random fraction of ``recycle`` up
+            to this value, so connections opened together do not all expire
+            together. Must be in ``[0, 1)``. Default: 0.1.
+        checkout_order: ``"fifo"`` hands out the connection that has been idle
+            longest, so light traffic rotates through every idle connection
+            and keeps them all equally warm. ``"lifo"`` hands out the most
+            recently returned one (SQLAlchemy's ``use_lifo``), so a few hot
+            connections keep their session caches and the rest stay idle long
+            enough for ``idle_timeout`` to close them. Default: ``"fifo"``.
+        idle_timeout: Seconds a connection may sit idle before the maintainer
+            closes it, never going below ``min_idle``. Measured from the last
+            checkin, unlike ``recycle``, which counts from when the connection
+            was opened. Most useful with ``checkout_order="lifo"``. Default:
+            ``None``, which takes ``config.idle_timeout`` on the config path
+            (itself ``None`` unless set; idle connections are then not closed
+            for being idle).
+        autoscale: ``(min_size, max_size)`` bounds for adaptive sizing. The
+            maintainer watches checkout waits and how many connections are in
+            use, and moves ``pool_size`` between the bounds at runtime: it
+            grows by half when the 95th-percentile wait exceeds
+            ``autoscale_target_wait`` or overflow connections are in use, and
+            shrinks by a quarter after several quiet windows. ``max_overflow``
+            is kept, so the checkout ceiling moves with ``pool_size``. Each
+            decision covers ``10 * maintenance_interval`` seconds of
+            checkouts. ``pool_size`` is the starting size and must lie within
+            the bounds. Default: ``None`` (fixed size).
+        autoscale_target_wait: Seconds of 95th-percentile checkout wait above
+            which an autoscaled pool grows. Default: 0.05.
+        name: Label for this pool in metrics exports (the ``pool`` label of
+            `render_prometheus`). Default: ``None``, which numbers unnamed
+            pools ``pool-1``, ``pool-2``, ... in creation order.
+        pool_class: ``"queue"`` builds a SQLAlchemy `QueuePool`
+            (`AdbcQueuePool`). ``"adbc"`` builds the native `AdbcPool`, which
+            skips SQLAlchemy's per-checkout record, proxy and event machinery
+            for a much cheaper checkout and checkin, at the cost of the
+            SQLAlchemy pool events. ``pre_ping`` is not supported with
+            ``"adbc"``. Default: ``"queue"``.
+        fetch_processes: Worker processes for `fetch_arrow`. Each opens its own
+            connection with the pool's driver arguments, runs queries and
+            materializes their results under its own GIL, and hands each table
+            back as an Arrow IPC file in shared memory, which the caller maps
+            without copying. Concurrent ``fetch_arrow`` calls then scale with
+            the process count instead of serializing on the GIL. Query
+            parameters must be picklable. The processes start on the first
+            fetch and are stopped by `close_pool`. A file database that allows
+            a single writer (DuckDB) must be opened read-only for the workers
+            to open it too. Default: 0 (``fetch_arrow`` uses a pool connection
+            on the calling thread).
+        fork_prefill: Connections to open in each child process on its first
+            checkout, for pools built before a pre-fork server forks its
+            workers. Every pool is fork-safe: a child drops the connections
+            it inherited, without closing the parent's sockets, and reopens
+            its own on demand. With ``fork_prefill`` its first checkout opens
+            this many together, so each worker warms up at once rather than
+            one login per early request. Must be between 0 and ``pool_size``.
+            Default: 0.
+        host_budget: A `HostConnectionBudget` shared with the other processes
+            on the host. Each connection the pool opens then takes one of the
+            budget's slots, held until the pool closes the connection; an open
+            that finds every slot taken waits up to ``timeout`` for one and then
+            raises ``sqlalchemy.exc.TimeoutError``, while idle connections in
+            other processes' budgeted pools are closed to make room. The source
+            connection is not counted. Default: ``None``.
+        budget: A `ConnectionBudget` shared with other pools in this process.
+            Each connection the pool opens counts against the budget until the
+            pool closes it. When the budget is full, an open closes an idle
+            connection of the coldest budgeted pool to make room, or waits up
+            to ``timeout`` for one and then raises
+            ``sqlalchemy.exc.TimeoutError``. The source connection is not
+            counted. Default: ``None``.
+        lazy: Return without connecting, and open the source connection with
+            the pool's first connection instead, so declaring pools costs no
+            warehouse logins until they are used. Concurrent first checkouts
+            wait on one login rather than each opening a source. Connection
+            errors then surface from that first ``connect()``. Cannot be
+            combined with ``prefill`` or ``min_idle``. Default: ``False``.
 
     Returns:
-        A configured ``sqlalchemy.pool.QueuePool`` ready for use.
+        A configured `AdbcQueuePool` (a ``sqlalchemy.pool.QueuePool``
+        subclass) ready for use, or an `AdbcPool` with ``pool_class="adbc"``.
 
     Raises:
         TypeError: If none of ``config``, ``driver_path``, or ``dbapi_module``
             is provided, or if both ``driver_path`` and ``dbapi_module`` are
             provided.
+        ConfigurationError: If ``prefill``, ``fork_prefill`` or ``min_idle`` is negative or above
+            ``pool_size``, ``max_idle`` is outside ``min_idle..pool_size``,
+            ``maintenance_interval`` is not positive, ``recycle_mode`` is
+            unknown, ``recycle_mode="background"`` is combined with a
+            non-positive ``recycle``, ``recycle_jitter`` is outside ``[0, 1)``,
+            ``checkout_order`` is unknown, ``idle_timeout`` is not positive,
+            ``autoscale`` bounds do not contain ``pool_size`` (or ``min_idle``
+            exceeds the minimum), ``autoscale_target_wait`` is not positive,
+            ``pool_class`` is unknown, ``pre_ping`` is combined with
+            ``pool_class="adbc"``, ``fetch_processes`` is negative, or
+            ``lazy`` is combined with ``prefill`` or ``min_idle``.
         ImportError: If the required ADBC driver is not installed.
 
     Example:
@@ -216,6 +700,31 @@ def create_pool(
         close_pool(pool)
         ```
 
+        Pre-filled at startup:
+
+        ```python
+        pool = create_pool(SnowflakeConfig(), prefill=5)
+        print(pool.prefill_report.serial_time)  # login time moved off requests
+        ```
+
+        Warm idle set kept by a background maintainer:
+
+        ```python
+        pool = create_pool(SnowflakeConfig(), min_idle=2, max_idle=4)
+        ```
+
+        Recycled in the background, never on checkout:
+
+        ```python
+        pool = create_pool(SnowflakeConfig(), recycle=3600, recycle_mode="background")
+        ```
+
+        Native pool for short, frequent queries:
+
+        ```python
+        pool = create_pool(DuckDBConfig(database="/tmp/my.db"), pool_class="adbc")
+        ```
+
         Raw native driver path:
 
         ```python
@@ -238,19 +747,42 @@ def create_pool(
         timeout,
         recycle,
         pre_ping,
+        prefill=prefill,
+        min_idle=min_idle,
+        max_idle=max_idle,
+        maintenance_interval=maintenance_interval,
+        recycle_mode=recycle_mode,
+        recycle_jitter=recycle_jitter,
+        checkout_order=checkout_order,
+        idle_timeout=idle_timeout,
+        autoscale=autoscale,
+        autoscale_target_wait=autoscale_target_wait,
+        name=name,
+        pool_class=pool_class,
+        fetch_processes=fetch_processes,
+        fork_prefill=fork_prefill,
+        host_budget=host_budget,
+        budget=budget,
+        lazy=lazy,
     )
 
 
-def close_pool(pool: sqlalchemy.pool.QueuePool) -> None:
+def close_pool(pool: sqlalchemy.pool.QueuePool | AdbcPool) -> None:
     """
     Dispose a pool and close its underlying ADBC source connection.
 
     Replaces the two-step pattern ``pool.dispose()`` followed by
     ``pool._adbc_source.close()``. Always call this instead of calling
     ``pool.dispose()`` directly to avoid leaving the ADBC source connection open.
+    A background maintainer (``min_idle`` / ``max_idle``) is stopped first, so
+    it cannot open a fresh clone into a pool that is being torn down, and the
+    ``fetch_processes`` worker processes are stopped. In a process that
+    inherited the pool across a fork, the parent's connections are dropped, not
+    closed.
 
     Args:
-        pool: A pool returned by `create_pool`.
+        pool: A pool returned by `create_pool` (an `AdbcQueuePool` or an
+            `AdbcPool`).
 
     Example:
         ```python
@@ -260,8 +792,54 @@ def close_pool(pool: sqlalchemy.pool.QueuePool) -> None:
         close_pool(pool)
         ```
     """
+    _fork.untrack(pool)  # type: ignore[arg-type]
+    if getattr(pool, "_adbc_pid", None) not in (None, os.getpid()):
+        # Inherited across a fork: drop the parent's connections, do not close them.
+        _fork.reset(pool, warm=False)  # type: ignore[arg-type]
+    maintainer = getattr(pool, "_adbc_maintainer", None)
+    if maintainer is not None:
+        maintainer.stop()
+    fetcher = getattr(pool, "_adbc_fetcher", None)
+    if fetcher is not None:
+        fetcher.close()
+    gate = getattr(pool, "_adbc_gate", None)
+    if gate is not None:
+        gate.unregister(pool)
+    _prometheus.untrack(pool)
     pool.dispose()
-    pool._adbc_source.close()  # type: ignore[attr-defined]
+    source = getattr(pool, "_adbc_source", None)
+    if source is not None:
+        # `None` in a forked child that never reopened it, or a lazy pool never used.
+        source.close()
+
+
+@overload
+def managed_pool(
+    config: WarehouseConfig,
+    *,
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> contextlib.AbstractContextManager[AdbcQueuePool]: ...
 
 
 @overload
@@ -273,7 +851,24 @@ def managed_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
-) -> contextlib.AbstractContextManager[sqlalchemy.pool.QueuePool]: ...
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["adbc"],
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> contextlib.AbstractContextManager[AdbcPool]: ...
 
 
 @overload
@@ -287,7 +882,85 @@ def managed_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
-) -> contextlib.AbstractContextManager[sqlalchemy.pool.QueuePool]: ...
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> contextlib.AbstractContextManager[AdbcQueuePool]: ...
+
+
+@overload
+def managed_pool(
+    *,
+    driver_path: str,
+    db_kwargs: dict[str, str],
+    entrypoint: str | None = None,
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["adbc"],
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> contextlib.AbstractContextManager[AdbcPool]: ...
+
+
+@overload
+def managed_pool(
+    *,
+    dbapi_module: str,
+    db_kwargs: dict[str, str],
+    pool_size: int = 5,
+    max_overflow: int = 3,
+    timeout: int = 30,
+    recycle: int = 3600,
+    pre_ping: bool = False,
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> contextlib.AbstractContextManager[AdbcQueuePool]: ...
 
 
 @overload
@@ -300,7 +973,24 @@ def managed_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
-) -> contextlib.AbstractContextManager[sqlalchemy.pool.QueuePool]: ...
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["adbc"],
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> contextlib.AbstractContextManager[AdbcPool]: ...
 
 
 @contextlib.contextmanager
@@ -316,7 +1006,24 @@ def managed_pool(
     timeout: int = 30,
     recycle: int = 3600,
     pre_ping: bool = False,
-) -> collections.abc.Generator[sqlalchemy.pool.QueuePool, None, None]:
+    prefill: int = 0,
+    min_idle: int = 0,
+    max_idle: int | None = None,
+    maintenance_interval: float = 1.0,
+    recycle_mode: Literal["checkout", "background"] = "checkout",
+    recycle_jitter: float = 0.1,
+    checkout_order: Literal["fifo", "lifo"] = "fifo",
+    idle_timeout: float | None = None,
+    autoscale: tuple[int, int] | None = None,
+    autoscale_target_wait: float = 0.05,
+    name: str | None = None,
+    pool_class: Literal["queue", "adbc"] = "queue",
+    fetch_processes: int = 0,
+    fork_prefill: int = 0,
+    host_budget: HostConnectionBudget | None = None,
+    budget: ConnectionBudget | None = None,
+    lazy: bool = False,
+) -> collections.abc.Generator[AdbcQueuePool | AdbcPool, None, None]:
     """
     Context manager that creates a pool and closes it on exit.
 
@@ -350,15 +1057,64 @@ def managed_pool(
         timeout: Seconds to wait for a connection before raising. Default: 30.
         recycle: Seconds before a connection is recycled. Default: 3600.
         pre_ping: Whether to ping connections before checkout. Default: False.
+        prefill: Connections to open eagerly before the ``with`` block is
+            entered (see `create_pool`). Default: 0.
+        min_idle: Idle connections a background maintainer keeps open (see
+            `create_pool`). Default: 0.
+        max_idle: Idle connections above this count are closed by the
+            maintainer. Default: ``None``.
+        maintenance_interval: Seconds between maintenance passes. Default: 1.0.
+        recycle_mode: ``"checkout"`` or ``"background"`` (see `create_pool`).
+            Default: ``"checkout"``.
+        recycle_jitter: Random fraction of ``recycle`` by which each
+            connection's background-recycle deadline is brought forward.
+            Default: 0.1.
+        checkout_order: ``"fifo"`` or ``"lifo"`` (most recently returned
+            connection first; see `create_pool`). Default: ``"fifo"``.
+        idle_timeout: Seconds idle before the maintainer closes a connection,
+            down to ``min_idle``. Default: ``None`` (``config.idle_timeout``,
+            if set).
+        autoscale: ``(min_size, max_size)`` bounds for adaptive sizing (see
+            `create_pool`). Default: ``None`` (fixed size).
+        autoscale_target_wait: 95th-percentile checkout wait, in seconds, above
+            which an autoscaled pool grows. Default: 0.05.
+        name: Label for this pool in metrics exports (the ``pool`` label of
+            `render_prometheus`). Default: ``None``, which numbers unnamed
+            pools ``pool-1``, ``pool-2``, ... in creation order.
+        pool_class: ``"queue"`` (`AdbcQueuePool`) or ``"adbc"`` (the native
+            `AdbcPool`; see `create_pool`). Default: ``"queue"``.
+        fetch_processes: Worker processes that run `fetch_arrow` queries and
+            return their tables through shared memory (see `create_pool`).
+            Default: 0.
+        fork_prefill: Connections each forked child opens on its first
+            checkout (see `create_pool`). Default: 0.
+        host_budget: A `HostConnectionBudget` capping connections across
+            processes (see `create_pool`). Default: ``None``.
+        budget: A `ConnectionBudget` capping connections across pools in this
+            process (see `create_pool`). Default: ``None``.
+        lazy: Defer the source connection to the first checkout (see
+            `create_pool`). Default: ``False``.
 
     Yields:
-        A configured ``sqlalchemy.pool.QueuePool``. The pool is automatically
-        closed when the ``with`` block exits.
+        A configured `AdbcQueuePool` (or `AdbcPool` with
+        ``pool_class="adbc"``). The pool is automatically closed when the
+        ``with`` block exits.
 
     Raises:
         TypeError: If none of ``config``, ``driver_path``, or ``dbapi_module``
             is provided, or if both ``driver_path`` and ``dbapi_module`` are
             provided.
+        ConfigurationError: If ``prefill``, ``fork_prefill`` or ``min_idle`` is negative or above
+            ``pool_size``, ``max_idle`` is outside ``min_idle..pool_size``,
+            ``maintenance_interval`` is not positive, ``recycle_mode`` is
+            unknown, ``recycle_mode="background"`` is combined with a
+            non-positive ``recycle``, ``recycle_jitter`` is outside ``[0, 1)``,
+            ``checkout_order`` is unknown, ``idle_timeout`` is not positive,
+            ``autoscale`` bounds do not contain ``pool_size`` (or ``min_idle``
+            exceeds the minimum), ``autoscale_target_wait`` is not positive,
+            ``pool_class`` is unknown, ``pre_ping`` is combined with
+            ``pool_class="adbc"``, ``fetch_processes`` is negative, or
+            ``lazy`` is combined with ``prefill`` or ``min_idle``.
         ImportError: If the required ADBC driver is not installed.
 
     Example:
@@ -397,6 +1153,23 @@ def managed_pool(
         timeout,
         recycle,
         pre_ping,
+        prefill=prefill,
+        min_idle=min_idle,
+        max_idle=max_idle,
+        maintenance_interval=maintenance_interval,
+        recycle_mode=recycle_mode,
+        recycle_jitter=recycle_jitter,
+        checkout_order=checkout_order,
+        idle_timeout=idle_timeout,
+        autoscale=autoscale,
+        autoscale_target_wait=autoscale_target_wait,
+        name=name,
+        pool_class=pool_class,
+        fetch_processes=fetch_processes,
+        fork_prefill=fork_prefill,
+        host_budget=host_budget,
+        budget=budget,
+        lazy=lazy,
     )
     try:
         yield pool
@@ -422,7 +1195,4 @@ def _release_arrow_allocators(
     """
     if dbapi_conn is None:
         return
-    for cur in list(getattr(dbapi_conn, "_cursors", [])):
-        if not getattr(cur, "_closed", True):
-            with contextlib.suppress(Exception):
-                cur.close()
+    _close_open_cursors(dbapi_conn)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import importlib.util
 from urllib.parse import quote
 
 from pydantic import SecretStr  # noqa: TC002
@@ -62,7 +61,7 @@ class PostgreSQLConfig(BaseWarehouseConfig):
         return self._resolve_driver_path("adbc_driver_postgresql")
 
     def _dbapi_module(self) -> str | None:
-        if importlib.util.find_spec("adbc_driver_postgresql") is not None:
+        if self._package_installed("adbc_driver_postgresql"):
             return "adbc_driver_postgresql.dbapi"
         return None
 
@@ -0,0 +1,126 @@
+"""
+Eager pool pre-fill: open pooled clones at pool-construction time.
+
+A `QueuePool` starts empty. Every connection after the ADBC source is opened
+lazily through `source.adbc_clone` on the first checkouts, so the first
+`pool_size` requests after a deploy each pay a full warehouse login (seconds on
+Snowflake or Databricks). [`prefill_pool`][adbc_poolhouse._prefill.prefill_pool]
+moves that cost to startup: it opens the clones concurrently on a small, bounded
+thread pool, checks them all back in together so the pool holds `count` distinct
+idle connections, and reports how long each open took.
+
+The pre-fill goes through the pool's own `connect()`, so every clone is created
+by SQLAlchemy's normal record machinery (creator, overflow accounting, `reset`
+event) and is indistinguishable from one opened lazily.
+
+Internal only --- `PrefillReport` is re-exported from `__init__.py`, the helper is
+not.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.pool import PoolProxiedConnection
+
+    from adbc_poolhouse._adbc_pool import AdbcPool
+    from adbc_poolhouse._queue_pool import AdbcQueuePool
+
+# Upper bound on concurrent clone opens during a pre-fill. Warehouse logins are
+# network-bound, so a handful of threads removes most of the serial wait without
+# stampeding the identity provider when `pool_size` is large.
+_PREFILL_MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class PrefillReport:
+    """
+    Per-connection open timings from an eager pool pre-fill.
+
+    Attached to the pool as `prefill_report` when a factory is called with
+    `prefill > 0`. Without the pre-fill, each of these opens would have been
+    paid by one of the first requests to check a connection out; `serial_time`
+    is that cold-start latency in total.
+
+    Attributes:
+        open_times: Seconds each connection took to open, in the order the opens were submitted.
+        wall_time: Seconds the whole pre-fill took, start to last open. Smaller
+            than `serial_time` because the opens run concurrently.
+
+    Example:
+        ```python
+        pool = create_pool(SnowflakeConfig(), prefill=5)
+        report = pool.prefill_report
+        print(report.connections, report.serial_time, report.wall_time)
+        ```
+    """
+
+    open_times: tuple[float, ...]
+    wall_time: float
+
+    @property
+    def connections(self) -> int:
+        """Number of connections opened by the pre-fill."""
+        return len(self.open_times)
+
+    @property
+    def serial_time(self) -> float:
+        """Sum of the per-connection open times, in seconds."""
+        return sum(self.open_times)
+
+
+def prefill_pool(pool: AdbcQueuePool | AdbcPool, count: int) -> PrefillReport:
+    """
+    Open `count` pooled connections concurrently and check them back in.
+
+    Each worker calls `pool.connect()` and holds the checked-out connection, so
+    the `count` opens land on `count` distinct connections rather than reusing one
+    that a faster worker already returned. Once every open has finished, all of
+    them are checked in together and the pool holds `count` idle connections.
+
+    If any open fails, the connections that did open are still checked in before
+    the first error is re-raised; the caller owns tearing the pool down.
+
+    Args:
+        pool: The freshly built pool to fill.
+        count: Number of connections to open. `0` is a no-op.
+
+    Returns:
+        A `PrefillReport` with the per-connection open times.
+    """
+    if count == 0:
+        return PrefillReport(open_times=(), wall_time=0.0)
+
+    def _open() -> tuple[PoolProxiedConnection, float]:
+        t0 = time.perf_counter()
+        conn = pool.connect()
+        return conn, time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=min(count, _PREFILL_MAX_WORKERS),
+        thread_name_prefix="adbc-poolhouse-prefill",
+    ) as ex:
+        futures = [ex.submit(_open) for _ in range(count)]
+    wall_time = time.perf_counter() - t0
+
+    held: list[PoolProxiedConnection] = []
+    open_times: list[float] = []
+    first_error: BaseException | None = None
+    for fut in futures:
+        exc = fut.exception()
+        if exc is not None:
+            first_error = first_error or exc
+            continue
+        conn, elapsed = fut.result()
+        held.append(conn)
+        open_times.append(elapsed)
+    for conn in held:
+        conn.close()
+    if first_error is not None:
+        raise first_error
+    return PrefillReport(open_times=tuple(open_times), wall_time=wall_time)
@@ -0,0 +1,316 @@
+"""
+Process-pool materialization: `fetch_processes=N`.
+
+Turning a driver result into a `pyarrow.Table` holds the GIL, so concurrent
+`fetch_arrow_table` calls on threads run one after another however many
+connections the pool has (`benchmarks/gil_release.py`). A pool built with
+`fetch_processes=N` gets a [`ProcessFetcher`][adbc_poolhouse._procfetch.ProcessFetcher]
+instead: `N` worker processes, each holding its own ADBC connection, opened from
+the same driver path, kwargs, entrypoint and dbapi module as the pool's source.
+Each process has its own GIL, so `N` fetches materialize at once.
+
+A worker writes its table as an Arrow IPC file in shared memory
+(`adbc_poolhouse._shm`) and returns only the path. The calling process maps the
+file, so the table's buffers are the worker's pages: no pickling and no copy on
+the way back.
+
+The workers are started with the `spawn` method, never `fork`: a forked child
+would inherit the parent's open driver handles and threads. They start on the
+first fetch, not when the pool is built. Queries and parameters are pickled to
+reach a worker, so parameters must be picklable.
+
+[`ProcessQuery`][adbc_poolhouse._procfetch.ProcessQuery] is one fetch. Like
+`OneShotQuery`, it has a blocking `run` and a `cancel` that may be called from
+another thread. `cancel` withdraws a fetch still waiting for a worker process. A
+fetch already running in a worker cannot be interrupted from outside it and runs
+to completion; the caller has stopped waiting, and its result is dropped.
+
+Internal only --- callers use `fetch_arrow` on the pools.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import dataclasses
+import multiprocessing
+import multiprocessing.util
+import os
+import threading
+from typing import TYPE_CHECKING, Any, cast
+
+from adbc_poolhouse._driver_api import create_adbc_connection
+from adbc_poolhouse._shm import map_table, shm_dir, write_table
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from adbc_poolhouse._adbc_pool import AdbcPool
+    from adbc_poolhouse._queue_pool import AdbcQueuePool
+    from adbc_poolhouse._result_store import SharedResultStore
+
+# The worker process's own connection, opened once by `_init_worker`.
+_worker_conn: Any = None
+
+# Keyword-only arguments of ADBC's `Error.__init__`. Its exceptions pickle but
+# cannot be unpickled, and a failed unpickle in the caller breaks the whole
+# process pool, so worker errors travel as `_WorkerError` instead.
+_ADBC_ERROR_FIELDS = ("status_code", "vendor_code", "sqlstate", "details")
+
+
+@dataclasses.dataclass(frozen=True)
+class ConnectSpec:
+    """
+    What a worker process needs to open its own connection.
+
+    The resolved arguments `_create_pool_impl` opened the pool's source
+    connection with, passed unchanged to `create_adbc_connection`. The pool
+    keeps one too, to reopen its source in a forked child (`adbc_poolhouse._fork`).
+    """
+
+    driver_path: str
+    kwargs: dict[str, str]
+    entrypoint: str | None
+    dbapi_module: str | None
+
+    def connect(self) -> Any:
+        """Open a connection with these arguments."""
+        return create_adbc_connection(
+            self.driver_path,
+            dict(self.kwargs),
+            entrypoint=self.entrypoint,
+            dbapi_module=self.dbapi_module,
+        )
+
+
+class _WorkerError(Exception):
+    """A worker-side exception, carried as its class, arguments and ADBC fields."""
+
+    def rebuild(self) -> BaseException:
+        """Rebuild the original exception, or return this one if that fails."""
+        cls, args, fields = self.args
+        try:
+            return cls(*args, **fields)
+        except Exception:
+            return self
+
+
+def _init_worker(spec: ConnectSpec) -> None:
+    """Open the worker's connection and close it again when the process exits."""
+    global _worker_conn  # noqa: PLW0603
+    _worker_conn = spec.connect()
+    # Worker processes skip `atexit`; multiprocessing runs its own finalizers.
+    multiprocessing.util.Finalize(None, _worker_conn.close, exitpriority=10)
+
+
+def _materialize(operation: str, parameters: Any, directory: str) -> str:
+    """Run one query on the worker's connection and write its table to shared memory."""
+    conn = _worker_conn
+    cursor = conn.cursor()
+    try:
+        cursor.execute(operation, parameters)
+        table = cursor.fetch_arrow_table()
+    except Exception as exc:
+        fields = {name: getattr(exc, name) for name in _ADBC_ERROR_FIELDS if hasattr(exc, name)}
+        raise _WorkerError(type(exc), exc.args, fields) from None
+    finally:
+        cursor.close()
+        # As a pool checkin does, so the next query gets a fresh snapshot.
+        conn.rollback()
+    return write_table(table, directory)
+
+
+class ProcessFetcher:
+    """
+    A pool's worker processes, each holding one connection.
+
+    Built by the factory for `fetch_processes > 0` and stored on the pool as
+    `_adbc_fetcher`; `close_pool` closes it.
+
+    Attributes:
+        spec: How each worker opens its connection.
+        processes: The number of worker processes.
+    """
+
+    def __init__(self, spec: ConnectSpec, processes: int) -> None:
+        """
+        Prepare the process pool; no process starts until the first fetch.
+
+        Args:
+            spec: How each worker opens its connection.
+            processes: Worker processes, and so connections, to run.
+        """
+        self.spec = spec
+        self.processes = processes
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(spec,),
+        )
+        self._directory = shm_dir()
+        self._lock = threading.Lock()
+        # Submitted fetches whose shared-memory file nobody has claimed yet.
+        self._outstanding: set[concurrent.futures.Future[str]] = set()
+
+    def fetch(self, operation: str, parameters: Any = None) -> pyarrow.Table:
+        """
+        Run a query in a worker process and return its table (blocking).
+
+        Args:
+            operation: The SQL text to execute.
+            parameters: Bound parameters, forwarded to the dbapi cursor. Must be
+                picklable.
+
+        Returns:
+            The result, mapped from shared memory.
+        """
+        # `run` returns `None` only after a `cancel`, which nothing here calls.
+        return cast("pyarrow.Table", self.query(operation, parameters).run())
+
+    def query(self, operation: str, parameters: Any = None) -> ProcessQuery:
+        """
+        Prepare a cancellable fetch; nothing is submitted until its `run`.
+
+        Args:
+            operation: The SQL text to execute.
+            parameters: Bound parameters. Must be picklable.
+
+        Returns:
+            The prepared fetch.
+        """
+        return ProcessQuery(self, operation, parameters)
+
+    def close(self) -> None:
+        """
+        Stop the worker processes, and delete results nobody collected.
+
+        Fetches still waiting for a worker are cancelled; running ones finish
+        first. Idempotent.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            left = list(self._outstanding)
+            self._outstanding.clear()
+        for future in left:
+            if not future.cancelled() and future.exception() is None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(future.result())
+
+    def after_fork(self) -> ProcessFetcher:
+        """
+        Return a fresh fetcher to replace this one in a forked child.
+
+        The parent's worker processes and the threads that manage them belong to
+        the parent; the replacement starts its own on its first fetch. This one
+        must be left alone, not closed.
+
+        Returns:
+            An unstarted fetcher with the same spec and process count.
+        """
+        return ProcessFetcher(self.spec, self.processes)
+
+    def _submit(self, operation: str, parameters: Any) -> concurrent.futures.Future[str]:
+        future = self._executor.submit(_materialize, operation, parameters, self._directory)
+        with self._lock:
+            self._outstanding.add(future)
+        return future
+
+    def _collect(self, future: concurrent.futures.Future[str]) -> pyarrow.Table:
+        try:
+            path = future.result()
+        except _WorkerError as exc:
+            raise exc.rebuild() from None
+        finally:
+            with self._lock:
+                owned = future in self._outstanding
+                self._outstanding.discard(future)
+        if not owned:
+            # `close` got to the file first and deleted it.
+            raise concurrent.futures.CancelledError
+        return map_table(path)
+
+
+class ProcessQuery:
+    """
+    One fetch through a `ProcessFetcher`, abortable from another thread.
+
+    `run` goes to `cancellable_offload` as the blocking callable and `cancel` as
+    its `adbc_cancel` hook.
+    """
+
+    __slots__ = ("_aborted", "_fetcher", "_future", "_lock", "_operation", "_parameters")
+
+    def __init__(self, fetcher: ProcessFetcher, operation: str, parameters: Any) -> None:
+        self._fetcher = fetcher
+        self._operation = operation
+        self._parameters = parameters
+        self._lock = threading.Lock()
+        self._future: concurrent.futures.Future[str] | None = None
+        self._aborted = False
+
+    def cancel(self) -> None:
+        """Withdraw the fetch if no worker has started it; otherwise let it finish."""
+        with self._lock:
+            self._aborted = True
+            future = self._future
+        if future is not None:
+            future.cancel()
+
+    def run(self) -> pyarrow.Table | None:
+        """
+        Submit the fetch and wait for its table (blocking).
+
+        Returns:
+            The result, or `None` if the fetch was cancelled before submission.
+
+        Raises:
+            concurrent.futures.CancelledError: If the fetch was withdrawn before
+                a worker started it.
+        """
+        with self._lock:
+            if self._aborted:
+                return None
+            self._future = future = self._fetcher._submit(self._operation, self._parameters)
+        return self._fetcher._collect(future)
+
+
+def fetch_table(
+    pool: AdbcQueuePool | AdbcPool,
+    operation: str,
+    parameters: Any = None,
+    shared: SharedResultStore | None = None,
+) -> pyarrow.Table:
+    """
+    Run a query and return its result as a table, in a worker process if the pool has them.
+
+    Args:
+        pool: The pool to fetch through.
+        operation: The SQL text to execute.
+        parameters: Bound parameters, forwarded to the dbapi cursor.
+        shared: A store to take the result from, or to fetch it into on a miss.
+
+    Returns:
+        The materialized result.
+
+    Raises:
+        sqlalchemy.exc.TimeoutError: If the pool has no worker processes and
+            stays exhausted for `timeout` seconds.
+    """
+    if shared is not None:
+        return shared.get_or_fetch(
+            shared.key(operation, parameters), lambda: fetch_table(pool, operation, parameters)
+        )
+    fetcher = pool._adbc_fetcher
+    if fetcher is not None:
+        return fetcher.fetch(operation, parameters)
+    conn = pool.connect()
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(operation, parameters)
+            return cursor.fetch_arrow_table()
+        finally:
+            cursor.close()
+    finally:
+        conn.close()
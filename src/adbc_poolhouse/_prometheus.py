@@ -0,0 +1,246 @@
+"""
+Prometheus text-format export of every live pool, with no metrics library.
+
+Pools built by the factories register themselves here (weakly) and drop out when
+closed with `close_pool` / `AsyncPool.close` or garbage-collected.
+[`render_prometheus`][adbc_poolhouse.render_prometheus] renders them all in the
+Prometheus text exposition format (version 0.0.4). An async pool is rendered
+once, with its limiter gauges, rather than once for the async wrapper and again
+for the sync pool inside it.
+
+Every sample carries two labels: `pool`, the `name=` given to the factory (or
+`pool-N` in creation order), and `config`, the config class (`DuckDBConfig`,
+`SnowflakeConfig`, ...; empty for pools built from raw driver arguments).
+
+The counters and histograms come from the same recorder as `pool.stats()`. The
+exported histogram buckets are coarser than the recorder's: a sample is counted
+under an `le` bound only when its fine bucket lies wholly below it, so a
+cumulative count can be short by the samples in the one fine bucket straddling
+the bound.
+
+An async pool's limiter and checkout-queue gauges belong to its event loop but
+are read from whichever thread renders, usually the scrape server's, without
+synchronising with the loop. Each is a momentary reading. It may be a call or
+two out of step with the other gauges of the same pool, and it is never torn:
+every field is read as one value under the GIL.
+
+Two ways out are provided: [`PrometheusHandler`][adbc_poolhouse.PrometheusHandler]
+for a `http.server` scrape endpoint, and
+[`write_prometheus_textfile`][adbc_poolhouse.write_prometheus_textfile] for the
+node_exporter textfile collector.
+"""
+
+from __future__ import annotations
+
+import http.server
+import os
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from adbc_poolhouse._stats import PoolStats
+
+# Exported `le` bounds, in seconds: sub-millisecond checkouts up to minute-long
+# warehouse logins.
+_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Sync pools and `AsyncPool`s alive and not yet closed.
+_live: weakref.WeakSet[Any] = weakref.WeakSet()
+
+_GAUGES = (
+    ("pool_size", "Current pool_size.", "size"),
+    ("connections_in_use", "Connections checked out.", "checked_out"),
+    ("connections_idle", "Idle connections in the pool.", "idle"),
+    ("connections_overflow", "Open connections minus pool_size.", "overflow"),
+)
+_ASYNC_GAUGES = (
+    (
+        "limiter_tokens_borrowed",
+        "Async limiter tokens held by calls in flight.",
+        "limiter_borrowed",
+    ),
+    ("limiter_tasks_waiting", "Async tasks waiting for a limiter token.", "limiter_waiting"),
+    ("checkout_tasks_waiting", "Async tasks waiting for a free connection.", "checkout_waiting"),
+)
+_COUNTERS = (
+    ("checkouts_total", "Successful checkouts.", "checkouts"),
+    ("checkout_timeouts_total", "Checkouts that timed out.", "timeouts"),
+    ("invalidations_total", "Connections invalidated instead of returned.", "invalidations"),
+    ("cancellations_total", "Async calls aborted mid-flight with adbc_cancel.", "cancellations"),
+)
+_HISTOGRAMS = (
+    ("checkout_wait_seconds", "Time connect() took.", "checkout_wait"),
+    ("hold_seconds", "Time connections were held, checkout to checkin.", "hold_time"),
+    ("connect_seconds", "Time each new connection took to open.", "connect_time"),
+)
+
+
+def track(pool: Any) -> None:
+    """Include `pool` in `render_prometheus` until it is untracked or collected."""
+    _live.add(pool)
+
+
+def untrack(pool: Any) -> None:
+    """Drop `pool` from `render_prometheus`; a no-op if it was not tracked."""
+    _live.discard(pool)
+
+
+def render_prometheus() -> str:
+    """
+    Render every live pool in the Prometheus text exposition format.
+
+    Safe to call from any thread. Async pools' limiter and checkout-queue gauges
+    are read without waiting for their event loops, so they are momentary and
+    may disagree slightly with each other.
+
+    Returns:
+        The exposition text, one metric family per block, each sample labelled
+        with `pool` and `config`. Empty when no pool is open.
+
+    Example:
+        ```python
+        from adbc_poolhouse import render_prometheus
+
+        print(render_prometheus())
+        ```
+    """
+    rows = list(_rows())
+    if not rows:
+        return ""
+    lines: list[str] = []
+    for suffix, help_text, field in _GAUGES:
+        _family(lines, suffix, "gauge", help_text)
+        for labels, stats, _, _ in rows:
+            lines.append(f"adbc_poolhouse_{suffix}{{{labels}}} {getattr(stats, field)}")
+    async_rows = [
+        (labels, stats, tokens) for labels, stats, _, tokens in rows if tokens is not None
+    ]
+    if async_rows:
+        _family(lines, "limiter_tokens", "gauge", "Async limiter capacity.")
+        for labels, _, tokens in async_rows:
+            lines.append(f"adbc_poolhouse_limiter_tokens{{{labels}}} {_number(tokens)}")
+        for suffix, help_text, field in _ASYNC_GAUGES:
+            _family(lines, suffix, "gauge", help_text)
+            for labels, stats, _ in async_rows:
+                lines.append(f"adbc_poolhouse_{suffix}{{{labels}}} {getattr(stats, field)}")
+    for suffix, help_text, field in _COUNTERS:
+        _family(lines, suffix, "counter", help_text)
+        for labels, stats, _, _ in rows:
+            lines.append(f"adbc_poolhouse_{suffix}{{{labels}}} {getattr(stats, field)}")
+    for suffix, help_text, key in _HISTOGRAMS:
+        name = f"adbc_poolhouse_{suffix}"
+        _family(lines, suffix, "histogram", help_text)
+        for labels, _, histograms, _ in rows:
+            cumulative, count, total = histograms[key]
+            for bound, seen in zip(_BUCKETS, cumulative, strict=True):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {seen}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {total!r}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(path: str | os.PathLike[str]) -> None:
+    """
+    Write `render_prometheus()` to `path` for the node_exporter textfile collector.
+
+    The text goes to a temporary file beside `path` that is then renamed over
+    it, so the collector never reads a half-written file.
+
+    Args:
+        path: Destination file, conventionally ending in `.prom`.
+    """
+    tmp = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(render_prometheus())
+    os.replace(tmp, path)
+
+
+class PrometheusHandler(http.server.BaseHTTPRequestHandler):
+    """
+    `http.server` handler serving `render_prometheus()` on `GET /metrics`.
+
+    Example:
+        ```python
+        import http.server
+        import threading
+
+        from adbc_poolhouse import PrometheusHandler
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 9464), PrometheusHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        ```
+    """
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+        """Serve the metrics on `/metrics` (or `/`); 404 anything else."""
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", _CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Keep scrapes out of stderr."""
+
+
+_Row = tuple[str, "PoolStats", dict[str, tuple[list[int], int, float]], float | None]
+
+
+def _rows() -> Iterable[_Row]:
+    pools = list(_live)
+    # Only `AsyncPool` has a limiter. It is rendered with the limiter figures,
+    # and the sync pool it wraps is skipped.
+    async_pools = [pool for pool in pools if hasattr(pool, "_limiter")]
+    wrapped = {id(pool._pool) for pool in async_pools}
+    for pool in pools:
+        if id(pool) in wrapped:
+            continue
+        is_async = hasattr(pool, "_limiter")
+        sync_pool = pool._pool if is_async else pool
+        labels = (
+            f'pool="{_escape(sync_pool._adbc_name)}",'
+            f'config="{_escape(sync_pool._adbc_config_class)}"'
+        )
+        tokens = pool._limiter.total_tokens if is_async else None
+        yield labels, pool.stats(), sync_pool._adbc_stats.histograms(_BUCKETS), tokens
+
+
+def _family(lines: list[str], suffix: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP adbc_poolhouse_{suffix} {help_text}")
+    lines.append(f"# TYPE adbc_poolhouse_{suffix} {kind}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if value == int(value) else repr(value)
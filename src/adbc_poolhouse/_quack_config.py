@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import importlib.util
 from typing import Self
 
 from pydantic import SecretStr, model_validator
@@ -94,7 +93,7 @@ class QuackConfig(BaseWarehouseConfig):
         return self._resolve_driver_path("adbc_driver_quack")
 
     def _dbapi_module(self) -> str | None:
-        if importlib.util.find_spec("adbc_driver_quack") is not None:
+        if self._package_installed("adbc_driver_quack"):
             return "adbc_driver_quack.dbapi"
         return None
 
@@ -0,0 +1,446 @@
+"""
+`AdbcQueuePool`: the `QueuePool` subclass returned by `create_pool`.
+
+Checkout, checkin, overflow and timeout behaviour are SQLAlchemy's, unchanged.
+The subclass exists so the poolhouse-level state the factory builds alongside a
+pool (the ADBC source connection, the pre-fill report, the background
+maintainer) has a typed home on the object users already hold, instead of being
+bolted on as untyped attributes.
+
+It also adds the idle-set operations the maintainer needs. Growing and shrinking
+go through the same `QueuePool` primitives SQLAlchemy uses on its own checkout
+and checkin paths (`_inc_overflow` / `_create_connection` / `_do_return_conn`,
+and `_pool.get` / `_dec_overflow`), so `checkedin()`, `checkedout()` and
+`overflow()` stay consistent while the maintainer grows or shrinks the pool.
+Background recycling swaps a replacement record into the idle queue in place,
+under the queue's own mutex, so no checkout ever sees the pool one short. Every
+checkin stamps the record's `info` with the time it went idle, which the
+maintainer's `idle_timeout` eviction reads. Autoscaling resizes the idle queue
+and shifts the overflow counter by the same amount, so the checkout ceiling
+moves while the checked-out count stays put.
+
+`stats()` reports checkout waits, hold times and connection-open latency,
+recorded on every checkout and checkin (see `adbc_poolhouse._stats`).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, cast
+
+import sqlalchemy.event
+import sqlalchemy.exc
+import sqlalchemy.pool
+
+from adbc_poolhouse import _fork
+from adbc_poolhouse._maintenance import _IDLE_SINCE
+from adbc_poolhouse._procfetch import fetch_table
+from adbc_poolhouse._stats import PoolRecorder, TimedCreator
+from adbc_poolhouse._stream import stream_query
+
+if TYPE_CHECKING:
+    import collections
+    from collections.abc import Callable
+
+    import pyarrow
+    from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+    from sqlalchemy.util import queue as sqla_queue
+
+    from adbc_poolhouse._autoscale import PoolAutoscaler
+    from adbc_poolhouse._budget import BudgetGate
+    from adbc_poolhouse._maintenance import PoolMaintainer
+    from adbc_poolhouse._prefill import PrefillReport
+    from adbc_poolhouse._procfetch import ConnectSpec, ProcessFetcher
+    from adbc_poolhouse._result_store import SharedResultStore
+    from adbc_poolhouse._stats import PoolStats
+
+# `record.info` key: `perf_counter()` at checkout, read back on checkin for the
+# hold-time histogram.
+_CHECKED_OUT_AT = "adbc_poolhouse.checked_out_at"
+
+# `record.info` key: the pool's pid at checkout. A record checked in under a
+# different one was checked out before a fork (see `adbc_poolhouse._fork`).
+_CHECKED_OUT_IN = "adbc_poolhouse.checked_out_in"
+
+
+class AdbcQueuePool(sqlalchemy.pool.QueuePool):
+    """
+    SQLAlchemy `QueuePool` backed by an ADBC source connection.
+
+    Returned by [`create_pool`][adbc_poolhouse.create_pool] and
+    [`managed_pool`][adbc_poolhouse.managed_pool]. It is a `QueuePool` in every
+    respect --- `connect()`, `size()`, `checkedout()`, `dispose()` and the pool
+    events all behave exactly as documented by SQLAlchemy --- so existing code
+    typed against `sqlalchemy.pool.QueuePool` keeps working.
+
+    Close it with [`close_pool`][adbc_poolhouse.close_pool], never with
+    `dispose()` alone, so the ADBC source connection is released and any
+    background maintainer is stopped.
+
+    Attributes:
+        prefill_report: Timings from the eager pre-fill when the pool was created
+            with `prefill > 0`, else `None`.
+    """
+
+    prefill_report: PrefillReport | None = None
+    _adbc_maintainer: PoolMaintainer | None = None
+    _adbc_autoscaler: PoolAutoscaler | None = None
+    _adbc_fetcher: ProcessFetcher | None = None
+    # `db.system` on trace spans; set by the factory from the config.
+    _adbc_backend = "adbc"
+    # `pool` and `config` labels in metrics exports; set by the factory.
+    _adbc_name = ""
+    _adbc_config_class = ""
+    _adbc_source: Any = None
+    # How to reopen the source, and what to pre-fill, in a forked child.
+    _adbc_connect_spec: ConnectSpec | None = None
+    _adbc_fork_prefill = 0
+    # Set by a fork reset that owes the pool its `fork_prefill` warm-up.
+    _adbc_warm_pending = False
+    # Takes a connection budget lease per open; see `adbc_poolhouse._budget`.
+    _adbc_gate: BudgetGate | None = None
+
+    def __init__(self, creator: Any, *args: Any, **kwargs: Any) -> None:
+        """
+        Build the pool, exactly as `QueuePool`.
+
+        Args:
+            creator: Zero-argument callable opening a new connection. It is
+                wrapped so every open is timed for `stats()`.
+            *args: Passed to `QueuePool`.
+            **kwargs: Passed to `QueuePool`.
+        """
+        self._adbc_stats = PoolRecorder()
+        # `recreate()` passes our own wrapper back in; time the original once.
+        if isinstance(creator, TimedCreator):
+            creator = creator.creator
+        super().__init__(TimedCreator(creator, self._adbc_stats), *args, **kwargs)
+        self._adbc_pid = os.getpid()
+        sqlalchemy.event.listen(self, "invalidate", self._adbc_on_invalidate)
+
+    def connect(self) -> PoolProxiedConnection:
+        """
+        Check out a connection, exactly as `QueuePool.connect`.
+
+        The time the checkout took is recorded for `stats()` and, when the pool
+        is autoscaled, reported to the autoscaler.
+
+        Returns:
+            The checked-out connection.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If the pool stays exhausted for
+                `timeout` seconds.
+        """
+        return self._adbc_checkout(time.perf_counter())
+
+    def _adbc_checkout(self, start: float) -> PoolProxiedConnection:
+        # `connect()`, with the checkout wait measured from `start`. `AsyncPool`
+        # passes the moment its task started queueing for a checkout slot.
+        if self._adbc_pid != os.getpid():
+            _fork.reset(self)
+        if self._adbc_warm_pending:
+            _fork.warm_up(self)
+        try:
+            conn = super().connect()
+        except sqlalchemy.exc.TimeoutError:
+            self._adbc_stats.timed_out()
+            raise
+        now = time.perf_counter()
+        conn.info[_CHECKED_OUT_AT] = now
+        conn.info[_CHECKED_OUT_IN] = self._adbc_pid
+        self._adbc_stats.checked_out(now - start)
+        autoscaler = self._adbc_autoscaler
+        if autoscaler is not None:
+            autoscaler.observe(now - start)
+        return conn
+
+    def stats(self) -> PoolStats:
+        """
+        Snapshot the pool's current state and recorded latencies.
+
+        Returns:
+            Connection counts right now, plus checkout / timeout counts and
+            checkout-wait, hold-time and connection-open percentiles over the
+            pool's lifetime.
+        """
+        return self._adbc_stats.snapshot(self)
+
+    def stream(
+        self, operation: str, parameters: Any = None
+    ) -> contextlib.AbstractContextManager[pyarrow.RecordBatchReader]:
+        """
+        Run a query and stream its result without materializing it.
+
+        Checks a connection out, executes `operation` and yields a
+        `pyarrow.RecordBatchReader` that pulls batches from the driver as it is
+        read. The connection stays checked out while the reader is live and is
+        returned to the pool when the reader is exhausted or the `with` block
+        exits, whichever comes first. Do not keep the reader past the block.
+
+        Args:
+            operation: The SQL text to execute.
+            parameters: Bound parameters, forwarded to the dbapi cursor.
+
+        Returns:
+            A context manager yielding the reader.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If the pool stays exhausted for
+                `timeout` seconds.
+
+        Example:
+            ```python
+            with pool.stream("SELECT * FROM events") as reader:
+                for batch in reader:
+                    sink.write(batch)
+            ```
+        """
+        return stream_query(self, operation, parameters)
+
+    def fetch_arrow(
+        self, operation: str, parameters: Any = None, *, shared: SharedResultStore | None = None
+    ) -> pyarrow.Table:
+        """
+        Run a query and return its whole result as a `pyarrow.Table`.
+
+        On a pool built with `fetch_processes`, the query runs in one of the
+        pool's worker processes, on that process's own connection, and the table
+        comes back through shared memory; no pool connection is checked out.
+        Otherwise a connection is checked out for the query and checked in
+        before this returns.
+
+        With `shared`, the result is taken from the store if another call, in
+        this process or any other, already put it there. On a miss it is fetched
+        as above and stored, and concurrent misses on the same query wait for
+        that one fetch.
+
+        Args:
+            operation: The SQL text to execute.
+            parameters: Bound parameters, forwarded to the dbapi cursor. With
+                `fetch_processes` they must be picklable.
+            shared: A `SharedResultStore` to read the result from, or to fetch
+                it into. Default: `None`.
+
+        Returns:
+            The materialized result.
+
+        Raises:
+            sqlalchemy.exc.TimeoutError: If the query needs a pool connection and
+                the pool stays exhausted for `timeout` seconds.
+        """
+        return fetch_table(self, operation, parameters, shared)
+
+    def _close_connection(self, connection: Any, *, terminate: bool = False) -> None:
+        # Every path that closes a pooled connection ends here; hand its budget
+        # lease back once it is closed.
+        super()._close_connection(connection, terminate=terminate)
+        if self._adbc_gate is not None:
+            self._adbc_gate.release(connection)
+
+    def _adbc_on_invalidate(self, *_: Any) -> None:
+        self._adbc_stats.invalidated()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        if record.info.pop(_CHECKED_OUT_IN, self._adbc_pid) != self._adbc_pid:
+            # Checked out before a fork: the parent's, so neither pooled nor closed.
+            _fork.abandon(record)
+            return
+        checked_out_at = record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            self._adbc_stats.checked_in(time.perf_counter() - checked_out_at)
+        record.info[_IDLE_SINCE] = time.time()
+        super()._do_return_conn(record)
+
+    def _adbc_add_idle(self) -> bool:
+        """
+        Open one new connection straight into the idle set.
+
+        Reserves a slot with `_inc_overflow` exactly as a checkout would, opens
+        the clone, and checks it in through `_do_return_conn` --- which closes it
+        again (releasing the slot) if the idle queue is already full.
+
+        Returns:
+            `True` if a connection was opened, `False` if the pool is already at
+            its `pool_size + max_overflow` ceiling.
+        """
+        if not self._inc_overflow():
+            return False
+        try:
+            record = self._create_connection()
+        except BaseException:
+            self._dec_overflow()
+            raise
+        self._do_return_conn(record)
+        return True
+
+    def _adbc_evict_idle(self) -> bool:
+        """
+        Close the longest-idle connection and release its slot.
+
+        Takes from the cold end of the queue even with `use_lifo`, where a
+        checkout would take from the other end.
+
+        Returns:
+            `True` if an idle connection was closed, `False` if none was idle.
+        """
+        mutex, queue = self._adbc_idle_queue()
+        with mutex:
+            if not queue:
+                return False
+            record = queue.popleft()
+        try:
+            record.close()
+        finally:
+            self._dec_overflow()
+        return True
+
+    def _adbc_evict_record(self, record: ConnectionPoolEntry) -> bool:
+        """
+        Close one specific idle connection and release its slot.
+
+        Args:
+            record: The idle record to close.
+
+        Returns:
+            `True` if `record` was still idle and has been closed; `False` if it
+            was checked out in the meantime.
+        """
+        mutex, queue = self._adbc_idle_queue()
+        with mutex:
+            try:
+                queue.remove(record)
+            except ValueError:
+                return False
+        try:
+            record.close()
+        finally:
+            self._dec_overflow()
+        return True
+
+    def _adbc_idle_records(self) -> list[ConnectionPoolEntry]:
+        """
+        Snapshot the idle connection records, oldest checkin first.
+
+        Returns:
+            The records currently in the idle queue. The list is a copy; a
+            record in it may be checked out by the time the caller looks at it.
+        """
+        mutex, queue = self._adbc_idle_queue()
+        with mutex:
+            return list(queue)
+
+    def _adbc_swap_idle(self, old: ConnectionPoolEntry, new: ConnectionPoolEntry) -> bool:
+        """
+        Replace an idle record with a freshly opened one, in place.
+
+        The swap happens under the idle queue's mutex, so a concurrent checkout
+        gets either the old record or the new one, never neither. The caller
+        closes whichever record this leaves unused, outside the lock.
+
+        Args:
+            old: The idle record to replace.
+            new: A record opened by `_create_connection`. It takes over `old`'s
+                slot, so overflow accounting is unchanged.
+
+        Returns:
+            `True` if `old` was still idle and has been replaced; `False` if it
+            was checked out in the meantime and the queue is unchanged.
+        """
+        mutex, queue = self._adbc_idle_queue()
+        with mutex:
+            try:
+                index = queue.index(old)
+            except ValueError:
+                return False
+            queue[index] = new
+        return True
+
+    def _adbc_replace_idle(self, old: ConnectionPoolEntry) -> bool:
+        """
+        Open a replacement for an idle record and swap it in.
+
+        The replacement is opened before the queue is touched, so the pool never
+        has one fewer idle connection while a clone is being opened. Whichever
+        record ends up unused is closed outside the lock. Under a budget the
+        replacement takes over the old connection's leases rather than waiting
+        for a new one, so a pool at its budget's cap still recycles.
+
+        Args:
+            old: The idle record to replace.
+
+        Returns:
+            `True` if `old` was replaced and closed; `False` if it was checked
+            out while the replacement opened (the replacement is closed).
+        """
+        gate = self._adbc_gate
+        with gate.replacing() if gate is not None else contextlib.nullcontext():
+            new = self._create_connection()
+        if self._adbc_swap_idle(old, new):
+            if gate is not None:
+                gate.hand_over(old.dbapi_connection, new.dbapi_connection)
+            old.close()
+            return True
+        new.close()
+        return False
+
+    def _adbc_resize(self, pool_size: int) -> None:
+        """
+        Change `pool_size` at runtime.
+
+        `_overflow` counts open connections minus `pool_size`, so it moves by
+        the opposite amount and `checkedout()` is unchanged. Idle connections
+        above a smaller size are left for the caller to evict; until then a
+        checkin finds the queue full and closes its connection.
+
+        Args:
+            pool_size: The new steady-state size.
+        """
+        mutex, _ = self._adbc_idle_queue()
+        overflow_lock = (
+            self._overflow_lock if self._max_overflow != -1 else contextlib.nullcontext()
+        )
+        with overflow_lock, mutex:
+            idle = cast("sqla_queue.Queue[ConnectionPoolEntry]", self._pool)
+            self._overflow -= pool_size - idle.maxsize
+            idle.maxsize = pool_size
+
+    def _adbc_listen_checkout(self, fn: Callable[..., None]) -> None:
+        sqlalchemy.event.listen(self, "checkout", fn)
+
+    def _adbc_remove_checkout(self, fn: Callable[..., None]) -> None:
+        if sqlalchemy.event.contains(self, "checkout", fn):
+            sqlalchemy.event.remove(self, "checkout", fn)
+
+    def _adbc_idle_queue(self) -> tuple[threading.RLock, collections.deque[ConnectionPoolEntry]]:
+        # `QueuePool._pool` is typed as the abstract `QueueCommon`; at runtime it
+        # is always SQLAlchemy's threading `Queue`, a deque guarded by an RLock.
+        idle = cast("sqla_queue.Queue[ConnectionPoolEntry]", self._pool)
+        return idle.mutex, idle.queue
+
+    # -- fork hooks (see `adbc_poolhouse._fork`) -------------------------------
+
+    def _adbc_forget(self) -> list[ConnectionPoolEntry]:
+        # Start over empty in a forked child, exactly as `QueuePool.__init__`
+        # does, handing back the inherited idle records for the caller to keep
+        # unclosed.
+        idle = cast("sqla_queue.Queue[ConnectionPoolEntry]", self._pool)
+        inherited = list(idle.queue)
+        self._pool = self._queue_class(idle.maxsize, use_lifo=idle.use_lifo)
+        self._overflow = 0 - idle.maxsize
+        self._overflow_lock = threading.Lock()
+        self._adbc_stats = PoolRecorder()
+        self._creator = TimedCreator(cast("TimedCreator", self._creator).creator, self._adbc_stats)
+        return inherited
+
+    def _adbc_set_creator(self, creator: Callable[[], Any]) -> None:
+        # `Pool._creator` wraps its value once, at assignment; the wrapper calls
+        # the `TimedCreator`, which reads `creator` on every call. A budget gate
+        # stays in front of whatever opens the connections.
+        if self._adbc_gate is not None:
+            self._adbc_gate.creator = creator
+        else:
+            cast("TimedCreator", self._creator).creator = creator
@@ -0,0 +1,244 @@
+"""
+Shared pools: one pool per distinct config, handed to every caller asking for it.
+
+Parts of an application that each call `create_pool(config)` with equal configs
+each get their own pool, with its own source connection, login and warehouse
+sessions. [`PoolRegistry`][adbc_poolhouse.PoolRegistry] builds the pool for a
+config once and hands the same pool to every later caller whose config and
+factory arguments are equal, counting references: each
+[`get_pool`][adbc_poolhouse.get_pool] is paired with a
+[`release_pool`][adbc_poolhouse.release_pool], and the last release closes it.
+
+Configs are matched by [`config_fingerprint`][adbc_poolhouse._registry.config_fingerprint],
+a digest of what the factory would connect with (`_driver_path()`,
+`_dbapi_module()`, `_adbc_entrypoint()`, `to_adbc_kwargs()`), the config's
+pool-tuning fields and the factory arguments. It is an HMAC keyed with a random
+per-process key, so the registry holds no password or token, not even as a plain
+hash that could be guessed offline. Factory arguments that are objects (a
+`ConnectionBudget`, say) match by identity.
+
+The registry's async counterpart is `AsyncPoolRegistry`
+(`adbc_poolhouse._async._registry`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+from typing import TYPE_CHECKING, Any, cast
+
+from adbc_poolhouse._pool_factory import close_pool, create_pool
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from adbc_poolhouse._adbc_pool import AdbcPool
+    from adbc_poolhouse._base_config import WarehouseConfig
+    from adbc_poolhouse._queue_pool import AdbcQueuePool
+
+# Config fields that shape the pool rather than the connection.
+_TUNING_FIELDS = ("pool_size", "max_overflow", "timeout", "recycle", "idle_timeout")
+
+# Keys the fingerprints of this process; never leaves it.
+_KEY = secrets.token_bytes(32)
+
+
+def _canonical(value: object) -> object:
+    """A JSON-encodable stand-in for a factory argument."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return [_canonical(v) for v in cast("Sequence[object]", value)]
+    # Budgets, stores and the like: the same object, not an equal one.
+    return f"{type(value).__qualname__}@{id(value):x}"
+
+
+def config_fingerprint(config: WarehouseConfig, options: Mapping[str, object]) -> str:
+    """
+    Digest a config and factory arguments into a registry key.
+
+    Args:
+        config: The warehouse config.
+        options: The keyword arguments for `create_pool`.
+
+    Returns:
+        A hex digest, equal for configs and arguments the factory would build
+        identical pools from.
+    """
+    material = {
+        "config": f"{type(config).__module__}.{type(config).__qualname__}",
+        "driver_path": config._driver_path(),
+        "dbapi_module": config._dbapi_module(),
+        "entrypoint": config._adbc_entrypoint(),
+        "kwargs": config.to_adbc_kwargs(),
+        "tuning": {field: _canonical(getattr(config, field, None)) for field in _TUNING_FIELDS},
+        "options": {key: _canonical(value) for key, value in options.items()},
+    }
+    payload = json.dumps(material, sort_keys=True).encode()
+    return hmac.new(_KEY, payload, hashlib.sha256).hexdigest()
+
+
+class _Entry:
+    """One shared pool, its reference count, and the lock its build runs under."""
+
+    __slots__ = ("build_lock", "pool", "refs")
+
+    def __init__(self) -> None:
+        self.build_lock = threading.Lock()
+        self.pool: AdbcQueuePool | AdbcPool | None = None
+        self.refs = 0
+
+
+class PoolRegistry:
+    """
+    Hands out one shared pool per distinct config, closing it after the last release.
+
+    Thread-safe. Concurrent callers asking for a config not yet built wait for
+    one build instead of each opening a source connection.
+
+    Example:
+        ```python
+        from adbc_poolhouse import PoolRegistry, SnowflakeConfig
+
+        registry = PoolRegistry()
+        pool = registry.get_pool(SnowflakeConfig(), pool_size=10)
+        try:
+            ...
+        finally:
+            registry.release_pool(pool)
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        # `id(pool)` -> its key, for `release_pool`.
+        self._keys: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        """The number of pools the registry holds open."""
+        with self._lock:
+            return len(self._keys)
+
+    def get_pool(self, config: WarehouseConfig, **options: Any) -> AdbcQueuePool | AdbcPool:
+        """
+        Return the shared pool for `config`, building it on first use.
+
+        Every call takes a reference; give it back with `release_pool`.
+
+        Args:
+            config: The warehouse config.
+            **options: Keyword arguments for `create_pool`. Callers share a
+                pool only when these are equal too.
+
+        Returns:
+            The pool, as `create_pool(config, **options)` would build it.
+        """
+        key = config_fingerprint(config, options)
+        while True:
+            with self._lock:
+                entry = self._entries.setdefault(key, _Entry())
+                if entry.pool is not None:
+                    entry.refs += 1
+                    return entry.pool
+            with entry.build_lock:
+                if entry.pool is None and self._entries.get(key) is entry:
+                    try:
+                        pool = cast("AdbcQueuePool | AdbcPool", create_pool(config, **options))
+                    except BaseException:
+                        # Callers waiting on this build retry it with a fresh entry.
+                        with self._lock:
+                            if self._entries.get(key) is entry:
+                                del self._entries[key]
+                        raise
+                    with self._lock:
+                        closed = self._entries.get(key) is not entry
+                        if not closed:
+                            entry.pool = pool
+                            self._keys[id(pool)] = key
+                    if closed:
+                        # `close()` ran during the build.
+                        close_pool(pool)
+
+    def release_pool(self, pool: AdbcQueuePool | AdbcPool) -> None:
+        """
+        Give back a reference taken by `get_pool`, closing the pool after the last one.
+
+        Args:
+            pool: A pool returned by `get_pool`.
+
+        Raises:
+            ValueError: If the registry does not hold `pool`.
+        """
+        with self._lock:
+            key = self._keys.get(id(pool))
+            if key is None:
+                raise ValueError("pool was not obtained from this registry, or already closed")
+            entry = self._entries[key]
+            entry.refs -= 1
+            if entry.refs:
+                return
+            del self._entries[key], self._keys[id(pool)]
+        close_pool(pool)
+
+    def close(self) -> None:
+        """Close every pool the registry holds, whatever its reference count."""
+        with self._lock:
+            pools = [entry.pool for entry in self._entries.values() if entry.pool is not None]
+            self._entries.clear()
+            self._keys.clear()
+        for pool in pools:
+            close_pool(pool)
+
+
+# The registry behind `get_pool` / `release_pool`.
+_registry = PoolRegistry()
+
+
+def get_pool(config: WarehouseConfig, **options: Any) -> AdbcQueuePool | AdbcPool:
+    """
+    Return the process-wide shared pool for `config`, building it on first use.
+
+    Parts of an application asking for equal configs with equal factory
+    arguments get the same pool, so they share its source connection and
+    warehouse sessions. Pair every call with `release_pool`; the last release
+    closes the pool. Do not call `close_pool` on a shared pool.
+
+    Args:
+        config: The warehouse config.
+        **options: Keyword arguments for `create_pool`.
+
+    Returns:
+        The shared pool.
+
+    Example:
+        ```python
+        from adbc_poolhouse import SnowflakeConfig, get_pool, release_pool
+
+        pool = get_pool(SnowflakeConfig(), pool_size=10)
+        try:
+            with pool.connect() as conn:
+                ...
+        finally:
+            release_pool(pool)
+        ```
+    """
+    return _registry.get_pool(config, **options)
+
+
+def release_pool(pool: AdbcQueuePool | AdbcPool) -> None:
+    """
+    Give back a reference taken by `get_pool`, closing the pool after the last one.
+
+    Args:
+        pool: A pool returned by `get_pool`.
+
+    Raises:
+        ValueError: If `pool` did not come from `get_pool`, or was already
+            released as many times as it was obtained.
+    """
+    _registry.release_pool(pool)
@@ -0,0 +1,347 @@
+"""
+A cross-process cache of query results in shared memory: `SharedResultStore`.
+
+A web server running several worker processes, each with its own pool, fetches
+the same reference tables once per process. A
+[`SharedResultStore`][adbc_poolhouse.SharedResultStore] keeps one copy instead:
+the first process to fetch a result writes it as an Arrow IPC file in a store
+directory under `/dev/shm`, and every process (itself included) memory-maps that
+file. Mapped buffers are used in place, so a hit costs a few system calls
+however large the table is.
+
+Everything the processes share is in the directory, coordinated with `flock`:
+
+- Entries are named by a hash of the query, and written to a temporary file
+  that is renamed into place, so a reader never sees a partial file.
+- A miss takes an exclusive lock on one of 256 stripe files (chosen by the key)
+  while it fetches, so processes missing on the same query wait for one fetch
+  instead of each running it.
+- A mapped entry is pinned by a shared lock on its file. The lock belongs to
+  the file description the mapping holds open, so it lasts exactly as long as
+  any Arrow buffer over the mapping, slices included, and the kernel drops it
+  if the process dies. That lock is the entry's reference count.
+- When a new entry would take the store past `max_bytes`, unpinned entries are
+  evicted least recently used first, under a store-wide lock. Removing a file
+  never invalidates a mapping: a process still using an entry keeps its pages
+  until it lets go of them.
+
+`fcntl` locks make the store POSIX-only. `pyarrow` is imported inside each
+method so the sync core stays importable without it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import mmap
+import os
+import time
+from typing import TYPE_CHECKING, Any
+
+from adbc_poolhouse._exceptions import ConfigurationError
+from adbc_poolhouse._shm import SHM_PREFIX, shm_dir, write_table
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    import pyarrow
+
+_ENTRY_SUFFIX = ".arrow"
+_STORE_LOCK = ".store.lock"
+
+
+class KeyLock:
+    """
+    An exclusive lock on the stripe a key hashes to, held by one fetching caller.
+
+    Returned by `SharedResultStore.try_lock`; call `release` when done.
+    """
+
+    __slots__ = ("_fd",)
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    def release(self) -> None:
+        """Release the lock; idempotent."""
+        fd, self._fd = self._fd, -1
+        if fd >= 0:
+            os.close(fd)
+
+
+class SharedResultStore:
+    """
+    Query results shared between processes through Arrow IPC files in shared memory.
+
+    Pass it to a pool's `fetch_arrow` as `shared=`, in every process that should
+    share results. Processes constructing a store with the same `name` share its
+    entries. A result is keyed by its SQL text and parameters only, so give each
+    database its own store name.
+
+    Args:
+        name: The store's name, used as its directory name. Default: `"default"`.
+        max_bytes: Bytes of entries to keep. A new entry evicts the least
+            recently used unpinned entries to fit; one that still does not fit is
+            returned to its caller without being stored. Default: 1 GiB.
+        ttl: Seconds after which an entry is stale and is fetched again.
+            Default: `None` (entries stay until evicted or invalidated).
+        directory: Where to create the store directory. Default: `/dev/shm`,
+            or the system temp directory where that does not exist.
+
+    Raises:
+        ConfigurationError: If `name` is not a plain file name, `max_bytes` or
+            `ttl` is not positive, or the platform has no `fcntl`.
+
+    Example:
+        ```python
+        from adbc_poolhouse import SharedResultStore
+
+        store = SharedResultStore("warehouse", max_bytes=4 << 30)
+        table = pool.fetch_arrow("SELECT * FROM countries", shared=store)
+        ```
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        *,
+        max_bytes: int = 1 << 30,
+        ttl: float | None = None,
+        directory: str | None = None,
+    ) -> None:
+        """Create the store directory if it does not exist yet."""
+        if fcntl is None:
+            raise ConfigurationError("SharedResultStore needs fcntl file locks (POSIX only)")
+        if not name or os.sep in name or name.startswith("."):
+            raise ConfigurationError(f"store name must be a plain file name, got {name!r}")
+        if max_bytes <= 0:
+            raise ConfigurationError(f"max_bytes must be positive, got {max_bytes}")
+        if ttl is not None and ttl <= 0:
+            raise ConfigurationError(f"ttl must be positive, got {ttl}")
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.path = os.path.join(directory or shm_dir(), f"{SHM_PREFIX}store-{name}")
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def key(operation: str, parameters: Any = None) -> str:
+        """
+        Return the store key for a query.
+
+        Args:
+            operation: The SQL text.
+            parameters: Bound parameters. Their `repr` is hashed, so it must be
+                the same in every process (true of numbers, strings, dates and
+                lists or tuples of them).
+
+        Returns:
+            A hex digest naming the query's entry.
+        """
+        return hashlib.sha256(repr((operation, parameters)).encode()).hexdigest()
+
+    def get(self, key: str) -> pyarrow.Table | None:
+        """
+        Map the entry for `key`, if there is a fresh one.
+
+        Args:
+            key: From `key`.
+
+        Returns:
+            The table, pinned for as long as any of its buffers is alive, or
+            `None` on a miss.
+        """
+        try:
+            fd = os.open(self._entry(key), os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        try:
+            # Blocks only while an evictor holds the file, to then find it gone.
+            fcntl.flock(fd, fcntl.LOCK_SH)  # type: ignore[union-attr]
+            stat = os.fstat(fd)
+            if stat.st_nlink == 0 or self._expired(stat.st_mtime):
+                return None
+            table = _map_table(fd)
+            # Last use, for LRU eviction; the modification time stays the write time.
+            os.utime(fd, (time.time(), stat.st_mtime))
+            return table
+        finally:
+            # The mapping keeps its own duplicate of the descriptor, and with it the pin.
+            os.close(fd)
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], pyarrow.Table]) -> pyarrow.Table:
+        """
+        Return the entry for `key`, calling `fetch` and storing its result on a miss.
+
+        Concurrent misses on the same key, in any process, run `fetch` once; the
+        others wait and then map its result.
+
+        Args:
+            key: From `key`.
+            fetch: Produces the table on a miss.
+
+        Returns:
+            The table, mapped from the store unless it did not fit.
+        """
+        table = self.get(key)
+        if table is not None:
+            return table
+        with self._stripe(key):
+            table = self.get(key)
+            if table is None:
+                table = self.put(key, fetch())
+        return table
+
+    def try_lock(self, key: str) -> KeyLock | None:
+        """
+        Take the fetch lock for `key` without waiting.
+
+        The building block of `get_or_fetch` for callers that must not block:
+        take the lock, check `get` again, fetch, `put`, then release.
+
+        Args:
+            key: From `key`.
+
+        Returns:
+            The lock, or `None` if another caller holds it.
+        """
+        fd = self._open_stripe(key)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)  # type: ignore[union-attr]
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        return KeyLock(fd)
+
+    def put(self, key: str, table: pyarrow.Table) -> pyarrow.Table:
+        """
+        Store `table` under `key`, evicting older entries to make room.
+
+        Replaces any existing entry; a process that has the old one mapped keeps
+        it.
+
+        Args:
+            key: From `key`.
+            table: The result to share.
+
+        Returns:
+            The stored entry, mapped, or `table` itself if it did not fit.
+        """
+        tmp = write_table(table, self.path)
+        try:
+            size = os.stat(tmp).st_size
+            with self._store_lock():
+                if not self._make_room(key, size):
+                    return table
+                os.replace(tmp, self._entry(key))
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp)
+        mapped = self.get(key)
+        return table if mapped is None else mapped
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove the entry for `key`; processes that have it mapped keep their copy.
+
+        Args:
+            key: From `key`.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._entry(key))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for entry in self._entries():
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(entry.path)
+
+    def nbytes(self) -> int:
+        """
+        Return the size of the stored entries.
+
+        Returns:
+            The total size of the entry files, in bytes. Entries removed while
+            still mapped somewhere are not counted.
+        """
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.path, key + _ENTRY_SUFFIX)
+
+    def _entries(self) -> list[os.DirEntry[str]]:
+        # Temporary files from `write_table` carry the shared-memory prefix.
+        with os.scandir(self.path) as it:
+            return [
+                e
+                for e in it
+                if e.name.endswith(_ENTRY_SUFFIX) and not e.name.startswith(SHM_PREFIX)
+            ]
+
+    def _expired(self, written: float) -> bool:
+        return self.ttl is not None and time.time() - written > self.ttl
+
+    def _open_stripe(self, key: str) -> int:
+        return os.open(os.path.join(self.path, f".lock-{key[:2]}"), os.O_RDWR | os.O_CREAT, 0o600)
+
+    @contextlib.contextmanager
+    def _stripe(self, key: str) -> Generator[None, None, None]:
+        fd = self._open_stripe(key)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)  # type: ignore[union-attr]
+            yield
+        finally:
+            os.close(fd)
+
+    @contextlib.contextmanager
+    def _store_lock(self) -> Generator[None, None, None]:
+        fd = os.open(os.path.join(self.path, _STORE_LOCK), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)  # type: ignore[union-attr]
+            yield
+        finally:
+            os.close(fd)
+
+    def _make_room(self, key: str, size: int) -> bool:
+        # Runs under the store lock. The entry being replaced frees its own space.
+        target = key + _ENTRY_SUFFIX
+        others = [(e.stat(), e.path) for e in self._entries() if e.name != target]
+        used = sum(stat.st_size for stat, _ in others)
+        for stat, path in sorted(others, key=lambda item: item[0].st_atime):
+            if used + size <= self.max_bytes:
+                break
+            if _evict(path):
+                used -= stat.st_size
+        return used + size <= self.max_bytes
+
+
+def _evict(path: str) -> bool:
+    """Remove an entry nobody has mapped; return whether it was removed."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return True
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)  # type: ignore[union-attr]
+        except BlockingIOError:
+            return False  # pinned
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+        return True
+    finally:
+        os.close(fd)
+
+
+def _map_table(fd: int) -> pyarrow.Table:
+    """Read the IPC file open on `fd` as a table over a read-only mapping of it."""
+    import pyarrow
+    import pyarrow.ipc
+
+    mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    return pyarrow.ipc.open_file(pyarrow.BufferReader(pyarrow.py_buffer(mapping))).read_all()
@@ -0,0 +1,92 @@
+"""
+Arrow IPC files in shared memory: how a table crosses a process boundary.
+
+A worker process writes its result as an Arrow IPC file under `/dev/shm` (a
+RAM-backed tmpfs on Linux; the system temp directory elsewhere).
+[`map_table`][adbc_poolhouse._shm.map_table] opens it with `pyarrow.memory_map`
+and reads it with the IPC file reader, so the table's buffers point straight at
+the mapped pages: nothing is copied or deserialized in the reading process. The
+file is unlinked as soon as it is mapped. The pages stay alive for as long as the
+table references them and are freed by the kernel once the last mapping goes.
+
+The IPC file format (not the stream format) is used because its footer lets the
+reader locate every record batch without scanning, and a file read from a memory
+map is zero-copy.
+
+`pyarrow` is imported inside each helper so the sync core stays importable
+without it.
+
+Internal only.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# RAM-backed on Linux; files written here never touch a disk.
+_DEV_SHM = "/dev/shm"  # noqa: S108
+
+# File name prefix, so stray files are recognisable (and easy to clean up).
+SHM_PREFIX = "adbc-poolhouse-"
+
+
+def shm_dir() -> str:
+    """
+    Return the directory shared-memory result files are written to.
+
+    Returns:
+        `/dev/shm` where it exists, else the system temp directory.
+    """
+    return _DEV_SHM if os.path.isdir(_DEV_SHM) else tempfile.gettempdir()
+
+
+def write_table(table: pyarrow.Table, directory: str) -> str:
+    """
+    Write `table` to a new Arrow IPC file in `directory`.
+
+    Args:
+        table: The table to write.
+        directory: Where to create the file (normally `shm_dir()`).
+
+    Returns:
+        The path of the new file. The caller owns it and must unlink it, which
+        `map_table` does.
+    """
+    import pyarrow.ipc
+
+    fd, path = tempfile.mkstemp(prefix=SHM_PREFIX, suffix=".arrow", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as sink, pyarrow.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def map_table(path: str, *, unlink: bool = True) -> pyarrow.Table:
+    """
+    Memory-map an Arrow IPC file and read it as a table, without copying.
+
+    Args:
+        path: A file written by `write_table`.
+        unlink: Remove the file once it is mapped (default). The table stays
+            valid: its mapping keeps the pages alive.
+
+    Returns:
+        A table whose buffers are the mapped file.
+    """
+    import pyarrow
+    import pyarrow.ipc
+
+    try:
+        with pyarrow.memory_map(path) as source:
+            return pyarrow.ipc.open_file(source).read_all()
+    finally:
+        if unlink:
+            os.unlink(path)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import importlib.util
 from pathlib import Path  # noqa: TC003
 from typing import Self
 
@@ -137,7 +136,7 @@ class SnowflakeConfig(BaseWarehouseConfig):
         return self._resolve_driver_path("adbc_driver_snowflake")
 
     def _dbapi_module(self) -> str | None:
-        if importlib.util.find_spec("adbc_driver_snowflake") is not None:
+        if self._package_installed("adbc_driver_snowflake"):
             return "adbc_driver_snowflake.dbapi"
         return None
 
@@ -0,0 +1,364 @@
+"""
+Pool statistics: always-on recording and a structured `PoolStats` snapshot.
+
+Every pool built by the factories records, for its whole lifetime:
+
+- checkout count, checkout timeouts, invalidations and cancelled calls;
+- checkout wait (how long `connect()` took, including any wait for a free
+  connection and any connection open);
+- hold time (checkout to checkin);
+- connection-open latency (every `adbc_clone`, whether for a checkout, a
+  pre-fill, the maintainer or a recycle).
+
+The latencies go into [`LatencyHistogram`][adbc_poolhouse._stats.LatencyHistogram]s
+with fixed log-linear buckets: eight linear sub-buckets per power of two from
+about a microsecond to a few minutes. Recording is one `math.frexp`, some integer
+arithmetic and a counter increment into a preallocated list, under a lock shared
+by the pool's histograms. Nothing is kept per sample, so the cost is the same
+after a billion checkouts as after one. Percentiles are read from the bucket
+boundaries and are accurate to within one bucket (12.5%).
+
+Both pool classes keep a `PoolRecorder` and wrap their creator in a
+`TimedCreator`. `pool.stats()` turns the counters into a frozen
+[`PoolStats`][adbc_poolhouse.PoolStats]. `PoolStats` and `LatencySummary` are
+re-exported from `__init__.py`; the recorder and histogram are internal.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+# Bucket layout. `math.frexp(x)` gives `x = m * 2**e` with `0.5 <= m < 1`; each
+# exponent from _MIN_EXP to _MAX_EXP gets _SUB_BUCKETS linear buckets over m.
+# 2**-19 s is ~1.9 us, 2**9 s is ~8.5 minutes; values outside are clamped.
+_SUB_BUCKETS = 8
+_MIN_EXP = -19
+_MAX_EXP = 9
+_N_BUCKETS = (_MAX_EXP - _MIN_EXP + 1) * _SUB_BUCKETS
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """
+    Percentiles of one latency distribution, in seconds.
+
+    Percentiles are bucket upper bounds (capped at `max`), so each is at most
+    12.5% above the true value. All fields are `0.0` when `count` is 0.
+
+    Attributes:
+        count: Number of samples recorded.
+        p50: Median.
+        p95: 95th percentile.
+        p99: 99th percentile.
+        max: Largest sample recorded.
+    """
+
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Point-in-time snapshot of a pool's state and recorded latencies.
+
+    Returned by `stats()` on pools built by [`create_pool`][adbc_poolhouse.create_pool]
+    and by [`AsyncPool.stats`][adbc_poolhouse._async._pool.AsyncPool.stats]. The
+    counters and latencies cover the pool's whole lifetime.
+
+    Attributes:
+        size: Current `pool_size`.
+        checked_out: Connections checked out right now.
+        idle: Connections idle in the pool right now.
+        overflow: Open connections minus `pool_size`; negative while the pool
+            holds fewer than `pool_size` connections.
+        checkouts: Successful checkouts.
+        timeouts: Checkouts that raised `sqlalchemy.exc.TimeoutError`.
+        invalidations: Connections invalidated instead of returned, including
+            the async poison path after a cancelled call.
+        cancellations: Async calls aborted mid-flight with `adbc_cancel`.
+        checkout_wait: How long `connect()` took.
+        hold_time: How long connections were held, checkout to checkin.
+        connect_time: How long each new connection took to open.
+        limiter_borrowed: Async pools only: limiter tokens held by in-flight
+            calls. `None` for sync pools.
+        limiter_waiting: Async pools only: tasks waiting for a limiter token.
+            `None` for sync pools.
+        checkout_waiting: Async pools only: tasks waiting for a free
+            connection. `None` for sync pools.
+
+    Example:
+        ```python
+        stats = pool.stats()
+        print(stats.checked_out, stats.idle, stats.checkout_wait.p99)
+        ```
+    """
+
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    invalidations: int
+    cancellations: int
+    checkout_wait: LatencySummary
+    hold_time: LatencySummary
+    connect_time: LatencySummary
+    limiter_borrowed: int | None = None
+    limiter_waiting: int | None = None
+    checkout_waiting: int | None = None
+
+
+class LatencyHistogram:
+    """Fixed-bucket log-linear histogram of durations in seconds. Not thread-safe."""
+
+    __slots__ = ("_counts", "count", "max", "total")
+
+    def __init__(self) -> None:
+        self._counts = [0] * _N_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Add one sample.
+
+        Args:
+            seconds: The duration to record. Values below the first bucket land
+                in it; values above the last land in the last.
+        """
+        mantissa, exp = math.frexp(seconds)
+        if exp < _MIN_EXP or seconds <= 0.0:
+            index = 0
+        elif exp > _MAX_EXP:
+            index = _N_BUCKETS - 1
+        else:
+            sub = int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+            index = (exp - _MIN_EXP) * _SUB_BUCKETS + sub
+        self._counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate the `q`-th percentile.
+
+        Args:
+            q: Percentile in `(0, 100]`.
+
+        Returns:
+            The upper bound of the bucket holding the `q`-th percentile sample,
+            capped at the largest sample; `0.0` with no samples.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(q / 100 * self.count), 1)
+        seen = 0
+        for index, n in enumerate(self._counts):
+            seen += n
+            if seen >= rank:
+                return min(_upper_bound(index), self.max)
+        return self.max
+
+    def cumulative(self, bounds: Sequence[float]) -> list[int]:
+        """
+        Count samples at or below each bound, for exporting coarser buckets.
+
+        A fine bucket is counted under a bound only if its upper edge is at or
+        below it, so a count can be short by the samples of the one fine bucket
+        straddling the bound.
+
+        Args:
+            bounds: Ascending upper bounds in seconds.
+
+        Returns:
+            One cumulative count per bound.
+        """
+        counts: list[int] = []
+        seen = 0
+        index = 0
+        for bound in bounds:
+            while index < _N_BUCKETS and _upper_bound(index) <= bound:
+                seen += self._counts[index]
+                index += 1
+            counts.append(seen)
+        return counts
+
+    def summary(self) -> LatencySummary:
+        """
+        Summarise the recorded samples.
+
+        Returns:
+            The count, p50 / p95 / p99 and maximum.
+        """
+        return LatencySummary(
+            count=self.count,
+            p50=self.percentile(50),
+            p95=self.percentile(95),
+            p99=self.percentile(99),
+            max=self.max,
+        )
+
+
+def _upper_bound(index: int) -> float:
+    exp, sub = divmod(index, _SUB_BUCKETS)
+    return (0.5 + (sub + 1) / (2 * _SUB_BUCKETS)) * 2.0 ** (exp + _MIN_EXP)
+
+
+class _SizedPool(Protocol):
+    def size(self) -> int: ...
+
+    def checkedin(self) -> int: ...
+
+    def checkedout(self) -> int: ...
+
+    def overflow(self) -> int: ...
+
+
+class TimedCreator:
+    """
+    Connection creator that reports how long each open took.
+
+    Both pool classes wrap their creator in one, so every new connection is
+    timed --- checkout, pre-fill, maintainer top-up and recycle alike --- without
+    each call site timing itself.
+
+    Args:
+        creator: Zero-argument callable opening a new connection.
+        recorder: Where to record the open latency.
+    """
+
+    __slots__ = ("creator", "recorder")
+
+    def __init__(self, creator: Callable[[], Any], recorder: PoolRecorder) -> None:
+        self.creator = creator
+        self.recorder = recorder
+
+    def __call__(self) -> Any:
+        """Open a connection with the wrapped creator, timing it."""
+        start = time.perf_counter()
+        conn = self.creator()
+        self.recorder.opened(time.perf_counter() - start)
+        return conn
+
+
+class PoolRecorder:
+    """Counters and histograms behind `pool.stats()`, shared by both pool classes."""
+
+    __slots__ = (
+        "_lock",
+        "cancellations",
+        "checkout_wait",
+        "checkouts",
+        "connect_time",
+        "hold_time",
+        "invalidations",
+        "timeouts",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.invalidations = 0
+        self.cancellations = 0
+        self.checkout_wait = LatencyHistogram()
+        self.hold_time = LatencyHistogram()
+        self.connect_time = LatencyHistogram()
+
+    def checked_out(self, wait: float) -> None:
+        """Record a successful checkout that took `wait` seconds."""
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait.record(wait)
+
+    def timed_out(self) -> None:
+        """Record a checkout that raised `TimeoutError`."""
+        with self._lock:
+            self.timeouts += 1
+
+    def invalidated(self) -> None:
+        """Record a connection invalidated instead of returned."""
+        with self._lock:
+            self.invalidations += 1
+
+    def cancelled(self) -> None:
+        """Record an async call aborted mid-flight."""
+        with self._lock:
+            self.cancellations += 1
+
+    def checked_in(self, held: float) -> None:
+        """Record a connection returned after `held` seconds."""
+        with self._lock:
+            self.hold_time.record(held)
+
+    def opened(self, seconds: float) -> None:
+        """Record a new connection that took `seconds` to open."""
+        with self._lock:
+            self.connect_time.record(seconds)
+
+    def snapshot(self, pool: _SizedPool) -> PoolStats:
+        """
+        Build a `PoolStats` for `pool` from the recorded counters.
+
+        Args:
+            pool: The pool this recorder belongs to, for its live counts.
+
+        Returns:
+            The snapshot.
+        """
+        size, out, idle, overflow = (
+            pool.size(),
+            pool.checkedout(),
+            pool.checkedin(),
+            pool.overflow(),
+        )
+        with self._lock:
+            return PoolStats(
+                size=size,
+                checked_out=out,
+                idle=idle,
+                overflow=overflow,
+                checkouts=self.checkouts,
+                timeouts=self.timeouts,
+                invalidations=self.invalidations,
+                cancellations=self.cancellations,
+                checkout_wait=self.checkout_wait.summary(),
+                hold_time=self.hold_time.summary(),
+                connect_time=self.connect_time.summary(),
+            )
+
+    def histograms(self, bounds: Sequence[float]) -> dict[str, tuple[list[int], int, float]]:
+        """
+        Export the latency histograms with coarser buckets.
+
+        Args:
+            bounds: Ascending bucket upper bounds in seconds.
+
+        Returns:
+            For each of `checkout_wait`, `hold_time` and `connect_time`: the
+            cumulative counts at `bounds`, the sample count and the sample sum.
+        """
+        with self._lock:
+            return {
+                name: (histogram.cumulative(bounds), histogram.count, histogram.total)
+                for name, histogram in (
+                    ("checkout_wait", self.checkout_wait),
+                    ("hold_time", self.hold_time),
+                    ("connect_time", self.connect_time),
+                )
+            }
@@ -0,0 +1,124 @@
+"""
+Streaming reads that keep their connection checked out: `pool.stream(sql)`.
+
+A `RecordBatchReader` from `cursor.fetch_record_batch` reads from the cursor that
+produced it. On checkin the pool closes every open cursor
+(`_release_arrow_allocators`, or `AdbcPool`'s inline equivalent), so a reader
+handed back from a pooled connection dies as soon as the connection does, and
+callers fall back to `fetch_arrow_table` and hold the whole result in memory.
+
+[`stream_query`][adbc_poolhouse._stream.stream_query] ties the two lifetimes
+together instead. It checks a connection out, executes the query, and yields a
+reader whose batches come from the driver one at a time. The connection stays
+checked out until the reader is exhausted or the `with` block exits, whichever
+comes first. Then the driver reader, the cursor and the connection are closed
+in that order, exactly once.
+
+The yielded reader is a `pyarrow.RecordBatchReader` wrapping the driver's, so it
+can be passed to anything that consumes one (`pyarrow.dataset`, DuckDB, Polars)
+without materializing. `pyarrow` is imported only when a stream is opened; the
+ADBC dbapi already requires it.
+
+Internal only --- callers use the `stream` method on
+[`AdbcQueuePool`][adbc_poolhouse.AdbcQueuePool] and
+[`AdbcPool`][adbc_poolhouse.AdbcPool].
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    import pyarrow
+
+    from adbc_poolhouse._adbc_pool import AdbcPool
+    from adbc_poolhouse._queue_pool import AdbcQueuePool
+
+
+class _StreamLease:
+    """The checked-out connection, cursor and driver reader behind one stream."""
+
+    __slots__ = ("_conn", "_cursor", "_lock", "_reader")
+
+    def __init__(self, conn: Any, cursor: Any, reader: Any) -> None:
+        self._conn = conn
+        self._cursor = cursor
+        self._reader = reader
+        self._lock = threading.Lock()
+
+    def batches(self) -> Generator[pyarrow.RecordBatch, None, None]:
+        """Yield the driver's batches, releasing the lease once they run out."""
+        try:
+            while True:
+                try:
+                    batch = self._reader.read_next_batch()
+                except StopIteration:
+                    return
+                yield batch
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        """Close the reader and cursor and check the connection in; idempotent."""
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                return
+            self._conn = None
+        try:
+            try:
+                self._reader.close()
+            finally:
+                self._cursor.close()
+        finally:
+            conn.close()
+
+
+@contextlib.contextmanager
+def stream_query(
+    pool: AdbcQueuePool | AdbcPool,
+    operation: str,
+    parameters: Any = None,
+) -> Generator[pyarrow.RecordBatchReader, None, None]:
+    """
+    Execute `operation` on a checked-out connection and stream its result.
+
+    Args:
+        pool: The pool to check a connection out of.
+        operation: The SQL text to execute.
+        parameters: Bound parameters, forwarded to the dbapi cursor.
+
+    Yields:
+        A `pyarrow.RecordBatchReader` over the result. The connection stays
+        checked out until the reader is exhausted or the block exits.
+
+    Raises:
+        sqlalchemy.exc.TimeoutError: If the pool stays exhausted for `timeout`
+            seconds.
+    """
+    # Deferred so the sync core stays importable without pyarrow.
+    import pyarrow
+
+    conn = pool.connect()
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(operation, parameters)
+            source = cursor.fetch_record_batch()
+        except BaseException:
+            cursor.close()
+            raise
+    except BaseException:
+        conn.close()
+        raise
+    lease = _StreamLease(conn, cursor, source)
+    try:
+        reader = pyarrow.RecordBatchReader.from_batches(source.schema, lease.batches())
+        with reader:
+            yield reader
+    finally:
+        lease.release()
@@ -0,0 +1,137 @@
+"""
+Optional OpenTelemetry tracing for pool creation, checkout, execute and fetch.
+
+Tracing is off until [`enable_tracing`][adbc_poolhouse.enable_tracing] is
+called. Until then no `opentelemetry` module is imported, and every
+instrumented call site pays one global read and a shared `nullcontext`. Once
+enabled, these spans are emitted:
+
+- `adbc_poolhouse.create_pool` around opening the ADBC source and any pre-fill,
+  with `db.system`, `adbc_poolhouse.pool_class` and `adbc_poolhouse.pool_size`;
+- `adbc_poolhouse.connect` around `AsyncPool.connect`, with `db.system`;
+- `adbc_poolhouse.limiter_wait` inside the `offload` chokepoint while a call
+  waits for a limiter token, with `adbc_poolhouse.limiter.borrowed` and
+  `adbc_poolhouse.limiter.total`;
+- `adbc_poolhouse.execute` around `AsyncCursor.execute`, with `db.system` and,
+  when the driver reports one, `db.response.returned_rows`;
+- `adbc_poolhouse.fetch_arrow_table` around `AsyncCursor.fetch_arrow_table`,
+  with `db.system`, `db.response.returned_rows` and `adbc_poolhouse.arrow.bytes`.
+
+`limiter_wait` is a child of the span around the call that waited, so a trace
+separates limiter queueing from the worker-thread time. Worker-thread time for
+`connect` is the sync checkout, which includes any wait for a free pool
+connection. anyio copies the context into worker threads, so spans opened by the
+driver or by user code in the worker nest under these.
+
+`opentelemetry-api` is an optional dependency (the `[otel]` extra); the SDK and
+exporter are the application's choice.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib.metadata
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+    from opentelemetry.trace import Span, Tracer, TracerProvider
+
+    from adbc_poolhouse._base_config import WarehouseConfig
+
+# The tracer spans go to; `None` while tracing is disabled. Read on every
+# instrumented call, so it is a plain module global.
+tracer: Tracer | None = None
+
+_NO_SPAN: AbstractContextManager[None] = contextlib.nullcontext()
+
+# `db.system` for pools built from raw driver arguments rather than a config.
+_GENERIC_BACKEND = "adbc"
+
+
+def enable_tracing(tracer_provider: TracerProvider | None = None) -> None:
+    """
+    Emit OpenTelemetry spans from pool creation, checkout, execute and fetch.
+
+    Applies to every pool, including ones created before the call. Calling it
+    again replaces the tracer.
+
+    Args:
+        tracer_provider: The provider to take the `adbc_poolhouse` tracer from.
+            Defaults to the global provider set with
+            `opentelemetry.trace.set_tracer_provider`.
+
+    Raises:
+        ImportError: If `opentelemetry-api` is not installed.
+
+    Example:
+        ```python
+        from opentelemetry.sdk.trace import TracerProvider
+        import adbc_poolhouse
+
+        adbc_poolhouse.enable_tracing(TracerProvider())
+        ```
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError as exc:
+        raise ImportError(
+            "enable_tracing requires the optional tracing dependencies. "
+            "Install them with: pip install adbc-poolhouse[otel]"
+        ) from exc
+    try:
+        version = importlib.metadata.version("adbc-poolhouse")
+    except importlib.metadata.PackageNotFoundError:
+        version = None
+    global tracer
+    tracer = trace.get_tracer("adbc_poolhouse", version, tracer_provider=tracer_provider)
+
+
+def disable_tracing() -> None:
+    """Stop emitting spans. Instrumented calls go back to costing nothing."""
+    global tracer
+    tracer = None
+
+
+def start_span(name: str) -> AbstractContextManager[Span | None]:
+    """
+    Open a span as the current span, or do nothing when tracing is disabled.
+
+    Callers set attributes on the yielded span after checking it is not `None`,
+    so attribute values are never computed while tracing is off.
+
+    Args:
+        name: The span name.
+
+    Returns:
+        A context manager yielding the span, or `None` when tracing is disabled.
+    """
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.start_as_current_span(name)
+
+
+def backend_name(
+    config: WarehouseConfig | None, driver_path: str | None, dbapi_module: str | None
+) -> str:
+    """
+    Name the backend a pool connects to, for the `db.system` span attribute.
+
+    Args:
+        config: The warehouse config, if the pool was built from one.
+        driver_path: The raw driver path, if given instead of a config.
+        dbapi_module: The raw DBAPI module, if given instead of a config.
+
+    Returns:
+        The config class name without its `Config` suffix, lower-cased
+        (`DuckDBConfig` is `"duckdb"`); otherwise the driver named by
+        `dbapi_module` or `driver_path`; otherwise `"adbc"`.
+    """
+    if config is not None:
+        return type(config).__name__.removesuffix("Config").lower()
+    raw = dbapi_module.split(".")[0] if dbapi_module else driver_path
+    if not raw:
+        return _GENERIC_BACKEND
+    stem = raw.replace("\\", "/").rsplit("/", 1)[-1].split(".")[0]
+    return stem.removeprefix("lib").removeprefix("adbc_driver_") or _GENERIC_BACKEND
@@ -115,6 +115,10 @@ class TestBlockingStubCursor:
         cursor.release()
         assert d1.wait(timeout=5)
         assert d2.wait(timeout=5)
+        # `done` is set just before each runner returns; join so the thread has
+        # actually exited before checking it.
+        t1.join(timeout=5)
+        t2.join(timeout=5)
         assert not t1.is_alive()
         assert not t2.is_alive()
 
@@ -18,19 +18,25 @@ from __future__ import annotations
 import importlib
 import inspect
 import os
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import anyio
 import pyarrow
 import pytest
 
 from adbc_poolhouse import (
+    ConfigurationError,
     DuckDBConfig,
     SnowflakeConfig,
     close_async_pool,
     create_async_pool,
     managed_async_pool,
+    open_async_pool,
+    render_prometheus,
 )
+from adbc_poolhouse._async import _factory
 
 if TYPE_CHECKING:
     from adbc_poolhouse._async._pool import AsyncPool
@@ -38,7 +44,9 @@ if TYPE_CHECKING:
 _CASSETTE_ROOT = Path(__file__).parent.parent / "cassettes"
 
 # Repeat (env-controlled) + timeout: codify the "0-hang" loop gate (see _edge_helpers).
-pytestmark = importlib.import_module("tests.async._edge_helpers").concurrency_marks
+_helpers = importlib.import_module("tests.async._edge_helpers")
+await_inside = _helpers.await_inside
+pytestmark = _helpers.concurrency_marks
 
 
 class TestHappyPath:
@@ -73,6 +81,263 @@ class TestHappyPath:
             assert pool._pool.checkedout() == 0
 
 
+class TestPrefill:
+    """`prefill=` on the async factories fills the wrapped sync pool before return."""
+
+    @pytest.mark.anyio
+    async def test_create_async_pool_prefill(self, anyio_backend_name: str) -> None:
+        """`create_async_pool(prefill=N)` returns with N idle connections and a report."""
+        del anyio_backend_name
+        import tempfile
+
+        db = str(Path(tempfile.mkdtemp()) / "prefill.db")
+        pool = create_async_pool(DuckDBConfig(database=db, pool_size=2), prefill=2)
+        try:
+            assert pool._pool.checkedin() == 2
+            assert pool.prefill_report is not None
+            assert pool.prefill_report.connections == 2
+        finally:
+            await close_async_pool(pool)
+
+    @pytest.mark.anyio
+    async def test_managed_async_pool_prefill(self, anyio_backend_name: str) -> None:
+        """`managed_async_pool(prefill=N)` yields an already-filled pool."""
+        del anyio_backend_name
+        import tempfile
+
+        db = str(Path(tempfile.mkdtemp()) / "prefill_managed.db")
+        async with managed_async_pool(DuckDBConfig(database=db), prefill=1) as pool:
+            assert pool._pool.checkedin() == 1
+
+
+class TestOpenAsyncPool:
+    """`open_async_pool` builds the pool on a worker thread and cleans up on cancel."""
+
+    @pytest.mark.anyio
+    async def test_builds_off_the_loop(
+        self, anyio_backend_name: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The source connect and pre-fill run on a worker thread, not the loop."""
+        del anyio_backend_name
+        import tempfile
+
+        build_threads: list[int] = []
+        real_build = _factory._create_pool_impl
+
+        def recording_build(*args: Any, **kwargs: Any) -> Any:
+            build_threads.append(threading.get_ident())
+            return real_build(*args, **kwargs)
+
+        monkeypatch.setattr(_factory, "_create_pool_impl", recording_build)
+        db = str(Path(tempfile.mkdtemp()) / "open.db")
+        pool = await open_async_pool(DuckDBConfig(database=db), pool_size=2, prefill=2)
+        try:
+            assert build_threads != [threading.get_ident()]
+            assert pool._pool.checkedin() == 2
+            async with await pool.connect() as conn:
+                cur = conn.cursor()
+                await cur.execute("SELECT 3 AS n")
+                tbl = await cur.fetch_arrow_table()
+                assert tbl.column("n")[0].as_py() == 3
+        finally:
+            await close_async_pool(pool)
+
+    @pytest.mark.anyio
+    async def test_cancel_mid_build_closes_the_pool(
+        self, anyio_backend_name: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A cancellation during the build closes the pool once the build returns."""
+        del anyio_backend_name
+        import tempfile
+
+        entered = threading.Event()
+        gate = threading.Event()
+        built: list[Any] = []
+        closed: list[Any] = []
+        real_build = _factory._create_pool_impl
+        real_close = _factory.close_pool
+
+        def gated_build(*args: Any, **kwargs: Any) -> Any:
+            entered.set()
+            gate.wait(5)
+            built.append(real_build(*args, **kwargs))
+            return built[-1]
+
+        def recording_close(pool: Any) -> None:
+            closed.append(pool)
+            real_close(pool)
+
+        monkeypatch.setattr(_factory, "_create_pool_impl", gated_build)
+        monkeypatch.setattr(_factory, "close_pool", recording_close)
+        db = str(Path(tempfile.mkdtemp()) / "open_cancel.db")
+        opened: list[AsyncPool] = []
+
+        async def opener() -> None:
+            opened.append(await open_async_pool(DuckDBConfig(database=db), prefill=1))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(opener)
+            assert await await_inside(entered.is_set)
+            tg.cancel_scope.cancel()
+            gate.set()
+        assert opened == []
+        assert len(built) == 1
+        assert closed == built
+
+    @pytest.mark.anyio
+    async def test_build_error_propagates(self, anyio_backend_name: str) -> None:
+        """A build that fails raises from the `await`, exactly as `create_async_pool`."""
+        del anyio_backend_name
+        with pytest.raises(ConfigurationError):
+            await open_async_pool(DuckDBConfig(database=":memory:"), pool_size=1, prefill=2)
+
+
+class TestMaintenance:
+    """`min_idle=` on the async factories: thread for `create_*`, task for `managed_*`."""
+
+    @pytest.mark.anyio
+    async def test_managed_async_pool_runs_maintenance_task(self, anyio_backend_name: str) -> None:
+        """The task maintainer warms the idle set and replaces a checked-out connection."""
+        del anyio_backend_name
+        import tempfile
+
+        import anyio
+
+        db = str(Path(tempfile.mkdtemp()) / "maintain.db")
+        async with managed_async_pool(DuckDBConfig(database=db), min_idle=2) as pool:
+            # No thread in the managed form: maintenance is a task in the block.
+            assert pool._pool._adbc_maintainer is not None
+            assert pool._pool._adbc_maintainer._thread is None
+            while pool._pool.checkedin() < 2:
+                await anyio.sleep(0)
+            async with await pool.connect():
+                while pool._pool.checkedin() < 2:
+                    await anyio.sleep(0)
+                assert pool._pool.checkedout() == 1
+        assert pool._maintenance_wake is None
+
+    @pytest.mark.anyio
+    async def test_create_async_pool_uses_thread(self, anyio_backend_name: str) -> None:
+        """`create_async_pool(min_idle=N)` starts the thread; close stops it."""
+        del anyio_backend_name
+        import tempfile
+
+        db = str(Path(tempfile.mkdtemp()) / "maintain_thread.db")
+        pool = create_async_pool(DuckDBConfig(database=db), min_idle=1)
+        maintainer = pool._pool._adbc_maintainer
+        assert maintainer is not None
+        thread = maintainer._thread
+        assert thread is not None
+        await close_async_pool(pool)
+        assert not thread.is_alive()
+
+    @pytest.mark.anyio
+    async def test_lifo_and_idle_timeout_pass_through(self, anyio_backend_name: str) -> None:
+        """LIFO checkout reuses the hot connection; `idle_timeout` reaches the maintainer."""
+        del anyio_backend_name
+        import tempfile
+
+        db = str(Path(tempfile.mkdtemp()) / "lifo.db")
+        cfg = DuckDBConfig(database=db, pool_size=2)
+        async with managed_async_pool(
+            cfg, prefill=2, checkout_order="lifo", idle_timeout=30
+        ) as pool:
+            maintainer = pool._pool._adbc_maintainer
+            assert maintainer is not None
+            assert maintainer.idle_timeout == 30
+            async with await pool.connect() as conn:
+                raw = conn._fairy.dbapi_connection
+            async with await pool.connect() as conn:
+                assert conn._fairy.dbapi_connection is raw
+
+
+class TestAutoscale:
+    """`autoscale=`: the pool limiter follows the sync pool's runtime size."""
+
+    @pytest.mark.anyio
+    async def test_limiter_tracks_resize(self, anyio_backend_name: str) -> None:
+        """After the sync pool grows, the next checkout resizes the limiter to match."""
+        del anyio_backend_name
+        import tempfile
+
+        db = str(Path(tempfile.mkdtemp()) / "autoscale.db")
+        cfg = DuckDBConfig(database=db)
+        async with managed_async_pool(cfg, pool_size=2, max_overflow=1, autoscale=(1, 6)) as pool:
+            assert pool._limiter.total_tokens == 3
+            pool._pool._adbc_resize(5)
+            async with await pool.connect():
+                assert pool._limiter.total_tokens == 6
+            pool._pool._adbc_resize(1)
+            async with await pool.connect():
+                assert pool._limiter.total_tokens == 2
+
+
+class TestStats:
+    """`AsyncPool.stats()`: the sync pool's stats plus limiter usage."""
+
+    @pytest.mark.anyio
+    async def test_stats_include_limiter(self, duckdb_async_pool: AsyncPool) -> None:
+        """Checkouts are counted and the limiter fields are filled in."""
+        async with await duckdb_async_pool.connect():
+            stats = duckdb_async_pool.stats()
+            assert stats.checked_out == 1
+            assert stats.limiter_borrowed == 0
+            assert stats.limiter_waiting == 0
+        stats = duckdb_async_pool.stats()
+        assert stats.checkouts == 1
+        assert stats.hold_time.count == 1
+
+    @pytest.mark.anyio
+    async def test_prometheus_renders_async_pool_once(self, anyio_backend_name: str) -> None:
+        """The async pool is rendered with limiter gauges; its sync pool is not repeated."""
+        del anyio_backend_name
+        async with managed_async_pool(
+            DuckDBConfig(database=":memory:"), pool_size=2, max_overflow=1, name="async-wh"
+        ):
+            text = render_prometheus()
+            labels = '{pool="async-wh",config="DuckDBConfig"}'
+            assert text.count(f"adbc_poolhouse_pool_size{labels}") == 1
+            assert f"adbc_poolhouse_limiter_tokens{labels} 3" in text
+            assert f"adbc_poolhouse_limiter_tasks_waiting{labels} 0" in text
+        assert 'pool="async-wh"' not in render_prometheus()
+
+
+class TestNativePool:
+    """`pool_class="adbc"`: the async layer runs unchanged over the native `AdbcPool`."""
+
+    @pytest.mark.anyio
+    async def test_round_trip(self, anyio_backend_name: str) -> None:
+        """Connect, execute, fetch and check-in work over `AdbcPool`."""
+        del anyio_backend_name
+        import tempfile
+
+        from adbc_poolhouse import AdbcPool
+
+        db = str(Path(tempfile.mkdtemp()) / "native.db")
+        async with managed_async_pool(DuckDBConfig(database=db), pool_class="adbc") as pool:
+            assert isinstance(pool._pool, AdbcPool)
+            async with await pool.connect() as conn:
+                cur = conn.cursor()
+                await cur.execute("SELECT 7 AS n")
+                tbl = await cur.fetch_arrow_table()
+                assert tbl.column("n")[0].as_py() == 7
+            assert pool._pool.checkedout() == 0
+
+    @pytest.mark.anyio
+    async def test_invalidate_drops_connection(self, anyio_backend_name: str) -> None:
+        """`AsyncConnection.invalidate` releases the native pool slot."""
+        del anyio_backend_name
+        import tempfile
+
+        db = str(Path(tempfile.mkdtemp()) / "native_invalidate.db")
+        async with managed_async_pool(DuckDBConfig(database=db), pool_class="adbc") as pool:
+            conn = await pool.connect()
+            await conn.invalidate()
+            await conn.close()
+            assert pool._pool.checkedout() == 0
+            assert pool._pool.checkedin() == 0
+
+
 class TestSyncSurface:
     """`cursor()` and the cursor properties are read WITHOUT `await` (ACONN-03 / ACUR-07)."""
 
@@ -163,3 +428,47 @@ class TestSnowflakeCassetteLeg:
             assert table.num_rows == 1
         finally:
             await close_async_pool(pool)
+
+
+class TestTracing:
+    """`enable_tracing`: spans from connect, the limiter wait, execute and fetch."""
+
+    @pytest.mark.anyio
+    async def test_round_trip_spans(self, duckdb_async_pool: AsyncPool) -> None:
+        """A traced round trip emits nested spans with backend, row and byte counts."""
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        from adbc_poolhouse import disable_tracing, enable_tracing
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        enable_tracing(provider)
+        try:
+            async with await duckdb_async_pool.connect() as conn:
+                cur = conn.cursor()
+                await cur.execute("SELECT * FROM range(3)")
+                await cur.fetch_arrow_table()
+        finally:
+            disable_tracing()
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        connect = spans["adbc_poolhouse.connect"]
+        fetch = spans["adbc_poolhouse.fetch_arrow_table"]
+        assert (connect.attributes or {})["db.system"] == "duckdb"
+        assert (spans["adbc_poolhouse.execute"].attributes or {})["db.system"] == "duckdb"
+        assert (fetch.attributes or {})["db.response.returned_rows"] == 3
+        arrow_bytes = (fetch.attributes or {})["adbc_poolhouse.arrow.bytes"]
+        assert isinstance(arrow_bytes, int)
+        assert arrow_bytes > 0
+        waits = [
+            s for s in exporter.get_finished_spans() if s.name == "adbc_poolhouse.limiter_wait"
+        ]
+        assert connect.context is not None
+        assert any(
+            w.parent is not None and w.parent.span_id == connect.context.span_id for w in waits
+        )
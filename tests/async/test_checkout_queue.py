@@ -0,0 +1,341 @@
+"""
+The event-loop checkout queue: waiting for a free connection parks no thread.
+
+`CheckoutQueue` is exercised directly for its FIFO hand-off, cancellation and
+resize rules, then through a real DuckDB `AsyncPool`: tasks queued behind an
+exhausted pool hold no limiter token, many more tasks than connections drain
+without stalling, the pool's `timeout` bounds the wait, and a connection dropped
+without `close()` still gives its slot back. A `deadline`, an enclosing
+`fail_after` or a cancellation ends the wait promptly, and a connection freed or
+checked out just as its task gives up goes back to the pool.
+
+These tests run on a real clock under both backends. Under the trio `MockClock`
+used elsewhere in this directory, a task waiting in the queue while the loop
+idles on a worker thread would see its `timeout` deadline autojumped and fire.
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import anyio
+import pytest
+import sqlalchemy.exc
+
+from adbc_poolhouse import DuckDBConfig, close_async_pool, create_async_pool
+from adbc_poolhouse._async._checkout import CheckoutQueue
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from adbc_poolhouse._async._pool import AsyncPool
+
+_helpers = importlib.import_module("tests.async._edge_helpers")
+await_inside = _helpers.await_inside
+pytestmark = _helpers.concurrency_marks
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> object:
+    """Both backends on the real clock (see the module docstring)."""
+    return request.param
+
+
+@pytest.fixture
+async def small_pool() -> AsyncIterator[AsyncPool]:
+    """A two-connection DuckDB `AsyncPool` with no overflow and a 5 s timeout."""
+    db = str(Path(tempfile.mkdtemp()) / "checkout_queue.db")
+    pool = create_async_pool(DuckDBConfig(database=db), pool_size=2, max_overflow=0, timeout=5)
+    try:
+        yield pool
+    finally:
+        await close_async_pool(pool)
+
+
+class TestCheckoutQueue:
+    """Slot accounting, FIFO hand-off, cancellation and resizing."""
+
+    @pytest.mark.anyio
+    async def test_free_slot_taken_without_waiting(self, anyio_backend_name: str) -> None:
+        """Slots are handed out until `total` are held."""
+        del anyio_backend_name
+        queue = CheckoutQueue(2)
+        await queue.acquire()
+        await queue.acquire()
+        assert (queue.held, queue.waiting) == (2, 0)
+        queue.release()
+        assert queue.held == 1
+
+    @pytest.mark.anyio
+    async def test_release_hands_off_in_arrival_order(self, anyio_backend_name: str) -> None:
+        """Each release wakes the longest-waiting task, keeping `held` at `total`."""
+        del anyio_backend_name
+        queue = CheckoutQueue(1)
+        await queue.acquire()
+        order: list[int] = []
+
+        async def waiter(n: int) -> None:
+            await queue.acquire()
+            order.append(n)
+
+        async with anyio.create_task_group() as tg:
+            for n in range(3):
+                tg.start_soon(waiter, n)
+                assert await await_inside(lambda n=n: queue.waiting == n + 1)
+            for n in range(3):
+                queue.release()
+                assert await await_inside(lambda n=n: len(order) == n + 1)
+                assert queue.held == 1
+        assert order == [0, 1, 2]
+        queue.release()
+        assert queue.held == 0
+
+    @pytest.mark.anyio
+    async def test_cancelled_waiter_leaves_the_queue(self, anyio_backend_name: str) -> None:
+        """A waiter cancelled before its turn takes nothing with it."""
+        del anyio_backend_name
+        queue = CheckoutQueue(1)
+        await queue.acquire()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(queue.acquire)
+            assert await await_inside(lambda: queue.waiting == 1)
+            tg.cancel_scope.cancel()
+        assert (queue.held, queue.waiting) == (1, 0)
+        queue.release()
+        assert queue.held == 0
+
+    @pytest.mark.anyio
+    async def test_handoff_to_cancelled_waiter_is_passed_on(self, anyio_backend_name: str) -> None:
+        """A slot handed to a waiter cancelled before it resumes goes to the next one."""
+        del anyio_backend_name
+        queue = CheckoutQueue(1)
+        await queue.acquire()
+        got: list[str] = []
+        scopes: dict[str, anyio.CancelScope] = {}
+
+        async def waiter(name: str) -> None:
+            with anyio.CancelScope() as scope:
+                scopes[name] = scope
+                await queue.acquire()
+                got.append(name)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(waiter, "first")
+            assert await await_inside(lambda: queue.waiting == 1)
+            tg.start_soon(waiter, "second")
+            assert await await_inside(lambda: queue.waiting == 2)
+            # Same loop step: the slot goes to "first", which is then cancelled.
+            # Depending on the backend "first" either still wakes with the slot
+            # or passes it on to "second"; either way exactly one task has it.
+            queue.release()
+            scopes["first"].cancel()
+            assert await await_inside(lambda: len(got) == 1)
+            assert queue.held == 1
+            if got == ["first"]:
+                queue.release()
+            else:
+                assert got == ["second"]
+                assert queue.waiting == 0
+        assert queue.held == 1
+
+    @pytest.mark.anyio
+    async def test_resize(self, anyio_backend_name: str) -> None:
+        """Growing wakes waiters into the new slots; shrinking retires slots on release."""
+        del anyio_backend_name
+        queue = CheckoutQueue(1)
+        await queue.acquire()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(queue.acquire)
+            tg.start_soon(queue.acquire)
+            assert await await_inside(lambda: queue.waiting == 2)
+            queue.resize(3)
+        assert (queue.held, queue.waiting) == (3, 0)
+        queue.resize(1)
+        queue.release()
+        queue.release()
+        assert queue.held == 1
+
+
+class TestAsyncPoolCheckout:
+    """`AsyncPool.connect` waits in the queue, not on a worker thread."""
+
+    @pytest.mark.anyio
+    async def test_waiters_hold_no_thread_or_token(
+        self, small_pool: AsyncPool, anyio_backend_name: str
+    ) -> None:
+        """Tasks queued behind an exhausted pool borrow no limiter token."""
+        del anyio_backend_name
+        held = [await small_pool.connect(), await small_pool.connect()]
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+
+                async def checkout() -> None:
+                    async with await small_pool.connect():
+                        pass
+
+                tg.start_soon(checkout)
+            assert await await_inside(lambda: small_pool.stats().checkout_waiting == 5)
+            assert small_pool._limiter.borrowed_tokens == 0
+            for conn in held:
+                await conn.close()
+        stats = small_pool.stats()
+        assert (stats.checked_out, stats.checkout_waiting, stats.checkouts) == (0, 0, 7)
+
+    @pytest.mark.anyio
+    async def test_many_tasks_drain_without_stalling(
+        self, small_pool: AsyncPool, anyio_backend_name: str
+    ) -> None:
+        """Ten times more tasks than connections all complete, none timing out."""
+        del anyio_backend_name
+
+        async def worker() -> None:
+            for _ in range(3):
+                async with await small_pool.connect() as conn:
+                    await conn.cursor().execute("SELECT 1")
+
+        with anyio.fail_after(30):
+            async with anyio.create_task_group() as tg:
+                for _ in range(20):
+                    tg.start_soon(worker)
+        stats = small_pool.stats()
+        assert (stats.checkouts, stats.timeouts, stats.checked_out) == (60, 0, 0)
+        assert small_pool._checkouts.held == 0
+
+    @pytest.mark.anyio
+    async def test_timeout(self, anyio_backend_name: str) -> None:
+        """A task still queued after `timeout` seconds gets `TimeoutError`."""
+        del anyio_backend_name
+        db = str(Path(tempfile.mkdtemp()) / "checkout_timeout.db")
+        pool = create_async_pool(DuckDBConfig(database=db), pool_size=1, max_overflow=0, timeout=0)
+        try:
+            async with await pool.connect():
+                with pytest.raises(sqlalchemy.exc.TimeoutError):
+                    await pool.connect()
+                assert pool.stats().timeouts == 1
+            assert pool._checkouts.held == 0
+        finally:
+            await close_async_pool(pool)
+
+    @pytest.mark.anyio
+    async def test_dropped_connection_releases_its_slot(
+        self, small_pool: AsyncPool, anyio_backend_name: str
+    ) -> None:
+        """An `AsyncConnection` collected without `close()` frees its slot."""
+        del anyio_backend_name
+        conn = await small_pool.connect()
+        assert small_pool._checkouts.held == 1
+        del conn
+        gc.collect()
+        assert small_pool._checkouts.held == 0
+
+
+class TestCancellableCheckout:
+    """`connect(deadline=...)`, `fail_after` and cancellation leave no slot behind."""
+
+    @pytest.mark.anyio
+    async def test_deadline_beats_pool_timeout(
+        self, small_pool: AsyncPool, anyio_backend_name: str
+    ) -> None:
+        """A queued task gives up at its `deadline`, well before the 5 s `timeout`."""
+        del anyio_backend_name
+        held = [await small_pool.connect(), await small_pool.connect()]
+        start = anyio.current_time()
+        with pytest.raises(sqlalchemy.exc.TimeoutError, match="deadline reached"):
+            await small_pool.connect(deadline=start + 0.05)
+        assert anyio.current_time() - start < 2
+        stats = small_pool.stats()
+        assert (stats.timeouts, stats.checkout_waiting) == (1, 0)
+        for conn in held:
+            await conn.close()
+        assert small_pool._checkouts.held == 0
+
+    @pytest.mark.anyio
+    async def test_past_deadline_with_free_slot(
+        self, small_pool: AsyncPool, anyio_backend_name: str
+    ) -> None:
+        """A free connection is handed out even when the deadline has passed."""
+        del anyio_backend_name
+        async with await small_pool.connect(deadline=anyio.current_time() - 1):
+            assert small_pool._checkouts.held == 1
+        assert small_pool._checkouts.held == 0
+
+    @pytest.mark.anyio
+    async def test_fail_after_while_queued(
+        self, small_pool: AsyncPool, anyio_backend_name: str
+    ) -> None:
+        """An enclosing `fail_after` interrupts the wait promptly and cleanly."""
+        del anyio_backend_name
+        held = [await small_pool.connect(), await small_pool.connect()]
+        start = anyio.current_time()
+        with pytest.raises(TimeoutError), anyio.fail_after(0.05):
+            await small_pool.connect()
+        assert anyio.current_time() - start < 2
+        assert small_pool.stats().checkout_waiting == 0
+        for conn in held:
+            await conn.close()
+        assert small_pool._checkouts.held == 0
+
+    @pytest.mark.anyio
+    async def test_cancel_during_checkout_returns_the_connection(
+        self, small_pool: AsyncPool, anyio_backend_name: str
+    ) -> None:
+        """A connection checked out after its task was cancelled goes back to the pool."""
+        del anyio_backend_name
+        sync_pool = small_pool._pool
+        checkout = sync_pool._adbc_checkout
+        entered = threading.Event()
+        gate = threading.Event()
+
+        def gated(start: float) -> object:
+            entered.set()
+            gate.wait(5)
+            return checkout(start)
+
+        sync_pool._adbc_checkout = gated  # type: ignore[method-assign]
+        got: list[object] = []
+
+        async def task() -> None:
+            got.append(await small_pool.connect())
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(task)
+            assert await await_inside(entered.is_set)
+            tg.cancel_scope.cancel()
+            gate.set()
+        assert got == []
+        assert sync_pool.checkedout() == 0
+        assert small_pool._checkouts.held == 0
+
+    @pytest.mark.anyio
+    async def test_handoff_race_with_cancelled_waiter(self, anyio_backend_name: str) -> None:
+        """A connection freed as its only waiter gives up is neither lost nor leaked."""
+        del anyio_backend_name
+        db = str(Path(tempfile.mkdtemp()) / "checkout_race.db")
+        pool = create_async_pool(DuckDBConfig(database=db), pool_size=1, max_overflow=0, timeout=5)
+        try:
+            held = await pool.connect()
+            got: list[object] = []
+            with anyio.CancelScope() as scope:
+                async with anyio.create_task_group() as tg:
+
+                    async def waiter() -> None:
+                        conn = await pool.connect()
+                        got.append(conn)
+                        await conn.close()
+
+                    tg.start_soon(waiter)
+                    assert await await_inside(lambda: pool.stats().checkout_waiting == 1)
+                    await held.close()
+                    scope.cancel()
+            assert len(got) <= 1
+            assert pool._checkouts.held == 0
+            assert pool._pool.checkedout() == 0
+            async with await pool.connect():
+                pass
+        finally:
+            await close_async_pool(pool)
@@ -0,0 +1,100 @@
+"""
+`create_async_pool(..., budget=)`: async pools sharing one `ConnectionBudget`.
+
+These tests run on a real clock under both backends, as the checkout queue tests
+do: under the trio `MockClock`, a task queued on the budget while the loop idles
+on a worker thread would see its `timeout` deadline autojumped and fire.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+
+import anyio
+import pytest
+import sqlalchemy.exc
+
+from adbc_poolhouse import (
+    ConfigurationError,
+    ConnectionBudget,
+    DuckDBConfig,
+    close_async_pool,
+    create_async_pool,
+)
+
+pytestmark = importlib.import_module("tests.async._edge_helpers").concurrency_marks
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> object:
+    """Both backends on the real clock (see the module docstring)."""
+    return request.param
+
+
+class TestConnectionBudget:
+    """Checkouts beyond the budget wait on the loop, across pools."""
+
+    @pytest.mark.anyio
+    async def test_checkout_past_the_limit_times_out(self) -> None:
+        """With the budget's only slot held by one pool, the other's checkout raises."""
+        budget = ConnectionBudget(1)
+        first = create_async_pool(DuckDBConfig(), timeout=0, budget=budget)
+        second = create_async_pool(DuckDBConfig(), timeout=0, budget=budget)
+        try:
+            async with await first.connect():
+                with pytest.raises(sqlalchemy.exc.TimeoutError, match="ConnectionBudget"):
+                    await second.connect()
+                assert second.stats().checked_out == 0
+            async with await second.connect():
+                assert budget.in_use() == 1
+        finally:
+            await close_async_pool(first)
+            await close_async_pool(second)
+        assert budget.in_use() == 0
+
+    @pytest.mark.anyio
+    async def test_waiting_task_gets_the_released_slot(self) -> None:
+        """A task queued on the budget checks out once another pool's task is done."""
+        budget = ConnectionBudget(1)
+        first = create_async_pool(DuckDBConfig(), budget=budget)
+        second = create_async_pool(DuckDBConfig(), budget=budget)
+        rows: list[int] = []
+
+        async def query(pool: object, value: int) -> None:
+            table = await pool.fetch_arrow(f"SELECT {value} AS n")  # type: ignore[attr-defined]
+            rows.append(table.column("n")[0].as_py())
+
+        try:
+            async with anyio.create_task_group() as tg:
+                for i in range(4):
+                    tg.start_soon(query, first if i % 2 else second, i)
+            assert sorted(rows) == [0, 1, 2, 3]
+            assert budget.in_use() == 1
+        finally:
+            await close_async_pool(first)
+            await close_async_pool(second)
+
+    @pytest.mark.anyio
+    async def test_second_event_loop_rejected(self, anyio_backend: str) -> None:
+        """A pool checking out on another loop than the budget's first raises."""
+        budget = ConnectionBudget(2)
+        first = create_async_pool(DuckDBConfig(), budget=budget)
+
+        async def other_loop() -> None:
+            second = create_async_pool(DuckDBConfig(), budget=budget)
+            try:
+                with pytest.raises(ConfigurationError, match="one event loop"):
+                    await second.connect()
+                assert second.stats().checked_out == 0
+            finally:
+                await close_async_pool(second)
+
+        try:
+            async with await first.connect():
+                await anyio.to_thread.run_sync(
+                    functools.partial(anyio.run, other_loop, backend=anyio_backend)
+                )
+        finally:
+            await close_async_pool(first)
+        assert budget.in_use() == 0
@@ -51,10 +51,13 @@ from typing import TYPE_CHECKING
 import anyio
 import pytest
 
+from adbc_poolhouse._async._connection import AsyncConnection
+from adbc_poolhouse._stats import PoolRecorder
+from tests._async_harness.stubs import BlockingStubConnection
+
 if TYPE_CHECKING:
-    from adbc_poolhouse._async._connection import AsyncConnection
     from adbc_poolhouse._async._pool import AsyncPool
-    from tests._async_harness.stubs import BlockingStubConnection, BlockingStubCursor
+    from tests._async_harness.stubs import BlockingStubCursor
 
 # `tests/async/` cannot be imported with a dotted path (`async` is a reserved
 # keyword), so the sibling helper module is loaded via importlib.
@@ -147,6 +150,37 @@ class TestEdgeCancelDepth:
         assert sc.observed_cancel is True
         assert stub_conn.invalidate_call_count == 1  # poison-recovery once
 
+    @pytest.mark.anyio
+    async def test_cancel_during_block_is_counted(self, anyio_backend_name: str) -> None:
+        """
+        `during`: an aborted call bumps the pool recorder's `cancellations` once.
+
+        The connection is wired to a `PoolRecorder` as `AsyncPool.connect` does;
+        the abort path's `adbc_cancel` counts the cancellation before firing.
+        """
+        del anyio_backend_name
+        recorder = PoolRecorder()
+        stub_conn = BlockingStubConnection()
+        async_conn = AsyncConnection(
+            stub_conn,  # type: ignore[arg-type]
+            anyio.CapacityLimiter(8),
+            recorder=recorder,
+        )
+        cur = async_conn.cursor()
+        sc = stub_conn.cursors[0]
+        with real_clock_watchdog(stub_conn.cursors) as tripped:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(functools.partial(cur.execute, "SELECT 1"))
+                try:
+                    await await_inside(lambda: sc.execute_call_count == 1)
+                    tg.cancel_scope.cancel()
+                finally:
+                    for c in stub_conn.cursors:
+                        c.release()
+        assert tripped[0] is False
+        assert sc.adbc_cancel_call_count == 1
+        assert recorder.cancellations == 1
+
     @pytest.mark.anyio
     async def test_framework_cancel_escapes_no_hang(
         self,
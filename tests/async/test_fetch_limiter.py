@@ -0,0 +1,132 @@
+"""
+`fetch_concurrency`: a smaller limiter for GIL-bound fetches, none for executes.
+
+The gating tests build `AsyncConnection`s over Phase 23 blocking stubs sharing
+one pool limiter and one fetch limiter, so a worker parks inside the stub's
+`fetch_arrow_table` / `execute` until the test releases it.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import tempfile
+from pathlib import Path
+
+import anyio
+import pytest
+
+from adbc_poolhouse import (
+    ConfigurationError,
+    DuckDBConfig,
+    close_async_pool,
+    create_async_pool,
+)
+from adbc_poolhouse._async._connection import AsyncConnection
+from adbc_poolhouse._async._pool import resolve_fetch_concurrency
+from tests._async_harness.stubs import BlockingStubConnection
+
+_helpers = importlib.import_module("tests.async._edge_helpers")
+await_inside = _helpers.await_inside
+pytestmark = _helpers.concurrency_marks
+
+
+def _connections(
+    count: int, fetch_tokens: int
+) -> tuple[list[AsyncConnection], list[BlockingStubConnection], anyio.CapacityLimiter]:
+    """`count` stub-backed connections sharing an 8-token pool limiter and a fetch limiter."""
+    limiter = anyio.CapacityLimiter(8)
+    fetch_limiter = anyio.CapacityLimiter(fetch_tokens)
+    stubs = [BlockingStubConnection() for _ in range(count)]
+    conns = [
+        AsyncConnection(stub, limiter, fetch_limiter=fetch_limiter)  # type: ignore[arg-type]
+        for stub in stubs
+    ]
+    return conns, stubs, fetch_limiter
+
+
+class TestFetchGate:
+    """Fetches beyond the fetch limit wait on the loop; executes are never held back."""
+
+    @pytest.mark.anyio
+    async def test_surplus_fetch_waits_on_the_loop(self) -> None:
+        """With one fetch token, a second fetch queues without reaching a worker."""
+        conns, stubs, fetch_limiter = _connections(2, fetch_tokens=1)
+        cursors = [conn.cursor() for conn in conns]
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(cursors[0].fetch_arrow_table)
+            assert await await_inside(lambda: stubs[0].cursors[0].in_execute == 1)
+            tg.start_soon(cursors[1].fetch_arrow_table)
+            assert await await_inside(lambda: fetch_limiter.statistics().tasks_waiting == 1)
+            assert stubs[1].cursors[0].fetch_call_count == 0
+            assert conns[0]._limiter.borrowed_tokens == 1
+            stubs[0].cursors[0].release()
+            assert await await_inside(lambda: stubs[1].cursors[0].in_execute == 1)
+            stubs[1].cursors[0].release()
+        assert fetch_limiter.borrowed_tokens == 0
+
+    @pytest.mark.anyio
+    async def test_execute_is_not_gated(self) -> None:
+        """An execute runs while every fetch token is taken."""
+        conns, stubs, fetch_limiter = _connections(2, fetch_tokens=1)
+        fetching, executing = (conn.cursor() for conn in conns)
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(fetching.fetch_arrow_table)
+            assert await await_inside(lambda: stubs[0].cursors[0].in_execute == 1)
+            tg.start_soon(executing.execute, "SELECT 1")
+            assert await await_inside(lambda: stubs[1].cursors[0].in_execute == 1)
+            assert fetch_limiter.borrowed_tokens == 1
+            stubs[1].cursors[0].release()
+            stubs[0].cursors[0].release()
+
+    @pytest.mark.anyio
+    async def test_cancel_while_queued_touches_nothing(self) -> None:
+        """A fetch cancelled while waiting for a token fires no abort and frees the guard."""
+        conns, stubs, fetch_limiter = _connections(2, fetch_tokens=1)
+        cursors = [conn.cursor() for conn in conns]
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(cursors[0].fetch_arrow_table)
+            assert await await_inside(lambda: stubs[0].cursors[0].in_execute == 1)
+            async with anyio.create_task_group() as queued:
+                queued.start_soon(cursors[1].fetch_arrow_table)
+                assert await await_inside(lambda: fetch_limiter.statistics().tasks_waiting == 1)
+                queued.cancel_scope.cancel()
+            stubs[0].cursors[0].release()
+        assert (stubs[1].cursors[0].fetch_call_count, stubs[1].invalidate_call_count) == (0, 0)
+        assert not conns[1]._in_use
+
+
+class TestFetchConcurrencyOption:
+    """The factory argument builds, sizes or omits the pool's fetch limiter."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("value", "tokens"), [(None, None), ("auto", min(2, os.cpu_count() or 1)), (3, 3)]
+    )
+    async def test_limiter_size(self, value: int | str | None, tokens: int | None) -> None:
+        """`None` builds no fetch limiter; `"auto"` and integers size it."""
+        db = str(Path(tempfile.mkdtemp()) / "fetch.db")
+        pool = create_async_pool(DuckDBConfig(database=db), fetch_concurrency=value)  # type: ignore[arg-type]
+        try:
+            limiter = pool._fetch_limiter
+            assert (None if limiter is None else limiter.total_tokens) == tokens
+            async with await pool.connect() as conn:
+                cur = conn.cursor()
+                await cur.execute("SELECT 42 AS n")
+                assert (await cur.fetch_arrow_table()).column("n")[0].as_py() == 42
+        finally:
+            await close_async_pool(pool)
+
+    @pytest.mark.anyio
+    async def test_invalid_value_rejected_before_build(self) -> None:
+        """A non-positive limit raises before any connection is opened."""
+        with pytest.raises(ConfigurationError, match="fetch_concurrency"):
+            create_async_pool(driver_path="nowhere", db_kwargs={}, fetch_concurrency=0)
+
+    @pytest.mark.parametrize(("cpus", "tokens"), [(None, 1), (1, 1), (2, 2), (64, 2)])
+    def test_auto_follows_cpu_count(
+        self, monkeypatch: pytest.MonkeyPatch, cpus: int | None, tokens: int
+    ) -> None:
+        """`"auto"` allows one fetch per CPU, up to 2."""
+        monkeypatch.setattr(os, "cpu_count", lambda: cpus)
+        assert resolve_fetch_concurrency("auto") == tokens
@@ -0,0 +1,36 @@
+"""`create_async_pool(..., host_budget=)`: async pools opening connections under a shared cap."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+import pytest
+import sqlalchemy.exc
+
+from adbc_poolhouse import DuckDBConfig, HostConnectionBudget, close_async_pool, create_async_pool
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = importlib.import_module("tests.async._edge_helpers").concurrency_marks
+
+
+class TestHostBudget:
+    """The budget's limit spans async pools."""
+
+    @pytest.mark.anyio
+    async def test_open_past_the_limit_times_out(self, tmp_path: Path) -> None:
+        """With the only slot held by one pool, the other's checkout raises."""
+        budget = HostConnectionBudget("t", 1, directory=str(tmp_path))
+        first = create_async_pool(DuckDBConfig(), timeout=0, host_budget=budget)
+        second = create_async_pool(DuckDBConfig(), timeout=0, host_budget=budget)
+        try:
+            async with await first.connect():
+                with pytest.raises(sqlalchemy.exc.TimeoutError, match="HostConnectionBudget"):
+                    await second.connect()
+            assert budget.in_use() == 1
+        finally:
+            await close_async_pool(first)
+            await close_async_pool(second)
+        assert budget.in_use() == 0
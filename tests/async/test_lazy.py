@@ -0,0 +1,64 @@
+"""
+`create_async_pool(..., lazy=True)`: the first checkout opens the source, off the loop.
+
+These tests run on a real clock under both backends: under the trio `MockClock`,
+a task queued for a pool slot while the loop idles on the source open would see
+its `timeout` deadline autojumped and fire.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import Any
+
+import anyio
+import pytest
+
+from adbc_poolhouse import DuckDBConfig, _procfetch, close_async_pool, create_async_pool
+
+pytestmark = importlib.import_module("tests.async._edge_helpers").concurrency_marks
+
+
+@pytest.fixture(params=["asyncio", "trio"])
+def anyio_backend(request: pytest.FixtureRequest) -> object:
+    """Both backends on the real clock (see the module docstring)."""
+    return request.param
+
+
+class TestLazyAsyncPool:
+    """A lazy pool connects on a worker thread, once."""
+
+    @pytest.mark.anyio
+    async def test_concurrent_first_checkouts_share_one_open(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Creation opens nothing; concurrent first fetches open the source once, off the loop."""
+        opened_on: list[threading.Thread] = []
+        connect = _procfetch.create_adbc_connection
+
+        def recording_connect(*args: Any, **kwargs: Any) -> Any:
+            opened_on.append(threading.current_thread())
+            return connect(*args, **kwargs)
+
+        monkeypatch.setattr(_procfetch, "create_adbc_connection", recording_connect)
+        pool = create_async_pool(DuckDBConfig(), lazy=True, pool_size=2)
+        rows: list[int] = []
+
+        async def query(value: int) -> None:
+            table = await pool.fetch_arrow(f"SELECT {value} AS n")
+            rows.append(table.column("n")[0].as_py())
+
+        try:
+            assert pool._pool._adbc_source is None
+            async with anyio.create_task_group() as tg:
+                for i in range(4):
+                    tg.start_soon(query, i)
+            assert sorted(rows) == [0, 1, 2, 3]
+            assert len(opened_on) == 1
+            assert opened_on[0] is not threading.current_thread()
+        finally:
+            await close_async_pool(pool)
+        source = pool._pool._adbc_source
+        assert source is not None
+        assert source._closed
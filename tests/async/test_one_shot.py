@@ -0,0 +1,152 @@
+"""
+`AsyncPool.fetch_arrow` / `fetch_rows`: a whole read in one worker dispatch.
+
+The happy and error paths run against a real DuckDB `AsyncPool`. The cancel
+paths need a query that blocks, so they use a stub-backed pool: an
+`AdbcQueuePool` whose connections are Phase 23 `BlockingStubConnection`s, so the
+worker parks inside the stub cursor's `execute` until the test cancels it.
+"""
+
+from __future__ import annotations
+
+import importlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import anyio
+import pyarrow
+import pytest
+
+from adbc_poolhouse import AdbcQueuePool, DuckDBConfig, close_async_pool, create_async_pool
+from adbc_poolhouse._async._oneshot import OneShotQuery
+from adbc_poolhouse._async._pool import AsyncPool
+from tests._async_harness.stubs import BlockingStubConnection
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+_helpers = importlib.import_module("tests.async._edge_helpers")
+await_inside = _helpers.await_inside
+pytestmark = _helpers.concurrency_marks
+
+
+@pytest.fixture
+async def duckdb_pool() -> AsyncIterator[AsyncPool]:
+    """A one-connection DuckDB `AsyncPool` holding a small table."""
+    db = str(Path(tempfile.mkdtemp()) / "one_shot.db")
+    pool = create_async_pool(DuckDBConfig(database=db), pool_size=1, max_overflow=0)
+    try:
+        async with await pool.connect() as conn:
+            cur = conn.cursor()
+            await cur.execute("CREATE TABLE t AS SELECT range AS n FROM range(5)")
+            await conn.commit()
+        yield pool
+    finally:
+        await close_async_pool(pool)
+
+
+@pytest.fixture
+async def stub_pool() -> AsyncIterator[tuple[AsyncPool, list[BlockingStubConnection]]]:
+    """A one-connection `AsyncPool` over blocking stub connections, and the stubs it opened."""
+    opened: list[BlockingStubConnection] = []
+
+    def creator() -> BlockingStubConnection:
+        opened.append(BlockingStubConnection())
+        return opened[-1]
+
+    sync_pool = AdbcQueuePool(creator, pool_size=1, max_overflow=0, reset_on_return=None)
+    sync_pool._adbc_source = BlockingStubConnection()  # type: ignore[attr-defined]
+    pool = AsyncPool(sync_pool, pool_size=1, max_overflow=0)
+    try:
+        yield pool, opened
+    finally:
+        await close_async_pool(pool)
+
+
+class TestOneShot:
+    """Results, check-in and error propagation against real DuckDB."""
+
+    @pytest.mark.anyio
+    async def test_fetch_arrow(self, duckdb_pool: AsyncPool) -> None:
+        """A materialized table comes back and the connection is checked in."""
+        table = await duckdb_pool.fetch_arrow("SELECT sum(n) AS total FROM t")
+        assert isinstance(table, pyarrow.Table)
+        assert table.column("total")[0].as_py() == 10
+        stats = duckdb_pool.stats()
+        assert (stats.checked_out, stats.checkouts, stats.hold_time.count) == (0, 2, 2)
+        assert duckdb_pool._checkouts.held == 0
+
+    @pytest.mark.anyio
+    async def test_fetch_rows_with_parameters(self, duckdb_pool: AsyncPool) -> None:
+        """Bound parameters reach the driver; rows come back as `fetchall` returns them."""
+        rows = await duckdb_pool.fetch_rows("SELECT n FROM t WHERE n >= ? ORDER BY n", [3])
+        assert list(rows) == [(3,), (4,)]
+        assert duckdb_pool._checkouts.held == 0
+
+    @pytest.mark.anyio
+    async def test_query_error_checks_the_connection_in(self, duckdb_pool: AsyncPool) -> None:
+        """A failing query raises the driver error unchanged and returns its connection."""
+        with pytest.raises(Exception, match="missing_table"):
+            await duckdb_pool.fetch_arrow("SELECT * FROM missing_table")
+        stats = duckdb_pool.stats()
+        assert (stats.checked_out, stats.invalidations) == (0, 0)
+        assert duckdb_pool._checkouts.held == 0
+        assert (await duckdb_pool.fetch_rows("SELECT 1"))[0] == (1,)
+
+
+class TestOneShotCancel:
+    """Cancellation aborts with `adbc_cancel` and invalidates only a touched connection."""
+
+    @pytest.mark.anyio
+    async def test_cancel_mid_query_invalidates(
+        self, stub_pool: tuple[AsyncPool, list[BlockingStubConnection]]
+    ) -> None:
+        """A query cancelled inside `execute` is aborted and its connection dropped."""
+        pool, opened = stub_pool
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(pool.fetch_arrow, "SELECT 1")
+            assert await await_inside(lambda: bool(opened) and bool(opened[0].cursors))
+            assert await await_inside(lambda: opened[0].cursors[0].in_execute == 1)
+            tg.cancel_scope.cancel()
+        assert opened[0].cursors[0].adbc_cancel_call_count == 1
+        stats = pool.stats()
+        assert (stats.checked_out, stats.invalidations, stats.cancellations) == (0, 1, 1)
+        assert pool._checkouts.held == 0
+
+    @pytest.mark.anyio
+    async def test_cancel_during_checkout_skips_the_query(
+        self,
+        stub_pool: tuple[AsyncPool, list[BlockingStubConnection]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A cancellation that lands before `execute` runs nothing and checks the connection in."""
+        pool, opened = stub_pool
+        sync_pool = pool._pool
+        checkout = sync_pool._adbc_checkout
+        entered = threading.Event()
+        cancelled = threading.Event()
+        cancel = OneShotQuery.cancel
+
+        def recording_cancel(query: OneShotQuery[object]) -> None:
+            cancel(query)
+            cancelled.set()
+
+        def gated(start: float) -> object:
+            # Hold the checkout until the watcher has fired `cancel`.
+            entered.set()
+            cancelled.wait(5)
+            return checkout(start)
+
+        monkeypatch.setattr(OneShotQuery, "cancel", recording_cancel)
+        sync_pool._adbc_checkout = gated  # type: ignore[method-assign]
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(pool.fetch_rows, "SELECT 1")
+            assert await await_inside(entered.is_set)
+            tg.cancel_scope.cancel()
+        assert opened[0].cursors[0].execute_call_count == 0
+        assert opened[0].cursors[0].closed
+        stats = pool.stats()
+        assert (stats.checked_out, stats.invalidations, stats.cancellations) == (0, 0, 0)
+        assert pool._checkouts.held == 0
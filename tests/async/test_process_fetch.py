@@ -0,0 +1,142 @@
+"""
+`AsyncPool.fetch_arrow` on a pool built with `fetch_processes`.
+
+The result path runs against real worker processes over an in-memory DuckDB. The
+waiting and cancel paths need a fetch that blocks, so they put a fake fetcher on
+a stub-backed pool: its queries park in `run` until cancelled or released.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import TYPE_CHECKING
+
+import anyio
+import pyarrow
+import pytest
+
+from adbc_poolhouse import AdbcQueuePool, DuckDBConfig, close_async_pool, create_async_pool
+from adbc_poolhouse._async._pool import AsyncPool
+from tests._async_harness.stubs import BlockingStubConnection
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+_helpers = importlib.import_module("tests.async._edge_helpers")
+await_inside = _helpers.await_inside
+pytestmark = _helpers.concurrency_marks
+
+
+class _GatedQuery:
+    """A `ProcessQuery` stand-in whose `run` blocks until released or cancelled."""
+
+    def __init__(self) -> None:
+        self.running = threading.Event()
+        self.released = threading.Event()
+        self.cancel_calls = 0
+
+    def cancel(self) -> None:
+        self.cancel_calls += 1
+        self.released.set()
+
+    def run(self) -> pyarrow.Table | None:
+        self.running.set()
+        self.released.wait(5)
+        return None if self.cancel_calls else pyarrow.table({"n": [1]})
+
+
+class _FakeFetcher:
+    """A `ProcessFetcher` stand-in with one worker, handing out `_GatedQuery`s."""
+
+    processes = 1
+
+    def __init__(self) -> None:
+        self.queries: list[_GatedQuery] = []
+
+    def query(self, operation: str, parameters: object = None) -> _GatedQuery:
+        self.queries.append(_GatedQuery())
+        return self.queries[-1]
+
+    def close(self) -> None:
+        for query in self.queries:
+            query.released.set()
+
+
+@pytest.fixture
+async def gated_pool() -> AsyncIterator[tuple[AsyncPool, _FakeFetcher]]:
+    """A stub-backed `AsyncPool` whose `fetch_arrow` goes to a fake one-process fetcher."""
+    sync_pool = AdbcQueuePool(BlockingStubConnection, pool_size=1, max_overflow=0)
+    sync_pool._adbc_source = BlockingStubConnection()  # type: ignore[attr-defined]
+    fetcher = _FakeFetcher()
+    sync_pool._adbc_fetcher = fetcher  # type: ignore[assignment]
+    pool = AsyncPool(sync_pool, pool_size=1, max_overflow=0)
+    try:
+        yield pool, fetcher
+    finally:
+        await close_async_pool(pool)
+
+
+class TestProcessFetch:
+    """Results come from worker processes and leave the pool's connections alone."""
+
+    @pytest.mark.anyio
+    async def test_fetch_arrow_in_worker_processes(self) -> None:
+        """Concurrent fetches all return; no connection is checked out for them."""
+        pool = create_async_pool(DuckDBConfig(), fetch_processes=2)
+        try:
+            assert pool._process_limiter is not None
+            assert pool._process_limiter.total_tokens == 2
+            results: dict[int, int] = {}
+
+            async def fetch(n: int) -> None:
+                table = await pool.fetch_arrow("SELECT range AS n FROM range(?)", [n])
+                results[n] = table.num_rows
+
+            async with anyio.create_task_group() as tg:
+                for n in (10, 20, 30):
+                    tg.start_soon(fetch, n)
+            assert results == {10: 10, 20: 20, 30: 30}
+            assert pool.stats().checkouts == 0
+        finally:
+            await close_async_pool(pool)
+
+
+class TestProcessFetchWaiting:
+    """Surplus fetches queue on the loop; cancellation reaches the query."""
+
+    @pytest.mark.anyio
+    async def test_surplus_fetch_waits_on_the_loop(
+        self, gated_pool: tuple[AsyncPool, _FakeFetcher]
+    ) -> None:
+        """With one process, a second fetch waits for the process token, not in a thread."""
+        pool, fetcher = gated_pool
+        limiter = pool._process_limiter
+        assert limiter is not None
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(pool.fetch_arrow, "SELECT 1")
+            assert await await_inside(lambda: bool(fetcher.queries))
+            assert await await_inside(lambda: fetcher.queries[0].running.is_set())
+            tg.start_soon(pool.fetch_arrow, "SELECT 2")
+            assert await await_inside(lambda: limiter.statistics().tasks_waiting == 1)
+            assert not fetcher.queries[1].running.is_set()
+            assert pool._limiter.borrowed_tokens == 0
+            fetcher.queries[0].released.set()
+            assert await await_inside(lambda: fetcher.queries[1].running.is_set())
+            fetcher.queries[1].released.set()
+        assert limiter.borrowed_tokens == 0
+
+    @pytest.mark.anyio
+    async def test_cancel_mid_fetch_cancels_the_query(
+        self, gated_pool: tuple[AsyncPool, _FakeFetcher]
+    ) -> None:
+        """Cancelling a running fetch fires the query's `cancel` once and frees the token."""
+        pool, fetcher = gated_pool
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(pool.fetch_arrow, "SELECT 1")
+            assert await await_inside(lambda: bool(fetcher.queries))
+            assert await await_inside(lambda: fetcher.queries[0].running.is_set())
+            tg.cancel_scope.cancel()
+        assert fetcher.queries[0].cancel_calls == 1
+        assert pool._process_limiter is not None
+        assert pool._process_limiter.borrowed_tokens == 0
@@ -0,0 +1,142 @@
+"""`AsyncPoolRegistry` and `get_async_pool`: one shared `AsyncPool` per distinct config."""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from typing import TYPE_CHECKING
+
+import anyio
+import pytest
+
+from adbc_poolhouse import (
+    AsyncPoolRegistry,
+    ConfigurationError,
+    DuckDBConfig,
+    get_async_pool,
+    release_async_pool,
+)
+from adbc_poolhouse._async import _registry
+
+if TYPE_CHECKING:
+    from adbc_poolhouse._async._pool import AsyncPool
+
+pytestmark = importlib.import_module("tests.async._edge_helpers").concurrency_marks
+
+
+class TestAsyncRegistry:
+    """Sharing, single-flight builds and reference counting."""
+
+    @pytest.mark.anyio
+    async def test_equal_configs_share_a_pool(self) -> None:
+        """The pool is built once and closed by the last release."""
+        registry = AsyncPoolRegistry()
+        first = await registry.get_pool(DuckDBConfig(), pool_size=2)
+        second = await registry.get_pool(DuckDBConfig(), pool_size=2)
+        assert first is second
+        await registry.release_pool(first)
+        assert len(registry) == 1
+        await registry.release_pool(second)
+        assert len(registry) == 0
+        assert first._pool._adbc_source._closed
+        with pytest.raises(ValueError, match="registry"):
+            await registry.release_pool(first)
+
+    @pytest.mark.anyio
+    async def test_concurrent_tasks_build_once(self) -> None:
+        """Tasks asking for one config together wait for one build."""
+        registry = AsyncPoolRegistry()
+        pools: list[object] = []
+
+        async def get() -> None:
+            pools.append(await registry.get_pool(DuckDBConfig()))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(4):
+                tg.start_soon(get)
+        assert len({id(pool) for pool in pools}) == 1
+        await registry.close()
+        assert len(registry) == 0
+
+    @pytest.mark.anyio
+    async def test_failed_build_after_close(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A build failing after `close()` raises its own error and spares a newer entry."""
+        registry = AsyncPoolRegistry()
+        started = anyio.Event()
+        fail = anyio.Event()
+        open_pool = _registry.open_async_pool
+
+        async def failing_open(*args: object, **kwargs: object) -> object:
+            started.set()
+            await fail.wait()
+            raise RuntimeError("login failed")
+
+        async def first_build() -> None:
+            with pytest.raises(RuntimeError, match="login failed"):
+                await registry.get_pool(DuckDBConfig())
+
+        pool: AsyncPool | None = None
+        monkeypatch.setattr(_registry, "open_async_pool", failing_open)
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(first_build)
+            await started.wait()
+            await registry.close()
+            monkeypatch.setattr(_registry, "open_async_pool", open_pool)
+            pool = await registry.get_pool(DuckDBConfig())
+            fail.set()
+        assert pool is not None
+        assert await registry.get_pool(DuckDBConfig()) is pool
+        await registry.close()
+
+    @pytest.mark.anyio
+    async def test_default_registry(self) -> None:
+        """`get_async_pool` shares the pool across callers until the last release."""
+        pool = await get_async_pool(DuckDBConfig(), name="shared-async-default")
+        try:
+            assert await get_async_pool(DuckDBConfig(), name="shared-async-default") is pool
+            await release_async_pool(pool)
+        finally:
+            await release_async_pool(pool)
+        assert pool._pool._adbc_source._closed
+
+    @pytest.mark.anyio
+    async def test_registry_rejects_another_loop(self, anyio_backend_name: str) -> None:
+        """A registry holding a pool refuses calls from another event loop."""
+        registry = AsyncPoolRegistry()
+        pool = await registry.get_pool(DuckDBConfig())
+
+        async def other_loop() -> None:
+            with pytest.raises(ConfigurationError, match="one event loop"):
+                await registry.get_pool(DuckDBConfig())
+            with pytest.raises(ConfigurationError, match="one event loop"):
+                await registry.release_pool(pool)
+
+        try:
+            await anyio.to_thread.run_sync(
+                functools.partial(anyio.run, other_loop, backend=anyio_backend_name)
+            )
+        finally:
+            await registry.release_pool(pool)
+        assert len(registry) == 0
+
+    @pytest.mark.anyio
+    async def test_default_registry_per_loop(self, anyio_backend_name: str) -> None:
+        """Each event loop gets its own shared pools from `get_async_pool`."""
+        pool = await get_async_pool(DuckDBConfig(), name="shared-async-loops")
+
+        async def other_loop() -> None:
+            other = await get_async_pool(DuckDBConfig(), name="shared-async-loops")
+            try:
+                assert other is not pool
+                with pytest.raises(ValueError, match="registry"):
+                    await release_async_pool(pool)
+            finally:
+                await release_async_pool(other)
+
+        try:
+            await anyio.to_thread.run_sync(
+                functools.partial(anyio.run, other_loop, backend=anyio_backend_name)
+            )
+        finally:
+            await release_async_pool(pool)
+        assert not _registry._registries
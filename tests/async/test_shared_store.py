@@ -0,0 +1,79 @@
+"""`AsyncPool.fetch_arrow(..., shared=store)`: results read through a `SharedResultStore`."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+import anyio
+import pyarrow
+import pytest
+
+from adbc_poolhouse import DuckDBConfig, SharedResultStore, close_async_pool, create_async_pool
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from adbc_poolhouse._async._pool import AsyncPool
+
+pytestmark = importlib.import_module("tests.async._edge_helpers").concurrency_marks
+
+QUERY = "SELECT range AS n FROM range(?)"
+
+
+@pytest.fixture
+async def pool(tmp_path: Path) -> AsyncIterator[AsyncPool]:
+    """A file-backed DuckDB async pool."""
+    pool = create_async_pool(DuckDBConfig(database=str(tmp_path / "shared.db")))
+    try:
+        yield pool
+    finally:
+        await close_async_pool(pool)
+
+
+class TestSharedFetch:
+    """Hits use no connection; concurrent misses fetch once."""
+
+    @pytest.mark.anyio
+    async def test_second_fetch_is_mapped(self, pool: AsyncPool, tmp_path: Path) -> None:
+        """The first call fetches and stores; the second maps the entry without a checkout."""
+        store = SharedResultStore("t", directory=str(tmp_path))
+        first = await pool.fetch_arrow(QUERY, [100], shared=store)
+        second = await pool.fetch_arrow(QUERY, [100], shared=store)
+        assert first.equals(second)
+        assert pool.stats().checkouts == 1
+
+    @pytest.mark.anyio
+    async def test_concurrent_misses_fetch_once(self, pool: AsyncPool, tmp_path: Path) -> None:
+        """Tasks missing on the same query together run one fetch between them."""
+        store = SharedResultStore("t", directory=str(tmp_path))
+        rows: list[int] = []
+
+        async def fetch() -> None:
+            rows.append((await pool.fetch_arrow(QUERY, [50], shared=store)).num_rows)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(4):
+                tg.start_soon(fetch)
+        assert rows == [50] * 4
+        assert pool.stats().checkouts == 1
+
+    @pytest.mark.anyio
+    async def test_waits_for_another_fetcher(self, pool: AsyncPool, tmp_path: Path) -> None:
+        """While another caller holds the query's lock, the task waits for its entry."""
+        store = SharedResultStore("t", directory=str(tmp_path))
+        key = store.key(QUERY, [3])
+        lock = store.try_lock(key)
+        assert lock is not None
+        result: list[pyarrow.Table] = []
+
+        async def fetch() -> None:
+            result.append(await pool.fetch_arrow(QUERY, [3], shared=store))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(fetch)
+            store.put(key, pyarrow.table({"n": pyarrow.array([7, 8, 9], pyarrow.int64())}))
+            lock.release()
+        assert result[0].column("n").to_pylist() == [7, 8, 9]
+        assert pool.stats().checkouts == 0
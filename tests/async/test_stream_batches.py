@@ -0,0 +1,226 @@
+"""
+`AsyncCursor.stream_batches`: Arrow record batches through a bounded channel.
+
+The happy path runs against the real DuckDB pool. Backpressure, early close,
+cancellation and driver errors need a reader the test controls, so they wrap a
+`_BatchCursor` (a cursor whose `fetch_record_batch` hands back a gated fake
+reader) in an `AsyncCursor` owned by a stub-backed `AsyncConnection`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import anyio
+import pyarrow
+import pytest
+
+from adbc_poolhouse import ConnectionBusyError
+from adbc_poolhouse._async._cursor import AsyncCursor
+
+if TYPE_CHECKING:
+    from adbc_poolhouse._async._connection import AsyncConnection
+    from adbc_poolhouse._async._pool import AsyncPool
+    from tests._async_harness.stubs import BlockingStubConnection
+
+_helpers = importlib.import_module("tests.async._edge_helpers")
+await_inside = _helpers.await_inside
+pytestmark = _helpers.concurrency_marks
+
+_StubFactory = Callable[[], "tuple[AsyncConnection, BlockingStubConnection]"]
+
+
+class _GatedReader:
+    """
+    A `RecordBatchReader` stand-in that counts reads and can park before one.
+
+    Attributes:
+        reads: Number of `read_next_batch` calls that returned a batch.
+        closed: `True` once `close` has run.
+    """
+
+    def __init__(self, batches: int, *, block_at: int | None = None, fail_at: int | None = None):
+        self._batches = batches
+        self._block_at = block_at
+        self._fail_at = fail_at
+        self._release = threading.Event()
+        self.blocked = threading.Event()
+        self.reads = 0
+        self.closed = False
+
+    def read_next_batch(self) -> pyarrow.RecordBatch:
+        if self.reads == self._block_at:
+            self.blocked.set()
+            self._release.wait(5)
+            raise RuntimeError("query cancelled")
+        if self.reads == self._fail_at:
+            raise RuntimeError("driver failed mid-stream")
+        if self.reads == self._batches:
+            raise StopIteration
+        self.reads += 1
+        return pyarrow.record_batch({"n": [self.reads]})
+
+    def cancel(self) -> None:
+        self._release.set()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _BatchCursor:
+    """A minimal sync cursor whose result set is a `_GatedReader`."""
+
+    def __init__(self, reader: _GatedReader) -> None:
+        self.reader = reader
+        self.adbc_cancel_call_count = 0
+
+    def fetch_record_batch(self) -> _GatedReader:
+        return self.reader
+
+    def adbc_cancel(self) -> None:
+        self.adbc_cancel_call_count += 1
+        self.reader.cancel()
+
+
+def _stream_cursor(
+    factory: _StubFactory, reader: _GatedReader
+) -> tuple[AsyncCursor, _BatchCursor, AsyncConnection, BlockingStubConnection]:
+    conn, stub = factory()
+    sync_cursor = _BatchCursor(reader)
+    cursor = AsyncCursor(sync_cursor, conn._limiter, conn)  # type: ignore[arg-type]
+    return cursor, sync_cursor, conn, stub
+
+
+class TestStreamBatchesDuckDB:
+    """Streaming a real DuckDB result set."""
+
+    @pytest.mark.anyio
+    async def test_streams_whole_result(self, duckdb_async_pool: AsyncPool) -> None:
+        """Every row arrives, in batches, and the connection is usable afterwards."""
+        async with await duckdb_async_pool.connect() as conn:
+            cur = conn.cursor()
+            await cur.execute("SELECT range AS n FROM range(100000)")
+            total = 0
+            batches = 0
+            async with cur.stream_batches() as stream:
+                async for batch in stream:
+                    assert isinstance(batch, pyarrow.RecordBatch)
+                    total += batch.num_rows
+                    batches += 1
+            assert (total, conn._in_use) == (100000, False)
+            assert batches > 1
+            await cur.execute("SELECT 1")
+            assert (await cur.fetchone()) == (1,)
+
+    @pytest.mark.anyio
+    async def test_connection_is_busy_mid_stream(self, duckdb_async_pool: AsyncPool) -> None:
+        """Other calls on the connection are rejected until the block exits."""
+        async with await duckdb_async_pool.connect() as conn:
+            cur = conn.cursor()
+            await cur.execute("SELECT range AS n FROM range(100000)")
+            async with cur.stream_batches(prefetch=0) as batches:
+                async for _ in batches:
+                    with pytest.raises(ConnectionBusyError):
+                        await conn.cursor().execute("SELECT 1")
+                    break
+            assert not conn._in_use
+
+
+class TestStreamBatchesControl:
+    """Backpressure, early close, cancellation and errors, against a gated reader."""
+
+    @pytest.mark.anyio
+    async def test_prefetch_bounds_read_ahead(
+        self, make_stub_async_connection: _StubFactory
+    ) -> None:
+        """With one batch taken, the worker reads at most `prefetch` more plus one in hand."""
+        reader = _GatedReader(batches=50)
+        cursor, _, _, _ = _stream_cursor(make_stub_async_connection, reader)
+        async with cursor.stream_batches(prefetch=2) as batches:
+            for taken in range(1, 11):
+                await anext(batches)
+                # Two queued, one in hand waiting to be sent; never more.
+                assert await await_inside(lambda t=taken: reader.reads == t + 3)
+                assert reader.reads == taken + 3
+        assert reader.closed
+
+    @pytest.mark.anyio
+    async def test_negative_prefetch_rejected(
+        self, make_stub_async_connection: _StubFactory
+    ) -> None:
+        """A negative `prefetch` is a `ValueError` before anything is claimed."""
+        cursor, _, conn, _ = _stream_cursor(make_stub_async_connection, _GatedReader(batches=1))
+        with pytest.raises(ValueError, match="prefetch"):
+            async with cursor.stream_batches(prefetch=-1):
+                pass
+        assert not conn._in_use
+
+    @pytest.mark.anyio
+    async def test_early_close_keeps_connection(
+        self, make_stub_async_connection: _StubFactory
+    ) -> None:
+        """Leaving the block early closes the reader without an abort or invalidation."""
+        reader = _GatedReader(batches=50)
+        cursor, sync_cursor, conn, stub = _stream_cursor(make_stub_async_connection, reader)
+        async with cursor.stream_batches(prefetch=1) as batches:
+            async for _ in batches:
+                break
+        assert reader.closed
+        assert (sync_cursor.adbc_cancel_call_count, stub.invalidate_call_count) == (0, 0)
+        assert not conn._in_use
+
+    @pytest.mark.anyio
+    async def test_cancel_aborts_and_invalidates(
+        self, make_stub_async_connection: _StubFactory
+    ) -> None:
+        """Cancelling a consumer whose read is blocked fires `adbc_cancel` and invalidates."""
+        reader = _GatedReader(batches=50, block_at=1)
+        cursor, sync_cursor, conn, stub = _stream_cursor(make_stub_async_connection, reader)
+        received: list[pyarrow.RecordBatch] = []
+
+        async def consume() -> None:
+            async with cursor.stream_batches() as batches:
+                async for batch in batches:
+                    received.append(batch)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(consume)
+            assert await await_inside(reader.blocked.is_set)
+            assert await await_inside(lambda: len(received) == 1)
+            tg.cancel_scope.cancel()
+        assert (sync_cursor.adbc_cancel_call_count, stub.invalidate_call_count) == (1, 1)
+        assert reader.closed
+        assert not conn._in_use
+
+    @pytest.mark.anyio
+    async def test_driver_error_raised_bare(self, make_stub_async_connection: _StubFactory) -> None:
+        """A reader error surfaces unwrapped after the batches read before it."""
+        reader = _GatedReader(batches=50, fail_at=3)
+        cursor, _, conn, stub = _stream_cursor(make_stub_async_connection, reader)
+        received = 0
+        with pytest.raises(RuntimeError, match="driver failed mid-stream"):
+            async with cursor.stream_batches() as batches:
+                async for _ in batches:
+                    received += 1
+        assert received == 3
+        assert reader.closed
+        assert stub.invalidate_call_count == 0
+        assert not conn._in_use
+
+    @pytest.mark.anyio
+    async def test_error_in_block_keeps_connection(
+        self, make_stub_async_connection: _StubFactory
+    ) -> None:
+        """An exception raised in the block propagates bare, with no abort or invalidation."""
+        reader = _GatedReader(batches=50)
+        cursor, sync_cursor, conn, stub = _stream_cursor(make_stub_async_connection, reader)
+        with pytest.raises(KeyError, match="sink"):
+            async with cursor.stream_batches(prefetch=1) as batches:
+                async for _ in batches:
+                    raise KeyError("sink")
+        assert reader.closed
+        assert (sync_cursor.adbc_cancel_call_count, stub.invalidate_call_count) == (0, 0)
+        assert not conn._in_use
@@ -8,6 +8,10 @@ reads matching env vars at ``__init__`` time, so any ``SNOWFLAKE_*`` /
 explicit kwargs passed to a config constructor.  Clearing them before every
 test keeps unit tests deterministic regardless of which dotenv files (or
 CI secrets) happen to be loaded in the process.
+
+The ``_clear_driver_caches`` autouse fixture does the same for the process-wide
+driver resolution cache, so a test that patches ``find_spec`` or
+``import_module`` sees its patch rather than an answer cached by an earlier test.
 """
 
 from __future__ import annotations
@@ -16,6 +20,8 @@ import os
 
 import pytest
 
+from adbc_poolhouse._driver_cache import clear_driver_caches
+
 _WAREHOUSE_ENV_PREFIXES: tuple[str, ...] = (
     "BIGQUERY_",
     "CLICKHOUSE_",
@@ -44,3 +50,9 @@ def _clear_warehouse_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:  # pyrig
     for key in list(os.environ):
         if key.startswith(_WAREHOUSE_ENV_PREFIXES):
             monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def _clear_driver_caches() -> None:  # pyright: ignore[reportUnusedFunction]
+    """Forget driver paths and DBAPI connect plans cached by earlier tests."""
+    clear_driver_caches()
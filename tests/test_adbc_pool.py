@@ -0,0 +1,272 @@
+"""Tests for the native `pool_class="adbc"` pool (`AdbcPool`)."""
+
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+import sqlalchemy.exc
+from sqlalchemy.pool import PoolProxiedConnection
+
+from adbc_poolhouse import (
+    AdbcPool,
+    ConfigurationError,
+    DuckDBConfig,
+    close_pool,
+    create_pool,
+    managed_pool,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def mock_source() -> Iterator[MagicMock]:
+    """Patch the ADBC source so every clone is a fresh mock connection."""
+    source = MagicMock()
+    source.adbc_clone = MagicMock(side_effect=lambda: MagicMock(_cursors=()))
+    with patch("adbc_poolhouse._pool_factory.create_adbc_connection", return_value=source):
+        yield source
+
+
+def _adbc_pool(**kwargs: object) -> AdbcPool:
+    return create_pool(driver_path="d", db_kwargs={}, pool_class="adbc", **kwargs)  # type: ignore[arg-type]
+
+
+class TestRealDriver:
+    """End-to-end against the in-process DuckDB driver."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """pool_class="adbc" returns an AdbcPool whose connections run queries."""
+        pool = create_pool(DuckDBConfig(database=str(tmp_path / "native.db")), pool_class="adbc")
+        try:
+            assert isinstance(pool, AdbcPool)
+            with pool.connect() as conn:
+                assert isinstance(conn, PoolProxiedConnection)
+                assert pool.checkedout() == 1
+                cur = conn.cursor()
+                cur.execute("SELECT 42 AS answer")
+                assert cur.fetch_arrow_table().column("answer")[0].as_py() == 42
+            assert pool.checkedout() == 0
+            assert pool.checkedin() == 1
+        finally:
+            close_pool(pool)
+
+    def test_open_cursor_is_closed_on_checkin(self, tmp_path: Path) -> None:
+        """Checkin closes cursors left open, releasing their Arrow readers."""
+        with managed_pool(
+            DuckDBConfig(database=str(tmp_path / "cursors.db")), pool_class="adbc"
+        ) as pool:
+            conn = pool.connect()
+            cur = conn.cursor()
+            cur.execute("SELECT 1")
+            conn.close()
+            assert cur._closed  # type: ignore[attr-defined]
+
+    def test_connection_is_reused(self, tmp_path: Path) -> None:
+        """A returned connection is handed out again rather than re-cloned."""
+        with managed_pool(
+            DuckDBConfig(database=str(tmp_path / "reuse.db")), pool_class="adbc"
+        ) as pool:
+            with pool.connect() as first:
+                raw = first.dbapi_connection
+            with pool.connect() as second:
+                assert second.dbapi_connection is raw
+
+
+class TestSizing:
+    """pool_size / max_overflow / timeout semantics match QueuePool."""
+
+    def test_overflow_connection_closed_on_checkin(self, mock_source: MagicMock) -> None:
+        """Connections above pool_size are closed, not kept idle."""
+        pool = _adbc_pool(pool_size=1, max_overflow=1)
+        try:
+            a, b = pool.connect(), pool.connect()
+            assert pool.overflow() == 1
+            raw_b = b.dbapi_connection
+            a.close()
+            b.close()
+            assert pool.checkedin() == 1
+            assert pool.overflow() == 0
+            raw_b.close.assert_called_once()  # type: ignore[union-attr]
+        finally:
+            close_pool(pool)
+
+    def test_exhausted_pool_times_out(self, mock_source: MagicMock) -> None:
+        """A checkout beyond pool_size + max_overflow raises sqlalchemy TimeoutError."""
+        pool = _adbc_pool(pool_size=1, max_overflow=0, timeout=0)
+        try:
+            held = pool.connect()
+            with pytest.raises(sqlalchemy.exc.TimeoutError):
+                pool.connect()
+            held.close()
+        finally:
+            close_pool(pool)
+
+    def test_waiter_gets_returned_connection(self, mock_source: MagicMock) -> None:
+        """A blocked checkout is handed the next connection checked in."""
+        pool = _adbc_pool(pool_size=1, max_overflow=0, timeout=10)
+        try:
+            held = pool.connect()
+            raw = held.dbapi_connection
+            got: list[object] = []
+            waiter = threading.Thread(target=lambda: got.append(pool.connect().dbapi_connection))
+            waiter.start()
+            held.close()
+            waiter.join(timeout=10)
+            assert got == [raw]
+            assert mock_source.adbc_clone.call_count == 1
+        finally:
+            close_pool(pool)
+
+    def test_failed_open_releases_slot(self, mock_source: MagicMock) -> None:
+        """A clone that fails to open does not leak its reserved slot."""
+        mock_source.adbc_clone = MagicMock(side_effect=RuntimeError("login failed"))
+        pool = _adbc_pool(pool_size=1, max_overflow=0)
+        try:
+            with pytest.raises(RuntimeError):
+                pool.connect()
+            assert pool.checkedout() == 0
+            assert pool.overflow() == -1
+        finally:
+            close_pool(pool)
+
+
+class TestCheckin:
+    """Reset, invalidation and leak handling on the way back into the pool."""
+
+    def test_checkin_rolls_back(self, mock_source: MagicMock) -> None:
+        """Checkin rolls back, as QueuePool's reset_on_return does."""
+        pool = _adbc_pool()
+        try:
+            conn = pool.connect()
+            raw = conn.dbapi_connection
+            conn.close()
+            raw.rollback.assert_called_once()  # type: ignore[union-attr]
+        finally:
+            close_pool(pool)
+
+    def test_failed_reset_discards_connection(self, mock_source: MagicMock) -> None:
+        """A connection whose rollback fails is closed instead of pooled."""
+        pool = _adbc_pool()
+        try:
+            conn = pool.connect()
+            raw = conn.dbapi_connection
+            raw.rollback.side_effect = RuntimeError("broken")  # type: ignore[union-attr]
+            conn.close()
+            assert pool.checkedin() == 0
+            assert pool.checkedout() == 0
+            raw.close.assert_called_once()  # type: ignore[union-attr]
+        finally:
+            close_pool(pool)
+
+    def test_invalidate_releases_slot(self, mock_source: MagicMock) -> None:
+        """invalidate() closes the connection; a later close() is a no-op."""
+        pool = _adbc_pool()
+        try:
+            conn = pool.connect()
+            raw = conn.dbapi_connection
+            conn.invalidate()
+            assert not conn.is_valid
+            conn.close()
+            assert pool.checkedout() == 0
+            assert pool.checkedin() == 0
+            raw.close.assert_called_once()  # type: ignore[union-attr]
+        finally:
+            close_pool(pool)
+
+    def test_dropped_connection_returns_to_pool(self, mock_source: MagicMock) -> None:
+        """A proxy garbage-collected without close() gives its connection back."""
+        pool = _adbc_pool()
+        try:
+            pool.connect()
+            gc.collect()
+            assert pool.checkedout() == 0
+            assert pool.checkedin() == 1
+        finally:
+            close_pool(pool)
+
+    def test_closed_connection_rejects_use(self, mock_source: MagicMock) -> None:
+        """Using a connection after close() raises instead of touching a pooled one."""
+        pool = _adbc_pool()
+        try:
+            conn = pool.connect()
+            conn.close()
+            with pytest.raises(sqlalchemy.exc.InvalidRequestError):
+                conn.cursor()
+        finally:
+            close_pool(pool)
+
+
+class TestLifecycle:
+    """Recycle, dispose and maintainer integration."""
+
+    def test_recycle_on_checkout(self, mock_source: MagicMock) -> None:
+        """A connection older than recycle is reopened at checkout."""
+        pool = _adbc_pool(recycle=10)
+        try:
+            pool.connect().close()
+            with (
+                patch("adbc_poolhouse._adbc_pool.time.time", return_value=time.time() + 11),
+                pool.connect() as conn,
+            ):
+                assert mock_source.adbc_clone.call_count == 2
+                assert conn.is_valid
+        finally:
+            close_pool(pool)
+
+    def test_dispose_closes_idle(self, mock_source: MagicMock) -> None:
+        """dispose() closes every idle connection and frees its slot."""
+        pool = _adbc_pool(prefill=3)
+        raws = [rec.dbapi_connection for rec in pool._adbc_idle_records()]
+        pool.dispose()
+        assert pool.checkedin() == 0
+        assert pool.overflow() == -pool.size()
+        for raw in raws:
+            raw.close.assert_called_once()  # type: ignore[union-attr]
+        close_pool(pool)
+
+    def test_maintainer_tops_up_and_recycles(self, mock_source: MagicMock) -> None:
+        """The background maintainer drives AdbcPool through the same hooks."""
+        pool = _adbc_pool(min_idle=2, recycle=100, recycle_mode="background", recycle_jitter=0.0)
+        try:
+            maintainer = pool._adbc_maintainer
+            assert maintainer is not None
+            maintainer.stop()
+            maintainer.run_once()
+            assert pool.checkedin() == 2
+            before = pool._adbc_idle_records()
+            with patch("adbc_poolhouse._maintenance.time") as fake_time:
+                fake_time.time.return_value = time.time() + 101
+                maintainer.run_once()
+            after = pool._adbc_idle_records()
+            assert len(after) == 2
+            assert not set(map(id, after)) & set(map(id, before))
+        finally:
+            close_pool(pool)
+
+
+class TestValidation:
+    """Invalid pool_class combinations are rejected before connecting."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"pool_class": "static"}, "pool_class"),
+            ({"pool_class": "adbc", "pre_ping": True}, "pre_ping"),
+        ],
+    )
+    def test_invalid_settings_raise(self, kwargs: dict[str, object], match: str) -> None:
+        """Each invalid combination raises ConfigurationError."""
+        with (
+            patch("adbc_poolhouse._pool_factory.create_adbc_connection") as mock_factory,
+            pytest.raises(ConfigurationError, match=match),
+        ):
+            create_pool(driver_path="d", db_kwargs={}, **kwargs)  # type: ignore[arg-type]
+        mock_factory.assert_not_called()
@@ -0,0 +1,188 @@
+"""Tests for adaptive pool sizing (`autoscale=`)."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from adbc_poolhouse import ConfigurationError, close_pool, create_pool
+from adbc_poolhouse._autoscale import percentile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from adbc_poolhouse import AdbcPool, AdbcQueuePool
+    from adbc_poolhouse._autoscale import PoolAutoscaler
+
+
+@pytest.fixture
+def mock_source() -> Iterator[MagicMock]:
+    """Patch the ADBC source so every clone is a fresh mock connection."""
+    source = MagicMock()
+    source.adbc_clone = MagicMock(side_effect=lambda: MagicMock(_cursors=()))
+    with patch("adbc_poolhouse._pool_factory.create_adbc_connection", return_value=source):
+        yield source
+
+
+def _pool(pool_class: Any = "queue", **kwargs: Any) -> AdbcQueuePool | AdbcPool:
+    """Build an autoscaled pool with its maintainer thread stopped."""
+    pool = cast(
+        "AdbcQueuePool | AdbcPool",
+        create_pool(driver_path="d", db_kwargs={}, pool_class=pool_class, **kwargs),
+    )
+    assert pool._adbc_maintainer is not None
+    pool._adbc_maintainer.stop()
+    return pool
+
+
+def _scaler(pool: AdbcQueuePool | AdbcPool) -> PoolAutoscaler:
+    assert pool._adbc_autoscaler is not None
+    return pool._adbc_autoscaler
+
+
+class TestPercentile:
+    """Nearest-rank percentile used for the wait threshold."""
+
+    def test_nearest_rank(self) -> None:
+        """p95 of 1..100 is 95; p50 of four samples is the second."""
+        assert percentile([float(v) for v in range(100, 0, -1)], 95) == 95.0
+        assert percentile([4.0, 1.0, 3.0, 2.0], 50) == 2.0
+
+    def test_empty(self) -> None:
+        """No samples means no wait."""
+        assert percentile([], 95) == 0.0
+
+
+@pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+class TestDecisions:
+    """Sizing decisions applied to both pool implementations."""
+
+    def test_slow_checkouts_grow_the_pool(self, mock_source: MagicMock, pool_class: str) -> None:
+        """A p95 wait above target grows pool_size by half and opens the new slots."""
+        pool = _pool(pool_class, pool_size=4, autoscale=(2, 10))
+        try:
+            assert _scaler(pool).evaluate([0.5] * 20, peak=1) == 6
+            assert pool.size() == 6
+            assert pool.checkedin() == 2
+            assert pool.checkedout() == 0
+        finally:
+            close_pool(pool)
+
+    def test_growth_is_capped(self, mock_source: MagicMock, pool_class: str) -> None:
+        """Overflow in use grows the pool, but never above the maximum."""
+        pool = _pool(pool_class, pool_size=4, autoscale=(2, 5))
+        try:
+            assert _scaler(pool).evaluate([], peak=5) == 5
+        finally:
+            close_pool(pool)
+
+    def test_quiet_windows_shrink_the_pool(self, mock_source: MagicMock, pool_class: str) -> None:
+        """Three calm windows shrink pool_size by a quarter and close the surplus."""
+        pool = _pool(pool_class, pool_size=8, prefill=8, autoscale=(2, 8))
+        scaler = _scaler(pool)
+        try:
+            assert scaler.evaluate([0.001], peak=1) == 8
+            assert scaler.evaluate([0.001], peak=1) == 8
+            assert scaler.evaluate([0.001], peak=1) == 6
+            assert pool.checkedin() == 6
+            assert pool.overflow() == 0
+        finally:
+            close_pool(pool)
+
+    def test_busy_window_resets_shrink(self, mock_source: MagicMock, pool_class: str) -> None:
+        """A window with more than half the pool in use interrupts the calm streak."""
+        pool = _pool(pool_class, pool_size=4, autoscale=(1, 4))
+        scaler = _scaler(pool)
+        try:
+            scaler.evaluate([], peak=0)
+            scaler.evaluate([], peak=0)
+            scaler.evaluate([], peak=3)
+            assert scaler.evaluate([], peak=0) == 4
+        finally:
+            close_pool(pool)
+
+    def test_never_below_minimum(self, mock_source: MagicMock, pool_class: str) -> None:
+        """Shrinking stops at the autoscale minimum."""
+        pool = _pool(pool_class, pool_size=2, autoscale=(2, 4))
+        scaler = _scaler(pool)
+        try:
+            for _ in range(6):
+                scaler.evaluate([], peak=0)
+            assert pool.size() == 2
+        finally:
+            close_pool(pool)
+
+    def test_resize_moves_ceiling_not_checkedout(
+        self, mock_source: MagicMock, pool_class: str
+    ) -> None:
+        """Growing lets a full pool hand out another connection; held ones still count."""
+        pool = _pool(pool_class, pool_size=1, max_overflow=0, timeout=0, autoscale=(1, 2))
+        try:
+            held = pool.connect()
+            pool._adbc_resize(2)
+            assert pool.checkedout() == 1
+            extra = pool.connect()
+            assert pool.checkedout() == 2
+            extra.close()
+            held.close()
+        finally:
+            close_pool(pool)
+
+    def test_growth_wakes_blocked_checkout(self, mock_source: MagicMock, pool_class: str) -> None:
+        """A checkout blocked on the old ceiling is served as soon as the pool grows."""
+        pool = _pool(pool_class, pool_size=1, max_overflow=0, timeout=30, autoscale=(1, 2))
+        try:
+            held = pool.connect()
+            served = threading.Event()
+
+            def checkout() -> None:
+                pool.connect().close()
+                served.set()
+
+            waiter = threading.Thread(target=checkout, daemon=True)
+            waiter.start()
+            _scaler(pool).evaluate([1.0], peak=1)
+            assert served.wait(timeout=5)
+            waiter.join(timeout=5)
+            held.close()
+        finally:
+            close_pool(pool)
+
+    def test_checkouts_are_observed(self, mock_source: MagicMock, pool_class: str) -> None:
+        """Each connect() reports its wait and the peak in-use count."""
+        pool = _pool(pool_class, autoscale=(1, 10))
+        scaler = _scaler(pool)
+        try:
+            a, b = pool.connect(), pool.connect()
+            a.close()
+            b.close()
+            assert len(scaler._waits) == 2
+            assert scaler._peak == 2
+        finally:
+            close_pool(pool)
+
+
+class TestValidation:
+    """Bad autoscale settings are rejected before any connection opens."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"autoscale": (0, 10)}, "autoscale"),
+            ({"autoscale": (6, 10)}, "autoscale"),
+            ({"autoscale": (1, 4)}, "autoscale"),
+            ({"autoscale": (1, 10), "min_idle": 2}, "min_idle"),
+            ({"autoscale": (1, 10), "autoscale_target_wait": 0}, "autoscale_target_wait"),
+        ],
+    )
+    def test_invalid_settings_raise(self, kwargs: dict[str, object], match: str) -> None:
+        """Each invalid combination raises ConfigurationError naming the argument."""
+        with (
+            patch("adbc_poolhouse._pool_factory.create_adbc_connection") as mock_factory,
+            pytest.raises(ConfigurationError, match=match),
+        ):
+            create_pool(driver_path="d", db_kwargs={}, pool_size=5, **kwargs)  # type: ignore[arg-type]
+        mock_factory.assert_not_called()
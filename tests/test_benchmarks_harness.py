@@ -14,7 +14,9 @@ import pytest
 from benchmarks._harness import (
     concurrent_wall,
     median,
+    overhead_report,
     parallel_efficiency,
+    per_call_us,
     report,
     speedup,
 )
@@ -83,6 +85,33 @@ class TestHarnessArithmetic:
             report(1.0, 0.0, 4)
 
 
+class TestOverheadArithmetic:
+    """Per-call conversion and the two-implementation overhead report."""
+
+    def test_per_call_us(self) -> None:
+        """0.5 s over 250_000 calls is 2 microseconds per call."""
+        assert per_call_us(0.5, 250_000) == pytest.approx(2.0)
+
+    def test_per_call_us_zero_calls_raises(self) -> None:
+        """An empty batch has no per-call cost."""
+        with pytest.raises(ValueError, match="calls must be > 0"):
+            per_call_us(1.0, 0)
+
+    def test_overhead_report(self) -> None:
+        """A candidate at half the baseline cost reports speedup 2 and the saving."""
+        assert overhead_report(10.0, 5.0) == {
+            "baseline_us": 10.0,
+            "candidate_us": 5.0,
+            "saved_us": 5.0,
+            "speedup_x": 2.0,
+        }
+
+    def test_overhead_report_zero_candidate_raises(self) -> None:
+        """A sub-resolution candidate cost raises an actionable ValueError."""
+        with pytest.raises(ValueError, match="candidate_us must be > 0"):
+            overhead_report(10.0, 0.0)
+
+
 class TestConcurrentWall:
     """The barrier-gated concurrent_wall driver, exercised with a synthetic call."""
 
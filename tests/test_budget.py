@@ -0,0 +1,292 @@
+"""Tests for connection budgets: one cap shared by pools in one process or in many."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Literal
+
+import pytest
+import sqlalchemy.exc
+
+from adbc_poolhouse import (
+    ConfigurationError,
+    ConnectionBudget,
+    DuckDBConfig,
+    HostConnectionBudget,
+    close_pool,
+    create_pool,
+    managed_pool,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+needs_fcntl = pytest.mark.skipif(os.name != "posix", reason="needs fcntl")
+
+POOL_CLASSES: tuple[Literal["queue", "adbc"], ...] = ("queue", "adbc")
+
+
+def _select(pool: Any, value: int) -> int:
+    with pool.connect() as conn:
+        cur = conn.cursor()
+        cur.execute(f"SELECT {value}")
+        row = cur.fetchone()
+        cur.close()
+    return row[0]
+
+
+def _select_in_child(directory: str, timeout: int) -> str:
+    """Run in a spawned process: one query through a pool under the `shared` budget."""
+    budget = HostConnectionBudget("shared", 1, directory=directory)
+    with managed_pool(DuckDBConfig(), timeout=timeout, host_budget=budget) as pool:
+        try:
+            return str(_select(pool, 1))
+        except sqlalchemy.exc.TimeoutError:
+            return "timeout"
+
+
+def _lease_and_exit(directory: str) -> None:
+    """Run in a spawned process: take the only slot and exit without giving it back."""
+    HostConnectionBudget("shared", 1, directory=directory).acquire(0)
+    os._exit(0)
+
+
+@pytest.mark.parametrize("pool_class", POOL_CLASSES)
+class TestConnectionBudget:
+    """Pools in one process sharing a `ConnectionBudget`."""
+
+    def test_limit_spans_pools(self, pool_class: Literal["queue", "adbc"]) -> None:
+        """With every connection held by one pool, another pool's open times out."""
+        budget = ConnectionBudget(2)
+        kwargs: Any = {"pool_class": pool_class, "budget": budget, "timeout": 0}
+        with (
+            managed_pool(DuckDBConfig(), **kwargs) as a,
+            managed_pool(DuckDBConfig(), **kwargs) as b,
+        ):
+            held = [a.connect(), a.connect()]
+            with pytest.raises(sqlalchemy.exc.TimeoutError, match="ConnectionBudget"):
+                b.connect()
+            for conn in held:
+                conn.close()
+            assert budget.in_use() == 2
+        assert budget.in_use() == 0
+
+    def test_coldest_pool_gives_up_an_idle_connection(
+        self, pool_class: Literal["queue", "adbc"]
+    ) -> None:
+        """A full budget closes an idle connection of the least recently used pool."""
+        budget = ConnectionBudget(2)
+        kwargs: Any = {"pool_class": pool_class, "budget": budget, "timeout": 0}
+        with (
+            managed_pool(DuckDBConfig(), **kwargs) as cold,
+            managed_pool(DuckDBConfig(), **kwargs) as warm,
+            managed_pool(DuckDBConfig(), **kwargs) as hot,
+        ):
+            _select(cold, 1)
+            _select(warm, 2)
+            assert _select(hot, 3) == 3
+            assert (cold.checkedin(), warm.checkedin(), hot.checkedin()) == (0, 1, 1)
+            assert budget.in_use() == 2
+
+    def test_recycling_at_the_cap(self, pool_class: Literal["queue", "adbc"]) -> None:
+        """Replacing an idle connection reuses its lease instead of waiting for one."""
+        budget = ConnectionBudget(1)
+        kwargs: Any = {"pool_class": pool_class, "budget": budget, "timeout": 0}
+        with managed_pool(DuckDBConfig(), prefill=1, **kwargs) as pool:
+            (old,) = pool._adbc_idle_records()
+            assert pool._adbc_replace_idle(old)
+            assert pool._adbc_idle_records()[0] is not old
+            assert budget.in_use() == 1
+            assert _select(pool, 5) == 5
+        assert budget.in_use() == 0
+
+    def test_top_up_at_the_cap_spares_its_own_pool(
+        self, pool_class: Literal["queue", "adbc"]
+    ) -> None:
+        """A `min_idle` top-up with the budget full does not evict its own idle connection."""
+        budget = ConnectionBudget(3)
+        with managed_pool(
+            DuckDBConfig(),
+            pool_size=4,
+            max_overflow=2,
+            min_idle=2,
+            maintenance_interval=0.01,
+            timeout=0,
+            budget=budget,
+            pool_class=pool_class,
+        ) as pool:
+            held = [pool.connect(), pool.connect()]
+            time.sleep(0.2)
+            assert pool.stats().connect_time.count == 3
+            assert (budget.in_use(), pool.checkedin()) == (3, 1)
+            for conn in held:
+                conn.close()
+
+    def test_waits_for_a_release(self, pool_class: Literal["queue", "adbc"]) -> None:
+        """With nothing idle, an open waits for another pool to close a connection."""
+        budget = ConnectionBudget(1)
+        kwargs: Any = {"pool_class": pool_class, "budget": budget}
+        with (
+            managed_pool(DuckDBConfig(), pool_size=1, max_overflow=0, **kwargs) as a,
+            managed_pool(DuckDBConfig(), timeout=10, **kwargs) as b,
+        ):
+            held = a.connect()
+            threading.Timer(0.05, held.invalidate).start()
+            assert _select(b, 4) == 4
+
+
+@needs_fcntl
+@pytest.mark.parametrize("pool_class", POOL_CLASSES)
+class TestInProcess:
+    """Pools in one process sharing a `HostConnectionBudget`."""
+
+    def test_limit_spans_pools(self, pool_class: Literal["queue", "adbc"], tmp_path: Path) -> None:
+        """With every slot held by one pool, another pool's open times out."""
+        budget = HostConnectionBudget("t", 2, directory=str(tmp_path))
+        kwargs: Any = {"pool_class": pool_class, "host_budget": budget, "timeout": 0}
+        with (
+            managed_pool(DuckDBConfig(), **kwargs) as a,
+            managed_pool(DuckDBConfig(), **kwargs) as b,
+        ):
+            held = [a.connect(), a.connect()]
+            assert budget.in_use() == 2
+            with pytest.raises(sqlalchemy.exc.TimeoutError, match="HostConnectionBudget"):
+                b.connect()
+            assert b.stats().connect_time.count == 0
+            for conn in held:
+                conn.close()
+            assert budget.in_use() == 2
+        assert budget.in_use() == 0
+
+    def test_closed_connection_returns_its_slot(
+        self, pool_class: Literal["queue", "adbc"], tmp_path: Path
+    ) -> None:
+        """An overflow connection closed on checkin frees its slot."""
+        budget = HostConnectionBudget("t", 5, directory=str(tmp_path))
+        with managed_pool(
+            DuckDBConfig(), pool_size=1, pool_class=pool_class, host_budget=budget
+        ) as pool:
+            first, second = pool.connect(), pool.connect()
+            assert budget.in_use() == 2
+            second.close()
+            first.close()
+            assert budget.in_use() == 1
+
+    def test_idle_connections_are_lent(
+        self, pool_class: Literal["queue", "adbc"], tmp_path: Path
+    ) -> None:
+        """A waiting open gets the slot of another pool's idle connection."""
+        budget = HostConnectionBudget("t", 2, directory=str(tmp_path), lend_interval=0.01)
+        kwargs: Any = {"pool_class": pool_class, "host_budget": budget}
+        with managed_pool(DuckDBConfig(), prefill=2, **kwargs) as idle:
+            with managed_pool(DuckDBConfig(), timeout=10, **kwargs) as busy:
+                assert _select(busy, 7) == 7
+                assert busy.checkedin() == 1
+            assert idle.checkedin() < 2
+
+    def test_waiting_pool_is_not_lent_from(
+        self, pool_class: Literal["queue", "adbc"], tmp_path: Path
+    ) -> None:
+        """The lender spares a pool waiting for a slot, so its top-up cannot churn."""
+        budget = HostConnectionBudget("t", 3, directory=str(tmp_path), lend_interval=0.01)
+        with managed_pool(
+            DuckDBConfig(),
+            pool_size=4,
+            max_overflow=2,
+            min_idle=2,
+            maintenance_interval=0.01,
+            timeout=1,
+            host_budget=budget,
+            pool_class=pool_class,
+        ) as pool:
+            held = [pool.connect(), pool.connect()]
+            time.sleep(0.3)
+            assert pool.stats().connect_time.count == 3
+            assert pool.checkedin() == 1
+            for conn in held:
+                conn.close()
+
+
+@needs_fcntl
+class TestAcrossProcesses:
+    """Slots are shared with, and released by, other processes."""
+
+    def test_limit_and_lending_across_processes(self, tmp_path: Path) -> None:
+        """A child times out while this process holds the slot, then borrows it once idle."""
+        budget = HostConnectionBudget("shared", 1, directory=str(tmp_path), lend_interval=0.01)
+        context = multiprocessing.get_context("spawn")
+        with (
+            managed_pool(DuckDBConfig(), host_budget=budget) as pool,
+            concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as executor,
+        ):
+            held = pool.connect()
+            assert executor.submit(_select_in_child, str(tmp_path), 0).result() == "timeout"
+            held.close()
+            assert executor.submit(_select_in_child, str(tmp_path), 30).result() == "1"
+            assert pool.checkedin() == 0
+
+    def test_slot_of_a_dead_process_is_free(self, tmp_path: Path) -> None:
+        """A process that exits holding a slot gives it back."""
+        budget = HostConnectionBudget("shared", 1, directory=str(tmp_path))
+        child = multiprocessing.get_context("spawn").Process(
+            target=_lease_and_exit, args=(str(tmp_path),)
+        )
+        child.start()
+        child.join()
+        assert child.exitcode == 0
+        assert budget.in_use() == 0
+        budget.acquire(0).release()
+
+
+@needs_fcntl
+class TestClose:
+    """`close_pool` gives back the pool's slots and withdraws it from lending."""
+
+    def test_close_pool_leaves_no_leases(self, tmp_path: Path) -> None:
+        """Every slot taken by a pool is free after `close_pool`."""
+        budget = HostConnectionBudget("t", 3, directory=str(tmp_path))
+        pool = create_pool(DuckDBConfig(), prefill=3, host_budget=budget)
+        assert budget.in_use() == 3
+        close_pool(pool)
+        assert budget.in_use() == 0
+
+    def test_close_pool_stops_lending(self, tmp_path: Path) -> None:
+        """The lender thread exits once no budgeted pool is open."""
+        budget = HostConnectionBudget("t", 1, directory=str(tmp_path), lend_interval=0.01)
+        with managed_pool(DuckDBConfig(), host_budget=budget):
+            lender = budget._lender
+            assert lender is not None
+            assert lender.is_alive()
+        lender.join(timeout=5)
+        assert not lender.is_alive()
+        assert budget._lender is None
+
+
+class TestOptions:
+    """Construction-time validation."""
+
+    @pytest.mark.parametrize(
+        ("args", "kwargs", "match"),
+        [
+            (("a/b", 1), {}, "name"),
+            ((".hidden", 1), {}, "name"),
+            (("t", 0), {}, "limit"),
+            (("t", 1), {"lend_interval": 0}, "lend_interval"),
+        ],
+    )
+    @needs_fcntl
+    def test_invalid(
+        self, args: tuple[str, int], kwargs: dict[str, float], match: str, tmp_path: Path
+    ) -> None:
+        """Bad names, an empty budget and a non-positive lend interval are rejected."""
+        with pytest.raises(ConfigurationError, match=match):
+            HostConnectionBudget(*args, directory=str(tmp_path), **kwargs)
+
+    def test_empty_connection_budget(self) -> None:
+        """A `ConnectionBudget` needs room for at least one connection."""
+        with pytest.raises(ConfigurationError, match="limit"):
+            ConnectionBudget(0)
@@ -31,6 +31,17 @@ class TestBaseWarehouseConfig:
         assert BaseWarehouseConfig.model_fields["max_overflow"].default == 3
         assert BaseWarehouseConfig.model_fields["timeout"].default == 30
         assert BaseWarehouseConfig.model_fields["recycle"].default == 3600
+        assert BaseWarehouseConfig.model_fields["idle_timeout"].default is None
+
+    def test_idle_timeout_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """idle_timeout loads with the warehouse env prefix like the other tuning fields."""
+        monkeypatch.setenv("DUCKDB_IDLE_TIMEOUT", "300")
+        assert DuckDBConfig().idle_timeout == 300
+
+    def test_idle_timeout_must_be_positive(self) -> None:
+        """A zero or negative idle_timeout is rejected."""
+        with pytest.raises(ValidationError, match="idle_timeout must be > 0"):
+            DuckDBConfig(idle_timeout=0)
 
 
 class TestDuckDBConfig:
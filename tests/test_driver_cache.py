@@ -0,0 +1,87 @@
+"""Tests for the process-wide driver resolution and DBAPI connect plan caches."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import inspect
+import sys
+import types
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from adbc_poolhouse import SnowflakeConfig
+from adbc_poolhouse._driver_api import create_adbc_connection
+from adbc_poolhouse._driver_cache import clear_driver_caches, connect_plan
+
+
+def _module(connect: Any) -> types.ModuleType:
+    module = types.ModuleType("mock_dbapi")
+    module.connect = connect  # type: ignore[attr-defined]
+    return module
+
+
+class TestDriverResolution:
+    """`_driver_path()` and `_dbapi_module()` look a package up once."""
+
+    def test_find_spec_runs_once_per_package(self) -> None:
+        """Repeated resolution, across both methods and configs, calls `find_spec` once."""
+        with patch("importlib.util.find_spec", wraps=importlib.util.find_spec) as find_spec:
+            for _ in range(3):
+                config = SnowflakeConfig(account="a")
+                config._driver_path()
+                config._dbapi_module()
+        assert [c.args for c in find_spec.call_args_list] == [("adbc_driver_snowflake",)]
+
+    def test_clear_forgets_the_answer(self) -> None:
+        """After `clear_driver_caches`, a package removed since is reported missing."""
+        assert SnowflakeConfig(account="a")._dbapi_module() == "adbc_driver_snowflake.dbapi"
+        with patch("importlib.util.find_spec", return_value=None):
+            assert SnowflakeConfig(account="a")._dbapi_module() is not None
+            clear_driver_caches()
+            assert SnowflakeConfig(account="a")._dbapi_module() is None
+            assert SnowflakeConfig(account="a")._driver_path() == "adbc_driver_snowflake"
+
+
+class TestConnectPlan:
+    """The DBAPI module import and `connect()` signature are resolved once."""
+
+    def test_plan_is_reused(self) -> None:
+        """A second connection neither imports the module nor inspects `connect` again."""
+        module = _module(lambda db_kwargs=None: MagicMock())
+        with (
+            patch.dict(sys.modules, {"mock_dbapi": module}),
+            patch("inspect.signature", wraps=inspect.signature) as signature,
+            patch("importlib.import_module", wraps=importlib.import_module) as import_module,
+        ):
+            first = connect_plan("mock_dbapi")
+            create_adbc_connection("", {"k": "v"}, dbapi_module="mock_dbapi")
+            assert connect_plan("mock_dbapi") is first
+        assert first.shape == "db_kwargs"
+        assert import_module.call_count == 1
+        assert signature.call_count == 1
+
+    def test_replaced_connect_gets_a_new_plan(self) -> None:
+        """Monkeypatching the module's `connect` is honoured, with its own call shape."""
+        calls: list[dict[str, Any]] = []
+        module = _module(lambda db_kwargs=None: MagicMock())
+        with patch.dict(sys.modules, {"mock_dbapi": module}):
+            assert connect_plan("mock_dbapi").shape == "db_kwargs"
+
+            def replay_connect(**kwargs: Any) -> MagicMock:
+                calls.append(kwargs)
+                return MagicMock()
+
+            module.connect = replay_connect  # type: ignore[attr-defined]
+            create_adbc_connection("", {"path": "x"}, dbapi_module="mock_dbapi")
+            assert connect_plan("mock_dbapi").shape == "kwargs"
+        assert calls == [{"path": "x"}]
+
+    def test_replaced_module_gets_a_new_plan(self) -> None:
+        """A module swapped in `sys.modules`, as by a reload, is not served the old plan."""
+        with patch.dict(sys.modules, {"mock_dbapi": _module(lambda db_kwargs=None: None)}):
+            assert connect_plan("mock_dbapi").shape == "db_kwargs"
+            replacement = sys.modules["mock_dbapi"] = _module(lambda **kwargs: None)
+            plan = connect_plan("mock_dbapi")
+        assert plan.module is replacement
+        assert plan.shape == "kwargs"
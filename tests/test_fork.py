@@ -0,0 +1,279 @@
+"""Tests for fork safety: pools inherited by a forked child are reset, never closed."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from adbc_poolhouse import (
+    ConfigurationError,
+    ConnectionBudget,
+    DuckDBConfig,
+    _fork,
+    close_pool,
+    create_pool,
+    managed_pool,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+pytestmark = [
+    pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork"),
+    # DuckDB runs its own threads; the children here only touch the pool.
+    pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning"),
+]
+
+
+def _in_child(fn: Callable[[], Any]) -> str:
+    """Run `fn` in a forked child and return the `repr` of its result (or error)."""
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        try:
+            os.write(write, repr(fn()).encode())
+        except BaseException as exc:
+            os.write(write, f"error: {exc!r}".encode())
+        finally:
+            os._exit(0)
+    os.close(write)
+    with os.fdopen(read) as f:
+        result = f.read()
+    os.waitpid(pid, 0)
+    return result
+
+
+def _select(pool: Any, value: int) -> int:
+    with pool.connect() as conn:
+        cur = conn.cursor()
+        cur.execute(f"SELECT {value}")
+        row = cur.fetchone()
+        cur.close()
+    return row[0]
+
+
+@pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+class TestForkedChild:
+    """A pool built before a fork, used on both sides of it."""
+
+    def test_child_reconnects_and_parent_is_untouched(self, pool_class: str) -> None:
+        """The child gets fresh connections; the parent's source and idle set survive."""
+        with managed_pool(DuckDBConfig(), prefill=2, pool_class=pool_class) as pool:  # type: ignore[call-overload]
+            source = pool._adbc_source
+
+            def child() -> tuple[object, ...]:
+                inherited_idle = pool.checkedin()
+                value = _select(pool, 42)
+                return (
+                    inherited_idle,
+                    value,
+                    pool._adbc_source is not source,
+                    any(obj is source for obj in _fork._abandoned),
+                    source._closed,
+                    pool.stats().checkouts,
+                )
+
+            # The child marks its copy of the source closed, without closing it.
+            assert _in_child(child) == repr((0, 42, True, True, True, 1))
+            assert pool._adbc_source is source
+            assert not source._closed
+            assert pool.checkedin() == 2
+            assert _select(pool, 7) == 7
+
+    def test_fork_prefill_warms_the_child(self, pool_class: str) -> None:
+        """With `fork_prefill`, the child's first checkout opens its connections together."""
+        with managed_pool(DuckDBConfig(), fork_prefill=2, pool_class=pool_class) as pool:  # type: ignore[call-overload]
+            assert pool.checkedin() == 0
+            report = _in_child(
+                lambda: (
+                    pool.checkedin(),
+                    _select(pool, 1),
+                    pool.checkedin(),
+                    pool.prefill_report.connections,
+                )
+            )
+            assert report == repr((0, 1, 2, 2))
+            assert pool.checkedin() == 0
+
+    def test_maintainer_restarts_in_the_child(self, pool_class: str) -> None:
+        """A background maintainer thread runs again in the child."""
+        with managed_pool(DuckDBConfig(), min_idle=1, pool_class=pool_class) as pool:  # type: ignore[call-overload]
+            maintainer = pool._adbc_maintainer
+            assert maintainer is not None
+            assert _in_child(lambda: maintainer._thread.is_alive()) == "True"
+
+    def test_connection_held_across_the_fork_is_dropped(self, pool_class: str) -> None:
+        """A connection checked out before the fork and checked in by the child is not pooled."""
+        with managed_pool(DuckDBConfig(), pool_class=pool_class) as pool:  # type: ignore[call-overload]
+            held = pool.connect()
+            dbapi_conn = held.dbapi_connection
+
+            def child() -> tuple[object, ...]:
+                value = _select(pool, 1)
+                held.close()
+                return value, pool.checkedin(), pool.checkedout(), dbapi_conn._closed
+
+            assert _in_child(child) == repr((1, 1, 0, True))
+            held.close()
+            assert pool.checkedin() == 1
+            assert not dbapi_conn._closed
+
+    def test_close_in_child_leaves_parent_source_open(self, pool_class: str) -> None:
+        """`close_pool` in the child closes nothing the parent owns."""
+        pool = create_pool(DuckDBConfig(), prefill=1, pool_class=pool_class)  # type: ignore[call-overload]
+        source = pool._adbc_source
+        try:
+
+            def child() -> bool:
+                close_pool(pool)
+                return pool._adbc_source is None
+
+            assert _in_child(child) == "True"
+            assert not source._closed
+            assert _select(pool, 3) == 3
+        finally:
+            close_pool(pool)
+
+
+class TestBudgetAcrossFork:
+    """A `ConnectionBudget` counts only the child's own connections."""
+
+    def test_child_budget_starts_empty(self) -> None:
+        """The parent's connections do not use up the child's budget."""
+        budget = ConnectionBudget(1)
+        with managed_pool(DuckDBConfig(), prefill=1, timeout=0, budget=budget) as pool:
+            assert _in_child(lambda: (budget.in_use(), _select(pool, 1))) == repr((0, 1))
+            assert budget.in_use() == 1
+
+    def test_pool_reset_resets_its_budget(self) -> None:
+        """Without the budget's own fork hook, the pool's reset still starts it afresh."""
+        budget = ConnectionBudget(1)
+        with managed_pool(DuckDBConfig(), prefill=1, timeout=0, budget=budget) as pool:
+
+            def child() -> tuple[int, int]:
+                # Neither hook ran, as after a fork from C: the parent's count stands.
+                budget._pid = -1
+                budget._open = 1
+                pool._adbc_pid = -1
+                return _select(pool, 1), budget.in_use()
+
+            assert _in_child(child) == repr((1, 1))
+            assert budget.in_use() == 1
+
+
+class TestLazyAcrossFork:
+    """A lazy pool forked before its first checkout."""
+
+    def test_child_opens_its_own_source(self) -> None:
+        """Neither side has a source at the fork; each opens its own on first use."""
+        with managed_pool(DuckDBConfig(), lazy=True) as pool:
+            assert _in_child(lambda: (_select(pool, 1), pool._adbc_source is not None)) == repr(
+                (1, True)
+            )
+            assert pool._adbc_source is None
+            assert _select(pool, 2) == 2
+
+
+@pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+class TestPidCheck:
+    """A checkout notices a pid change the fork hook missed, as after a fork from C."""
+
+    def test_checkout_resets_an_inherited_pool(self, pool_class: str) -> None:
+        """The inherited source and idle connections are abandoned, not closed."""
+        with managed_pool(DuckDBConfig(), pool_class=pool_class) as pool:  # type: ignore[call-overload]
+
+            def child() -> tuple[object, ...]:
+                # The hook has reset the pool; open a source, then pose as inherited.
+                _select(pool, 1)
+                source = pool._adbc_source
+                pool._adbc_pid = -1
+                value = _select(pool, 5)
+                return (
+                    value,
+                    pool._adbc_pid == os.getpid(),
+                    pool._adbc_source is not source,
+                    any(obj is source for obj in _fork._abandoned),
+                    pool.checkedin(),
+                )
+
+            assert _in_child(child) == repr((5, True, True, True, 1))
+
+
+# Builds a pool, forks a child that uses it and exits normally, then uses the
+# pool in the parent. The child reports any close of a connection it inherited,
+# including from finalizers run at interpreter exit.
+_EXIT_CHILD = textwrap.dedent(
+    """
+    import os
+    import sys
+
+    from adbc_driver_manager import dbapi
+
+    from adbc_poolhouse import DuckDBConfig, close_pool, create_pool
+
+    pool = create_pool(DuckDBConfig(), prefill=2, pool_class=sys.argv[1])
+    source = pool._adbc_source
+    held = pool.connect()
+    inherited = {id(source), id(held.dbapi_connection)}
+
+    pid = os.fork()
+    if pid == 0:
+        close = dbapi.Connection.close
+
+        def reporting_close(self):
+            if id(self) in inherited:
+                print("INHERITED_CLOSED", flush=True)
+            close(self)
+
+        dbapi.Connection.close = reporting_close
+        with pool.connect() as conn:
+            conn.cursor().execute("SELECT 1")
+        held.close()
+        close_pool(pool)
+        sys.exit(0)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert not source._closed
+    cur = held.cursor()
+    cur.execute("SELECT 42")
+    assert cur.fetchone() == (42,)
+    cur.close()
+    held.close()
+    close_pool(pool)
+    print("PARENT_OK")
+    """
+)
+
+
+@pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+class TestChildExit:
+    """A child that exits normally, finalizers and all, closes nothing of the parent's."""
+
+    def test_parent_connections_survive_the_child(self, pool_class: str) -> None:
+        """The parent's source and checked-out connection stay open and usable."""
+        result = subprocess.run(
+            [sys.executable, "-W", "ignore::DeprecationWarning", "-c", _EXIT_CHILD, pool_class],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+        assert "INHERITED_CLOSED" not in result.stdout
+        assert "PARENT_OK" in result.stdout
+        assert "Exception ignored" not in result.stderr
+
+
+class TestForkPrefillOption:
+    """Validation of `fork_prefill`."""
+
+    @pytest.mark.parametrize("fork_prefill", [-1, 6])
+    def test_out_of_range(self, fork_prefill: int) -> None:
+        """`fork_prefill` must lie in `0..pool_size`."""
+        with pytest.raises(ConfigurationError, match="fork_prefill"):
+            create_pool(driver_path="nowhere", db_kwargs={}, fork_prefill=fork_prefill)
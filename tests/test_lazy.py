@@ -0,0 +1,121 @@
+"""Tests for lazy pools: the source connection opens with the first checkout."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Literal
+
+import pytest
+
+from adbc_poolhouse import (
+    ConfigurationError,
+    ConnectionBudget,
+    DuckDBConfig,
+    _procfetch,
+    close_pool,
+    create_pool,
+    managed_pool,
+)
+
+
+def _select(pool: Any, value: int) -> int:
+    with pool.connect() as conn:
+        cur = conn.cursor()
+        cur.execute(f"SELECT {value}")
+        row = cur.fetchone()
+        cur.close()
+    return row[0]
+
+
+@pytest.fixture
+def source_opens(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record every source open made through a `ConnectSpec`, each taking a little while."""
+    opens: list[float] = []
+    connect = _procfetch.create_adbc_connection
+
+    def slow_connect(*args: Any, **kwargs: Any) -> Any:
+        opens.append(time.monotonic())
+        time.sleep(0.05)
+        return connect(*args, **kwargs)
+
+    monkeypatch.setattr(_procfetch, "create_adbc_connection", slow_connect)
+    return opens
+
+
+POOL_CLASSES: tuple[Literal["queue", "adbc"], ...] = ("queue", "adbc")
+
+
+@pytest.mark.parametrize("pool_class", POOL_CLASSES)
+class TestLazyPool:
+    """A pool built with `lazy=True`."""
+
+    def test_first_checkout_opens_the_source(
+        self, pool_class: Literal["queue", "adbc"], source_opens: list[float]
+    ) -> None:
+        """Nothing connects until the first checkout, which opens the source once."""
+        with managed_pool(DuckDBConfig(), lazy=True, pool_class=pool_class) as pool:
+            assert pool._adbc_source is None
+            assert source_opens == []
+            assert _select(pool, 1) == 1
+            source = pool._adbc_source
+            assert source is not None
+            assert _select(pool, 2) == 2
+            assert pool._adbc_source is source
+            assert len(source_opens) == 1
+        assert source._closed
+
+    def test_concurrent_first_checkouts_share_one_open(
+        self, pool_class: Literal["queue", "adbc"], source_opens: list[float]
+    ) -> None:
+        """Threads checking out together wait for one source open."""
+        with managed_pool(DuckDBConfig(), lazy=True, pool_class=pool_class) as pool:
+            results: list[int] = []
+            threads = [
+                threading.Thread(target=lambda i=i: results.append(_select(pool, i)))
+                for i in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert sorted(results) == [0, 1, 2, 3]
+            assert len(source_opens) == 1
+
+    def test_budget_counts_lazy_clones(self, pool_class: Literal["queue", "adbc"]) -> None:
+        """A budget wraps the deferred open like any other."""
+        budget = ConnectionBudget(2)
+        with managed_pool(DuckDBConfig(), lazy=True, budget=budget, pool_class=pool_class) as pool:
+            assert budget.in_use() == 0
+            assert _select(pool, 3) == 3
+            assert budget.in_use() == 1
+        assert budget.in_use() == 0
+
+
+class TestLazyErrors:
+    """Failures a lazy pool defers, and the options it refuses."""
+
+    def test_unused_pool_closes(self, source_opens: list[float]) -> None:
+        """Closing a pool that never connected opens nothing."""
+        close_pool(create_pool(DuckDBConfig(), lazy=True))
+        assert source_opens == []
+
+    def test_connection_error_surfaces_on_connect(self) -> None:
+        """A bad driver fails the first checkout, not creation, and the next one again."""
+        pool = create_pool(driver_path="nowhere", db_kwargs={}, lazy=True)
+        try:
+            for _ in range(2):
+                with pytest.raises(ImportError):
+                    pool.connect()
+        finally:
+            close_pool(pool)
+
+    def test_prefill_is_rejected(self) -> None:
+        """`prefill` opens connections at creation, so it cannot be lazy."""
+        with pytest.raises(ConfigurationError, match="lazy"):
+            create_pool(DuckDBConfig(), lazy=True, prefill=1)
+
+    def test_min_idle_is_rejected(self) -> None:
+        """`min_idle` would have the maintainer open the source at startup."""
+        with pytest.raises(ConfigurationError, match="lazy"):
+            create_pool(DuckDBConfig(), lazy=True, min_idle=1)
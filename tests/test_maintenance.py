@@ -0,0 +1,372 @@
+"""Tests for the background pool maintainer (min_idle / max_idle / idle_timeout)."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from adbc_poolhouse import (
+    ConfigurationError,
+    DuckDBConfig,
+    close_pool,
+    create_pool,
+    managed_pool,
+)
+from adbc_poolhouse._maintenance import _IDLE_SINCE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from adbc_poolhouse import AdbcPool, AdbcQueuePool
+
+_P = TypeVar("_P", bound="AdbcQueuePool | AdbcPool")
+
+
+@pytest.fixture
+def mock_source() -> Iterator[MagicMock]:
+    """Patch the ADBC source so every clone is a fresh mock connection."""
+    source = MagicMock()
+    source.adbc_clone = MagicMock(side_effect=lambda: MagicMock())
+    with patch("adbc_poolhouse._pool_factory.create_adbc_connection", return_value=source):
+        yield source
+
+
+def _stopped(pool: _P) -> _P:
+    """Stop the pool's maintainer thread so passes can be driven by hand."""
+    maintainer = pool._adbc_maintainer
+    assert maintainer is not None
+    maintainer.stop()
+    return pool
+
+
+class TestRunOnce:
+    """A single maintenance pass, driven directly (no thread timing involved)."""
+
+    def test_tops_up_to_min_idle(self, mock_source: MagicMock) -> None:
+        """A pass opens connections until min_idle are idle."""
+        pool = _stopped(create_pool(driver_path="d", db_kwargs={}, pool_size=4, min_idle=3))
+        try:
+            for _ in range(pool.checkedin()):
+                pool._adbc_evict_idle()
+            assert pool.checkedin() == 0
+            assert pool._adbc_maintainer is not None
+            pool._adbc_maintainer.run_once()
+            assert pool.checkedin() == 3
+            assert pool.checkedout() == 0
+        finally:
+            close_pool(pool)
+
+    def test_replaces_checked_out_connections(self, mock_source: MagicMock) -> None:
+        """Checked-out connections are replaced so min_idle stay idle for the next caller."""
+        pool = _stopped(create_pool(driver_path="d", db_kwargs={}, pool_size=4, min_idle=2))
+        try:
+            assert pool._adbc_maintainer is not None
+            pool._adbc_maintainer.run_once()
+            held = [pool.connect(), pool.connect()]
+            assert pool.checkedin() == 0
+            pool._adbc_maintainer.run_once()
+            assert pool.checkedin() == 2
+            assert pool.checkedout() == 2
+            for conn in held:
+                conn.close()
+        finally:
+            close_pool(pool)
+
+    def test_stops_at_pool_ceiling(self, mock_source: MagicMock) -> None:
+        """The maintainer never opens beyond pool_size + max_overflow."""
+        pool = _stopped(
+            create_pool(driver_path="d", db_kwargs={}, pool_size=2, max_overflow=0, min_idle=2)
+        )
+        try:
+            assert pool._adbc_maintainer is not None
+            pool._adbc_maintainer.run_once()
+            held = [pool.connect(), pool.connect()]
+            pool._adbc_maintainer.run_once()
+            assert pool.checkedin() == 0
+            assert pool.checkedout() == 2
+            for conn in held:
+                conn.close()
+        finally:
+            close_pool(pool)
+
+    def test_trims_above_max_idle(self, mock_source: MagicMock) -> None:
+        """Idle connections above max_idle are closed and their slots released."""
+        pool = _stopped(create_pool(driver_path="d", db_kwargs={}, pool_size=4, max_idle=1))
+        try:
+            held = [pool.connect() for _ in range(4)]
+            for conn in held:
+                conn.close()
+            assert pool.checkedin() == 4
+            assert pool._adbc_maintainer is not None
+            pool._adbc_maintainer.run_once()
+            assert pool.checkedin() == 1
+            assert pool.overflow() == -3
+        finally:
+            close_pool(pool)
+
+
+class TestBackgroundThread:
+    """The maintainer thread started by the sync factories."""
+
+    def test_thread_warms_pool(self, tmp_path: Path) -> None:
+        """create_pool(min_idle=N) fills the idle set in the background."""
+        pool = create_pool(DuckDBConfig(database=str(tmp_path / "warm.db")), min_idle=2)
+        try:
+            deadline = time.monotonic() + 10
+            while pool.checkedin() < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pool.checkedin() == 2
+        finally:
+            close_pool(pool)
+
+    def test_close_pool_stops_thread(self, tmp_path: Path) -> None:
+        """close_pool joins the maintainer thread before disposing."""
+        pool = create_pool(DuckDBConfig(database=str(tmp_path / "stop.db")), min_idle=1)
+        maintainer = pool._adbc_maintainer
+        assert maintainer is not None
+        thread = maintainer._thread
+        assert thread is not None
+        close_pool(pool)
+        assert not thread.is_alive()
+
+    def test_failed_pass_is_logged_and_retried(
+        self, mock_source: MagicMock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A failing clone does not kill the thread; the next pass succeeds."""
+        calls = {"n": 0}
+
+        def flaky_clone() -> MagicMock:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RuntimeError("login failed")
+            return MagicMock()
+
+        mock_source.adbc_clone = MagicMock(side_effect=flaky_clone)
+        pool = create_pool(driver_path="d", db_kwargs={}, min_idle=1, maintenance_interval=0.01)
+        try:
+            deadline = time.monotonic() + 10
+            while pool.checkedin() < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pool.checkedin() == 1
+            assert pool.overflow() == -4
+            assert "maintenance pass failed" in caplog.text
+        finally:
+            close_pool(pool)
+
+    def test_no_maintainer_by_default(self, mock_source: MagicMock) -> None:
+        """Without min_idle / max_idle no maintainer is attached."""
+        pool = create_pool(driver_path="d", db_kwargs={})
+        try:
+            assert pool._adbc_maintainer is None
+        finally:
+            close_pool(pool)
+
+    def test_managed_pool_min_idle(self, mock_source: MagicMock) -> None:
+        """managed_pool accepts min_idle and stops the thread on exit."""
+        with managed_pool(driver_path="d", db_kwargs={}, min_idle=1) as pool:
+            maintainer = pool._adbc_maintainer
+            assert maintainer is not None
+        assert maintainer._thread is None
+
+
+class TestBackgroundRecycle:
+    """`recycle_mode="background"`: aged idle connections are swapped off the request path."""
+
+    def _pool(self, **kwargs: float) -> AdbcQueuePool:
+        return _stopped(
+            create_pool(
+                driver_path="d",
+                db_kwargs={},
+                pool_size=2,
+                recycle=100,
+                recycle_mode="background",
+                **kwargs,  # type: ignore[arg-type]
+            )
+        )
+
+    def test_pool_never_recycles_on_checkout(self, mock_source: MagicMock) -> None:
+        """The QueuePool is built with recycling disabled; checkout never re-clones by age."""
+        pool = self._pool(prefill=1)
+        try:
+            assert pool._recycle == -1
+            assert pool._adbc_maintainer is not None
+            assert pool._adbc_maintainer.recycle == 100
+            clones = mock_source.adbc_clone.call_count
+            with patch("sqlalchemy.pool.base.time.time", return_value=time.time() + 10_000):
+                pool.connect().close()
+            assert mock_source.adbc_clone.call_count == clones
+        finally:
+            close_pool(pool)
+
+    def test_expired_idle_connections_are_replaced(self, mock_source: MagicMock) -> None:
+        """A pass swaps each expired idle record for a new one and closes the old one."""
+        pool = self._pool(prefill=2, recycle_jitter=0.0)
+        try:
+            maintainer = pool._adbc_maintainer
+            assert maintainer is not None
+            before = pool._adbc_idle_records()
+            old_conns = [rec.dbapi_connection for rec in before]
+            maintainer.run_once()
+            assert pool._adbc_idle_records() == before  # not yet due
+
+            with patch("adbc_poolhouse._maintenance.time") as fake_time:
+                fake_time.time.return_value = time.time() + 101
+                maintainer.run_once()
+            after = pool._adbc_idle_records()
+            assert len(after) == 2
+            assert not set(map(id, after)) & set(map(id, before))
+            for conn in old_conns:
+                conn.close.assert_called_once()  # type: ignore[union-attr]
+            assert pool.overflow() == -pool.size() + 2
+        finally:
+            close_pool(pool)
+
+    def test_checked_out_connection_is_left_alone(self, mock_source: MagicMock) -> None:
+        """A record checked out before the swap keeps its slot; the spare clone is closed."""
+        pool = self._pool(prefill=1)
+        try:
+            (old,) = pool._adbc_idle_records()
+            conn = pool.connect()
+            new = pool._create_connection()
+            assert not pool._adbc_swap_idle(old, new)
+            new.close()
+            conn.close()
+            assert pool._adbc_idle_records() == [old]
+        finally:
+            close_pool(pool)
+
+    def test_jitter_spreads_deadlines(self, mock_source: MagicMock) -> None:
+        """Each connection's deadline is brought forward by its own random fraction."""
+        pool = self._pool(prefill=2, recycle_jitter=0.5)
+        try:
+            maintainer = pool._adbc_maintainer
+            assert maintainer is not None
+            records = pool._adbc_idle_records()
+            for rec in records:
+                rec.info.clear()  # drop any stamp from the thread's first pass
+            with patch("adbc_poolhouse._maintenance.random.uniform", side_effect=[0.0, 0.5]):
+                deadlines = [maintainer._deadline(rec) for rec in records]
+            starts = [rec.starttime for rec in records]  # type: ignore[attr-defined]
+            assert deadlines[0] - starts[0] == pytest.approx(100)
+            assert deadlines[1] - starts[1] == pytest.approx(50)
+            # Stable once assigned.
+            assert maintainer._deadline(records[0]) == deadlines[0]
+        finally:
+            close_pool(pool)
+
+
+class TestIdleTimeout:
+    """`checkout_order="lifo"` + `idle_timeout`: hot connections stay, cold ones are closed."""
+
+    def _lifo_pool(self, pool_class: Any, **kwargs: Any) -> AdbcQueuePool | AdbcPool:
+        kwargs.setdefault("prefill", 3)
+        return cast(
+            "AdbcQueuePool | AdbcPool",
+            create_pool(
+                driver_path="d",
+                db_kwargs={},
+                checkout_order="lifo",
+                pool_class=pool_class,
+                **kwargs,
+            ),
+        )
+
+    @pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+    def test_lifo_hands_out_most_recent(self, mock_source: MagicMock, pool_class: str) -> None:
+        """With LIFO the connection returned last is the next one checked out."""
+        pool = self._lifo_pool(pool_class)
+        try:
+            first, second = pool.connect(), pool.connect()
+            raw = second.dbapi_connection
+            first.close()
+            second.close()
+            for _ in range(3):
+                with pool.connect() as conn:
+                    assert conn.dbapi_connection is raw
+        finally:
+            close_pool(pool)
+
+    @pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+    def test_cold_connections_are_closed(self, mock_source: MagicMock, pool_class: str) -> None:
+        """A pass closes connections idle past idle_timeout and keeps the hot one."""
+        pool = _stopped(self._lifo_pool(pool_class, idle_timeout=60))
+        try:
+            for rec in pool._adbc_idle_records():
+                rec.info[_IDLE_SINCE] = time.time() - 120
+            with pool.connect() as conn:
+                raw = conn.dbapi_connection
+            assert pool._adbc_maintainer is not None
+            pool._adbc_maintainer.run_once()
+            assert pool.checkedin() == 1
+            assert pool._adbc_idle_records()[0].dbapi_connection is raw
+            assert pool.checkedout() == 0
+        finally:
+            close_pool(pool)
+
+    def test_keeps_min_idle(self, mock_source: MagicMock) -> None:
+        """Idle eviction never takes the idle set below min_idle."""
+        pool = _stopped(
+            create_pool(driver_path="d", db_kwargs={}, prefill=4, min_idle=2, idle_timeout=60)
+        )
+        try:
+            for rec in pool._adbc_idle_records():
+                rec.info[_IDLE_SINCE] = time.time() - 120
+            assert pool._adbc_maintainer is not None
+            pool._adbc_maintainer.run_once()
+            assert pool.checkedin() == 2
+            assert pool.overflow() == -pool.size() + 2
+        finally:
+            close_pool(pool)
+
+    def test_idle_timeout_from_config(self, tmp_path: Path) -> None:
+        """A config's idle_timeout starts the maintainer; an explicit argument wins."""
+        cfg = DuckDBConfig(database=str(tmp_path / "idle.db"), idle_timeout=300)
+        with managed_pool(cfg) as pool:
+            assert pool._adbc_maintainer is not None
+            assert pool._adbc_maintainer.idle_timeout == 300
+        with managed_pool(cfg, idle_timeout=30) as pool:
+            assert pool._adbc_maintainer is not None
+            assert pool._adbc_maintainer.idle_timeout == 30
+
+    def test_checkin_stamps_idle_time(self, mock_source: MagicMock) -> None:
+        """Every checkin records when the connection went idle."""
+        pool = create_pool(driver_path="d", db_kwargs={})
+        try:
+            before = time.time()
+            with pool.connect() as conn:
+                info = conn.info
+            assert info[_IDLE_SINCE] >= before
+        finally:
+            close_pool(pool)
+
+
+class TestValidation:
+    """Out-of-range maintenance settings are rejected before any connection opens."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"min_idle": -1}, "min_idle"),
+            ({"min_idle": 6}, "min_idle"),
+            ({"min_idle": 2, "max_idle": 1}, "max_idle"),
+            ({"max_idle": 6}, "max_idle"),
+            ({"min_idle": 1, "maintenance_interval": 0}, "maintenance_interval"),
+            ({"recycle_mode": "eager"}, "recycle_mode"),
+            ({"recycle_mode": "background", "recycle": -1}, "recycle"),
+            ({"recycle_jitter": 1.0}, "recycle_jitter"),
+            ({"checkout_order": "random"}, "checkout_order"),
+            ({"idle_timeout": 0}, "idle_timeout"),
+        ],
+    )
+    def test_invalid_settings_raise(self, kwargs: dict[str, object], match: str) -> None:
+        """Each invalid combination raises ConfigurationError naming the argument."""
+        with (
+            patch("adbc_poolhouse._pool_factory.create_adbc_connection") as mock_factory,
+            pytest.raises(ConfigurationError, match=match),
+        ):
+            create_pool(driver_path="d", db_kwargs={}, pool_size=5, **kwargs)  # type: ignore[arg-type]
+        mock_factory.assert_not_called()
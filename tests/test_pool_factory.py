@@ -11,6 +11,7 @@ from adbc_poolhouse import (
     DuckDBConfig,
     PoolhouseError,
     SQLiteConfig,
+    close_pool,
     create_pool,
     managed_pool,
 )
@@ -570,3 +571,109 @@ class TestRawDuckDBIntegration:
         finally:
             pool.dispose()
             pool._adbc_source.close()  # type: ignore[attr-defined]
+
+
+class TestPrefill:
+    """Eager pre-fill: clones opened at create_pool() time, with open timings."""
+
+    def test_prefill_fills_pool_before_return(self, tmp_path: Path) -> None:
+        """prefill=N leaves N idle connections in the pool and reports N open times."""
+        cfg = DuckDBConfig(database=str(tmp_path / "prefill.db"), pool_size=3)
+        pool = create_pool(cfg, prefill=3)
+        try:
+            assert pool.checkedin() == 3
+            assert pool.checkedout() == 0
+            report = pool.prefill_report
+            assert report is not None
+            assert report.connections == 3
+            assert all(t >= 0.0 for t in report.open_times)
+            assert report.serial_time == sum(report.open_times)
+        finally:
+            close_pool(pool)
+
+    def test_prefilled_connections_are_distinct_clones(self) -> None:
+        """Each pre-filled connection is its own adbc_clone, not one reused N times."""
+        from unittest.mock import MagicMock, patch
+
+        mock_conn = MagicMock()
+        mock_conn.adbc_clone = MagicMock(side_effect=lambda: MagicMock())
+
+        with patch(
+            "adbc_poolhouse._pool_factory.create_adbc_connection",
+            return_value=mock_conn,
+        ):
+            pool = create_pool(driver_path="d", db_kwargs={}, pool_size=4, prefill=4)
+            try:
+                assert mock_conn.adbc_clone.call_count == 4
+                assert pool.checkedin() == 4
+            finally:
+                close_pool(pool)
+
+    def test_no_prefill_by_default(self, tmp_path: Path) -> None:
+        """Without prefill the pool starts empty and has no report."""
+        pool = create_pool(DuckDBConfig(database=str(tmp_path / "lazy.db")))
+        try:
+            assert pool.checkedin() == 0
+            assert pool.prefill_report is None
+        finally:
+            close_pool(pool)
+
+    def test_managed_pool_prefill(self, tmp_path: Path) -> None:
+        """managed_pool accepts prefill and yields an already-filled pool."""
+        cfg = DuckDBConfig(database=str(tmp_path / "managed.db"), pool_size=2)
+        with managed_pool(cfg, prefill=2) as pool:
+            assert pool.checkedin() == 2
+
+    @pytest.mark.parametrize("prefill", [-1, 6])
+    def test_prefill_out_of_range_raises(self, tmp_path: Path, prefill: int) -> None:
+        """A `prefill` outside 0..pool_size is rejected before any connection opens."""
+        from unittest.mock import patch
+
+        with (
+            patch("adbc_poolhouse._pool_factory.create_adbc_connection") as mock_factory,
+            pytest.raises(ConfigurationError, match="prefill"),
+        ):
+            create_pool(driver_path="d", db_kwargs={}, pool_size=5, prefill=prefill)
+        mock_factory.assert_not_called()
+
+    def test_failed_prefill_closes_source(self) -> None:
+        """A clone failure during pre-fill closes the source and re-raises."""
+        from unittest.mock import MagicMock, patch
+
+        mock_conn = MagicMock()
+        mock_conn.adbc_clone = MagicMock(side_effect=RuntimeError("login failed"))
+
+        with (
+            patch(
+                "adbc_poolhouse._pool_factory.create_adbc_connection",
+                return_value=mock_conn,
+            ),
+            pytest.raises(RuntimeError, match="login failed"),
+        ):
+            create_pool(driver_path="d", db_kwargs={}, pool_size=2, prefill=2)
+        mock_conn.close.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("target", "options"),
+        [
+            ("ProcessFetcher", {"fetch_processes": 1}),
+            ("PoolAutoscaler", {"autoscale": (1, 2)}),
+            ("PoolMaintainer", {"min_idle": 1}),
+        ],
+    )
+    def test_failed_setup_closes_source(self, target: str, options: dict[str, object]) -> None:
+        """A failure anywhere after the source opens closes it and re-raises."""
+        from unittest.mock import MagicMock, patch
+
+        mock_conn = MagicMock()
+
+        with (
+            patch(
+                "adbc_poolhouse._pool_factory.create_adbc_connection",
+                return_value=mock_conn,
+            ),
+            patch(f"adbc_poolhouse._pool_factory.{target}", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            create_pool(driver_path="d", db_kwargs={}, pool_size=2, **options)  # type: ignore[arg-type]
+        mock_conn.close.assert_called_once()
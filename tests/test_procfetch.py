@@ -0,0 +1,107 @@
+"""Tests for `fetch_processes`: `fetch_arrow` in worker processes, tables over shared memory."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+from typing import TYPE_CHECKING
+
+import adbc_driver_manager
+import pyarrow
+import pytest
+
+from adbc_poolhouse import ConfigurationError, DuckDBConfig, create_pool, managed_pool
+from adbc_poolhouse._shm import map_table, write_table
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from adbc_poolhouse import AdbcPool, AdbcQueuePool
+
+
+@pytest.fixture(scope="module")
+def process_pool() -> Iterator[AdbcQueuePool]:
+    """An in-memory DuckDB pool with two fetch processes, shared to pay their startup once."""
+    with managed_pool(DuckDBConfig(), fetch_processes=2) as pool:
+        yield pool
+
+
+class TestSharedMemoryTables:
+    """`write_table` / `map_table`: the IPC file round trip."""
+
+    def test_round_trip_maps_without_copying(self, tmp_path: Path) -> None:
+        """The mapped table equals the original, allocates nothing, and outlives its file."""
+        table = pyarrow.table({"n": pyarrow.array(range(100_000))})
+        path = write_table(table, str(tmp_path))
+        before = pyarrow.total_allocated_bytes()
+        mapped = map_table(path)
+        assert pyarrow.total_allocated_bytes() == before
+        assert not os.path.exists(path)
+        assert mapped.equals(table)
+
+
+class TestFetchArrow:
+    """`pool.fetch_arrow` with and without worker processes."""
+
+    @pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+    def test_in_process_without_fetch_processes(self, pool_class: str, tmp_path: Path) -> None:
+        """Without worker processes the query runs on a pool connection that is checked in."""
+        config = DuckDBConfig(database=str(tmp_path / "fetch.db"))
+        with managed_pool(config, pool_class=pool_class) as pool:  # type: ignore[call-overload]
+            assert pool._adbc_fetcher is None
+            table = pool.fetch_arrow("SELECT range AS n FROM range(10) WHERE n >= ?", [8])
+            assert table.column("n").to_pylist() == [8, 9]
+            assert pool.checkedout() == 0
+            assert pool.stats().checkouts == 1
+
+    def test_worker_process_result(self, process_pool: AdbcQueuePool) -> None:
+        """The table comes back whole from a worker and no pool connection is used."""
+        checkouts = process_pool.stats().checkouts
+        table = process_pool.fetch_arrow("SELECT range AS n FROM range(?)", [50_000])
+        assert table.num_rows == 50_000
+        assert table.column("n")[49_999].as_py() == 49_999
+        assert process_pool.stats().checkouts == checkouts
+
+    def test_concurrent_fetches(self, process_pool: AdbcQueuePool) -> None:
+        """Fetches from several threads, more than there are processes, all complete."""
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            tables = list(
+                executor.map(
+                    lambda n: process_pool.fetch_arrow("SELECT ? AS n", [n]),
+                    range(8),
+                )
+            )
+        assert [t.column("n")[0].as_py() for t in tables] == list(range(8))
+
+    def test_driver_error_keeps_its_type(self, process_pool: AdbcQueuePool) -> None:
+        """A driver error from a worker is re-raised as the driver's own exception."""
+        with pytest.raises(adbc_driver_manager.DatabaseError, match="missing_table") as info:
+            process_pool.fetch_arrow("SELECT * FROM missing_table")
+        assert info.value.status_code is not None  # type: ignore[attr-defined]
+        assert process_pool.fetch_arrow("SELECT 1 AS n").num_rows == 1
+
+
+class TestFetchProcessesOption:
+    """Validation and teardown of the worker processes."""
+
+    def test_negative_rejected(self) -> None:
+        """A negative process count raises before anything is opened."""
+        with pytest.raises(ConfigurationError, match="fetch_processes"):
+            create_pool(driver_path="nowhere", db_kwargs={}, fetch_processes=-1)
+
+    def test_close_deletes_uncollected_results(self) -> None:
+        """`close_pool` removes a finished result's file that nobody collected."""
+        with managed_pool(DuckDBConfig(), fetch_processes=1) as pool:
+            fetcher = pool._adbc_fetcher
+            assert fetcher is not None
+            future = fetcher._submit("SELECT 1 AS n", None)
+            path = future.result()
+            assert os.path.exists(path)
+        assert not os.path.exists(path)
+
+    def test_adbc_pool_class(self) -> None:
+        """The native pool gets worker processes too."""
+        pool: AdbcPool
+        with managed_pool(DuckDBConfig(), fetch_processes=1, pool_class="adbc") as pool:
+            assert pool.fetch_arrow("SELECT 3 AS n").column("n")[0].as_py() == 3
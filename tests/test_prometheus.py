@@ -0,0 +1,188 @@
+"""Tests for the Prometheus text-format exporter (`render_prometheus`)."""
+
+from __future__ import annotations
+
+import http.server
+import threading
+import urllib.error
+import urllib.request
+import weakref
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from adbc_poolhouse import (
+    DuckDBConfig,
+    PrometheusHandler,
+    _prometheus,
+    close_pool,
+    create_pool,
+    render_prometheus,
+    write_prometheus_textfile,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from adbc_poolhouse import AdbcPool, AdbcQueuePool
+
+
+@pytest.fixture
+def mock_source() -> Iterator[MagicMock]:
+    """Patch the ADBC source so every clone is a fresh mock connection."""
+    source = MagicMock()
+    source.adbc_clone = MagicMock(side_effect=lambda: MagicMock(_cursors=()))
+    with patch("adbc_poolhouse._pool_factory.create_adbc_connection", return_value=source):
+        yield source
+
+
+def _pool(pool_class: Any = "queue", **kwargs: Any) -> AdbcQueuePool | AdbcPool:
+    return cast(
+        "AdbcQueuePool | AdbcPool",
+        create_pool(driver_path="d", db_kwargs={}, pool_class=pool_class, **kwargs),
+    )
+
+
+def _samples(text: str) -> dict[str, str]:
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#"))
+
+
+@pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+class TestRender:
+    """`render_prometheus` over live sync pools."""
+
+    def test_gauges_and_counters(self, mock_source: MagicMock, pool_class: str) -> None:
+        """Connection gauges and checkout counters reflect the pool's state."""
+        pool = _pool(pool_class, pool_size=3, name="orders")
+        try:
+            held = pool.connect()
+            pool.connect().close()
+            samples = _samples(render_prometheus())
+            labels = '{pool="orders",config=""}'
+            assert samples[f"adbc_poolhouse_pool_size{labels}"] == "3"
+            assert samples[f"adbc_poolhouse_connections_in_use{labels}"] == "1"
+            assert samples[f"adbc_poolhouse_connections_idle{labels}"] == "1"
+            assert samples[f"adbc_poolhouse_checkouts_total{labels}"] == "2"
+            assert samples[f"adbc_poolhouse_checkout_timeouts_total{labels}"] == "0"
+            held.close()
+        finally:
+            close_pool(pool)
+
+    def test_invalidations_counted(self, mock_source: MagicMock, pool_class: str) -> None:
+        """An invalidated connection bumps `invalidations_total` once."""
+        pool = _pool(pool_class, name="inv")
+        try:
+            conn = pool.connect()
+            conn.invalidate()
+            conn.close()
+            assert pool.stats().invalidations == 1
+            samples = _samples(render_prometheus())
+            assert samples['adbc_poolhouse_invalidations_total{pool="inv",config=""}'] == "1"
+        finally:
+            close_pool(pool)
+
+    def test_histogram_series(self, mock_source: MagicMock, pool_class: str) -> None:
+        """Each histogram has cumulative buckets ending at `+Inf`, a sum and a count."""
+        pool = _pool(pool_class, name="h")
+        try:
+            for _ in range(3):
+                pool.connect().close()
+            text = render_prometheus()
+            samples = _samples(text)
+            labels = 'pool="h",config=""'
+            assert "# TYPE adbc_poolhouse_checkout_wait_seconds histogram" in text
+            assert samples[f'adbc_poolhouse_hold_seconds_bucket{{{labels},le="+Inf"}}'] == "3"
+            assert samples[f"adbc_poolhouse_hold_seconds_count{{{labels}}}"] == "3"
+            assert float(samples[f"adbc_poolhouse_hold_seconds_sum{{{labels}}}"]) >= 0.0
+            buckets = [
+                int(value)
+                for key, value in samples.items()
+                if key.startswith(f"adbc_poolhouse_checkout_wait_seconds_bucket{{{labels}")
+            ]
+            assert buckets == sorted(buckets)
+            assert buckets[-1] == 3
+        finally:
+            close_pool(pool)
+
+
+class TestLabels:
+    """The `pool` and `config` labels."""
+
+    def test_config_class_label(self, mock_source: MagicMock) -> None:
+        """Pools built from a config are labelled with its class name."""
+        pool = create_pool(DuckDBConfig(database=":memory:"), name="wh")
+        try:
+            assert 'adbc_poolhouse_pool_size{pool="wh",config="DuckDBConfig"}' in (
+                render_prometheus()
+            )
+        finally:
+            close_pool(pool)
+
+    def test_unnamed_pools_are_numbered(self, mock_source: MagicMock) -> None:
+        """Without `name=`, pools get distinct `pool-N` names."""
+        a, b = _pool(), _pool()
+        try:
+            assert a._adbc_name.startswith("pool-")
+            assert a._adbc_name != b._adbc_name
+        finally:
+            close_pool(a)
+            close_pool(b)
+
+    def test_label_values_escaped(self, mock_source: MagicMock) -> None:
+        """Quotes and backslashes in a name are escaped."""
+        pool = _pool(name='a"b\\c')
+        try:
+            assert 'pool="a\\"b\\\\c"' in render_prometheus()
+        finally:
+            close_pool(pool)
+
+
+class TestLiveness:
+    """Which pools are rendered."""
+
+    def test_closed_pool_dropped(self, mock_source: MagicMock) -> None:
+        """`close_pool` removes the pool from the output."""
+        pool = _pool(name="gone")
+        close_pool(pool)
+        assert 'pool="gone"' not in render_prometheus()
+
+    def test_empty_without_pools(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Nothing is rendered when no pool is open."""
+        monkeypatch.setattr(_prometheus, "_live", weakref.WeakSet[Any]())
+        assert render_prometheus() == ""
+
+
+class TestOutputs:
+    """The textfile dump and the HTTP handler."""
+
+    def test_textfile(self, mock_source: MagicMock, tmp_path: Path) -> None:
+        """`write_prometheus_textfile` writes the rendered text and leaves no temp file."""
+        pool = _pool(name="file")
+        try:
+            target = tmp_path / "adbc.prom"
+            write_prometheus_textfile(target)
+            assert 'pool="file"' in target.read_text()
+            assert [p.name for p in tmp_path.iterdir()] == ["adbc.prom"]
+        finally:
+            close_pool(pool)
+
+    def test_http_handler(self, mock_source: MagicMock) -> None:
+        """`/metrics` serves the text format; other paths are 404."""
+        pool = _pool(name="http")
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), PrometheusHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{base}/metrics") as response:
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert 'pool="http"' in response.read().decode()
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(f"{base}/other")
+            assert excinfo.value.code == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+            close_pool(pool)
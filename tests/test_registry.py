@@ -0,0 +1,139 @@
+"""Tests for `PoolRegistry` and `get_pool`: one shared pool per distinct config."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from adbc_poolhouse import (
+    ConnectionBudget,
+    DuckDBConfig,
+    PoolRegistry,
+    SnowflakeConfig,
+    get_pool,
+    release_pool,
+)
+from adbc_poolhouse._registry import config_fingerprint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestFingerprint:
+    """What makes two configs share a pool."""
+
+    def test_equal_configs_match(self, tmp_path: Path) -> None:
+        """Separately built, equal configs and arguments give one key."""
+        db = str(tmp_path / "a.db")
+        assert config_fingerprint(DuckDBConfig(database=db), {"pool_size": 2}) == (
+            config_fingerprint(DuckDBConfig(database=db), {"pool_size": 2})
+        )
+
+    @pytest.mark.parametrize(
+        ("other", "options"),
+        [
+            ({"database": "b.db"}, {}),
+            ({"recycle": 60}, {}),
+            ({}, {"pool_size": 3}),
+        ],
+    )
+    def test_differences_split(self, other: dict[str, Any], options: dict[str, Any]) -> None:
+        """A different connection argument, tuning field or factory argument gives a new key."""
+        base = {"database": "a.db"}
+        assert config_fingerprint(DuckDBConfig.model_validate(base), {}) != config_fingerprint(
+            DuckDBConfig.model_validate(base | other), options
+        )
+
+    def test_secrets_are_not_in_the_key(self) -> None:
+        """Passwords count towards the key but cannot be read back from it."""
+        kwargs: dict[str, Any] = {"account": "acme", "user": "me"}
+        first = SnowflakeConfig(**kwargs, password="hunter2")  # type: ignore[arg-type]
+        second = SnowflakeConfig(**kwargs, password="hunter3")  # type: ignore[arg-type]
+        key = config_fingerprint(first, {})
+        assert key != config_fingerprint(second, {})
+        assert "hunter2" not in key
+
+    def test_objects_match_by_identity(self) -> None:
+        """Two equal budgets are still two budgets."""
+        config = DuckDBConfig()
+        budget = ConnectionBudget(2)
+        assert config_fingerprint(config, {"budget": budget}) == (
+            config_fingerprint(config, {"budget": budget})
+        )
+        assert config_fingerprint(config, {"budget": budget}) != (
+            config_fingerprint(config, {"budget": ConnectionBudget(2)})
+        )
+
+
+class TestRegistry:
+    """Sharing, reference counting and closing."""
+
+    def test_equal_configs_share_a_pool(self) -> None:
+        """The pool is built once and closed by the last release."""
+        registry = PoolRegistry()
+        first = registry.get_pool(DuckDBConfig(), pool_size=2)
+        second = registry.get_pool(DuckDBConfig(), pool_size=2)
+        other = registry.get_pool(DuckDBConfig(), pool_size=3)
+        assert first is second
+        assert other is not first
+        assert len(registry) == 2
+        registry.release_pool(first)
+        assert first._adbc_source is not None
+        assert not first._adbc_source._closed
+        registry.release_pool(second)
+        assert first._adbc_source._closed
+        assert len(registry) == 1
+        registry.close()
+        assert other._adbc_source._closed
+        assert len(registry) == 0
+
+    def test_unknown_pool(self) -> None:
+        """Releasing a pool more often than it was obtained is an error."""
+        registry = PoolRegistry()
+        pool = registry.get_pool(DuckDBConfig())
+        registry.release_pool(pool)
+        with pytest.raises(ValueError, match="registry"):
+            registry.release_pool(pool)
+
+    def test_concurrent_callers_build_once(self) -> None:
+        """Threads asking for one config together wait for one build."""
+        registry = PoolRegistry()
+        pools: list[object] = []
+        barrier = threading.Barrier(4)
+
+        def get() -> None:
+            barrier.wait()
+            pools.append(registry.get_pool(DuckDBConfig()))
+
+        threads = [threading.Thread(target=get) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(pool) for pool in pools}) == 1
+        assert len(registry) == 1
+        registry.close()
+
+    def test_failed_build_leaves_no_entry(self) -> None:
+        """A build that raises leaves nothing behind; the next caller builds again."""
+        registry = PoolRegistry()
+        with pytest.raises(Exception, match="prefill"):
+            registry.get_pool(DuckDBConfig(), prefill=99)
+        assert len(registry) == 0
+        assert registry._entries == {}
+
+
+class TestDefaultRegistry:
+    """The process-wide `get_pool` / `release_pool`."""
+
+    def test_get_and_release(self) -> None:
+        """Equal configs anywhere in the process share the pool."""
+        pool = get_pool(DuckDBConfig(), name="shared-default")
+        try:
+            assert get_pool(DuckDBConfig(), name="shared-default") is pool
+            release_pool(pool)
+        finally:
+            release_pool(pool)
+        assert pool._adbc_source._closed
@@ -0,0 +1,169 @@
+"""Tests for `SharedResultStore`: results shared between processes through shared memory."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import gc
+import multiprocessing
+import os
+import time
+from typing import TYPE_CHECKING
+
+import pyarrow
+import pytest
+
+from adbc_poolhouse import ConfigurationError, DuckDBConfig, SharedResultStore, managed_pool
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _table(rows: int, start: int = 0) -> pyarrow.Table:
+    return pyarrow.table({"n": pyarrow.array(range(start, start + rows), pyarrow.int64())})
+
+
+def _entry_size(tmp_path: Path) -> int:
+    """The file size of one `_table(10_000)` entry."""
+    probe = SharedResultStore("probe", directory=str(tmp_path))
+    probe.put("probe", _table(10_000))
+    return probe.nbytes()
+
+
+def _fetch_in_child(directory: str, counter: str) -> int:
+    """Run in a spawned process: read a shared result, fetching it on a miss."""
+
+    def fetch() -> pyarrow.Table:
+        with open(counter, "a") as f:
+            f.write("fetch\n")
+        return _table(1_000)
+
+    store = SharedResultStore("shared", directory=directory)
+    return store.get_or_fetch(store.key("SELECT reference"), fetch).num_rows
+
+
+class TestEntries:
+    """Storing, mapping and replacing entries."""
+
+    def test_put_then_get_maps_the_entry(self, tmp_path: Path) -> None:
+        """A stored table maps back equal and without allocating."""
+        store = SharedResultStore("t", directory=str(tmp_path))
+        key = store.key("SELECT n FROM t WHERE n > ?", [3])
+        assert store.get(key) is None
+        store.put(key, _table(1_000))
+        before = pyarrow.total_allocated_bytes()
+        mapped = store.get(key)
+        assert mapped is not None
+        assert pyarrow.total_allocated_bytes() == before
+        assert mapped.equals(_table(1_000))
+        assert store.nbytes() > 0
+
+    def test_key_depends_on_parameters(self) -> None:
+        """Different parameters give different keys; equal ones the same key."""
+        key = SharedResultStore.key
+        assert key("SELECT ?", [1]) == key("SELECT ?", [1])
+        assert key("SELECT ?", [1]) != key("SELECT ?", [2])
+
+    def test_invalidate_keeps_mapped_copies(self, tmp_path: Path) -> None:
+        """An invalidated entry is gone from the store but a held table stays readable."""
+        store = SharedResultStore("t", directory=str(tmp_path))
+        held = store.put("k", _table(100))
+        store.invalidate("k")
+        assert store.get("k") is None
+        assert held.column("n")[99].as_py() == 99
+
+    def test_expired_entry_is_refetched(self, tmp_path: Path) -> None:
+        """Past `ttl`, an entry misses and `get_or_fetch` replaces it."""
+        store = SharedResultStore("t", ttl=60, directory=str(tmp_path))
+        store.put("k", _table(3))
+        path = os.path.join(store.path, "k.arrow")
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert store.get("k") is None
+        table = store.get_or_fetch("k", lambda: _table(3, start=10))
+        assert table.column("n").to_pylist() == [10, 11, 12]
+
+
+class TestEviction:
+    """The byte bound, LRU order and pins."""
+
+    def test_least_recently_used_goes_first(self, tmp_path: Path) -> None:
+        """With room for two entries, a third evicts the one used least recently."""
+        size = _entry_size(tmp_path)
+        store = SharedResultStore("t", max_bytes=2 * size, directory=str(tmp_path))
+        store.put("a", _table(10_000))
+        store.put("b", _table(10_000))
+        gc.collect()
+        # Last use is kept in the access time; make "a" the more recent one.
+        os.utime(os.path.join(store.path, "b.arrow"), (time.time() - 60, time.time()))
+        assert store.get("a") is not None
+        gc.collect()
+        store.put("c", _table(10_000))
+        gc.collect()
+        assert (store.get("a") is None, store.get("b") is None, store.get("c") is None) == (
+            False,
+            True,
+            False,
+        )
+
+    def test_pinned_entry_is_not_evicted(self, tmp_path: Path) -> None:
+        """While a table is alive its entry stays; a newcomer that cannot fit is not stored."""
+        size = _entry_size(tmp_path)
+        store = SharedResultStore("t", max_bytes=size, directory=str(tmp_path))
+        held = store.put("a", _table(10_000)).column("n").slice(0, 5)
+        gc.collect()
+        unstored = store.put("b", _table(10_000))
+        assert unstored.num_rows == 10_000
+        assert store.get("b") is None
+        assert store.nbytes() == size
+        del held
+        gc.collect()
+        store.put("b", _table(10_000))
+        gc.collect()
+        assert store.get("a") is None
+        assert store.get("b") is not None
+
+
+class TestAcrossProcesses:
+    """Entries written by one process are mapped by the others."""
+
+    def test_fetched_once_for_all_processes(self, tmp_path: Path) -> None:
+        """Three processes reading the same query run its fetch once between them."""
+        counter = str(tmp_path / "fetches")
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(3, mp_context=context) as executor:
+            futures = [executor.submit(_fetch_in_child, str(tmp_path), counter) for _ in range(3)]
+            assert [f.result() for f in futures] == [1_000] * 3
+        with open(counter) as f:
+            assert f.read().count("fetch") == 1
+
+
+class TestPoolIntegration:
+    """`pool.fetch_arrow(..., shared=store)`."""
+
+    def test_second_fetch_uses_no_connection(self, tmp_path: Path) -> None:
+        """The first call fetches and stores; the second maps the entry without a checkout."""
+        store = SharedResultStore("t", directory=str(tmp_path))
+        config = DuckDBConfig(database=str(tmp_path / "shared.db"))
+        with managed_pool(config) as pool:
+            first = pool.fetch_arrow("SELECT range AS n FROM range(?)", [100], shared=store)
+            second = pool.fetch_arrow("SELECT range AS n FROM range(?)", [100], shared=store)
+            assert first.equals(second)
+            assert pool.stats().checkouts == 1
+
+
+class TestOptions:
+    """Construction-time validation."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"name": "a/b"}, "name"),
+            ({"name": ".hidden"}, "name"),
+            ({"max_bytes": 0}, "max_bytes"),
+            ({"ttl": 0}, "ttl"),
+        ],
+    )
+    def test_invalid(self, kwargs: dict[str, object], match: str, tmp_path: Path) -> None:
+        """Bad names and non-positive bounds are rejected."""
+        with pytest.raises(ConfigurationError, match=match):
+            SharedResultStore(directory=str(tmp_path), **kwargs)  # type: ignore[arg-type]
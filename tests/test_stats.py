@@ -0,0 +1,141 @@
+"""Tests for pool statistics (`pool.stats()`) and the latency histogram."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+import sqlalchemy.exc
+
+from adbc_poolhouse import LatencySummary, PoolStats, close_pool, create_pool
+from adbc_poolhouse._stats import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from adbc_poolhouse import AdbcPool, AdbcQueuePool
+
+
+@pytest.fixture
+def mock_source() -> Iterator[MagicMock]:
+    """Patch the ADBC source so every clone is a fresh mock connection."""
+    source = MagicMock()
+    source.adbc_clone = MagicMock(side_effect=lambda: MagicMock(_cursors=()))
+    with patch("adbc_poolhouse._pool_factory.create_adbc_connection", return_value=source):
+        yield source
+
+
+def _pool(pool_class: Any = "queue", **kwargs: Any) -> AdbcQueuePool | AdbcPool:
+    return cast(
+        "AdbcQueuePool | AdbcPool",
+        create_pool(driver_path="d", db_kwargs={}, pool_class=pool_class, **kwargs),
+    )
+
+
+class TestLatencyHistogram:
+    """Fixed log-linear buckets: cheap to record, percentiles within one bucket."""
+
+    def test_empty(self) -> None:
+        """No samples summarises to zeros."""
+        assert LatencyHistogram().summary() == LatencySummary(0, 0.0, 0.0, 0.0, 0.0)
+
+    @pytest.mark.parametrize("value", [3e-6, 0.0004, 0.0123, 0.5, 1.0, 7.9, 120.0])
+    def test_single_value_is_exact(self, value: float) -> None:
+        """With one sample every percentile is capped at that sample."""
+        histogram = LatencyHistogram()
+        histogram.record(value)
+        summary = histogram.summary()
+        assert summary.p50 == summary.p99 == summary.max == value
+
+    def test_percentiles_within_one_bucket(self) -> None:
+        """Percentiles of 1..1000 ms land at most 12.5% above the true value."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+        summary = histogram.summary()
+        assert summary.count == 1000
+        for got, want in ((summary.p50, 0.5), (summary.p95, 0.95), (summary.p99, 0.99)):
+            assert want <= got <= want * 1.125
+
+    def test_out_of_range_values_are_clamped(self) -> None:
+        """Zero and huge durations are counted in the end buckets, max is kept."""
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(10_000.0)
+        assert histogram.count == 2
+        assert histogram.max == 10_000.0
+        assert histogram.percentile(50) > 0.0
+
+
+@pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+class TestPoolStats:
+    """`stats()` on both pool implementations."""
+
+    def test_fresh_pool(self, mock_source: MagicMock, pool_class: str) -> None:
+        """A new pool reports its size and no activity."""
+        pool = _pool(pool_class, pool_size=3)
+        try:
+            stats = pool.stats()
+            assert isinstance(stats, PoolStats)
+            assert (stats.size, stats.checked_out, stats.idle) == (3, 0, 0)
+            assert stats.checkouts == stats.timeouts == 0
+            assert stats.limiter_borrowed is None
+            assert stats.limiter_waiting is None
+        finally:
+            close_pool(pool)
+
+    def test_checkout_and_hold_recorded(self, mock_source: MagicMock, pool_class: str) -> None:
+        """Each checkout, its hold time and each connection open are recorded."""
+        pool = _pool(pool_class, pool_size=2)
+        try:
+            a, b = pool.connect(), pool.connect()
+            held = pool.stats()
+            assert (held.checked_out, held.checkouts, held.hold_time.count) == (2, 2, 0)
+            time.sleep(0.02)
+            a.close()
+            b.close()
+            pool.connect().close()
+            stats = pool.stats()
+            assert (stats.checked_out, stats.idle, stats.checkouts) == (0, 2, 3)
+            assert stats.checkout_wait.count == 3
+            assert stats.hold_time.count == 3
+            assert stats.hold_time.max >= 0.02
+            assert stats.connect_time.count == 2
+        finally:
+            close_pool(pool)
+
+    def test_invalidated_hold_recorded(self, mock_source: MagicMock, pool_class: str) -> None:
+        """An invalidated connection still counts towards hold time."""
+        pool = _pool(pool_class)
+        try:
+            conn = pool.connect()
+            conn.invalidate()
+            conn.close()
+            assert pool.stats().hold_time.count == 1
+        finally:
+            close_pool(pool)
+
+    def test_timeouts_counted(self, mock_source: MagicMock, pool_class: str) -> None:
+        """A checkout that times out bumps `timeouts`, not `checkouts`."""
+        pool = _pool(pool_class, pool_size=1, max_overflow=0, timeout=0)
+        try:
+            held = pool.connect()
+            with pytest.raises(sqlalchemy.exc.TimeoutError):
+                pool.connect()
+            held.close()
+            stats = pool.stats()
+            assert (stats.checkouts, stats.timeouts) == (1, 1)
+        finally:
+            close_pool(pool)
+
+    def test_prefill_opens_recorded(self, mock_source: MagicMock, pool_class: str) -> None:
+        """Connections opened by pre-fill count towards connect_time."""
+        pool = _pool(pool_class, pool_size=3, prefill=3)
+        try:
+            stats = pool.stats()
+            assert stats.connect_time.count == 3
+            assert stats.idle == 3
+        finally:
+            close_pool(pool)
@@ -0,0 +1,75 @@
+"""Tests for `pool.stream`: streamed reads that pin their connection."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pyarrow
+import pytest
+
+from adbc_poolhouse import DuckDBConfig, managed_pool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from adbc_poolhouse import AdbcPool, AdbcQueuePool
+
+_ROWS = 100_000
+
+
+@pytest.fixture(params=["queue", "adbc"])
+def pool(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[AdbcQueuePool | AdbcPool]:
+    """A one-connection DuckDB pool of each `pool_class`."""
+    config = DuckDBConfig(database=str(tmp_path / "stream.db"))
+    with managed_pool(config, pool_size=1, max_overflow=0, pool_class=request.param) as pool:
+        yield pool
+
+
+class TestStream:
+    """The reader streams the result and holds its connection for exactly its lifetime."""
+
+    def test_streams_whole_result(self, pool: AdbcQueuePool | AdbcPool) -> None:
+        """Every row arrives in several batches while the connection is checked out."""
+        with pool.stream(f"SELECT range AS n FROM range({_ROWS})") as reader:
+            assert isinstance(reader, pyarrow.RecordBatchReader)
+            assert reader.schema.names == ["n"]
+            assert pool.checkedout() == 1
+            batches = [reader.read_next_batch()]
+            assert pool.checkedout() == 1
+            batches.extend(reader)
+        assert sum(b.num_rows for b in batches) == _ROWS
+        assert len(batches) > 1
+        assert pool.checkedout() == 0
+
+    def test_exhaustion_checks_the_connection_in(self, pool: AdbcQueuePool | AdbcPool) -> None:
+        """Reading to the end returns the connection before the block exits."""
+        with pool.stream("SELECT 1 AS n") as reader:
+            assert reader.read_all().num_rows == 1
+            assert pool.checkedout() == 0
+            with pool.connect() as conn:
+                cur = conn.cursor()
+                cur.execute("SELECT 2")
+                assert cur.fetchone() == (2,)
+
+    def test_early_exit_checks_the_connection_in(self, pool: AdbcQueuePool | AdbcPool) -> None:
+        """Leaving the block part-way closes the stream and frees the connection."""
+        with pool.stream(f"SELECT range AS n FROM range({_ROWS})") as reader:
+            reader.read_next_batch()
+        assert pool.checkedout() == 0
+        with pool.stream("SELECT 7 AS n") as reader:
+            assert reader.read_all().column("n")[0].as_py() == 7
+
+    def test_parameters(self, pool: AdbcQueuePool | AdbcPool) -> None:
+        """Bound parameters reach the driver."""
+        with pool.stream("SELECT range AS n FROM range(10) WHERE n >= ?", [8]) as reader:
+            assert reader.read_all().column("n").to_pylist() == [8, 9]
+
+    def test_query_error_checks_the_connection_in(self, pool: AdbcQueuePool | AdbcPool) -> None:
+        """A failing query raises before the block runs and returns its connection."""
+        with (
+            pytest.raises(Exception, match="missing_table"),
+            pool.stream("SELECT * FROM missing_table"),
+        ):
+            pytest.fail("the block must not run")
+        assert pool.checkedout() == 0
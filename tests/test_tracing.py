@@ -0,0 +1,113 @@
+"""Tests for the optional OpenTelemetry tracing (`enable_tracing`)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from adbc_poolhouse import (
+    DuckDBConfig,
+    _tracing,
+    close_pool,
+    create_pool,
+    disable_tracing,
+    enable_tracing,
+)
+from adbc_poolhouse._tracing import backend_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from adbc_poolhouse import AdbcPool, AdbcQueuePool
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    """Enable tracing into an in-memory exporter for one test."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    enable_tracing(provider)
+    try:
+        yield exporter
+    finally:
+        disable_tracing()
+
+
+@pytest.fixture
+def mock_source() -> Iterator[MagicMock]:
+    """Patch the ADBC source so every clone is a fresh mock connection."""
+    source = MagicMock()
+    source.adbc_clone = MagicMock(side_effect=lambda: MagicMock(_cursors=()))
+    with patch("adbc_poolhouse._pool_factory.create_adbc_connection", return_value=source):
+        yield source
+
+
+class TestEnableDisable:
+    """Tracing is off by default and toggled globally."""
+
+    def test_off_by_default(self) -> None:
+        """No tracer is installed until `enable_tracing` is called."""
+        assert _tracing.tracer is None
+        with _tracing.start_span("x") as span:
+            assert span is None
+
+    def test_disable_stops_spans(
+        self, exporter: InMemorySpanExporter, mock_source: MagicMock
+    ) -> None:
+        """After `disable_tracing`, creating a pool emits nothing."""
+        disable_tracing()
+        close_pool(create_pool(driver_path="d", db_kwargs={}))
+        assert exporter.get_finished_spans() == ()
+
+
+class TestCreatePoolSpan:
+    """`create_pool` is traced around the source open and pre-fill."""
+
+    @pytest.mark.parametrize("pool_class", ["queue", "adbc"])
+    def test_span_attributes(
+        self, exporter: InMemorySpanExporter, mock_source: MagicMock, pool_class: Any
+    ) -> None:
+        """The span carries the backend, pool class and size."""
+        pool = cast(
+            "AdbcQueuePool | AdbcPool",
+            create_pool(
+                DuckDBConfig(database=":memory:"), pool_size=3, prefill=2, pool_class=pool_class
+            ),
+        )
+        close_pool(pool)
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "adbc_poolhouse.create_pool"
+        assert dict(span.attributes or {}) == {
+            "db.system": "duckdb",
+            "adbc_poolhouse.pool_class": pool_class,
+            "adbc_poolhouse.pool_size": 3,
+        }
+
+
+class TestBackendName:
+    """`db.system` values derived from the pool's construction arguments."""
+
+    @pytest.mark.parametrize(
+        ("driver_path", "dbapi_module", "expected"),
+        [
+            ("/usr/lib/libadbc_driver_postgresql.so", None, "postgresql"),
+            ("adbc_driver_sqlite", None, "sqlite"),
+            (None, "adbc_driver_snowflake.dbapi", "snowflake"),
+            (None, None, "adbc"),
+        ],
+    )
+    def test_raw_arguments(
+        self, driver_path: str | None, dbapi_module: str | None, expected: str
+    ) -> None:
+        """Driver paths and DBAPI modules are reduced to the driver name."""
+        assert backend_name(None, driver_path, dbapi_module) == expected
+
+    def test_config(self) -> None:
+        """A config names the backend by its class."""
+        assert backend_name(DuckDBConfig(database=":memory:"), None, None) == "duckdb"